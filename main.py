@@ -38,7 +38,7 @@ async def process_tv_show_seasons(media_title: str, requested_seasons: List[str]
     logger.info(f"Webhook: Performing comprehensive season validation for {media_title}")
     
     try:
-        from seerr.trakt import get_season_details_from_trakt, check_next_episode_aired
+        from seerr.trakt import get_season_details_from_trakt, get_all_seasons_from_trakt, check_next_episode_aired
         from seerr.enhanced_season_manager import EnhancedSeasonManager
         from seerr.config import DISCREPANCY_REPO_FILE
         import os
@@ -73,6 +73,9 @@ async def process_tv_show_seasons(media_title: str, requested_seasons: List[str]
                 json.dump({"discrepancies": []}, f)
             logger.info("Webhook: Initialized new episode_discrepancies.json file")
         
+        # One Trakt call returns every season with its episode air dates
+        all_seasons = await run_io(get_all_seasons_from_trakt, str(trakt_show_id))
+        
         # Process each requested season
         for season in requested_seasons:
             from seerr.utils import normalize_season
@@ -88,7 +91,7 @@ async def process_tv_show_seasons(media_title: str, requested_seasons: List[str]
             
             # Fetch season details from Trakt
             logger.info(f"Webhook: Fetching season {season_number} details from Trakt for show {trakt_show_id}")
-            season_details = get_season_details_from_trakt(str(trakt_show_id), season_number)
+            season_details = await run_io(get_season_details_from_trakt, str(trakt_show_id), season_number, all_seasons)
             
             if season_details:
                 logger.info(f"Webhook: Successfully fetched season {season_number} details from Trakt")
@@ -98,8 +101,8 @@ async def process_tv_show_seasons(media_title: str, requested_seasons: List[str]
                 
                 # Check for next episode if there's a discrepancy
                 if episode_count != aired_episodes:
-                    has_aired, next_episode_details = check_next_episode_aired(
-                        str(trakt_show_id), season_number, aired_episodes
+                    has_aired, next_episode_details = await run_io(check_next_episode_aired,
+                        str(trakt_show_id), season_number, aired_episodes, season_details
                     )
                     if has_aired:
                         logger.info(f"Webhook: Next episode (E{aired_episodes + 1:02d}) has aired for {media_title} Season {season_number}.")
@@ -201,6 +204,7 @@ import seerr.search
 
 # Now import specific functions
 from seerr.browser import initialize_browser, shutdown_browser, refresh_library_stats
+from seerr.executors import run_io, run_in_browser
 from seerr.background_tasks import (
     initialize_background_tasks, 
     populate_queues_from_overseerr, 
@@ -214,6 +218,7 @@ from seerr.background_tasks import (
     last_queue_activity_time
 )
 from seerr.api_endpoints import app as api_app
+from seerr.request_queue import PRIORITY_WEBHOOK
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -275,7 +280,7 @@ async def lifespan(app: FastAPI):
         # Check if it's safe to refresh before attempting
         if is_safe_to_refresh_library_stats(min_idle_seconds=30):
             logger.info("Initial library stats refresh triggered - queues are idle")
-            refresh_library_stats()
+            await run_in_browser(0, refresh_library_stats)
         else:
             logger.info("Initial library stats refresh skipped - queues are active or recently active")
     
@@ -391,8 +396,18 @@ async def lifespan(app: FastAPI):
     # Stop the scheduler
     scheduler.shutdown()
     
-    # Shutdown browser
+    # Shutdown browser pool sessions, then the primary browser
+    from seerr.browser_pool import browser_pool
+    await browser_pool.shutdown()
     await shutdown_browser()
+    
+    # Flush and close the queue journal
+    from seerr.queue_journal import queue_journal
+    queue_journal.close()
+    
+    # Stop the executor threads
+    from seerr.executors import executors
+    executors.shutdown()
 
 # Add helper functions for delayed task execution
 async def delayed_populate_queues():
@@ -452,6 +467,9 @@ async def get_status():
     # Check library refresh status for current cycle
     from seerr.background_tasks import library_refreshed_for_current_cycle
     
+    # Page-load time and browser memory, to measure the lightweight Chrome profile
+    from seerr.browser_profile import get_browser_performance_stats
+    
     # Prepare status data
     status_data = {
         "status": "running",
@@ -462,6 +480,7 @@ async def get_status():
         "current_time": datetime.now().isoformat(),
         "queue_status": queue_status,
         "browser_status": browser_status,
+        "browser_performance": get_browser_performance_stats(),
         "automatic_processing": ENABLE_AUTOMATIC_BACKGROUND_TASK,
         "show_subscription": ENABLE_SHOW_SUBSCRIPTION_TASK,
         "refresh_interval_minutes": REFRESH_INTERVAL_MINUTES,
@@ -516,7 +535,7 @@ async def jellyseer_webhook(request: Request, background_tasks: BackgroundTasks)
             raise HTTPException(status_code=400, detail="TMDB ID is missing in the payload")
 
         # Fetch media details from Trakt
-        media_details = get_media_details_from_trakt(tmdb_id, media_type)
+        media_details = await run_io(get_media_details_from_trakt, tmdb_id, media_type)
         if not media_details:
             logger.error(f"Failed to fetch {media_type} details from Trakt")
             raise HTTPException(status_code=500, detail=f"Failed to fetch {media_type} details from Trakt")
@@ -560,7 +579,7 @@ async def jellyseer_webhook(request: Request, background_tasks: BackgroundTasks)
         if media_type == 'movie':
             success = await add_movie_to_queue(
                 imdb_id, media_title, media_type, payload.extra, 
-                media_id, payload.media.tmdbId, request_id
+                media_id, payload.media.tmdbId, request_id, priority=PRIORITY_WEBHOOK
             )
             if success:
                 # Start tracking media processing in database
@@ -572,7 +591,7 @@ async def jellyseer_webhook(request: Request, background_tasks: BackgroundTasks)
                     image_data = None
                     try:
                         from seerr.unified_media_manager import fetch_and_cache_images_if_needed
-                        image_data = fetch_and_cache_images_if_needed(
+                        image_data = await run_io(fetch_and_cache_images_if_needed,
                             tmdb_id=int(payload.media.tmdbId),
                             title=media_details['title'],
                             media_type=media_type,
@@ -582,7 +601,7 @@ async def jellyseer_webhook(request: Request, background_tasks: BackgroundTasks)
                         logger.error(f"Error processing images for {media_title}: {e}")
                     
                     # Start tracking media processing
-                    processed_media_id = start_media_processing(
+                    processed_media_id = await run_io(start_media_processing,
                         tmdb_id=int(payload.media.tmdbId),
                         imdb_id=imdb_id,
                         trakt_id=media_details.get('trakt_id'),
@@ -614,7 +633,7 @@ async def jellyseer_webhook(request: Request, background_tasks: BackgroundTasks)
         else:  # TV show
             success = await add_tv_to_queue(
                 imdb_id, media_title, media_type, payload.extra,
-                media_id, payload.media.tmdbId, request_id
+                media_id, payload.media.tmdbId, request_id, priority=PRIORITY_WEBHOOK
             )
             if success:
                 # Start tracking media processing in database for TV shows
@@ -626,7 +645,7 @@ async def jellyseer_webhook(request: Request, background_tasks: BackgroundTasks)
                     image_data = None
                     try:
                         from seerr.unified_media_manager import fetch_and_cache_images_if_needed
-                        image_data = fetch_and_cache_images_if_needed(
+                        image_data = await run_io(fetch_and_cache_images_if_needed,
                             tmdb_id=int(payload.media.tmdbId),
                             title=media_details['title'],
                             media_type=media_type,
@@ -638,7 +657,7 @@ async def jellyseer_webhook(request: Request, background_tasks: BackgroundTasks)
                     # Use the requested seasons we extracted earlier
                     
                     # Start tracking media processing
-                    processed_media_id = start_media_processing(
+                    processed_media_id = await run_io(start_media_processing,
                         tmdb_id=int(payload.media.tmdbId),
                         imdb_id=imdb_id,
                         trakt_id=media_details.get('trakt_id'),
@@ -1001,7 +1020,7 @@ async def retrigger_media(media_id: int):
         if needs_trakt_data:
             logger.info(f"Critical data missing for media ID {media_id}, fetching from Trakt")
             # Get media details from Trakt
-            media_details = get_media_details_from_trakt(media_record.tmdb_id, media_record.media_type)
+            media_details = await run_io(get_media_details_from_trakt, media_record.tmdb_id, media_record.media_type)
             if not media_details:
                 raise HTTPException(status_code=500, detail=f"Failed to fetch {media_record.media_type} details from Trakt")
             
@@ -1105,7 +1124,7 @@ async def retrigger_media(media_id: int):
             image_data = None
             try:
                 from seerr.unified_media_manager import fetch_and_cache_images_if_needed
-                image_data = fetch_and_cache_images_if_needed(
+                image_data = await run_io(fetch_and_cache_images_if_needed,
                     tmdb_id=media_record.tmdb_id,
                     title=media_details['title'],
                     media_type=media_record.media_type,
@@ -1119,12 +1138,14 @@ async def retrigger_media(media_id: int):
         if media_record.media_type == 'movie':
             success = await add_movie_to_queue(
                 imdb_id, media_title, media_record.media_type, media_record.extra_data or {}, 
-                media_record.overseerr_media_id or 0, media_record.tmdb_id, media_record.overseerr_request_id
+                media_record.overseerr_media_id or 0, media_record.tmdb_id, media_record.overseerr_request_id,
+                priority=PRIORITY_WEBHOOK  # User-initiated retrigger
             )
         else:  # TV show
             success = await add_tv_to_queue(
                 imdb_id, media_title, media_record.media_type, media_record.extra_data or {},
-                media_record.overseerr_media_id or 0, media_record.tmdb_id, media_record.overseerr_request_id
+                media_record.overseerr_media_id or 0, media_record.tmdb_id, media_record.overseerr_request_id,
+                priority=PRIORITY_WEBHOOK  # User-initiated retrigger
             )
         
         if not success:
@@ -1200,7 +1221,7 @@ async def retrigger_media_bulk(request: Request):
                 
                 if needs_trakt_data:
                     logger.info(f"Critical data missing for media ID {media_id}, fetching from Trakt")
-                    media_details = get_media_details_from_trakt(media_record.tmdb_id, media_record.media_type)
+                    media_details = await run_io(get_media_details_from_trakt, media_record.tmdb_id, media_record.media_type)
                     if not media_details:
                         raise Exception(f"Failed to fetch {media_record.media_type} details from Trakt")
                     
@@ -1289,7 +1310,7 @@ async def retrigger_media_bulk(request: Request):
                 if media_details:
                     try:
                         from seerr.unified_media_manager import fetch_and_cache_images_if_needed
-                        fetch_and_cache_images_if_needed(
+                        await run_io(fetch_and_cache_images_if_needed,
                             tmdb_id=media_record.tmdb_id,
                             title=media_details['title'],
                             media_type=media_record.media_type,
@@ -1303,12 +1324,14 @@ async def retrigger_media_bulk(request: Request):
                 if media_record.media_type == 'movie':
                     success = await add_movie_to_queue(
                         imdb_id, media_title, media_record.media_type, media_record.extra_data or {},
-                        media_record.overseerr_media_id or 0, media_record.tmdb_id, media_record.overseerr_request_id
+                        media_record.overseerr_media_id or 0, media_record.tmdb_id, media_record.overseerr_request_id,
+                        priority=PRIORITY_WEBHOOK  # User-initiated retrigger
                     )
                 else:
                     success = await add_tv_to_queue(
                         imdb_id, media_title, media_record.media_type, media_record.extra_data or {},
-                        media_record.overseerr_media_id or 0, media_record.tmdb_id, media_record.overseerr_request_id
+                        media_record.overseerr_media_id or 0, media_record.tmdb_id, media_record.overseerr_request_id,
+                        priority=PRIORITY_WEBHOOK  # User-initiated retrigger
                     )
                 
                 if not success:
@@ -1362,8 +1385,8 @@ async def refresh_library_stats_endpoint():
                 "queue_status": queue_status
             }
         
-        # For manual refresh, call refresh_library_stats directly
-        success = refresh_library_stats()
+        # For manual refresh, call refresh_library_stats on the primary browser's thread
+        success = await run_in_browser(0, refresh_library_stats)
         
         if success:
             # Get updated stats
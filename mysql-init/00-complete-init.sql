@@ -191,6 +191,36 @@ CREATE TABLE IF NOT EXISTS overseerr_media_cache (
     INDEX idx_last_request_updated_at (last_request_updated_at)
 );
 
+-- Create translation_cache table so each title is sent to the translator at most once
+CREATE TABLE IF NOT EXISTS translation_cache (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    source_hash CHAR(64) NOT NULL UNIQUE,
+    source_text VARCHAR(500) NOT NULL,
+    target_lang VARCHAR(10) NOT NULL,
+    translated_text VARCHAR(500) NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    expires_at DATETIME NOT NULL,
+    INDEX idx_expires_at (expires_at)
+);
+
+-- Create trakt_cache table so Trakt metadata is fetched again only when it expires or changed
+CREATE TABLE IF NOT EXISTS trakt_cache (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    cache_key CHAR(64) NOT NULL UNIQUE,
+    endpoint VARCHAR(100) NOT NULL,
+    item_id VARCHAR(100) NOT NULL,
+    extended VARCHAR(50) NOT NULL DEFAULT '',
+    data_class VARCHAR(20) NOT NULL,
+    status_code INT NOT NULL,
+    payload JSON,
+    etag VARCHAR(200),
+    last_modified VARCHAR(100),
+    fetched_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    expires_at DATETIME NOT NULL,
+    INDEX idx_data_class (data_class),
+    INDEX idx_expires_at (expires_at)
+);
+
 -- Create service_status table for real-time status updates
 CREATE TABLE IF NOT EXISTS service_status (
     id INT AUTO_INCREMENT PRIMARY KEY,
@@ -604,6 +634,16 @@ VALUES
     -- Additional Task Configuration
     ('movie_queue_maxsize', '250', 'int', 'Maximum size of movie processing queue', TRUE),
     ('tv_queue_maxsize', '250', 'int', 'Maximum size of TV show processing queue', TRUE),
+    ('queue_enqueue_timeout_seconds', '60', 'int', 'Seconds a new request waits for room in a full queue before it is rejected', TRUE),
+    ('movie_item_timeout_seconds', '900', 'int', 'Hard deadline in seconds for processing one movie request', TRUE),
+    ('tv_item_timeout_seconds', '3600', 'int', 'Hard deadline in seconds for processing one TV show request', TRUE),
+    ('item_timeout_max_retries', '2', 'int', 'Times a timed-out request is requeued before it is marked as failed', TRUE),
+    ('browser_pool_size', '1', 'int', 'Number of parallel browser sessions used to process the queues', TRUE),
+    ('http_search_client_enabled', 'true', 'bool', 'Check the Real-Debrid library over HTTP before searching DMM in the browser', TRUE),
+    ('translation_cache_ttl_days', '90', 'int', 'Days a stored title translation is reused before it is translated again', TRUE),
+    ('browser_performance_profile_enabled', 'true', 'bool', 'Start browsers with a persistent profile that skips images, fonts, media and analytics', TRUE),
+    ('trakt_cache_enabled', 'true', 'bool', 'Reuse stored Trakt metadata until it expires, revalidating it with conditional requests', TRUE),
+    ('movie_queue_share', '0.5', 'float', 'Share of dispatches movies may take while TV requests are waiting (0.1-0.9)', TRUE),
     ('token_refresh_interval_minutes', '10', 'int', 'Interval in minutes for token refresh', TRUE),
     ('movie_processing_check_interval_minutes', '15', 'int', 'Interval in minutes for movie processing checks', TRUE),
     ('library_refresh_interval_minutes', '30', 'int', 'Interval in minutes for library refresh when queues are empty', TRUE),
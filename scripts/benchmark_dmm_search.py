@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark for the two ways SeerrBridge confirms RD (100%) torrents
+Compares seconds per title of the Real-Debrid HTTP client with the Selenium DMM page scraper
+using recorded fixtures, so both paths see exactly the same data
+
+Usage:
+    # Record fixtures (needs working RD/DMM credentials in .env)
+    python scripts/benchmark_dmm_search.py record --fixtures data/benchmark/dmm_search titles.json
+
+    # Replay the fixtures against both paths
+    python scripts/benchmark_dmm_search.py replay --fixtures data/benchmark/dmm_search
+
+titles.json is a list of {"imdb_id": "tt0113277", "title": "Heat (1995)"} objects (movies).
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def record_fixtures(fixtures_dir, titles_file):
+    """
+    Save the Real-Debrid library listing and a static copy of each DMM movie page
+
+    Args:
+        fixtures_dir: Directory the fixtures are written to
+        titles_file: JSON file with the titles to record
+    """
+    from seerr.config import load_config
+    from seerr.browser import create_browser_session
+    from seerr.debrid_search_client import debrid_search_client
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
+
+    load_config()
+    os.makedirs(fixtures_dir, exist_ok=True)
+    with open(titles_file) as f:
+        titles = json.load(f)
+
+    started = time.time()
+    library = debrid_search_client.get_cached_torrents(force_refresh=True)
+    library_seconds = time.time() - started
+    with open(os.path.join(fixtures_dir, 'library.json'), 'w') as f:
+        json.dump({"fetch_seconds": library_seconds, "torrents": library}, f)
+    print(f"Recorded {len(library)} cached torrents ({library_seconds:.2f}s)")
+
+    driver = create_browser_session()
+    if driver is None:
+        print("Could not start a logged-in browser session")
+        sys.exit(1)
+    try:
+        for entry in titles:
+            page_started = time.time()
+            driver.get(f"https://debridmediamanager.com/movie/{entry['imdb_id']}")
+            try:
+                WebDriverWait(driver, 30).until(
+                    EC.presence_of_element_located(
+                        (By.XPATH, "//div[@role='status' and contains(@aria-live, 'polite') and contains(text(), 'available torrents in RD')]")
+                    )
+                )
+            except TimeoutException:
+                print(f"  {entry['imdb_id']}: RD status message did not appear, saving page as is")
+            entry['page_load_seconds'] = time.time() - page_started
+            # Scripts are stripped so the replayed page keeps the recorded DOM
+            html = re.sub(r'<script\b[^>]*>.*?</script>', '', driver.page_source, flags=re.S | re.I)
+            with open(os.path.join(fixtures_dir, f"{entry['imdb_id']}.html"), 'w', encoding='utf-8') as f:
+                f.write(html)
+            print(f"  {entry['imdb_id']} {entry['title']}: {entry['page_load_seconds']:.2f}s")
+    finally:
+        driver.quit()
+
+    with open(os.path.join(fixtures_dir, 'titles.json'), 'w') as f:
+        json.dump(titles, f, indent=2)
+
+
+def create_replay_driver():
+    """Start a plain headless Chrome for replaying saved pages (no DMM login needed)"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    if os.path.exists('/.dockerenv'):
+        options.binary_location = "/usr/bin/google-chrome"
+    return webdriver.Chrome(options=options)
+
+
+def replay_fixtures(fixtures_dir):
+    """
+    Time both confirmation paths on the recorded fixtures and print seconds per title
+
+    Args:
+        fixtures_dir: Directory written by record_fixtures
+    """
+    from seerr.browser import check_red_buttons
+    from seerr.debrid_search_client import debrid_search_client
+
+    with open(os.path.join(fixtures_dir, 'titles.json')) as f:
+        titles = json.load(f)
+    with open(os.path.join(fixtures_dir, 'library.json')) as f:
+        library = json.load(f)
+
+    debrid_search_client.load_library(library['torrents'])
+    driver = create_replay_driver()
+
+    http_times, selenium_times, disagreements = [], [], []
+    try:
+        for entry in titles:
+            started = time.time()
+            cached = debrid_search_client.find_cached(entry['title'], [], False)
+            http_times.append(time.time() - started)
+            http_found = bool(cached and cached[0])
+
+            started = time.time()
+            driver.get("file://" + os.path.abspath(os.path.join(fixtures_dir, f"{entry['imdb_id']}.html")))
+            selenium_found, _ = check_red_buttons(driver, entry['title'], [], set(), False)
+            # The recorded page load is part of the browser path's cost per title
+            selenium_times.append(time.time() - started + entry.get('page_load_seconds', 0))
+
+            if http_found != selenium_found:
+                disagreements.append(entry['title'])
+            print(f"{entry['title'][:48]:<48} http {http_times[-1]:7.3f}s ({http_found!s:<5})  "
+                  f"selenium {selenium_times[-1]:7.3f}s ({selenium_found!s:<5})")
+    finally:
+        driver.quit()
+
+    amortized_fetch = library.get('fetch_seconds', 0) / max(1, len(titles))
+    print()
+    print(f"Titles: {len(titles)}")
+    print(f"HTTP client:  mean {statistics.mean(http_times) + amortized_fetch:.3f}s/title "
+          f"(match {statistics.mean(http_times):.3f}s + library fetch {amortized_fetch:.3f}s amortized)")
+    print(f"Selenium:     mean {statistics.mean(selenium_times):.3f}s/title "
+          f"(median {statistics.median(selenium_times):.3f}s)")
+    if disagreements:
+        print(f"Paths disagree on {len(disagreements)} title(s): {', '.join(disagreements)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark RD (100%) confirmation over HTTP vs Selenium")
+    parser.add_argument('mode', choices=['record', 'replay'])
+    parser.add_argument('titles', nargs='?', help="JSON list of titles to record (record mode)")
+    parser.add_argument('--fixtures', default=os.path.join('data', 'benchmark', 'dmm_search'),
+                        help="Fixture directory")
+    args = parser.parse_args()
+
+    if args.mode == 'record':
+        if not args.titles:
+            parser.error("record mode needs a titles file")
+        record_fixtures(args.fixtures, args.titles)
+    else:
+        replay_fixtures(args.fixtures)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+
+"""
+Microbenchmark for the torrent-title parsing helpers in seerr/utils.py
+Times extract_main_title, extract_year, match_single_season and parse_release_name over a
+corpus of release names, cold (caches cleared) and warm (memoized), and optionally against
+the implementation at an older git revision
+
+Usage:
+    python scripts/benchmark_title_parser.py
+    python scripts/benchmark_title_parser.py --corpus names.txt --passes 20 --baseline <commit>
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Release names in the formats DMM returns (scene, P2P, season packs, episodes, non-English)
+CORPUS = (
+    "The.Matrix.1999.1080p.BluRay.x264-SPARKS",
+    "The.Matrix.1999.REMASTERED.2160p.UHD.BluRay.REMUX.HDR.HEVC.Atmos-FGT",
+    "Heat.1995.Directors.Definitive.Edition.1080p.BluRay.x265-RARBG",
+    "1917.2019.2160p.UHD.BluRay.x265.10bit.HDR.DTS-HD.MA.5.1-SWTYBLZ",
+    "Blade.Runner.2049.2017.1080p.BluRay.x264.DTS-HD.MA.7.1-FGT",
+    "Wonder.Woman.1984.2020.1080p.WEBRip.x264-RARBG",
+    "Dune.Part.Two.2024.1080p.WEB-DL.DDP5.1.Atmos.H.264-FLUX",
+    "Oppenheimer (2023) [2160p] [4K] [WEB] [5.1] [YTS.MX]",
+    "Spirited.Away.2001.JAPANESE.1080p.BluRay.x264.DTS-FGT",
+    "Parasite.2019.KOREAN.2160p.BluRay.REMUX.HEVC.DTS-HD.MA.5.1-FGT",
+    "Amelie.2001.FRENCH.720p.BluRay.x264-CiNEFiLE",
+    "Up.2009.PROPER.1080p.BluRay.x264-METiS",
+    "Alien.1979.Directors.Cut.1080p.BluRay.x264-AMIABLE",
+    "Se7en.1995.REMASTERED.1080p.BluRay.x265-RARBG",
+    "The.Lord.of.the.Rings.The.Fellowship.of.the.Ring.2001.EXTENDED.2160p.UHD.BluRay.x265-TERMiNAL",
+    "Breaking.Bad.S01-S05.COMPLETE.1080p.BluRay.x265-RARBG",
+    "Breaking.Bad.S05E14.Ozymandias.1080p.WEB-DL.DD5.1.H.264-BS",
+    "Breaking Bad Season 1-5 Complete 720p BluRay x264",
+    "Better.Call.Saul.S06.COMPLETE.1080p.AMZN.WEB-DL.DDP5.1.H.264-NTb",
+    "The.Office.US.S01-S09.1080p.BluRay.x265-RARBG",
+    "The.Office.US.S03E05.720p.WEB-DL.DD5.1.H.264-NTb",
+    "Friends.1994-2004.Complete.Series.1080p.BluRay.x264",
+    "Friends.S01.1080p.BluRay.x265-RARBG",
+    "Game.of.Thrones.S08E06.The.Iron.Throne.2160p.HMAX.WEB-DL.DDP5.1.Atmos.HDR.HEVC-MZABI",
+    "Game of Thrones Season 8 Complete 1080p WEB-DL",
+    "Daredevil.Born.Again.S01E01E02.1080p.WEB.h264-ETHEL",
+    "Daredevil.Born.Again.S01.1080p.DSNP.WEB-DL.DDP5.1.H.264-FLUX",
+    "Severance.S02E10.Cold.Harbor.2160p.ATVP.WEB-DL.DDP5.1.Atmos.DV.HDR.H.265-FLUX",
+    "Severance.S01.COMPLETE.720p.ATVP.WEBRip.x264-GalaxyTV",
+    "Shogun.2024.S01E01.Anjin.1080p.DSNP.WEB-DL.DDP5.1.H.264-NTb",
+    "Shogun.2024.S01.1080p.WEBRip.x265-KONTRAST",
+    "The.Last.of.Us.S02E03.1080p.WEB.h264-ETHEL",
+    "Sons.of.Anarchy.S01-07.Complete.1080p.BluRay.x264",
+    "Sons.of.Anarchy.S07.1080p.BluRay.x264-ROVERS",
+    "La.Casa.de.Papel.Temporada.2.Completa.720p.WEB-DL",
+    "Dark.S03.GERMAN.1080p.NF.WEB-DL.DDP5.1.x264-TVS",
+    "Naruto.Shippuden.S01-S21.1080p.BluRay.x265",
+    "One.Piece.S01E1071.1080p.CR.WEB-DL.AAC2.0.H.264-VARYG",
+    "Doctor.Who.2005.S13E08.The.Vanquishers.1080p.AMZN.WEB-DL.DDP5.1.H.264-NTb",
+    "Star.Trek.The.Next.Generation.S01-S07.COMPLETE.720p.BluRay.x264",
+    "Stranger.Things.S04.Volume.2.1080p.NF.WEB-DL.DDP5.1.Atmos.x264-TEPES",
+    "True.Detective.S04E06.Night.Country.Part.6.2160p.MAX.WEB-DL.DDP5.1.Atmos.DV.HDR.H.265-FLUX",
+    "The Bear S03 1080p WEBRip x265-KONTRAST",
+    "Fallout.2024.S01.COMPLETE.2160p.AMZN.WEB-DL.DDP5.1.HDR.H.265-NTb",
+    "House.of.the.Dragon.S02E08.1080p.WEB.H264-SuccessfulCrab",
+    "Arcane.S02.1080p.NF.WEB-DL.DDP5.1.Atmos.H.264-FLUX",
+    "Chernobyl.2019.Complete.Miniseries.1080p.BluRay.x264",
+    "Band.of.Brothers.2001.Complete.720p.BluRay.x264",
+)
+
+SEASONS = ("Season 1", "Season 2", "Season 5", "Season 8")
+
+
+def load_corpus(path):
+    """Read one release name per line, or use the built-in corpus"""
+    if not path:
+        return list(CORPUS)
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def load_baseline(ref):
+    """Load seerr/utils.py as it was at a git revision, for comparing against the old code"""
+    source = subprocess.check_output(['git', 'show', f'{ref}:seerr/utils.py'], text=True)
+    module = types.ModuleType('baseline_utils')
+    exec(compile(source, f'{ref}:seerr/utils.py', 'exec'), module.__dict__)
+    return module
+
+
+def time_calls(calls, passes):
+    """Run every call `passes` times and return microseconds per call"""
+    started = time.perf_counter()
+    for _ in range(passes):
+        for func, args in calls:
+            func(*args)
+    return (time.perf_counter() - started) / (passes * len(calls)) * 1e6
+
+
+def build_calls(module, corpus):
+    """The calls a search makes for each title, for the given utils module"""
+    calls = []
+    for name in corpus:
+        calls.append((module.extract_main_title, (name,)))
+        calls.append((module.extract_year, (name, None, True)))
+        calls.extend((module.match_single_season, (name, season)) for season in SEASONS)
+        if hasattr(module, 'parse_release_name'):
+            calls.append((module.parse_release_name, (name,)))
+    return calls
+
+
+def clear_caches(module):
+    """Clear every lru_cache in a utils module"""
+    for value in vars(module).values():
+        if hasattr(value, 'cache_clear'):
+            value.cache_clear()
+
+
+def run(corpus, passes, baseline_ref=None):
+    from loguru import logger
+    import seerr.utils as utils
+
+    # match_single_season logs every match; keep the benchmark about parsing
+    logger.remove()
+
+    calls = build_calls(utils, corpus)
+    print(f"Corpus: {len(corpus)} release names, {len(calls)} calls per pass, {passes} passes")
+
+    cold = []
+    for _ in range(passes):
+        clear_caches(utils)
+        cold.append(time_calls(calls, 1))
+    print(f"current, cold cache:  {sum(cold) / len(cold):8.2f} us/call")
+
+    clear_caches(utils)
+    time_calls(calls, 1)
+    warm = time_calls(calls, passes)
+    print(f"current, warm cache:  {warm:8.2f} us/call")
+
+    if baseline_ref:
+        baseline = load_baseline(baseline_ref)
+        baseline_calls = build_calls(baseline, corpus)
+        old = time_calls(baseline_calls, passes)
+        print(f"{baseline_ref}:  {old:8.2f} us/call "
+              f"(speedup cold {old / (sum(cold) / len(cold)):.1f}x, warm {old / warm:.1f}x)")
+
+    for func_name, info in utils.get_title_parser_cache_stats().items():
+        print(f"  {func_name}: {info}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark torrent-title parsing")
+    parser.add_argument('--corpus', help="File with one release name per line")
+    parser.add_argument('--passes', type=int, default=10)
+    parser.add_argument('--baseline', help="Git revision to compare against, e.g. HEAD~1")
+    args = parser.parse_args()
+    run(load_corpus(args.corpus), args.passes, args.baseline)
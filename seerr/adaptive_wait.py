@@ -0,0 +1,317 @@
+"""
+Adaptive wait module for SeerrBridge
+Replaces fixed sleeps in the DMM browser automation with waits that end as soon as the page
+reaches the expected state, records how long each wait took and sizes its timeout from the
+observed p95 instead of a hardcoded worst case
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Optional
+
+from loguru import logger
+
+# Recent durations kept per named wait for the budget and percentile reporting
+WAIT_SAMPLE_SIZE = 200
+
+# Until a wait has this many samples its timeout is the old fixed sleep
+MIN_SAMPLES_FOR_BUDGET = 10
+
+# Timeout = observed p95 * headroom, never below the minimum nor above the old fixed sleep
+BUDGET_HEADROOM = 1.5
+MIN_BUDGET_SECONDS = 0.5
+
+POLL_INTERVAL_SECONDS = 0.1
+
+# No resource finished loading for this long counts as network idle
+NETWORK_IDLE_MS = 500
+
+# Result count unchanged for this long counts as settled
+RESULTS_QUIET_SECONDS = 0.75
+
+# The DMM filter box re-renders the (already loaded) results client-side, so a short quiet period will do
+FILTER_QUIET_SECONDS = 0.3
+
+# Milliseconds since the last resource finished loading, or -1 while the document is loading.
+# The timing buffer is cleared as it fills (it stops recording at 250 entries by default), so
+# the latest responseEnd is kept on window.
+NETWORK_QUIET_SCRIPT = """
+if (document.readyState !== 'complete') {
+    return -1;
+}
+const entries = performance.getEntriesByType('resource');
+let last = window.__seerrLastResponseEnd || 0;
+for (const entry of entries) {
+    if (entry.responseEnd > last) {
+        last = entry.responseEnd;
+    }
+}
+window.__seerrLastResponseEnd = last;
+if (entries.length > 200) {
+    performance.clearResourceTimings();
+}
+return performance.now() - last;
+"""
+
+LOADING_INDICATOR_XPATH = "//*[contains(@class, 'loading') or contains(@class, 'spinner') or contains(text(), 'Loading')]"
+
+Condition = Callable[[Any], bool]
+
+
+class WaitStats:
+    """Durations of one named wait"""
+
+    def __init__(self):
+        self.count = 0
+        self.timeouts = 0
+        self.waited_seconds = 0.0
+        self.saved_seconds = 0.0
+        self.samples: Deque[float] = deque(maxlen=WAIT_SAMPLE_SIZE)
+
+    def observe(self, elapsed: float, baseline: float, satisfied: bool):
+        self.count += 1
+        if not satisfied:
+            self.timeouts += 1
+        self.waited_seconds += elapsed
+        self.saved_seconds += baseline - elapsed
+        # Timed-out waits are kept at their budget, so a budget that is too tight pushes
+        # the p95 (and the next budget) up until waits stop timing out
+        self.samples.append(elapsed)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        samples = sorted(self.samples)
+        return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        p50 = self.percentile(0.5)
+        p95 = self.percentile(0.95)
+        return {
+            "count": self.count,
+            "timeouts": self.timeouts,
+            "avg_seconds": round(self.waited_seconds / self.count, 2) if self.count else None,
+            "p50_seconds": round(p50, 2) if p50 is not None else None,
+            "p95_seconds": round(p95, 2) if p95 is not None else None,
+            "saved_seconds": round(self.saved_seconds, 1)
+        }
+
+
+class AdaptiveWaits:
+    """
+    Named waits on page-state conditions with timeouts learned from past waits.
+
+    Each call site names its wait and passes the fixed sleep it replaces as the baseline.
+    The wait returns as soon as its condition holds; if it never does, it gives up after the
+    budget (the baseline at first, then p95 * headroom once there are enough samples) and the
+    caller carries on exactly as it did after the old sleep. Time saved against the baselines
+    is accumulated per title while track_title() is active.
+    """
+
+    def __init__(self):
+        self.waits: Dict[str, WaitStats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.titles = 0
+        self.title_saved_seconds = 0.0
+        self.recent_titles: Deque[Dict[str, Any]] = deque(maxlen=20)
+
+    def budget(self, name: str, baseline_seconds: float) -> float:
+        """
+        Timeout for the next wait of a kind.
+
+        Args:
+            name (str): Name of the wait
+            baseline_seconds (float): The fixed sleep the wait replaces
+
+        Returns:
+            float: Seconds to wait at most
+        """
+        stats = self.waits.get(name)
+        if stats is None or len(stats.samples) < MIN_SAMPLES_FOR_BUDGET:
+            return baseline_seconds
+        learned = stats.percentile(0.95) * BUDGET_HEADROOM
+        return min(baseline_seconds, max(MIN_BUDGET_SECONDS, learned))
+
+    def wait(self, driver, name: str, condition: Condition, baseline_seconds: float) -> bool:
+        """
+        Wait until a condition holds on the page, for at most the learned budget.
+
+        Args:
+            driver: Selenium WebDriver instance
+            name (str): Name of the wait, e.g. "library_page"
+            condition (callable): Takes the driver and returns True once the page is ready;
+                exceptions count as not ready
+            baseline_seconds (float): The fixed sleep the wait replaces
+
+        Returns:
+            bool: True if the condition was met, False if the budget ran out
+        """
+        budget = self.budget(name, baseline_seconds)
+        started = time.monotonic()
+        deadline = started + budget
+        satisfied = False
+        while True:
+            try:
+                satisfied = bool(condition(driver))
+            except Exception:
+                satisfied = False
+            if satisfied or time.monotonic() >= deadline:
+                break
+            time.sleep(POLL_INTERVAL_SECONDS)
+        elapsed = time.monotonic() - started
+
+        with self._lock:
+            stats = self.waits.setdefault(name, WaitStats())
+            stats.observe(elapsed, baseline_seconds, satisfied)
+        title_stats = getattr(self._local, 'title_stats', None)
+        if title_stats is not None:
+            title_stats["waits"] += 1
+            title_stats["waited_seconds"] += elapsed
+            title_stats["saved_seconds"] += baseline_seconds - elapsed
+
+        if not satisfied:
+            logger.debug(f"Wait '{name}' gave up after {elapsed:.2f}s (baseline {baseline_seconds}s)")
+        return satisfied
+
+    @contextmanager
+    def track_title(self, title: str):
+        """
+        Accumulate the waits made by the current thread while processing one title, and
+        log the time they saved against the old fixed sleeps.
+
+        Args:
+            title (str): Title being processed
+        """
+        previous = getattr(self._local, 'title_stats', None)
+        title_stats = {"title": title, "waits": 0, "waited_seconds": 0.0, "saved_seconds": 0.0}
+        self._local.title_stats = title_stats
+        try:
+            yield title_stats
+        finally:
+            self._local.title_stats = previous
+            if title_stats["waits"]:
+                with self._lock:
+                    self.titles += 1
+                    self.title_saved_seconds += title_stats["saved_seconds"]
+                    self.recent_titles.append({
+                        "title": title,
+                        "waits": title_stats["waits"],
+                        "waited_seconds": round(title_stats["waited_seconds"], 1),
+                        "saved_seconds": round(title_stats["saved_seconds"], 1)
+                    })
+                logger.info(f"Page waits for '{title}': {title_stats['waits']} wait(s), "
+                            f"{title_stats['waited_seconds']:.1f}s waited, "
+                            f"{title_stats['saved_seconds']:.1f}s saved against fixed sleeps")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-wait percentiles and time saved, for status endpoints"""
+        with self._lock:
+            waits = {}
+            for name, stats in self.waits.items():
+                waits[name] = stats.to_dict()
+                # None while the wait still uses its caller's fixed sleep
+                waits[name]["learned_budget_seconds"] = (
+                    round(self.budget(name, float('inf')), 2) if len(stats.samples) >= MIN_SAMPLES_FOR_BUDGET else None
+                )
+            return {
+                "waits": waits,
+                "titles": self.titles,
+                "avg_saved_seconds_per_title": round(self.title_saved_seconds / self.titles, 1) if self.titles else None,
+                "recent_titles": list(self.recent_titles)
+            }
+
+
+def page_loaded(driver) -> bool:
+    """The document finished loading"""
+    return driver.execute_script("return document.readyState") == 'complete'
+
+
+def network_idle(idle_ms: int = NETWORK_IDLE_MS) -> Condition:
+    """
+    The document finished loading and no resource (XHR/fetch included) finished for idle_ms.
+
+    Args:
+        idle_ms (int): Quiet period in milliseconds
+    """
+    def condition(driver) -> bool:
+        return (driver.execute_script(NETWORK_QUIET_SCRIPT) or -1) >= idle_ms
+    return condition
+
+
+def element_present(xpath: str) -> Condition:
+    """An element matching the XPath is in the page"""
+    def condition(driver) -> bool:
+        from selenium.webdriver.common.by import By
+        return bool(driver.find_elements(By.XPATH, xpath))
+    return condition
+
+
+def element_absent(xpath: str) -> Condition:
+    """No element matching the XPath is displayed"""
+    def condition(driver) -> bool:
+        from selenium.webdriver.common.by import By
+        return not any(element.is_displayed() for element in driver.find_elements(By.XPATH, xpath))
+    return condition
+
+
+def input_has_value(element, text: str) -> Condition:
+    """An input element holds the given text, i.e. typing into it has finished"""
+    def condition(driver) -> bool:
+        return (element.get_attribute('value') or '') == text
+    return condition
+
+
+def results_settled(card_xpath: str, quiet_seconds: float = RESULTS_QUIET_SECONDS,
+                    idle_ms: int = NETWORK_IDLE_MS, min_count: int = 0) -> Condition:
+    """
+    The result list stopped changing: no loading indicator, the network is idle and the
+    number of result cards stayed the same for quiet_seconds.
+
+    Args:
+        card_xpath (str): XPath selecting the result cards
+        quiet_seconds (float): How long the card count must stay unchanged
+        idle_ms (int): Network quiet period in milliseconds
+        min_count (int): Cards there must be at least, e.g. more than before a 'Show More Results' click
+    """
+    from selenium.webdriver.common.by import By
+
+    state = {"count": None, "since": time.monotonic()}
+    idle = network_idle(idle_ms)
+
+    def condition(driver) -> bool:
+        count = len(driver.find_elements(By.XPATH, card_xpath))
+        now = time.monotonic()
+        if count != state["count"]:
+            state["count"] = count
+            state["since"] = now
+            return False
+        if count < min_count or now - state["since"] < quiet_seconds:
+            return False
+        return not driver.find_elements(By.XPATH, LOADING_INDICATOR_XPATH) and idle(driver)
+    return condition
+
+
+def filter_applied(element, text: str, card_xpath: str) -> Condition:
+    """
+    Text typed into the DMM filter box has been applied to the result list.
+
+    Args:
+        element: The filter input
+        text (str): Text typed into it
+        card_xpath (str): XPath selecting the result cards
+    """
+    return all_of(input_has_value(element, text),
+                  results_settled(card_xpath, quiet_seconds=FILTER_QUIET_SECONDS))
+
+
+def all_of(*conditions: Condition) -> Condition:
+    """Every condition holds (checked in order, stopping at the first that does not)"""
+    def condition(driver) -> bool:
+        return all(check(driver) for check in conditions)
+    return condition
+
+
+# Global instance
+adaptive_waits = AdaptiveWaits()
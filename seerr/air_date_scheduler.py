@@ -0,0 +1,199 @@
+"""
+Air date scheduler module for SeerrBridge
+Keeps the next time each subscribed show needs a look, seeded from Trakt episode air dates,
+so a subscription check only visits the shows whose next episode is due
+"""
+import heapq
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+# Trakt could not be asked: try the show again after this long
+FETCH_RETRY_SECONDS = 60 * 60
+
+# Episodes are listed but have no air date yet
+UNDATED_EPISODE_RECHECK_SECONDS = 12 * 60 * 60
+
+# Every listed episode has aired; Trakt may still add episodes to the season
+COMPLETE_SEASON_RECHECK_SECONDS = 7 * 24 * 60 * 60
+
+
+def _parse_first_aired(value: Any) -> Optional[float]:
+    """Epoch seconds of a Trakt first_aired timestamp"""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+
+def to_season_value(due_at: float) -> str:
+    """A due time as stored in seasons_data (naive UTC ISO, like last_checked)"""
+    return datetime.fromtimestamp(due_at, tz=timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def from_season_value(value: Any) -> Optional[float]:
+    """Epoch seconds of a due time stored in seasons_data"""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return None
+
+
+def next_season_check(season_data: Dict[str, Any], season_details: Optional[Dict[str, Any]],
+                      aired_episodes: int, now: float = None) -> float:
+    """
+    When a subscribed season needs to be checked again.
+
+    Args:
+        season_data (dict): The season's entry in seasons_data
+        season_details (dict, optional): The season from Trakt (get_all_seasons_from_trakt, with
+            episodes), or None if it could not be fetched
+        aired_episodes (int): Aired episodes after this check
+        now (float, optional): Current epoch seconds
+
+    Returns:
+        float: Epoch seconds at which the season is due
+    """
+    now = time.time() if now is None else now
+    if not season_details:
+        return now + FETCH_RETRY_SECONDS
+
+    # Aired episodes that are not confirmed yet (including failed ones) are retried every run
+    confirmed_episodes = season_data.get('confirmed_episodes') or []
+    if len(confirmed_episodes) < aired_episodes or season_data.get('failed_episodes'):
+        return now
+
+    upcoming = [
+        _parse_first_aired(episode.get('first_aired'))
+        for episode in season_details.get('episodes') or []
+        if isinstance(episode, dict) and isinstance(episode.get('number'), int) and episode['number'] > aired_episodes
+    ]
+    dated = [air_time for air_time in upcoming if air_time is not None]
+    if dated:
+        return max(now, min(dated))
+    if upcoming or season_details.get('episode_count', 0) > aired_episodes:
+        return now + UNDATED_EPISODE_RECHECK_SECONDS
+    return now + COMPLETE_SEASON_RECHECK_SECONDS
+
+
+class AirDateScheduler:
+    """
+    Min-heap of subscribed shows by the time they are next due.
+
+    Each check stores the due time of every season in seasons_data (next_check_at): the next
+    episode's air date, right away while aired episodes still wait for confirmation, or a
+    slow recheck for finished or undated seasons. A show is due at its earliest season. The
+    heap is filled from seasons_data once per process, so a restart keeps the schedule, and
+    shows that are not in it yet (new subscriptions) are due immediately.
+
+    The heap uses lazy deletion: rescheduling pushes a new entry and older entries of the
+    same show are skipped when they surface.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int]] = []
+        self._due_at: Dict[int, float] = {}
+        self._lock = threading.Lock()
+        self.seeded = False
+
+        # Counters reported by get_stats()
+        self.runs = 0
+        self.shows_checked = 0
+        self.shows_skipped = 0
+
+    def seed(self, shows: Iterable[Tuple[int, Any]]):
+        """
+        Fill the heap from stored seasons_data.
+
+        Args:
+            shows: (media id, seasons_data) of every subscribed show
+        """
+        now = time.time()
+        count = 0
+        for media_id, seasons_data in shows:
+            due_times = [
+                from_season_value(season.get('next_check_at'))
+                for season in seasons_data or [] if isinstance(season, dict)
+            ]
+            # A season that was never scheduled is due now
+            due = min((due_at if due_at is not None else now for due_at in due_times), default=now)
+            self.schedule(media_id, due)
+            count += 1
+        self.seeded = True
+        logger.info(f"Air date scheduler seeded with {count} subscribed show(s)")
+
+    def schedule(self, media_id: int, due_at: float):
+        """Set when a show is next due, replacing its previous time"""
+        with self._lock:
+            self._due_at[media_id] = due_at
+            heapq.heappush(self._heap, (due_at, media_id))
+
+    def forget(self, media_id: int):
+        """Stop tracking a show; it is due again as soon as it is seen untracked"""
+        with self._lock:
+            self._due_at.pop(media_id, None)
+
+    def pop_due(self, subscribed_ids: Iterable[int], now: float = None) -> List[int]:
+        """
+        Take the shows that are due.
+
+        Args:
+            subscribed_ids: Media ids of every current subscription; ids the scheduler does not
+                track are due, tracked ids that are no longer subscribed are dropped
+            now (float, optional): Current epoch seconds
+
+        Returns:
+            list: Media ids to check, earliest due first
+        """
+        now = time.time() if now is None else now
+        subscribed = set(subscribed_ids)
+        due: List[int] = []
+        with self._lock:
+            for media_id in [media_id for media_id in self._due_at if media_id not in subscribed]:
+                del self._due_at[media_id]
+            while self._heap and self._heap[0][0] <= now:
+                due_at, media_id = heapq.heappop(self._heap)
+                # Skip entries superseded by a later schedule() or dropped by forget()
+                if self._due_at.get(media_id) != due_at:
+                    continue
+                del self._due_at[media_id]
+                due.append(media_id)
+            popped = set(due)
+            untracked = [media_id for media_id in subscribed if media_id not in self._due_at and media_id not in popped]
+            # Entries of dropped shows would otherwise stay in the heap forever
+            if len(self._heap) > 2 * len(self._due_at) + 64:
+                self._heap = [(due_at, media_id) for media_id, due_at in self._due_at.items()]
+                heapq.heapify(self._heap)
+            self.runs += 1
+            self.shows_checked += len(due) + len(untracked)
+            self.shows_skipped += len(subscribed) - len(due) - len(untracked)
+        return due + sorted(untracked)
+
+    def next_due(self) -> Optional[float]:
+        """Epoch seconds at which the next show is due, or None when none is scheduled"""
+        with self._lock:
+            return min(self._due_at.values(), default=None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Schedule size and counters for status endpoints"""
+        next_due = self.next_due()
+        with self._lock:
+            return {
+                "seeded": self.seeded,
+                "scheduled_shows": len(self._due_at),
+                "next_due": to_season_value(next_due) if next_due is not None else None,
+                "runs": self.runs,
+                "shows_checked": self.shows_checked,
+                "shows_skipped": self.shows_skipped
+            }
+
+
+# Global instance
+air_date_scheduler = AirDateScheduler()
@@ -9,9 +9,10 @@ from typing import Optional
 import asyncio
 import json
 from seerr.task_config_manager import task_config
-from seerr.background_tasks import refresh_all_scheduled_tasks, refresh_queue_sizes, get_queue_status
+from seerr.background_tasks import refresh_all_scheduled_tasks, refresh_queue_sizes, get_queue_status, notify_config_changed
 from seerr.db_logger import log_info, log_error
 from seerr.env_file_manager import env_file
+from seerr.executors import run_io
 import os
 
 app = FastAPI(title="SeerrBridge API", version="0.8.0")
@@ -83,6 +84,16 @@ async def update_task_config(config_data: dict):
                 'refresh_interval_minutes',
                 'movie_queue_maxsize',
                 'tv_queue_maxsize',
+                'queue_enqueue_timeout_seconds',
+                'browser_pool_size',
+                'http_search_client_enabled',
+                'translation_cache_ttl_days',
+                'browser_performance_profile_enabled',
+                'trakt_cache_enabled',
+                'movie_item_timeout_seconds',
+                'tv_item_timeout_seconds',
+                'item_timeout_max_retries',
+                'movie_queue_share',
                 'token_refresh_interval_minutes',
                 'movie_processing_check_interval_minutes',
                 'library_refresh_interval_minutes',
@@ -95,6 +106,8 @@ async def update_task_config(config_data: dict):
             if config_key in task_config_keys:
                 # Trigger refresh in background
                 asyncio.create_task(refresh_all_scheduled_tasks())
+                # Wake the queue consumer so it picks up the change without waiting for its next check
+                notify_config_changed()
             
             return {
                 "success": True,
@@ -542,7 +555,7 @@ async def fetch_trakt_list(request_data: TraktListFetchRequest):
                     raise
         else:
             from seerr.trakt_lists import fetch_trakt_list
-            items = fetch_trakt_list(list_id, limit=limit if limit else None)
+            items = await run_io(fetch_trakt_list, list_id, limit=limit if limit else None)
         
         return {
             "success": True,
@@ -570,7 +583,7 @@ async def search_trakt_by_imdb(request_data: TraktSearchByImdbRequest):
         if not imdb_id:
             raise HTTPException(status_code=400, detail="imdb_id is required")
         
-        result = search_trakt_by_imdb_id(imdb_id)
+        result = await run_io(search_trakt_by_imdb_id, imdb_id)
         
         if result and result.get('tmdb_id'):
             return {
@@ -604,7 +617,7 @@ async def search_trakt_by_title(request_data: TraktSearchByTitleRequest):
         if not title:
             raise HTTPException(status_code=400, detail="title is required")
         
-        result = search_trakt_by_title(title, year, media_type)
+        result = await run_io(search_trakt_by_title, title, year, media_type)
         
         if result and result.get('tmdb_id'):
             return {
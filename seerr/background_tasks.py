@@ -6,7 +6,7 @@ import os
 import json
 import asyncio
 import time
-from asyncio import Queue, Semaphore
+from asyncio import Semaphore
 from typing import Tuple, Dict, List, Any, Optional
 from datetime import datetime, timezone
 from loguru import logger
@@ -21,13 +21,18 @@ from seerr.config import (
     USE_DATABASE
 )
 from seerr.task_config_manager import task_config
-from seerr.browser import driver, click_show_more_results, check_red_buttons, prioritize_buttons_in_box
+from seerr.browser import driver, click_show_more_results, check_red_buttons, prioritize_buttons_in_box, RESULT_CARD_XPATH
+from seerr.adaptive_wait import adaptive_waits, element_absent, results_settled, FILTER_QUIET_SECONDS
 from seerr.overseerr import get_overseerr_media_requests, mark_completed
-from seerr.trakt import get_media_details_from_trakt, get_season_details_from_trakt, check_next_episode_aired
+from seerr.trakt import get_media_details_from_trakt, get_season_details_from_trakt, get_all_seasons_from_trakt, check_next_episode_aired
 from seerr.utils import parse_requested_seasons, normalize_season, extract_season, clean_title
 from seerr.database import get_db, LibraryStats, QueueStatus
 from seerr.image_utils import fetch_trakt_show_images, fetch_trakt_movie_images, store_show_image, store_media_images, should_update_image
 from seerr.db_logger import log_info, log_success, log_warning, log_error, log_critical, log_debug
+from seerr.request_queue import MediaRequestQueue, request_scheduler, get_item_key, PRIORITY_SYNC, PRIORITY_RECONCILE
+from seerr.queue_journal import queue_journal
+from seerr.processing_watchdog import processing_watchdog, ItemTimeoutError, STAGE_MOVIE_SEARCH, STAGE_TV_SEARCH
+from seerr.executors import executors, run_io, run_in_browser
 
 # Load queue sizes from database configuration
 def get_queue_sizes():
@@ -38,38 +43,17 @@ def get_queue_sizes():
 
 def refresh_queue_sizes():
     """Refresh queue sizes from database configuration and sync with database"""
-    global movie_queue, tv_queue, movie_queue_maxsize, tv_queue_maxsize
+    global movie_queue_maxsize, tv_queue_maxsize
     
     new_movie_size, new_tv_size = get_queue_sizes()
     
-    # Only recreate queues if sizes have changed
+    # Resize the existing queues in place so producers keep valid references and no item is dropped
     if new_movie_size != movie_queue_maxsize or new_tv_size != tv_queue_maxsize:
         log_info("Queue Management", f"Updating queue sizes: Movie {movie_queue_maxsize}->{new_movie_size}, TV {tv_queue_maxsize}->{new_tv_size}", 
                 module="background_tasks", function="refresh_queue_sizes")
         
-        # Create new queues with updated sizes
-        old_movie_queue = movie_queue
-        old_tv_queue = tv_queue
-        
-        movie_queue = Queue(maxsize=new_movie_size)
-        tv_queue = Queue(maxsize=new_tv_size)
-        
-        # Transfer any pending items from old queues to new queues
-        # Note: This is a best-effort transfer, some items might be lost if queues are full
-        try:
-            while not old_movie_queue.empty() and not movie_queue.full():
-                item = old_movie_queue.get_nowait()
-                movie_queue.put_nowait(item)
-        except:
-            pass
-            
-        try:
-            while not old_tv_queue.empty() and not tv_queue.full():
-                item = old_tv_queue.get_nowait()
-                tv_queue.put_nowait(item)
-        except:
-            pass
-        
+        movie_queue.resize(new_movie_size)
+        tv_queue.resize(new_tv_size)
         movie_queue_maxsize = new_movie_size
         tv_queue_maxsize = new_tv_size
         
@@ -105,10 +89,21 @@ def refresh_queue_sizes():
                 log_error("Queue Management", f"Error syncing queue sizes with database: {e}", 
                          module="background_tasks", function="refresh_queue_sizes")
 
+def get_enqueue_timeout():
+    """Get how long producers wait for queue capacity before a request is rejected"""
+    try:
+        return max(0.0, float(task_config.get_config('queue_enqueue_timeout_seconds', 60)))
+    except (TypeError, ValueError):
+        return 60.0
+
 # Initialize queues for different types of requests
 movie_queue_maxsize, tv_queue_maxsize = get_queue_sizes()
-movie_queue = Queue(maxsize=movie_queue_maxsize)  # Queue for movie requests
-tv_queue = Queue(maxsize=tv_queue_maxsize)     # Queue for TV show requests 
+movie_queue = MediaRequestQueue('movie', maxsize=movie_queue_maxsize)  # Priority queue for movie requests
+tv_queue = MediaRequestQueue('tv', maxsize=tv_queue_maxsize)     # Priority queue for TV show requests
+request_scheduler.register(movie_queue)
+request_scheduler.register(tv_queue)
+movie_queue.journal = queue_journal  # Crash-safe record of queue events, replayed on startup
+tv_queue.journal = queue_journal
 processing_task = None  # To track the current processing task
 
 # Cancellation tracking system (simplified)
@@ -122,9 +117,6 @@ last_queue_activity_time = time.time()  # Track when queues were last non-empty
 # Scheduler for background tasks
 scheduler = AsyncIOScheduler()
 
-# Browser access semaphore to prevent concurrent browser access
-browser_semaphore = Semaphore(1)
-
 # Global semaphore to ensure only one scheduled task runs at a time
 scheduled_task_semaphore = Semaphore(1)
 
@@ -132,6 +124,13 @@ scheduled_task_semaphore = Semaphore(1)
 is_processing_queue = False
 queue_processing_complete = asyncio.Event()
 
+# Long-lived queue workers (one per browser session) and how many are processing an item
+queue_worker_tasks = []
+busy_worker_count = 0
+
+# While the workers are busy, check this often that none of them has stopped
+QUEUE_WORKER_CHECK_SECONDS = 60
+
 # Flag to track if library refresh has been done for current empty queue cycle
 library_refreshed_for_current_cycle = False
 
@@ -139,6 +138,15 @@ library_refreshed_for_current_cycle = False
 last_config_refresh_time = 0
 config_refresh_interval = 60  # Check for config changes every 60 seconds
 
+# Queues must be idle this long before the library stats are refreshed
+LIBRARY_REFRESH_IDLE_SECONDS = 30
+
+def notify_config_changed():
+    """Make the queue consumer re-check its configuration as soon as possible"""
+    global last_config_refresh_time
+    last_config_refresh_time = 0
+    request_scheduler.notify()
+
 async def check_config_changes():
     """Check for configuration changes and refresh if needed"""
     global last_config_refresh_time
@@ -251,6 +259,10 @@ async def initialize_background_tasks():
     # This ensures queues are properly sized before we try to add items
     refresh_queue_sizes()
     
+    # Start the browser pool so queue workers can lease sessions
+    from seerr.browser_pool import browser_pool
+    await browser_pool.initialize()
+    
     # Start the processing task BEFORE syncing queues
     # This ensures the consumer is running so items can be processed even if queue gets full
     if processing_task is None:
@@ -260,6 +272,9 @@ async def initialize_background_tasks():
     else:
         log_info("Queue Management", f"Processing task already exists: {processing_task}", module="background_tasks", function="init_background_tasks")
     
+    # Restore queued and in-flight items from the journal with their original order and attempt counts
+    queue_journal.replay(request_scheduler.queues, on_abandon=fail_abandoned_item)
+    
     # Sync queues from database on startup (after processing task is started)
     await sync_queues_from_database()
 
@@ -419,66 +434,71 @@ async def scheduled_task_wrapper():
             log_error("Scheduled Task Error", f"Error in scheduled task: {e}", module="background_tasks", function="scheduled_task")
 
 ### Function to process requests from the queues
+def get_idle_wait_timeout():
+    """
+    Get how long the idle consumer may block before it has periodic work to do.
+    
+    Returns:
+        float: Seconds until the next config check or deferred library refresh
+    """
+    now = time.time()
+    timeout = max(1, config_refresh_interval - (now - last_config_refresh_time))
+    if not library_refreshed_for_current_cycle:
+        timeout = min(timeout, max(1, LIBRARY_REFRESH_IDLE_SECONDS - (now - last_queue_activity_time)))
+    return timeout
+
 async def process_queues():
-    """Process requests from movie queue first, then TV queue."""
+    """
+    Keep the queue workers running and do the idle-time maintenance.
+    The workers take items from the movie and TV queues as soon as they are queued.
+    """
     global is_processing_queue, library_refreshed_for_current_cycle
     
     while True:
         try:
-            # Check if there are any items in either queue
-            if movie_queue.empty() and tv_queue.empty():
-                # Set processing flag to false when no items to process
-                is_processing_queue = False
-                queue_processing_complete.set()
-                
-                # Run library refresh immediately if not already done for this cycle
-                if not library_refreshed_for_current_cycle:
-                    # Check if it's safe to refresh before attempting
-                    if is_safe_to_refresh_library_stats(min_idle_seconds=30):
-                        log_info("Library Refresh", "Queues are empty. Running library refresh now.", module="background_tasks", function="scheduled_task")
-                        try:
-                            from seerr.browser import refresh_library_stats
-                            refresh_library_stats()
-                            library_refreshed_for_current_cycle = True
-                            log_info("Library Refresh", "Library refresh completed after queue completion.", module="background_tasks", function="scheduled_task")
-                        except Exception as e:
-                            log_error("Library Refresh Error", f"Error during library refresh: {e}", module="background_tasks", function="scheduled_task")
-                    else:
-                        log_info("Library Refresh", "Queues are empty but not safe to refresh yet. Skipping library refresh.", module="background_tasks", function="scheduled_task")
-                
-                # Check for configuration changes when queues are empty
-                await check_config_changes()
+            # Restart any worker that stopped
+            start_queue_workers()
+            
+            if request_scheduler.has_work() or busy_worker_count:
+                # Reset the refresh flag when queues become active again
+                if library_refreshed_for_current_cycle:
+                    log_debug("Queue Management", "Queues became active again. Reset library refresh flag for next cycle.", module="background_tasks", function="scheduled_task")
+                    library_refreshed_for_current_cycle = False
                 
-                # Wait longer when queues are empty to avoid tight loop
-                await asyncio.sleep(10)
+                # Workers set the event once both queues are drained and none is busy
+                is_processing_queue = True
+                queue_processing_complete.clear()
+                try:
+                    await asyncio.wait_for(queue_processing_complete.wait(), QUEUE_WORKER_CHECK_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
                 continue
             
-            # Reset the refresh flag when queues become active again
-            if library_refreshed_for_current_cycle:
-                log_debug("Queue Management", "Queues became active again. Reset library refresh flag for next cycle.", module="background_tasks", function="scheduled_task")
-                library_refreshed_for_current_cycle = False
-            
-            # Update activity timestamp when we have items to process
-            update_queue_activity_timestamp()
-            
-            # Set processing flag and clear completion event when we have items
-            is_processing_queue = True
-            queue_processing_complete.clear()
-            
-            # Process all movies first (if any)
-            if not movie_queue.empty():
-                await process_movie_queue()
-            
-            # Then process all TV shows (if any)
-            if not tv_queue.empty():
-                await process_tv_queue()
-            
-            # Mark processing complete after this cycle
+            # Set processing flag to false when no items to process
             is_processing_queue = False
             queue_processing_complete.set()
             
-            # Short wait before checking queues again
-            await asyncio.sleep(2)
+            # Run library refresh immediately if not already done for this cycle
+            if not library_refreshed_for_current_cycle:
+                # Check if it's safe to refresh before attempting
+                if is_safe_to_refresh_library_stats(min_idle_seconds=LIBRARY_REFRESH_IDLE_SECONDS):
+                    log_info("Library Refresh", "Queues are empty. Running library refresh now.", module="background_tasks", function="scheduled_task")
+                    try:
+                        from seerr.browser import refresh_library_stats
+                        await run_in_browser(0, refresh_library_stats)
+                        library_refreshed_for_current_cycle = True
+                        log_info("Library Refresh", "Library refresh completed after queue completion.", module="background_tasks", function="scheduled_task")
+                    except Exception as e:
+                        log_error("Library Refresh Error", f"Error during library refresh: {e}", module="background_tasks", function="scheduled_task")
+                else:
+                    log_debug("Library Refresh", "Queues are empty but not safe to refresh yet. Deferring library refresh.", module="background_tasks", function="scheduled_task")
+            
+            # Check for configuration changes when queues are empty
+            await check_config_changes()
+            
+            # Block until something is enqueued, cancelled or reconfigured. The timeout only
+            # covers the periodic config check and the deferred library refresh.
+            await request_scheduler.wait_for_work(timeout=get_idle_wait_timeout())
             
         except Exception as e:
             log_error("Queue Processing Error", f"Error in process_queues: {e}", module="background_tasks", function="process_queues")
@@ -486,538 +506,684 @@ async def process_queues():
             queue_processing_complete.set()
             await asyncio.sleep(5)
 
-async def process_movie_queue():
-    """Process all movies in the movie queue."""
-    processed_count = 0
+def get_next_queue_item():
+    """
+    Take the next item to process without waiting.
+    The request scheduler picks across both queues by priority class, age and media type quota.
+    
+    Returns:
+        tuple: (media_type, queue_item), or (None, None) if both queues are empty
+    """
+    return request_scheduler.get_nowait()
+
+def queue_item_needs_browser(queue_item) -> bool:
+    """Check whether a queue item drives the browser (special tasks like failed item retries do not)."""
+    return queue_item[0] not in ("movie_processing_check", "failed_item_processing")
+
+async def queue_worker(worker_id):
+    """
+    Long-lived worker that leases a browser session per queue item.
+    It blocks on the request scheduler while both queues are empty, so an item queued while
+    other workers are busy starts as soon as this one is free. An item that fails is logged
+    and the worker moves on.
+    
+    Args:
+        worker_id (int): Worker number, used for logging
+    """
+    global busy_worker_count, is_processing_queue
+    from seerr.browser_pool import browser_pool
     
-    while not movie_queue.empty():
+    processed_count = 0
+    while True:
+        media_type, queue_item = get_next_queue_item()
+        if queue_item is None:
+            if processed_count > 0:
+                log_info("Queue Processing", f"Worker {worker_id} processed {processed_count} queue item(s)", module="background_tasks", function="queue_worker")
+                processed_count = 0
+            if busy_worker_count == 0:
+                is_processing_queue = False
+                queue_processing_complete.set()
+            await request_scheduler.wait_for_work()
+            continue
+        
+        busy_worker_count += 1
+        is_processing_queue = True
+        queue_processing_complete.clear()
+        update_queue_activity_timestamp()
+        
+        process_item = process_movie_item if media_type == 'movie' else process_tv_item
         try:
-            if processed_count == 0:  # Only log once when starting to process movies
-                log_info("Queue Processing", "Processing movie queue...", module="background_tasks", function="process_queues")
+            if queue_item_needs_browser(queue_item):
+                async with browser_pool.lease() as session:
+                    await process_item(queue_item, session)
+            else:
+                await process_item(queue_item)
+        except Exception as e:
+            log_error("Queue Processing Error", f"Worker {worker_id} failed to process {media_type} item {queue_item[:3]}: {e}", module="background_tasks", function="queue_worker")
+        finally:
+            busy_worker_count -= 1
+            # Journal the completion so the item is not replayed on the next start
+            request_scheduler.queues[media_type].complete(queue_item)
+        processed_count += 1
+        
+        if queue_journal.needs_compaction():
+            queue_journal.compact(request_scheduler.queues)
+
+def start_queue_workers():
+    """Start one long-lived queue worker per browser session, replacing any worker that stopped."""
+    from seerr.browser_pool import browser_pool
+    
+    worker_count = max(1, browser_pool.size)
+    started = 0
+    for worker_id in range(worker_count):
+        if worker_id < len(queue_worker_tasks):
+            task = queue_worker_tasks[worker_id]
+            if not task.done():
+                continue
+            if not task.cancelled() and task.exception() is not None:
+                log_error("Queue Processing Error", f"Worker {worker_id} stopped: {task.exception()}", module="background_tasks", function="start_queue_workers")
+            queue_worker_tasks[worker_id] = asyncio.create_task(queue_worker(worker_id))
+        else:
+            queue_worker_tasks.append(asyncio.create_task(queue_worker(worker_id)))
+        started += 1
+    
+    if started:
+        log_info("Queue Processing", f"Started {started} of {worker_count} browser queue worker(s)", module="background_tasks", function="start_queue_workers")
+
+async def process_movie_item(queue_item, session=None):
+    """
+    Process a single item taken from the movie queue.
+    
+    Args:
+        queue_item (tuple): Item as stored in movie_queue
+        session (BrowserSession, optional): Browser session leased for this item
+    """
+    try:
+        # Check if this is a special task (has string as first element)
+        if isinstance(queue_item[0], str) and queue_item[0] == "movie_processing_check":
+            # Check for stuck movies
+            log_info("Movie Processing Check", "Processing movie processing check task", module="background_tasks", function="process_movie_item")
+            await check_movie_processing()
+            movie_queue.task_done()
             
-            queue_item = await movie_queue.get()
+        elif isinstance(queue_item[0], str) and queue_item[0] == "failed_item_processing":
+            # Process failed items
+            log_info("Failed Item Processing", "Processing failed item retry task", module="background_tasks", function="process_movie_item")
+            from seerr.failed_item_manager import process_failed_items
+            retry_count = await process_failed_items()
+            log_info("Failed Item Processing", f"Processed {retry_count} failed items for retry", module="background_tasks", function="process_movie_item")
+            movie_queue.task_done()
             
-            # Check if this is a special task (has string as first element)
-            if isinstance(queue_item[0], str) and queue_item[0] == "movie_processing_check":
-                # Check for stuck movies
-                log_info("Movie Processing Check", "Processing movie processing check task", module="background_tasks", function="process_movie_queue")
-                await check_movie_processing()
-                movie_queue.task_done()
-                
-            elif isinstance(queue_item[0], str) and queue_item[0] == "failed_item_processing":
-                # Process failed items
-                log_info("Failed Item Processing", "Processing failed item retry task", module="background_tasks", function="process_movie_queue")
-                from seerr.failed_item_manager import process_failed_items
-                retry_count = await process_failed_items()
-                log_info("Failed Item Processing", f"Processed {retry_count} failed items for retry", module="background_tasks", function="process_movie_queue")
-                movie_queue.task_done()
-                
-            else:
-                # Regular movie processing
-                imdb_id, movie_title, media_type, extra_data, media_id, tmdb_id, request_id = queue_item
-                task_done_called = False
-                
-                # Check if this item was cancelled/cleared before processing
-                # Database is source of truth - if is_in_queue is False, item was cleared
+        else:
+            # Regular movie processing
+            imdb_id, movie_title, media_type, extra_data, media_id, tmdb_id, request_id = queue_item
+            task_done_called = False
+            
+            # Check if this item was cancelled/cleared before processing
+            # Database is source of truth - if is_in_queue is False, item was cleared
+            if USE_DATABASE:
+                from seerr.unified_media_manager import get_media_by_tmdb
+                from seerr.database_queue_manager import database_queue_manager
+                from seerr.queue_state_cache import queue_state_cache
+                # Batched snapshot of queue state; the full record is only loaded when it has to be written
+                media_state = queue_state_cache.get(tmdb_id, media_type)
+                if media_state:
+                    # Check if item was cleared (is_in_queue = False AND status = 'failed' with 'cancelled' stage)
+                    # This means the user cleared the queue while item was in in-memory queue
+                    is_cleared = (not media_state['is_in_queue'] and 
+                                 media_state['status'] == 'failed' and 
+                                 media_state['processing_stage'] == 'cancelled')
+                    
+                    if is_cleared:
+                        log_info("Queue Cancellation", f"Skipping cleared item from in-memory queue: {movie_title} (TMDB: {tmdb_id})", 
+                                module="background_tasks", function="process_movie_item")
+                        # Item was cleared, don't process it and don't set is_in_queue back to True
+                        task_done_called = True
+                        movie_queue.task_done()
+                        return
+                    
+                    # Item is valid - ensure is_in_queue is set to True (item is in queue since we just dequeued it)
+                    if not media_state['is_in_queue']:
+                        database_queue_manager._update_queue_tracking(get_media_by_tmdb(tmdb_id, media_type), True)
+                    
+                    # Clear any stale cancellation tracking (item is active since we dequeued it)
+                    cancellation_registry.pop((tmdb_id, media_type), None)
+                    
+                    # Check for recently cancelled items (race condition handling)
+                    is_cancelled = False
+                    if media_state['status'] == 'failed' and media_state['processing_stage'] == 'cancelled':
+                        # Explicitly cancelled - check if it was cancelled very recently (within last 2 seconds)
+                        # This handles race conditions where item was cancelled right before dequeuing
+                        if media_state['last_checked_at']:
+                            time_since_update = (datetime.utcnow() - media_state['last_checked_at']).total_seconds()
+                            if time_since_update < 2:  # Cancelled within last 2 seconds
+                                is_cancelled = True
+                                log_info("Queue Cancellation", f"Item was cancelled very recently: {movie_title} (TMDB: {tmdb_id})", 
+                                        module="background_tasks", function="process_movie_item")
+                    
+                    if is_cancelled:
+                        log_info("Queue Cancellation", f"Skipping cancelled item: {movie_title} (TMDB: {tmdb_id})", 
+                                module="background_tasks", function="process_movie_item")
+                        # Clear queue tracking
+                        database_queue_manager._update_queue_tracking(get_media_by_tmdb(tmdb_id, media_type), False)
+                        task_done_called = True
+                        movie_queue.task_done()
+                        return
+                else:
+                    # Media record doesn't exist yet - clear any stale cancellation tracking
+                    cancellation_registry.pop((tmdb_id, media_type), None)
+            
+            # Check if media is unreleased - skip processing if so
+            if USE_DATABASE:
+                from seerr.unified_media_manager import get_media_by_tmdb
+                from seerr.database_queue_manager import database_queue_manager
+                # datetime is already imported at top of file
+                media_record = get_media_by_tmdb(tmdb_id, media_type) if media_state and media_state['status'] == 'unreleased' else None
+                if media_record and media_record.status == 'unreleased':
+                    log_info("Movie Processing", f"Skipping unreleased movie {movie_title} (releases {media_record.released_date.strftime('%Y-%m-%d') if media_record.released_date else 'unknown'})", module="background_tasks", function="process_movie_item")
+                    # Clear queue tracking before removing from queue
+                    database_queue_manager._update_queue_tracking(media_record, False)
+                    task_done_called = True
+                    movie_queue.task_done()
+                    return
+            
+            log_info("Movie Processing", f"Processing movie request on browser session {session.slot if session else '-'} - IMDb ID: {imdb_id}, Title: {movie_title}", module="background_tasks", function="process_movie_item")
+            
+            # Set processing stage when item starts processing
+            if USE_DATABASE:
+                from seerr.unified_media_manager import update_media_processing_status
+                if media_state:
+                    update_media_processing_status(
+                        media_state['id'],
+                        'processing',
+                        'browser_automation'
+                    )
+                    log_info("Queue Processing", f"Set processing stage to browser_automation for {movie_title}", module="background_tasks", function="process_movie_item")
+            
+            # Use the driver of the browser session leased for this item
+            browser_driver = session.driver if session else None
+            if browser_driver is None:
+                log_error("Browser Error", "No browser session available. Skipping request.", module="background_tasks", function="process_movie_item")
+                # Clear queue tracking before removing from queue
                 if USE_DATABASE:
                     from seerr.unified_media_manager import get_media_by_tmdb
                     from seerr.database_queue_manager import database_queue_manager
                     media_record = get_media_by_tmdb(tmdb_id, media_type)
                     if media_record:
-                        # Check if item was cleared (is_in_queue = False AND status = 'failed' with 'cancelled' stage)
-                        # This means the user cleared the queue while item was in in-memory queue
-                        is_cleared = (not media_record.is_in_queue and 
-                                     media_record.status == 'failed' and 
-                                     media_record.processing_stage == 'cancelled')
-                        
-                        if is_cleared:
-                            log_info("Queue Cancellation", f"Skipping cleared item from in-memory queue: {movie_title} (TMDB: {tmdb_id})", 
-                                    module="background_tasks", function="process_movie_queue")
-                            # Item was cleared, don't process it and don't set is_in_queue back to True
-                            task_done_called = True
-                            movie_queue.task_done()
-                            continue
-                        
-                        # Item is valid - ensure is_in_queue is set to True (item is in queue since we just dequeued it)
-                        if not media_record.is_in_queue:
-                            database_queue_manager._update_queue_tracking(media_record, True)
-                        
-                        # Clear any stale cancellation tracking (item is active since we dequeued it)
-                        cancellation_registry.pop((tmdb_id, media_type), None)
-                        
-                        # Check for recently cancelled items (race condition handling)
-                        is_cancelled = False
-                        if media_record.status == 'failed' and media_record.processing_stage == 'cancelled':
-                            # Explicitly cancelled - check if it was cancelled very recently (within last 2 seconds)
-                            # This handles race conditions where item was cancelled right before dequeuing
-                            if media_record.last_checked_at:
-                                time_since_update = (datetime.utcnow() - media_record.last_checked_at).total_seconds()
-                                if time_since_update < 2:  # Cancelled within last 2 seconds
-                                    is_cancelled = True
-                                    log_info("Queue Cancellation", f"Item was cancelled very recently: {movie_title} (TMDB: {tmdb_id})", 
-                                            module="background_tasks", function="process_movie_queue")
-                        
-                        if is_cancelled:
-                            log_info("Queue Cancellation", f"Skipping cancelled item: {movie_title} (TMDB: {tmdb_id})", 
-                                    module="background_tasks", function="process_movie_queue")
-                            # Clear queue tracking
-                            database_queue_manager._update_queue_tracking(media_record, False)
-                            task_done_called = True
-                            movie_queue.task_done()
-                            continue
-                    else:
-                        # Media record doesn't exist yet - clear any stale cancellation tracking
-                        cancellation_registry.pop((tmdb_id, media_type), None)
-                
-                processed_count += 1
-                
-                # Check if media is unreleased - skip processing if so
-                if USE_DATABASE:
-                    from seerr.unified_media_manager import get_media_by_tmdb
-                    from seerr.database_queue_manager import database_queue_manager
-                    # datetime is already imported at top of file
-                    media_record = get_media_by_tmdb(tmdb_id, media_type)
-                    if media_record and media_record.status == 'unreleased':
-                        log_info("Movie Processing", f"Skipping unreleased movie {movie_title} (releases {media_record.released_date.strftime('%Y-%m-%d') if media_record.released_date else 'unknown'})", module="background_tasks", function="process_movie_queue")
-                        # Clear queue tracking before removing from queue
                         database_queue_manager._update_queue_tracking(media_record, False)
-                        task_done_called = True
-                        movie_queue.task_done()
-                        continue
-                
-                log_info("Movie Processing", f"Processing movie request #{processed_count} - IMDb ID: {imdb_id}, Title: {movie_title}", module="background_tasks", function="process_movie_queue")
-                
-                # Set processing stage when item starts processing
-                if USE_DATABASE:
-                    from seerr.unified_media_manager import get_media_by_tmdb, update_media_processing_status
-                    media_record = get_media_by_tmdb(tmdb_id, media_type)
-                    if media_record:
-                        update_media_processing_status(
-                            media_record.id,
-                            'processing',
-                            'browser_automation'
-                        )
-                        log_info("Queue Processing", f"Set processing stage to browser_automation for {movie_title}", module="background_tasks", function="process_movie_queue")
+                task_done_called = True
+                movie_queue.task_done()
+                return
+            
+            try:
+                from seerr.search import search_on_debrid
+                log_info("Movie Processing", f"Calling search_on_debrid with imdb_id={imdb_id}, movie_title={movie_title}, media_type={media_type}, extra_data={extra_data}", module="background_tasks", function="process_movie_item")
+                search_result = await processing_watchdog.run(STAGE_MOVIE_SEARCH, session, search_on_debrid,
+                                                              imdb_id, movie_title, media_type, browser_driver, extra_data, tmdb_id)
+                processing_watchdog.clear((tmdb_id, media_type))
                 
-                # Check if browser driver is available
-                from seerr.browser import driver as browser_driver
-                if browser_driver is None:
-                    log_warning("Browser Warning", "Browser driver not initialized. Attempting to initialize...", module="background_tasks", function="process_movie_queue")
-                    from seerr.browser import initialize_browser
-                    await initialize_browser()
-                    from seerr.browser import driver as browser_driver
-                    if browser_driver is None:
-                        log_error("Browser Error", "Failed to initialize browser driver. Skipping request.", module="background_tasks", function="process_movie_queue")
-                        # Clear queue tracking before removing from queue
+                # Handle search result - if True, item completed successfully
+                if search_result == True:
+                    if mark_completed(media_id, tmdb_id):
+                        log_info("Overseerr Update", f"Marked {movie_title} ({media_id}) as completed in Overseerr", module="background_tasks", function="process_movie_item")
+                        
+                        # Update database status to completed
+                        if USE_DATABASE and request_id:
+                            from seerr.overseerr import update_media_request_status
+                            update_media_request_status(request_id, 'completed', completed_at=datetime.utcnow().isoformat())
+                        
+                        # Update unified_media table to completed status
                         if USE_DATABASE:
-                            from seerr.unified_media_manager import get_media_by_tmdb
-                            from seerr.database_queue_manager import database_queue_manager
+                            from seerr.unified_media_manager import update_media_processing_status, get_media_by_tmdb
+                            
+                            # Find the media record by tmdb_id and media_type
                             media_record = get_media_by_tmdb(tmdb_id, media_type)
+                            
                             if media_record:
-                                database_queue_manager._update_queue_tracking(media_record, False)
-                        task_done_called = True
-                        movie_queue.task_done()
-                        continue
-                
-                try:
-                    # Acquire browser semaphore for processing
-                    async with browser_semaphore:
-                        from seerr.search import search_on_debrid
-                        log_info("Movie Processing", f"Calling search_on_debrid with imdb_id={imdb_id}, movie_title={movie_title}, media_type={media_type}, extra_data={extra_data}", module="background_tasks", function="process_movie_queue")
-                        search_result = await asyncio.to_thread(search_on_debrid, imdb_id, movie_title, media_type, browser_driver, extra_data, tmdb_id)
-                        
-                        # Handle search result - if True, item completed successfully
-                        if search_result == True:
-                            if mark_completed(media_id, tmdb_id):
-                                log_info("Overseerr Update", f"Marked {movie_title} ({media_id}) as completed in Overseerr", module="background_tasks", function="process_movie_queue")
-                                
-                                # Update database status to completed
-                                if USE_DATABASE and request_id:
-                                    from seerr.overseerr import update_media_request_status
-                                    update_media_request_status(request_id, 'completed', completed_at=datetime.utcnow().isoformat())
-                                
-                                # Update unified_media table to completed status
-                                if USE_DATABASE:
-                                    from seerr.unified_media_manager import update_media_processing_status, get_media_by_tmdb
-                                    
-                                    # Find the media record by tmdb_id and media_type
-                                    media_record = get_media_by_tmdb(tmdb_id, media_type)
-                                    
-                                    if media_record:
-                                        update_media_processing_status(
-                                            media_record.id,
-                                            'completed',
-                                            'movie_processing_complete',
-                                            extra_data={'completed_at': datetime.utcnow().isoformat(), 'overseerr_media_id': media_id}
-                                        )
-                                        log_info("Media Update", f"Updated unified_media status to completed for {movie_title} (TMDB: {tmdb_id})", module="background_tasks", function="process_movie_queue")
-                                    else:
-                                        log_warning("Media Warning", f"No unified_media record found for {movie_title} (TMDB: {tmdb_id})", module="background_tasks", function="process_movie_queue")
-                                
-                                # Single success message for the entire process
-                                log_success("Media Processing", f"Successfully processed and completed {movie_title} ({media_id})", module="background_tasks", function="process_movie_queue")
+                                update_media_processing_status(
+                                    media_record.id,
+                                    'completed',
+                                    'movie_processing_complete',
+                                    extra_data={'completed_at': datetime.utcnow().isoformat(), 'overseerr_media_id': media_id}
+                                )
+                                log_info("Media Update", f"Updated unified_media status to completed for {movie_title} (TMDB: {tmdb_id})", module="background_tasks", function="process_movie_item")
                             else:
-                                log_error("Overseerr Error", f"Failed to mark media {media_id} as completed in Overseerr", module="background_tasks", function="process_movie_queue")
-                        elif search_result == "cancelled":
-                            log_info("Queue Cancellation", f"{movie_title} ({media_id}) was cancelled during search", module="background_tasks", function="process_movie_queue")
-                            # Mark as failed and clear queue tracking
-                            if USE_DATABASE:
-                                from seerr.unified_media_manager import get_media_by_tmdb, update_media_processing_status
-                                from seerr.database_queue_manager import database_queue_manager
-                                media_record = get_media_by_tmdb(tmdb_id, media_type)
-                                if media_record:
-                                    update_media_processing_status(
-                                        media_record.id,
-                                        'failed',
-                                        'cancelled',
-                                        error_message="Cancelled by user"
-                                    )
-                                    # Clear queue tracking before removing from queue
-                                    database_queue_manager._update_queue_tracking(media_record, False)
-                            # Remove from registry
-                            cancellation_registry.pop((tmdb_id, media_type), None)
-                            task_done_called = True
-                        elif search_result in ["already_processing", "already_completed", "already_available", "skipped"]:
-                            log_info("Movie Processing", f"{movie_title} ({media_id}) was skipped - {search_result.replace('_', ' ')}. No action needed.", module="background_tasks", function="process_movie_queue")
+                                log_warning("Media Warning", f"No unified_media record found for {movie_title} (TMDB: {tmdb_id})", module="background_tasks", function="process_movie_item")
+                        
+                        # Single success message for the entire process
+                        log_success("Media Processing", f"Successfully processed and completed {movie_title} ({media_id})", module="background_tasks", function="process_movie_item")
+                    else:
+                        log_error("Overseerr Error", f"Failed to mark media {media_id} as completed in Overseerr", module="background_tasks", function="process_movie_item")
+                elif search_result == "cancelled":
+                    log_info("Queue Cancellation", f"{movie_title} ({media_id}) was cancelled during search", module="background_tasks", function="process_movie_item")
+                    # Mark as failed and clear queue tracking
+                    if USE_DATABASE:
+                        from seerr.unified_media_manager import get_media_by_tmdb, update_media_processing_status
+                        from seerr.database_queue_manager import database_queue_manager
+                        media_record = get_media_by_tmdb(tmdb_id, media_type)
+                        if media_record:
+                            update_media_processing_status(
+                                media_record.id,
+                                'failed',
+                                'cancelled',
+                                error_message="Cancelled by user"
+                            )
+                            # Clear queue tracking before removing from queue
+                            database_queue_manager._update_queue_tracking(media_record, False)
+                    # Remove from registry
+                    cancellation_registry.pop((tmdb_id, media_type), None)
+                    task_done_called = True
+                elif search_result in ["already_processing", "already_completed", "already_available", "skipped"]:
+                    log_info("Movie Processing", f"{movie_title} ({media_id}) was skipped - {search_result.replace('_', ' ')}. No action needed.", module="background_tasks", function="process_movie_item")
+                else:
+                    log_error("Movie Processing", f"{movie_title} ({media_id}) was not properly confirmed. Marking as failed.", module="background_tasks", function="process_movie_item")
+                    
+                    # Update media status to failed when search fails
+                    if USE_DATABASE:
+                        from seerr.unified_media_manager import update_media_processing_status, get_media_by_tmdb
+                        
+                        # Find the media record by tmdb_id and media_type
+                        media_record = get_media_by_tmdb(tmdb_id, media_type)
+                        
+                        if media_record:
+                            update_media_processing_status(
+                                media_record.id,
+                                'failed',
+                                'search_failed',
+                                error_message=f"Search failed for {movie_title} - no torrents found or processing timeout"
+                            )
+                            log_info("Media Update", f"Updated unified_media status to failed for {movie_title} (TMDB: {tmdb_id})", module="background_tasks", function="process_movie_item")
                         else:
-                            log_error("Movie Processing", f"{movie_title} ({media_id}) was not properly confirmed. Marking as failed.", module="background_tasks", function="process_movie_queue")
-                            
-                            # Update media status to failed when search fails
-                            if USE_DATABASE:
-                                from seerr.unified_media_manager import update_media_processing_status, get_media_by_tmdb
-                                
-                                # Find the media record by tmdb_id and media_type
-                                media_record = get_media_by_tmdb(tmdb_id, media_type)
-                                
-                                if media_record:
-                                    update_media_processing_status(
-                                        media_record.id,
-                                        'failed',
-                                        'search_failed',
-                                        error_message=f"Search failed for {movie_title} - no torrents found or processing timeout"
-                                    )
-                                    log_info("Media Update", f"Updated unified_media status to failed for {movie_title} (TMDB: {tmdb_id})", module="background_tasks", function="process_movie_queue")
-                                else:
-                                    log_warning("Media Warning", f"No unified_media record found for {movie_title} (TMDB: {tmdb_id})", module="background_tasks", function="process_movie_queue")
-                            
-                except Exception as ex:
-                    log_critical("Movie Processing Error", f"Error processing movie request for IMDb ID {imdb_id}: {ex}", module="background_tasks", function="process_movie_queue")
-                finally:
-                    # Clear queue tracking when item is done processing (BEFORE task_done)
-                    # This ensures database is updated before queue item is marked as done
-                    # Only clear if item successfully completed or failed - don't clear if it was cancelled/removed
-                    if USE_DATABASE and not task_done_called:
-                        try:
-                            from seerr.database_queue_manager import database_queue_manager
-                            from seerr.unified_media_manager import get_media_by_tmdb
-                            from seerr.queue_persistence_manager import queue_persistence_manager
-                            media_record = get_media_by_tmdb(tmdb_id, media_type)
-                            if media_record:
-                                # Only clear queue tracking if item is actually done (completed or failed, not cancelled)
-                                # If item was cancelled, queue tracking was already cleared above
-                                if media_record.status in ['completed', 'failed']:
-                                    database_queue_manager._update_queue_tracking(media_record, False)
-                                # Update queue status from database (source of truth)
-                                queue_persistence_manager.update_queue_status_from_database('movie', not movie_queue.empty())
-                        except Exception as db_error:
-                            log_error("Queue Database Update Error", f"Error updating database for {movie_title}: {db_error}", 
-                                     module="background_tasks", function="process_movie_queue")
+                            log_warning("Media Warning", f"No unified_media record found for {movie_title} (TMDB: {tmdb_id})", module="background_tasks", function="process_movie_item")
                     
-                    # Only call task_done() if we haven't already called it
-                    if not task_done_called:
-                        movie_queue.task_done()
+            except ItemTimeoutError as ex:
+                handle_item_timeout(queue_item, tmdb_id, media_type, movie_title, ex)
+            except Exception as ex:
+                log_critical("Movie Processing Error", f"Error processing movie request for IMDb ID {imdb_id}: {ex}", module="background_tasks", function="process_movie_item")
+                if session:
+                    session.mark_failed(ex)
+            finally:
+                # Clear queue tracking when item is done processing (BEFORE task_done)
+                # This ensures database is updated before queue item is marked as done
+                # Only clear if item successfully completed or failed - don't clear if it was cancelled/removed
+                if USE_DATABASE and not task_done_called:
+                    try:
+                        from seerr.database_queue_manager import database_queue_manager
+                        from seerr.unified_media_manager import get_media_by_tmdb
+                        from seerr.queue_persistence_manager import queue_persistence_manager
+                        media_record = get_media_by_tmdb(tmdb_id, media_type)
+                        if media_record:
+                            # Only clear queue tracking if item is actually done (completed or failed, not cancelled)
+                            # If item was cancelled, queue tracking was already cleared above
+                            if media_record.status in ['completed', 'failed'] and not movie_queue.has_pending_retry((tmdb_id, media_type)):
+                                database_queue_manager._update_queue_tracking(media_record, False)
+                            # Update queue status from database (source of truth)
+                            queue_persistence_manager.update_queue_status_from_database('movie', not movie_queue.empty())
+                    except Exception as db_error:
+                        log_error("Queue Database Update Error", f"Error updating database for {movie_title}: {db_error}", 
+                                 module="background_tasks", function="process_movie_item")
                 
-        except Exception as e:
-            log_error("Movie Queue Error", f"Error processing movie from queue: {e}", module="background_tasks", function="process_movie_queue")
+                # Only call task_done() if we haven't already called it
+                if not task_done_called:
+                    movie_queue.task_done()
+                
+    except Exception as e:
+        log_error("Movie Queue Error", f"Error processing movie from queue: {e}", module="background_tasks", function="process_movie_item")
+
+def handle_item_timeout(queue_item, tmdb_id, media_type, title, error):
+    """
+    Requeue a queue item whose processing overran its deadline, with exponential backoff.
+    The retry is deferred in the queue (and its journal), so it survives a restart, and the
+    item keeps is_in_queue set while it waits. After item_timeout_max_retries timeouts in a
+    row the item is marked as failed instead.
     
-    if processed_count > 0:
-        log_info("Movie Processing", f"Completed processing {processed_count} movie(s)", module="background_tasks", function="process_movie_queue")
+    Args:
+        queue_item (tuple): The queue item that timed out
+        tmdb_id (int): TMDB ID of the media
+        media_type (str): Type of media ('movie' or 'tv')
+        title (str): Title of the media, for logging
+        error (ItemTimeoutError): The timeout raised by the watchdog
+    """
+    key = (tmdb_id, media_type)
+    timeouts = processing_watchdog.record_timeout(key)
+    
+    if timeouts > processing_watchdog.get_max_retries():
+        processing_watchdog.clear(key)
+        log_error("Processing Timeout", f"{title} (TMDB: {tmdb_id}) timed out {timeouts} times in a row. Marking as failed.", 
+                 module="background_tasks", function="handle_item_timeout")
+        if USE_DATABASE:
+            from seerr.unified_media_manager import get_media_by_tmdb, update_media_processing_status
+            media_record = get_media_by_tmdb(tmdb_id, media_type)
+            if media_record:
+                update_media_processing_status(
+                    media_record.id,
+                    'failed',
+                    'processing_timeout',
+                    error_message=str(error)
+                )
+        return
+    
+    delay = processing_watchdog.get_retry_delay(timeouts)
+    log_warning("Processing Timeout", f"{title} (TMDB: {tmdb_id}) timed out ({error}). Requeuing in {delay:.0f}s (timeout {timeouts}).", 
+               module="background_tasks", function="handle_item_timeout")
+    request_scheduler.queues[media_type].defer(queue_item, time.time() + delay, PRIORITY_RECONCILE)
 
-async def process_tv_queue():
-    """Process all TV shows in the TV queue."""
-    processed_count = 0
+def fail_abandoned_item(queue_item, attempts):
+    """
+    Mark an item the queue journal stopped replaying as failed and clear its queue tracking,
+    so the startup sync does not queue it again.
     
-    while not tv_queue.empty():
-        try:
-            if processed_count == 0:  # Only log once when starting to process TV items
-                log_info("Queue Processing", "Processing TV queue...", module="background_tasks", function="process_queues")
+    Args:
+        queue_item (tuple): The dropped queue item
+        attempts (int): Number of interrupted attempts recorded for the item
+    """
+    if not USE_DATABASE:
+        return
+    tmdb_id, media_type = get_item_key(queue_item)
+    from seerr.unified_media_manager import get_media_by_tmdb, update_media_processing_status
+    from seerr.database_queue_manager import database_queue_manager
+    media_record = get_media_by_tmdb(int(tmdb_id), media_type)
+    if media_record:
+        update_media_processing_status(
+            media_record.id,
+            'failed',
+            'replay_limit',
+            error_message=f"Processing was interrupted {attempts} times"
+        )
+        database_queue_manager._update_queue_tracking(media_record, False)
+
+async def process_tv_item(queue_item, session=None):
+    """
+    Process a single item taken from the TV queue.
+    
+    Args:
+        queue_item (tuple): Item as stored in tv_queue
+        session (BrowserSession, optional): Browser session leased for this item
+    """
+    try:
+        queue_type = queue_item[0]
+        
+        if queue_type == "tv_processing":
+            # Regular TV show processing
+            _, imdb_id, movie_title, media_type, extra_data, media_id, tmdb_id, request_id = queue_item
+            task_done_called = False
+            
+            # Check if this item was cancelled/cleared before processing
+            # Database is source of truth - if is_in_queue is False, item was cleared
+            if USE_DATABASE:
+                from seerr.unified_media_manager import get_media_by_tmdb
+                from seerr.database_queue_manager import database_queue_manager
+                from seerr.queue_state_cache import queue_state_cache
+                # Batched snapshot of queue state; the full record is only loaded when it has to be written
+                media_state = queue_state_cache.get(tmdb_id, media_type)
+                if media_state:
+                    # Check if item was cleared (is_in_queue = False AND status = 'failed' with 'cancelled' stage)
+                    # This means the user cleared the queue while item was in in-memory queue
+                    is_cleared = (not media_state['is_in_queue'] and 
+                                 media_state['status'] == 'failed' and 
+                                 media_state['processing_stage'] == 'cancelled')
+                    
+                    if is_cleared:
+                        log_info("Queue Cancellation", f"Skipping cleared item from in-memory queue: {movie_title} (TMDB: {tmdb_id})", 
+                                module="background_tasks", function="process_tv_item")
+                        # Item was cleared, don't process it and don't set is_in_queue back to True
+                        task_done_called = True
+                        tv_queue.task_done()
+                        return
+                    
+                    # Item is valid - ensure is_in_queue is set to True (item is in queue since we just dequeued it)
+                    if not media_state['is_in_queue']:
+                        database_queue_manager._update_queue_tracking(get_media_by_tmdb(tmdb_id, media_type), True)
+                    
+                    # Clear any stale cancellation tracking (item is active since we dequeued it)
+                    cancellation_registry.pop((tmdb_id, media_type), None)
+                    
+                    # Check for recently cancelled items (race condition handling)
+                    is_cancelled = False
+                    if media_state['status'] == 'failed' and media_state['processing_stage'] == 'cancelled':
+                        # Explicitly cancelled - check if it was cancelled very recently (within last 2 seconds)
+                        # This handles race conditions where item was cancelled right before dequeuing
+                        if media_state['last_checked_at']:
+                            time_since_update = (datetime.utcnow() - media_state['last_checked_at']).total_seconds()
+                            if time_since_update < 2:  # Cancelled within last 2 seconds
+                                is_cancelled = True
+                                log_info("Queue Cancellation", f"Item was cancelled very recently: {movie_title} (TMDB: {tmdb_id})", 
+                                        module="background_tasks", function="process_tv_item")
+                    
+                    if is_cancelled:
+                        log_info("Queue Cancellation", f"Skipping cancelled item: {movie_title} (TMDB: {tmdb_id})", 
+                                module="background_tasks", function="process_tv_item")
+                        # Clear queue tracking
+                        database_queue_manager._update_queue_tracking(get_media_by_tmdb(tmdb_id, media_type), False)
+                        task_done_called = True
+                        tv_queue.task_done()
+                        return
+                else:
+                    # Media record doesn't exist yet - clear any stale cancellation tracking
+                    cancellation_registry.pop((tmdb_id, media_type), None)
             
-            queue_item = await tv_queue.get()
-            queue_type = queue_item[0]
+            log_info("TV Processing", f"Processing TV request on browser session {session.slot if session else '-'} - IMDb ID: {imdb_id}, Title: {movie_title}", module="background_tasks", function="process_tv_item")
             
-            if queue_type == "tv_processing":
-                # Regular TV show processing
-                _, imdb_id, movie_title, media_type, extra_data, media_id, tmdb_id, request_id = queue_item
-                task_done_called = False
-                
-                # Check if this item was cancelled/cleared before processing
-                # Database is source of truth - if is_in_queue is False, item was cleared
+            # Set processing stage when item starts processing
+            if USE_DATABASE:
+                from seerr.unified_media_manager import update_media_processing_status
+                if media_state:
+                    update_media_processing_status(
+                        media_state['id'],
+                        'processing',
+                        'browser_automation'
+                    )
+                    log_info("Queue Processing", f"Set processing stage to browser_automation for {movie_title}", module="background_tasks", function="process_tv_item")
+            
+            # Use the driver of the browser session leased for this item
+            browser_driver = session.driver if session else None
+            if browser_driver is None:
+                log_error("Browser Error", "No browser session available. Skipping request.", module="background_tasks", function="process_tv_item")
+                # Clear queue tracking before removing from queue
                 if USE_DATABASE:
                     from seerr.unified_media_manager import get_media_by_tmdb
                     from seerr.database_queue_manager import database_queue_manager
                     media_record = get_media_by_tmdb(tmdb_id, media_type)
                     if media_record:
-                        # Check if item was cleared (is_in_queue = False AND status = 'failed' with 'cancelled' stage)
-                        # This means the user cleared the queue while item was in in-memory queue
-                        is_cleared = (not media_record.is_in_queue and 
-                                     media_record.status == 'failed' and 
-                                     media_record.processing_stage == 'cancelled')
-                        
-                        if is_cleared:
-                            log_info("Queue Cancellation", f"Skipping cleared item from in-memory queue: {movie_title} (TMDB: {tmdb_id})", 
-                                    module="background_tasks", function="process_tv_queue")
-                            # Item was cleared, don't process it and don't set is_in_queue back to True
-                            task_done_called = True
-                            tv_queue.task_done()
-                            continue
-                        
-                        # Item is valid - ensure is_in_queue is set to True (item is in queue since we just dequeued it)
-                        if not media_record.is_in_queue:
-                            database_queue_manager._update_queue_tracking(media_record, True)
-                        
-                        # Clear any stale cancellation tracking (item is active since we dequeued it)
-                        cancellation_registry.pop((tmdb_id, media_type), None)
+                        database_queue_manager._update_queue_tracking(media_record, False)
+                task_done_called = True
+                tv_queue.task_done()
+                return
+            
+            try:
+                from seerr.search import search_on_debrid
+                search_result = await processing_watchdog.run(STAGE_TV_SEARCH, session, search_on_debrid,
+                                                              imdb_id, movie_title, media_type, browser_driver, extra_data, tmdb_id)
+                processing_watchdog.clear((tmdb_id, media_type))
+                
+                # Handle search result - if True, item completed successfully
+                if search_result == True:
+                    # Check if any seasons are discrepant before marking as available
+                    should_mark_available = True
+                    if USE_DATABASE:
+                        from seerr.unified_media_manager import get_media_by_tmdb
+                        media_record = get_media_by_tmdb(tmdb_id, media_type)
                         
-                        # Check for recently cancelled items (race condition handling)
-                        is_cancelled = False
-                        if media_record.status == 'failed' and media_record.processing_stage == 'cancelled':
-                            # Explicitly cancelled - check if it was cancelled very recently (within last 2 seconds)
-                            # This handles race conditions where item was cancelled right before dequeuing
-                            if media_record.last_checked_at:
-                                time_since_update = (datetime.utcnow() - media_record.last_checked_at).total_seconds()
-                                if time_since_update < 2:  # Cancelled within last 2 seconds
-                                    is_cancelled = True
-                                    log_info("Queue Cancellation", f"Item was cancelled very recently: {movie_title} (TMDB: {tmdb_id})", 
-                                            module="background_tasks", function="process_tv_queue")
+                        if media_record and media_record.seasons_data:
+                            for season_data in media_record.seasons_data:
+                                if season_data.get('is_discrepant', False):
+                                    should_mark_available = False
+                                    log_info("TV Processing", f"Skipping marking {movie_title} as available due to discrepant seasons", module="background_tasks", function="process_tv_item")
+                                    break
+                    
+                    
+                    # Only proceed with Overseerr marking if should_mark_available is True
+                    if not should_mark_available:
+                        # Discrepant seasons - episodes processed but not marking as available
+                        log_info("TV Processing", f"Episodes processed for {movie_title} but not marking as available due to discrepant seasons", module="background_tasks", function="process_tv_item")
+                        # Skip the rest of the processing logic for this item
+                        return
+                    
+                    # Proceed with marking as available and updating database
+                    if mark_completed(media_id, tmdb_id):
+                        log_info("Overseerr Update", f"Marked {movie_title} ({media_id}) as completed in Overseerr", module="background_tasks", function="process_tv_item")
                         
-                        if is_cancelled:
-                            log_info("Queue Cancellation", f"Skipping cancelled item: {movie_title} (TMDB: {tmdb_id})", 
-                                    module="background_tasks", function="process_tv_queue")
-                            # Clear queue tracking
-                            database_queue_manager._update_queue_tracking(media_record, False)
-                            task_done_called = True
-                            tv_queue.task_done()
-                            continue
+                        # Update database status to completed
+                        if USE_DATABASE and request_id:
+                            from seerr.overseerr import update_media_request_status
+                            update_media_request_status(request_id, 'completed', completed_at=datetime.utcnow().isoformat())
                         
-                        if is_cancelled:
-                            log_info("Queue Cancellation", f"Skipping cancelled item: {movie_title} (TMDB: {tmdb_id})", module="background_tasks", function="process_tv_queue")
-                            # Clear queue tracking
-                            database_queue_manager._update_queue_tracking(media_record, False)
-                            task_done_called = True
-                            tv_queue.task_done()
-                            continue
-                    else:
-                        # Media record doesn't exist yet - clear any stale cancellation tracking
-                        cancellation_registry.pop((tmdb_id, media_type), None)
-                
-                processed_count += 1
-                
-                log_info("TV Processing", f"Processing TV request #{processed_count} - IMDb ID: {imdb_id}, Title: {movie_title}", module="background_tasks", function="process_tv_queue")
-                
-                # Set processing stage when item starts processing
-                if USE_DATABASE:
-                    from seerr.unified_media_manager import get_media_by_tmdb, update_media_processing_status
-                    media_record = get_media_by_tmdb(tmdb_id, media_type)
-                    if media_record:
-                        update_media_processing_status(
-                            media_record.id,
-                            'processing',
-                            'browser_automation'
-                        )
-                        log_info("Queue Processing", f"Set processing stage to browser_automation for {movie_title}", module="background_tasks", function="process_tv_queue")
-                
-                from seerr.browser import driver as browser_driver
-                if browser_driver is None:
-                    log_warning("Browser Warning", "Browser driver not initialized. Attempting to initialize...", module="background_tasks", function="process_movie_queue")
-                    from seerr.browser import initialize_browser
-                    await initialize_browser()
-                    from seerr.browser import driver as browser_driver
-                    if browser_driver is None:
-                        log_error("Browser Error", "Failed to initialize browser driver. Skipping request.", module="background_tasks", function="process_movie_queue")
-                        # Clear queue tracking before removing from queue
+                        # Update unified_media table to completed status
                         if USE_DATABASE:
-                            from seerr.unified_media_manager import get_media_by_tmdb
-                            from seerr.database_queue_manager import database_queue_manager
-                            media_record = get_media_by_tmdb(tmdb_id, media_type)
-                            if media_record:
-                                database_queue_manager._update_queue_tracking(media_record, False)
-                        task_done_called = True
-                        tv_queue.task_done()
-                        continue
-                
-                try:
-                    # Acquire browser semaphore for processing
-                    async with browser_semaphore:
-                        from seerr.search import search_on_debrid
-                        search_result = await asyncio.to_thread(search_on_debrid, imdb_id, movie_title, media_type, browser_driver, extra_data, tmdb_id)
-                        
-                        # Handle search result - if True, item completed successfully
-                        if search_result == True:
-                            # Check if any seasons are discrepant before marking as available
-                            should_mark_available = True
-                            if USE_DATABASE:
-                                from seerr.unified_media_manager import get_media_by_tmdb
-                                media_record = get_media_by_tmdb(tmdb_id, media_type)
-                                
-                                if media_record and media_record.seasons_data:
-                                    for season_data in media_record.seasons_data:
-                                        if season_data.get('is_discrepant', False):
-                                            should_mark_available = False
-                                            log_info("TV Processing", f"Skipping marking {movie_title} as available due to discrepant seasons", module="background_tasks", function="process_tv_queue")
-                                            break
-                            
+                            from seerr.unified_media_manager import update_media_processing_status, get_media_by_tmdb
                             
-                            # Only proceed with Overseerr marking if should_mark_available is True
-                            if not should_mark_available:
-                                # Discrepant seasons - episodes processed but not marking as available
-                                log_info("TV Processing", f"Episodes processed for {movie_title} but not marking as available due to discrepant seasons", module="background_tasks", function="process_tv_queue")
-                                # Skip the rest of the processing logic for this item
-                                continue
+                            # Find the media record by tmdb_id and media_type
+                            media_record = get_media_by_tmdb(tmdb_id, media_type)
                             
-                            # Proceed with marking as available and updating database
-                            if mark_completed(media_id, tmdb_id):
-                                log_info("Overseerr Update", f"Marked {movie_title} ({media_id}) as completed in Overseerr", module="background_tasks", function="process_tv_queue")
-                                
-                                # Update database status to completed
-                                if USE_DATABASE and request_id:
-                                    from seerr.overseerr import update_media_request_status
-                                    update_media_request_status(request_id, 'completed', completed_at=datetime.utcnow().isoformat())
+                            if media_record:
+                                # Update processing status
+                                update_media_processing_status(
+                                    media_record.id,
+                                    'completed',
+                                    'tv_processing_complete',
+                                    extra_data={'completed_at': datetime.utcnow().isoformat(), 'overseerr_media_id': media_id}
+                                )
                                 
-                                # Update unified_media table to completed status
-                                if USE_DATABASE:
-                                    from seerr.unified_media_manager import update_media_processing_status, get_media_by_tmdb
+                                # For TV shows, update season completion status and set subscription
+                                if media_type == 'tv' and media_record.seasons_data:
+                                    from seerr.enhanced_season_manager import EnhancedSeasonManager
                                     
-                                    # Find the media record by tmdb_id and media_type
-                                    media_record = get_media_by_tmdb(tmdb_id, media_type)
+                                    # Mark all seasons as completed
+                                    seasons_data = media_record.seasons_data
+                                    for season in seasons_data:
+                                        if isinstance(season, dict):
+                                            season['status'] = 'completed'
+                                            season['updated_at'] = datetime.utcnow().isoformat()
                                     
-                                    if media_record:
-                                        # Update processing status
-                                        update_media_processing_status(
-                                            media_record.id,
-                                            'completed',
-                                            'tv_processing_complete',
-                                            extra_data={'completed_at': datetime.utcnow().isoformat(), 'overseerr_media_id': media_id}
-                                        )
-                                        
-                                        # For TV shows, update season completion status and set subscription
-                                        if media_type == 'tv' and media_record.seasons_data:
-                                            from seerr.enhanced_season_manager import EnhancedSeasonManager
-                                            
-                                            # Mark all seasons as completed
-                                            seasons_data = media_record.seasons_data
-                                            for season in seasons_data:
-                                                if isinstance(season, dict):
-                                                    season['status'] = 'completed'
-                                                    season['updated_at'] = datetime.utcnow().isoformat()
-                                            
-                                            # Update the seasons data
-                                            EnhancedSeasonManager.update_tv_show_seasons(tmdb_id, seasons_data, movie_title)
-                                            log_info("Season Update", f"Marked all seasons as completed for {movie_title}", module="background_tasks", function="process_tv_queue")
-                                            
-                                            # Set subscription status for TV shows
-                                            from seerr.unified_media_manager import update_media_details
-                                            update_media_details(
-                                                media_record.id,
-                                                is_subscribed=True,
-                                                subscription_active=True,
-                                                subscription_last_checked=datetime.utcnow()
-                                            )
-                                            log_info("Subscription Update", f"Set subscription status for {movie_title}", module="background_tasks", function="process_tv_queue")
-                                        
-                                        log_info("Media Update", f"Updated unified_media status to completed for {movie_title} (TMDB: {tmdb_id})", module="background_tasks", function="process_tv_queue")
-                                    else:
-                                        log_warning("Media Warning", f"No unified_media record found for {movie_title} (TMDB: {tmdb_id})", module="background_tasks", function="process_tv_queue")
-                                
-                                # Single success message for the entire process
-                                log_success("Media Processing", f"Successfully processed and completed {movie_title} ({media_id})", module="background_tasks", function="process_tv_queue")
-                            else:
-                                log_error("Overseerr Error", f"Failed to mark media {media_id} as completed in Overseerr", module="background_tasks", function="process_tv_queue")
-                        elif search_result == "cancelled":
-                            log_info("Queue Cancellation", f"{movie_title} ({media_id}) was cancelled during search", module="background_tasks", function="process_tv_queue")
-                            # Mark as failed and clear queue tracking
-                            if USE_DATABASE:
-                                from seerr.unified_media_manager import get_media_by_tmdb, update_media_processing_status
-                                from seerr.database_queue_manager import database_queue_manager
-                                media_record = get_media_by_tmdb(tmdb_id, media_type)
-                                if media_record:
-                                    update_media_processing_status(
+                                    # Update the seasons data
+                                    EnhancedSeasonManager.update_tv_show_seasons(tmdb_id, seasons_data, movie_title)
+                                    log_info("Season Update", f"Marked all seasons as completed for {movie_title}", module="background_tasks", function="process_tv_item")
+                                    
+                                    # Set subscription status for TV shows
+                                    from seerr.unified_media_manager import update_media_details
+                                    update_media_details(
                                         media_record.id,
-                                        'failed',
-                                        'cancelled',
-                                        error_message="Cancelled by user"
+                                        is_subscribed=True,
+                                        subscription_active=True,
+                                        subscription_last_checked=datetime.utcnow()
                                     )
-                                    # Clear queue tracking before removing from queue
-                                    database_queue_manager._update_queue_tracking(media_record, False)
-                            # Remove from registry
-                            cancellation_registry.pop((tmdb_id, media_type), None)
-                            task_done_called = True
-                        elif search_result in ["already_processing", "already_completed", "already_available", "skipped"]:
-                            log_info("TV Processing", f"{movie_title} ({media_id}) was skipped - {search_result.replace('_', ' ')}. No action needed.", module="background_tasks", function="process_tv_queue")
-                        else:
-                            log_error("TV Processing", f"{movie_title} ({media_id}) was not properly confirmed. Marking as failed.", module="background_tasks", function="process_tv_queue")
-                            
-                            # Update media status to failed when search fails
-                            if USE_DATABASE:
-                                from seerr.unified_media_manager import update_media_processing_status, get_media_by_tmdb
-                                
-                                # Find the media record by tmdb_id and media_type
-                                media_record = get_media_by_tmdb(tmdb_id, media_type)
+                                    log_info("Subscription Update", f"Set subscription status for {movie_title}", module="background_tasks", function="process_tv_item")
                                 
-                                if media_record:
-                                    update_media_processing_status(
-                                        media_record.id,
-                                        'failed',
-                                        'search_failed',
-                                        error_message=f"Search failed for {movie_title} - no torrents found or processing timeout"
-                                    )
-                                    log_info("Media Update", f"Updated unified_media status to failed for {movie_title} (TMDB: {tmdb_id})", module="background_tasks", function="process_tv_queue")
-                                else:
-                                    log_warning("Media Warning", f"No unified_media record found for {movie_title} (TMDB: {tmdb_id})", module="background_tasks", function="process_tv_queue")
-                            
-                except Exception as ex:
-                    log_critical("TV Processing Error", f"Error processing TV request for IMDb ID {imdb_id}: {ex}", module="background_tasks", function="process_tv_queue")
-                finally:
-                    # Remove from cancellation registry
+                                log_info("Media Update", f"Updated unified_media status to completed for {movie_title} (TMDB: {tmdb_id})", module="background_tasks", function="process_tv_item")
+                            else:
+                                log_warning("Media Warning", f"No unified_media record found for {movie_title} (TMDB: {tmdb_id})", module="background_tasks", function="process_tv_item")
+                        
+                        # Single success message for the entire process
+                        log_success("Media Processing", f"Successfully processed and completed {movie_title} ({media_id})", module="background_tasks", function="process_tv_item")
+                    else:
+                        log_error("Overseerr Error", f"Failed to mark media {media_id} as completed in Overseerr", module="background_tasks", function="process_tv_item")
+                elif search_result == "cancelled":
+                    log_info("Queue Cancellation", f"{movie_title} ({media_id}) was cancelled during search", module="background_tasks", function="process_tv_item")
+                    # Mark as failed and clear queue tracking
+                    if USE_DATABASE:
+                        from seerr.unified_media_manager import get_media_by_tmdb, update_media_processing_status
+                        from seerr.database_queue_manager import database_queue_manager
+                        media_record = get_media_by_tmdb(tmdb_id, media_type)
+                        if media_record:
+                            update_media_processing_status(
+                                media_record.id,
+                                'failed',
+                                'cancelled',
+                                error_message="Cancelled by user"
+                            )
+                            # Clear queue tracking before removing from queue
+                            database_queue_manager._update_queue_tracking(media_record, False)
+                    # Remove from registry
                     cancellation_registry.pop((tmdb_id, media_type), None)
+                    task_done_called = True
+                elif search_result in ["already_processing", "already_completed", "already_available", "skipped"]:
+                    log_info("TV Processing", f"{movie_title} ({media_id}) was skipped - {search_result.replace('_', ' ')}. No action needed.", module="background_tasks", function="process_tv_item")
+                else:
+                    log_error("TV Processing", f"{movie_title} ({media_id}) was not properly confirmed. Marking as failed.", module="background_tasks", function="process_tv_item")
                     
-                    # Clear queue tracking when item is done processing (BEFORE task_done)
-                    # This ensures database is updated before queue item is marked as done
+                    # Update media status to failed when search fails
                     if USE_DATABASE:
-                        try:
-                            from seerr.database_queue_manager import database_queue_manager
-                            from seerr.unified_media_manager import get_media_by_tmdb
-                            from seerr.queue_persistence_manager import queue_persistence_manager
-                            media_record = get_media_by_tmdb(tmdb_id, media_type)
-                            if media_record:
-                                database_queue_manager._update_queue_tracking(media_record, False)
-                                # Update queue status from database (source of truth)
-                                queue_persistence_manager.update_queue_status_from_database('tv', not tv_queue.empty())
-                        except Exception as db_error:
-                            log_error("Queue Database Update Error", f"Error updating database for {movie_title}: {db_error}", 
-                                     module="background_tasks", function="process_tv_queue")
-                    
-                    # Only call task_done() if we haven't already called it
-                    if not task_done_called:
-                        tv_queue.task_done()
+                        from seerr.unified_media_manager import update_media_processing_status, get_media_by_tmdb
+                        
+                        # Find the media record by tmdb_id and media_type
+                        media_record = get_media_by_tmdb(tmdb_id, media_type)
+                        
+                        if media_record:
+                            update_media_processing_status(
+                                media_record.id,
+                                'failed',
+                                'search_failed',
+                                error_message=f"Search failed for {movie_title} - no torrents found or processing timeout"
+                            )
+                            log_info("Media Update", f"Updated unified_media status to failed for {movie_title} (TMDB: {tmdb_id})", module="background_tasks", function="process_tv_item")
+                        else:
+                            log_warning("Media Warning", f"No unified_media record found for {movie_title} (TMDB: {tmdb_id})", module="background_tasks", function="process_tv_item")
                     
-            elif queue_type == "subscription_check":
-                # Check show subscriptions
-                log_info("Subscription Check", "Processing subscription check task", module="background_tasks", function="process_tv_queue")
-                await check_show_subscriptions()
-                tv_queue.task_done()
+            except ItemTimeoutError as ex:
+                handle_item_timeout(queue_item, tmdb_id, media_type, movie_title, ex)
+            except Exception as ex:
+                log_critical("TV Processing Error", f"Error processing TV request for IMDb ID {imdb_id}: {ex}", module="background_tasks", function="process_tv_item")
+                if session:
+                    session.mark_failed(ex)
+            finally:
+                # Remove from cancellation registry
+                cancellation_registry.pop((tmdb_id, media_type), None)
                 
-        except Exception as e:
-            log_error("TV Queue Error", f"Error processing TV item from queue: {e}", module="background_tasks", function="process_tv_queue")
-    
-    if processed_count > 0:
-        log_info("TV Processing", f"Completed processing {processed_count} TV show(s)", module="background_tasks", function="process_tv_queue")
+                # Clear queue tracking when item is done processing (BEFORE task_done)
+                # This ensures database is updated before queue item is marked as done
+                if USE_DATABASE:
+                    try:
+                        from seerr.database_queue_manager import database_queue_manager
+                        from seerr.unified_media_manager import get_media_by_tmdb
+                        from seerr.queue_persistence_manager import queue_persistence_manager
+                        media_record = get_media_by_tmdb(tmdb_id, media_type)
+                        if media_record:
+                            # A timed-out item waiting for its retry stays queued
+                            if not tv_queue.has_pending_retry((tmdb_id, media_type)):
+                                database_queue_manager._update_queue_tracking(media_record, False)
+                            # Update queue status from database (source of truth)
+                            queue_persistence_manager.update_queue_status_from_database('tv', not tv_queue.empty())
+                    except Exception as db_error:
+                        log_error("Queue Database Update Error", f"Error updating database for {movie_title}: {db_error}", 
+                                 module="background_tasks", function="process_tv_item")
+                
+                # Only call task_done() if we haven't already called it
+                if not task_done_called:
+                    tv_queue.task_done()
+                
+        elif queue_type == "subscription_check":
+            # Check show subscriptions
+            log_info("Subscription Check", "Processing subscription check task", module="background_tasks", function="process_tv_item")
+            # The whole check drives the browser, so it runs on the session's browser thread
+            await run_in_browser(session.slot if session else 0, check_show_subscriptions_sync,
+                                 session.driver if session else None)
+            tv_queue.task_done()
+                
+    except Exception as e:
+        log_error("TV Queue Error", f"Error processing TV item from queue: {e}", module="background_tasks", function="process_tv_item")
 
 ### Function to add requests to the appropriate queue
-async def add_movie_to_queue(imdb_id, movie_title, media_type, extra_data, media_id, tmdb_id, request_id=None):
-    """Add a movie request to the movie queue."""
+async def add_movie_to_queue(imdb_id, movie_title, media_type, extra_data, media_id, tmdb_id, request_id=None, priority=PRIORITY_SYNC):
+    """
+    Add a movie request to the movie queue.
+    
+    Args:
+        priority (str): Priority class ('webhook', 'sync' or 'reconcile'); webhook requests are served first
+    """
+    queue_item = (imdb_id, movie_title, media_type, extra_data, media_id, tmdb_id, request_id)
+    
+    # Collapse duplicate requests for a title that is already queued
+    if (tmdb_id, media_type) in movie_queue:
+        cancellation_registry.pop((tmdb_id, media_type), None)
+        movie_queue.merge_duplicate(queue_item, priority)
+        log_info("Queue Management", f"Movie already queued, merged request for IMDb ID: {imdb_id}, Title: {movie_title}", module="background_tasks", function="add_movie_to_queue")
+        return True
+    
+    # Backpressure: wait for a slot instead of dropping the request; only give up after the timeout
     if movie_queue.full():
-        movie_size = task_config.get_config('movie_queue_maxsize', 250)
-        log_warning("Queue Warning", f"Movie queue is full (maxsize={movie_size}). Cannot add request for IMDb ID: {imdb_id}", module="background_tasks", function="add_movie_to_queue")
+        log_info("Queue Management", f"Movie queue is full (maxsize={movie_queue.maxsize}). Waiting for capacity for IMDb ID: {imdb_id}", module="background_tasks", function="add_movie_to_queue")
+    if not await movie_queue.wait_for_capacity(get_enqueue_timeout()):
+        log_warning("Queue Warning", f"Movie queue stayed full (maxsize={movie_queue.maxsize}). Cannot add request for IMDb ID: {imdb_id}", module="background_tasks", function="add_movie_to_queue")
         return False
     
     # Clear any stale cancellation tracking FIRST (before checking database)
@@ -1039,7 +1205,7 @@ async def add_movie_to_queue(imdb_id, movie_title, media_type, extra_data, media
             log_warning("Queue Warning", f"Media record not found for {movie_title} (TMDB: {tmdb_id}), adding to queue anyway", module="background_tasks", function="add_movie_to_queue")
     
     # Add to in-memory queue
-    await movie_queue.put((imdb_id, movie_title, media_type, extra_data, media_id, tmdb_id, request_id))
+    await movie_queue.put(queue_item, priority)
     update_queue_activity_timestamp()  # Update timestamp when item is added
     
     # Update queue persistence (will calculate from database)
@@ -1130,63 +1296,16 @@ def drain_cleared_items_from_queues():
             cleared_movie_ids = {item.tmdb_id for item in cleared_items if item.media_type == 'movie' and item.tmdb_id}
             cleared_tv_ids = {item.tmdb_id for item in cleared_items if item.media_type == 'tv' and item.tmdb_id}
             
-            global movie_queue, tv_queue
-            drained_movie = 0
-            drained_tv = 0
+            # Remove cleared items by key; other queued items keep their position
+            drained_movie = movie_queue.remove_keys((tmdb_id, 'movie') for tmdb_id in cleared_movie_ids)
+            drained_tv = tv_queue.remove_keys((tmdb_id, 'tv') for tmdb_id in cleared_tv_ids)
             
-            # Drain movie queue
-            if cleared_movie_ids:
-                temp_items = []
-                try:
-                    while not movie_queue.empty():
-                        item = movie_queue.get_nowait()
-                        if isinstance(item, tuple) and len(item) >= 6:
-                            if not isinstance(item[0], str):  # Regular item
-                                item_tmdb_id = item[5] if len(item) > 5 else None
-                                if item_tmdb_id in cleared_movie_ids:
-                                    drained_movie += 1
-                                    continue  # Skip this item
-                        temp_items.append(item)
-                except Exception:
-                    pass
-                
-                # Put items back
-                for item in temp_items:
-                    try:
-                        movie_queue.put_nowait(item)
-                    except Exception:
-                        pass
-                
-                if drained_movie > 0:
-                    log_info("Queue Drain", f"Drained {drained_movie} cleared items from in-memory movie queue", 
-                            module="background_tasks", function="drain_cleared_items_from_queues")
-            
-            # Drain TV queue
-            if cleared_tv_ids:
-                temp_items = []
-                try:
-                    while not tv_queue.empty():
-                        item = tv_queue.get_nowait()
-                        if isinstance(item, tuple) and len(item) >= 8:
-                            if item[0] == "tv_processing":  # Regular TV item
-                                item_tmdb_id = item[7] if len(item) > 7 else None
-                                if item_tmdb_id in cleared_tv_ids:
-                                    drained_tv += 1
-                                    continue  # Skip this item
-                        temp_items.append(item)
-                except Exception:
-                    pass
-                
-                # Put items back
-                for item in temp_items:
-                    try:
-                        tv_queue.put_nowait(item)
-                    except Exception:
-                        pass
-                
-                if drained_tv > 0:
-                    log_info("Queue Drain", f"Drained {drained_tv} cleared items from in-memory TV queue", 
-                            module="background_tasks", function="drain_cleared_items_from_queues")
+            if drained_movie > 0:
+                log_info("Queue Drain", f"Drained {drained_movie} cleared items from in-memory movie queue", 
+                        module="background_tasks", function="drain_cleared_items_from_queues")
+            if drained_tv > 0:
+                log_info("Queue Drain", f"Drained {drained_tv} cleared items from in-memory TV queue", 
+                        module="background_tasks", function="drain_cleared_items_from_queues")
         
         finally:
             db.close()
@@ -1197,7 +1316,7 @@ def drain_cleared_items_from_queues():
 def skip_queue_item(tmdb_id: int, media_type: str) -> bool:
     """
     Skip a queue item by removing it from queue and updating database.
-    Simplified approach: just remove from queue, no complex tracking.
+    The in-memory item is removed by key without draining the queue.
     
     Args:
         tmdb_id (int): TMDB ID of the media
@@ -1207,6 +1326,9 @@ def skip_queue_item(tmdb_id: int, media_type: str) -> bool:
         bool: True if item was removed from queue
     """
     try:
+        queue = movie_queue if media_type == 'movie' else tv_queue
+        removed_from_memory = queue.remove((tmdb_id, media_type))
+        
         if USE_DATABASE:
             from seerr.unified_media_manager import get_media_by_tmdb
             from seerr.database_queue_manager import database_queue_manager
@@ -1227,11 +1349,11 @@ def skip_queue_item(tmdb_id: int, media_type: str) -> bool:
                 log_info("Queue Cancellation", f"Removed item from queue: TMDB {tmdb_id} ({media_type})", 
                         module="background_tasks", function="skip_queue_item")
                 return True
-            else:
+            elif not removed_from_memory:
                 log_warning("Queue Cancellation", f"Item not found in queue: TMDB {tmdb_id} ({media_type})", 
                            module="background_tasks", function="skip_queue_item")
                 return False
-        return False
+        return removed_from_memory
     except Exception as e:
         log_error("Queue Cancellation", f"Error removing item from queue: {e}", 
                  module="background_tasks", function="skip_queue_item")
@@ -1252,6 +1374,8 @@ def clear_queue(media_type: str = None) -> int:
         count = 0
         drained_movie_count = 0
         drained_tv_count = 0
+        movie_tmdb_ids = set()
+        tv_tmdb_ids = set()
         
         if USE_DATABASE:
             from seerr.database import get_db
@@ -1273,10 +1397,6 @@ def clear_queue(media_type: str = None) -> int:
                 
                 queued_items = query.all()
                 
-                # Collect tmdb_ids to drain from in-memory queues
-                movie_tmdb_ids = set()
-                tv_tmdb_ids = set()
-                
                 for item in queued_items:
                     # Mark as failed in database
                     update_media_processing_status(
@@ -1302,77 +1422,15 @@ def clear_queue(media_type: str = None) -> int:
             finally:
                 db.close()
         
-        # Drain in-memory queues - remove items that match cleared tmdb_ids
-        global movie_queue, tv_queue
-        
+        # Remove cleared items from the in-memory queues by key; special tasks and other items stay in place
         if not media_type or media_type == 'movie':
-            # Drain movie queue
-            temp_items = []
-            try:
-                while not movie_queue.empty():
-                    item = movie_queue.get_nowait()
-                    # Check if this is a regular item (not a special task)
-                    if isinstance(item, tuple) and len(item) >= 6:
-                        if not isinstance(item[0], str):  # Regular item, not special task
-                            item_tmdb_id = item[5] if len(item) > 5 else None
-                            # Keep item only if it's not in the cleared list
-                            if item_tmdb_id not in movie_tmdb_ids:
-                                temp_items.append(item)
-                            else:
-                                drained_movie_count += 1
-                        else:
-                            # Special task, keep it
-                            temp_items.append(item)
-                    else:
-                        # Unknown format, keep it
-                        temp_items.append(item)
-            except Exception as e:
-                log_warning("Queue Cancellation", f"Error draining movie queue: {e}", 
-                           module="background_tasks", function="clear_queue")
-            
-            # Put items back
-            for item in temp_items:
-                try:
-                    movie_queue.put_nowait(item)
-                except Exception:
-                    pass  # Queue might be full, but we tried
-            
+            drained_movie_count = movie_queue.remove_keys((tmdb_id, 'movie') for tmdb_id in movie_tmdb_ids)
             if drained_movie_count > 0:
                 log_info("Queue Cancellation", f"Drained {drained_movie_count} items from in-memory movie queue", 
                         module="background_tasks", function="clear_queue")
         
         if not media_type or media_type == 'tv':
-            # Drain TV queue
-            temp_items = []
-            try:
-                while not tv_queue.empty():
-                    item = tv_queue.get_nowait()
-                    # Check if this is a regular item
-                    if isinstance(item, tuple) and len(item) >= 8:
-                        if item[0] == "tv_processing":  # Regular TV item
-                            item_tmdb_id = item[7] if len(item) > 7 else None
-                            # Keep item only if it's not in the cleared list
-                            if item_tmdb_id not in tv_tmdb_ids:
-                                temp_items.append(item)
-                            else:
-                                drained_tv_count += 1
-                        else:
-                            # Special task or other format, keep it
-                            temp_items.append(item)
-                    else:
-                        # Unknown format, keep it
-                        temp_items.append(item)
-            except Exception as e:
-                log_warning("Queue Cancellation", f"Error draining TV queue: {e}", 
-                           module="background_tasks", function="clear_queue")
-            
-            # Put items back
-            for item in temp_items:
-                try:
-                    tv_queue.put_nowait(item)
-                except Exception:
-                    pass  # Queue might be full, but we tried
-            
+            drained_tv_count = tv_queue.remove_keys((tmdb_id, 'tv') for tmdb_id in tv_tmdb_ids)
             if drained_tv_count > 0:
                 log_info("Queue Cancellation", f"Drained {drained_tv_count} items from in-memory TV queue", 
                         module="background_tasks", function="clear_queue")
@@ -1386,11 +1444,27 @@ def clear_queue(media_type: str = None) -> int:
                  module="background_tasks", function="clear_queue")
         return 0
 
-async def add_tv_to_queue(imdb_id, movie_title, media_type, extra_data, media_id, tmdb_id, request_id=None):
-    """Add a TV show request to the TV queue."""
+async def add_tv_to_queue(imdb_id, movie_title, media_type, extra_data, media_id, tmdb_id, request_id=None, priority=PRIORITY_SYNC):
+    """
+    Add a TV show request to the TV queue.
+    
+    Args:
+        priority (str): Priority class ('webhook', 'sync' or 'reconcile'); webhook requests are served first
+    """
+    queue_item = ("tv_processing", imdb_id, movie_title, media_type, extra_data, media_id, tmdb_id, request_id)
+    
+    # Collapse duplicate requests for a title that is already queued
+    if (tmdb_id, media_type) in tv_queue:
+        cancellation_registry.pop((tmdb_id, media_type), None)
+        tv_queue.merge_duplicate(queue_item, priority)
+        log_info("Queue Management", f"TV show already queued, merged request for IMDb ID: {imdb_id}, Title: {movie_title}", module="background_tasks", function="add_tv_to_queue")
+        return True
+    
+    # Backpressure: wait for a slot instead of dropping the request; only give up after the timeout
     if tv_queue.full():
-        tv_size = task_config.get_config('tv_queue_maxsize', 250)
-        log_warning("Queue Warning", f"TV queue is full (maxsize={tv_size}). Cannot add request for IMDb ID: {imdb_id}", module="background_tasks", function="add_tv_to_queue")
+        log_info("Queue Management", f"TV queue is full (maxsize={tv_queue.maxsize}). Waiting for capacity for IMDb ID: {imdb_id}", module="background_tasks", function="add_tv_to_queue")
+    if not await tv_queue.wait_for_capacity(get_enqueue_timeout()):
+        log_warning("Queue Warning", f"TV queue stayed full (maxsize={tv_queue.maxsize}). Cannot add request for IMDb ID: {imdb_id}", module="background_tasks", function="add_tv_to_queue")
         return False
     
     # Clear any stale cancellation tracking FIRST (before checking database)
@@ -1412,7 +1486,7 @@ async def add_tv_to_queue(imdb_id, movie_title, media_type, extra_data, media_id
             log_warning("Queue Warning", f"Media record not found for {movie_title} (TMDB: {tmdb_id}), adding to queue anyway", module="background_tasks", function="add_tv_to_queue")
     
     # Add to in-memory queue
-    await tv_queue.put(("tv_processing", imdb_id, movie_title, media_type, extra_data, media_id, tmdb_id, request_id))
+    await tv_queue.put(queue_item, priority)
     update_queue_activity_timestamp()  # Update timestamp when item is added
     
     # Update queue persistence (will calculate from database)
@@ -1483,7 +1557,8 @@ async def populate_queues_from_unified_media():
                             extra_data=item.extra_data or {},
                             media_id=item.overseerr_media_id or 0,
                             tmdb_id=item.tmdb_id,
-                            request_id=item.overseerr_request_id
+                            request_id=item.overseerr_request_id,
+                            priority=PRIORITY_RECONCILE
                         )
                         if success:
                             movies_added += 1
@@ -1527,7 +1602,8 @@ async def populate_queues_from_unified_media():
                                 extra_data=extra_data,
                                 media_id=item.overseerr_media_id or 0,
                                 tmdb_id=item.tmdb_id,
-                                request_id=item.overseerr_request_id
+                                request_id=item.overseerr_request_id,
+                                priority=PRIORITY_RECONCILE
                             )
                             if success:
                                 tv_shows_added += 1
@@ -1581,7 +1657,7 @@ async def process_unavailable_tv_show(first_request: dict, all_requests_for_medi
         log_info("Unavailable TV Processing", f"Processing unavailable TV show: {title} ({year}) - TMDB ID: {tmdb_id}", module="background_tasks", function="process_unavailable_tv_show")
         
         # Get Trakt details
-        trakt_details = get_media_details_from_trakt(tmdb_id, media_type)
+        trakt_details = await run_io(get_media_details_from_trakt, tmdb_id, media_type)
         if not trakt_details:
             log_warning("Unavailable TV Processing", f"Could not fetch Trakt details for TMDB ID {tmdb_id}, skipping", module="background_tasks", function="process_unavailable_tv_show")
             return
@@ -1610,7 +1686,7 @@ async def process_unavailable_tv_show(first_request: dict, all_requests_for_medi
         }
         
         # Start media processing
-        success = start_media_processing(
+        success = await run_io(start_media_processing,
             tmdb_id=tmdb_id,
             imdb_id=trakt_details.get('imdb_id'),
             trakt_id=trakt_details.get('trakt_id'),
@@ -1656,7 +1732,7 @@ async def process_unavailable_movie(first_request: dict):
         log_info("Unavailable Movie Processing", f"Processing unavailable movie: {title} ({year}) - TMDB ID: {tmdb_id}", module="background_tasks", function="process_unavailable_movie")
         
         # Get Trakt details
-        trakt_details = get_media_details_from_trakt(tmdb_id, media_type)
+        trakt_details = await run_io(get_media_details_from_trakt, tmdb_id, media_type)
         if not trakt_details:
             log_warning("Unavailable Movie Processing", f"Could not fetch Trakt details for TMDB ID {tmdb_id}, skipping", module="background_tasks", function="process_unavailable_movie")
             return
@@ -1675,7 +1751,7 @@ async def process_unavailable_movie(first_request: dict):
         }
         
         # Start media processing
-        success = start_media_processing(
+        success = await run_io(start_media_processing,
             tmdb_id=tmdb_id,
             imdb_id=trakt_details.get('imdb_id'),
             trakt_id=trakt_details.get('trakt_id'),
@@ -1711,17 +1787,27 @@ async def sync_all_requests_to_database():
     log_info("Database Sync", "Syncing all Overseerr requests to database...", module="background_tasks", function="sync_all_requests_to_database")
     
     try:
-        # Get processing requests (original logic)
-        processing_requests = get_overseerr_media_requests()
+        # Only requests updated since the last sync are fetched and processed; every
+        # FULL_SYNC_INTERVAL_SECONDS all of them are walked again
+        from seerr.overseerr import (
+            load_sync_cursor, save_sync_cursor, fetch_changed_overseerr_requests, select_processing_requests
+        )
+        try:
+            changed_requests, sync_cursor = await run_io(fetch_changed_overseerr_requests, load_sync_cursor())
+        except Exception as e:
+            # Keep the stored cursor so the missed changes are picked up next run
+            log_error("Database Sync Error", f"Failed to fetch requests from Overseerr: {e}", module="background_tasks", function="sync_all_requests_to_database")
+            return
+        
+        processing_requests = select_processing_requests(changed_requests) if changed_requests else []
         if not processing_requests:
-            log_info("Database Sync", "No processing requests found in Overseerr", module="background_tasks", function="sync_all_requests_to_database")
+            log_info("Database Sync", "No changed processing requests found in Overseerr", module="background_tasks", function="sync_all_requests_to_database")
         else:
-            log_info("Database Sync", f"Found {len(processing_requests)} processing requests", module="background_tasks", function="sync_all_requests_to_database")
+            log_info("Database Sync", f"Found {len(processing_requests)} changed processing requests", module="background_tasks", function="sync_all_requests_to_database")
         
         # Also check for TV shows with available/unavailable status that might need season updates
         from seerr.config import OVERSEERR_API_BASE_URL, OVERSEERR_API_KEY
         import requests
-        from seerr.overseerr import get_all_overseerr_requests_for_media
         from seerr.unified_media_manager import update_tv_show_season_count_comprehensive
         
         # Get overseerr_media_ids from the unified media table instead of from Overseerr API
@@ -1753,15 +1839,23 @@ async def sync_all_requests_to_database():
         # Process TV shows that need season updates (only if they exist in database)
         if tv_media_ids_to_check:
             from seerr.unified_media_manager import get_media_by_tmdb
-            import time
+            from seerr.overseerr import iter_overseerr_requests
             
-            for i, media_id in enumerate(tv_media_ids_to_check):
-                # Add small delay between API calls to respect rate limits
-                if i > 0:
-                    time.sleep(0.1)  # 100ms delay between calls
+            # Page through all requests once instead of once per media ID
+            requests_by_media = {}
+            try:
+                wanted_ids = set(tv_media_ids_to_check)
+                for item in await run_io(lambda: list(iter_overseerr_requests('all', 'added'))):
+                    # Only processing (status 3), excluding available (status 5) and unavailable (status 7)
+                    if item['media']['id'] in wanted_ids and item['media']['status'] == 3:
+                        requests_by_media.setdefault(item['media']['id'], []).append(item)
+            except Exception as e:
+                log_error("Database Sync Error", f"Failed to fetch all requests from Overseerr: {e}", module="background_tasks", function="sync_all_requests_to_database")
+            
+            for media_id in tv_media_ids_to_check:
                 try:
                     # Get all requests for this media ID to check seasons
-                    all_requests_for_media = get_all_overseerr_requests_for_media(media_id)
+                    all_requests_for_media = requests_by_media.get(media_id)
                     if not all_requests_for_media:
                         continue
                     
@@ -1787,7 +1881,7 @@ async def sync_all_requests_to_database():
                     if media_type == 'tv':
                         log_info("Database Sync", f"Checking season count for TV show: {existing_media.title} (Media ID: {media_id})", module="background_tasks", function="sync_all_requests_to_database")
                         
-                        update_success = update_tv_show_season_count_comprehensive(
+                        update_success = await run_io(update_tv_show_season_count_comprehensive,
                             overseerr_media_id=media_id,
                             tmdb_id=tmdb_id,
                             title=existing_media.title
@@ -1804,10 +1898,13 @@ async def sync_all_requests_to_database():
                     log_error("Database Sync Error", f"Error processing media ID {media_id}: {e}", module="background_tasks", function="sync_all_requests_to_database")
                     continue
         
+        # Media whose changed requests could not be processed; they are retried next run
+        failed_media_ids = set()
+        
         # Use enhanced sync manager for processing requests
         if processing_requests:
             from seerr.enhanced_sync_manager import enhanced_sync_all_requests
-            await enhanced_sync_all_requests()
+            failed_media_ids |= await enhanced_sync_all_requests(processing_requests)
         else:
             log_info("Database Sync", "No processing requests to sync", module="background_tasks", function="sync_all_requests_to_database")
         
@@ -1849,9 +1946,10 @@ async def sync_all_requests_to_database():
                 
                 # Only make Trakt API call if we don't have complete data
                 if needs_trakt_call:
-                    movie_details = get_media_details_from_trakt(tmdb_id, media_type)
+                    movie_details = await run_io(get_media_details_from_trakt, tmdb_id, media_type)
                     if not movie_details:
                         log_warning("Database Sync Warning", f"Could not get details for TMDB ID {tmdb_id}, skipping database sync", module="background_tasks", function="sync_all_requests_to_database")
+                        failed_media_ids.add(media_id)
                         continue
                 
                 # Determine status based on Overseerr status
@@ -1910,10 +2008,21 @@ async def sync_all_requests_to_database():
                 
             except Exception as e:
                 log_error("Database Sync Error", f"Error syncing request {request.get('id', 'unknown')}: {e}", module="background_tasks", function="sync_all_requests_to_database")
+                failed_media_ids.add(request.get('media', {}).get('id'))
                 continue
         
         log_success("Database Sync", f"Synced {synced_count} requests to database", module="background_tasks", function="sync_all_requests_to_database")
         
+        # Advance the high-water mark past the changed requests, but keep the ones that failed
+        # (every request of a failed media item) so they are fetched again next run
+        sync_cursor['retry_ids'] = sorted({
+            request['id'] for request in changed_requests
+            if request.get('media', {}).get('id') in failed_media_ids
+        })
+        if sync_cursor['retry_ids']:
+            log_warning("Database Sync Warning", f"{len(sync_cursor['retry_ids'])} request(s) failed and will be retried next sync", module="background_tasks", function="sync_all_requests_to_database")
+        await run_io(save_sync_cursor, sync_cursor)
+        
     except Exception as e:
         log_error("Database Sync Error", f"Error syncing requests to database: {e}", module="background_tasks", function="sync_all_requests_to_database")
 
@@ -1968,7 +2077,7 @@ async def populate_queues_from_overseerr():
     else:
         logger.info("Database not enabled. No discrepancy information available.")
 
-    requests = get_overseerr_media_requests()
+    requests = await run_io(get_overseerr_media_requests)
     if not requests:
         logger.info("No requests to process")
         # Add subscription check to TV queue even if no new requests
@@ -2070,7 +2179,7 @@ async def populate_queues_from_overseerr():
         # Only fetch Trakt details if we don't have the needed info
         if needs_trakt_call:
             from seerr.trakt import get_media_details_from_trakt
-            movie_details = get_media_details_from_trakt(tmdb_id, media_type)
+            movie_details = await run_io(get_media_details_from_trakt, tmdb_id, media_type)
             if not movie_details:
                 logger.error(f"Failed to get media details for TMDB ID {tmdb_id}")
                 continue
@@ -2112,7 +2221,7 @@ async def populate_queues_from_overseerr():
                 # Still create the media record with unreleased status, but don't add to queue
                 if USE_DATABASE:
                     from seerr.unified_media_manager import start_media_processing
-                    start_media_processing(
+                    await run_io(start_media_processing,
                         tmdb_id=tmdb_id,
                         imdb_id=imdb_id,
                         trakt_id=movie_details.get('trakt_id'),
@@ -2155,11 +2264,11 @@ async def populate_queues_from_overseerr():
             try:
                 logger.info(f"Fetching and processing images for {media_title}")
                 if media_type == 'movie':
-                    images = fetch_trakt_movie_images(str(movie_details['trakt_id']))
+                    images = await run_io(fetch_trakt_movie_images, str(movie_details['trakt_id']))
                     if images:
-                        image_data = store_media_images(media_title, tmdb_id, media_type, str(movie_details['trakt_id']))
+                        image_data = await run_io(store_media_images, media_title, tmdb_id, media_type, str(movie_details['trakt_id']))
                 else:  # TV show
-                    images = fetch_trakt_show_images(str(movie_details['trakt_id']))
+                    images = await run_io(fetch_trakt_show_images, str(movie_details['trakt_id']))
                     if images:
                         image_data = store_show_image(media_title, str(movie_details['trakt_id']), images)
                 
@@ -2178,7 +2287,7 @@ async def populate_queues_from_overseerr():
                 # Start tracking media processing AFTER successfully adding to queue
                 if USE_DATABASE:
                     from seerr.unified_media_manager import start_media_processing
-                    processed_media_id = start_media_processing(
+                    processed_media_id = await run_io(start_media_processing,
                         tmdb_id=tmdb_id,
                         imdb_id=imdb_id,
                         trakt_id=movie_details.get('trakt_id'),
@@ -2214,7 +2323,7 @@ async def populate_queues_from_overseerr():
                 # Start tracking media processing AFTER successfully adding to queue
                 if USE_DATABASE:
                     from seerr.unified_media_manager import start_media_processing
-                    processed_media_id = start_media_processing(
+                    processed_media_id = await run_io(start_media_processing,
                         tmdb_id=tmdb_id,
                         imdb_id=imdb_id,
                         trakt_id=movie_details.get('trakt_id'),
@@ -2283,11 +2392,14 @@ async def populate_queues_from_overseerr():
                 
                 seasons_data = []
                 
+                # One Trakt call returns every season with its episode air dates
+                all_seasons = await run_io(get_all_seasons_from_trakt, str(trakt_show_id))
+                
                 for season in requested_seasons:
                     season_number = int(season.split()[-1])  # Extract number from "Season X"
                     
                     # Fetch season details from Trakt
-                    season_details = get_season_details_from_trakt(str(trakt_show_id), season_number)
+                    season_details = await run_io(get_season_details_from_trakt, str(trakt_show_id), season_number, all_seasons)
                     
                     if season_details:
                         episode_count = season_details.get('episode_count', 0)
@@ -2296,8 +2408,8 @@ async def populate_queues_from_overseerr():
                         
                         # Check for next episode if there's a discrepancy
                         if episode_count != aired_episodes:
-                            has_aired, next_episode_details = check_next_episode_aired(
-                                str(trakt_show_id), season_number, aired_episodes
+                            has_aired, next_episode_details = await run_io(check_next_episode_aired,
+                                str(trakt_show_id), season_number, aired_episodes, season_details
                             )
                             if has_aired:
                                 logger.info(f"Next episode (E{aired_episodes + 1:02d}) has aired for {media_title} Season {season_number}. Updating aired_episodes.")
@@ -2455,7 +2567,7 @@ async def check_movie_processing():
                 if needs_trakt_call:
                     logger.info(f"No released_date in database for {movie.title}, fetching from Trakt API")
                     from seerr.trakt import get_media_details_from_trakt
-                    movie_details = get_media_details_from_trakt(movie.tmdb_id, 'movie')
+                    movie_details = await run_io(get_media_details_from_trakt, movie.tmdb_id, 'movie')
                     if not movie_details:
                         logger.warning(f"Could not get details for movie {movie.title} (TMDB: {movie.tmdb_id}). Skipping.")
                         continue
@@ -2487,7 +2599,8 @@ async def check_movie_processing():
                     extra_data=movie.extra_data,
                     media_id=movie.overseerr_media_id,
                     tmdb_id=movie.tmdb_id,
-                    request_id=movie.overseerr_request_id
+                    request_id=movie.overseerr_request_id,
+                    priority=PRIORITY_RECONCILE
                 )
                 
                 # Update the processing stage to indicate it's been re-queued
@@ -2540,6 +2653,9 @@ async def check_stuck_items_on_startup():
                 logger.info(f"Startup Check: Found {len(stuck_movies)} movies stuck in processing status. Checking release dates...")
                 
                 for movie in stuck_movies:
+                    if (movie.tmdb_id, 'movie') in movie_queue:
+                        # Already restored from the queue journal
+                        continue
                     try:
                         logger.info(f"Startup Check: Checking stuck movie: {movie.title} (TMDB: {movie.tmdb_id})")
                         
@@ -2575,7 +2691,7 @@ async def check_stuck_items_on_startup():
                         if needs_trakt_call:
                             logger.info(f"Startup Check: No released_date in database for {movie.title}, fetching from Trakt API")
                             from seerr.trakt import get_media_details_from_trakt
-                            movie_details = get_media_details_from_trakt(movie.tmdb_id, 'movie')
+                            movie_details = await run_io(get_media_details_from_trakt, movie.tmdb_id, 'movie')
                             if not movie_details:
                                 logger.warning(f"Startup Check: Could not get details for movie {movie.title} (TMDB: {movie.tmdb_id}). Skipping.")
                                 continue
@@ -2618,7 +2734,8 @@ async def check_stuck_items_on_startup():
                             extra_data=extra_data,
                             media_id=movie.overseerr_media_id,
                             tmdb_id=movie.tmdb_id,
-                            request_id=movie.overseerr_request_id
+                            request_id=movie.overseerr_request_id,
+                            priority=PRIORITY_RECONCILE
                         )
                         
                         # Update the processing stage to indicate it's been re-queued on startup
@@ -2648,6 +2765,9 @@ async def check_stuck_items_on_startup():
                 logger.info(f"Startup Check: Found {len(stuck_tv_shows)} TV shows in processing status. Checking which seasons need processing...")
                 
                 for tv_show in stuck_tv_shows:
+                    if (tv_show.tmdb_id, 'tv') in tv_queue:
+                        # Already restored from the queue journal
+                        continue
                     try:
                         logger.info(f"Startup Check: Analyzing TV show: {tv_show.title} (TMDB: {tv_show.tmdb_id})")
                         
@@ -2696,7 +2816,7 @@ async def check_stuck_items_on_startup():
                             
                             # Get media details from Trakt
                             from seerr.trakt import get_media_details_from_trakt
-                            tv_details = get_media_details_from_trakt(tv_show.tmdb_id, 'tv')
+                            tv_details = await run_io(get_media_details_from_trakt, tv_show.tmdb_id, 'tv')
                             if not tv_details:
                                 logger.warning(f"Startup Check: Could not get details for TV show {tv_show.title} (TMDB: {tv_show.tmdb_id}). Skipping.")
                                 continue
@@ -2723,7 +2843,8 @@ async def check_stuck_items_on_startup():
                                 extra_data=extra_data,
                                 media_id=tv_show.overseerr_media_id,
                                 tmdb_id=tv_show.tmdb_id,
-                                request_id=tv_show.overseerr_request_id
+                                request_id=tv_show.overseerr_request_id,
+                                priority=PRIORITY_RECONCILE
                             )
                             
                             # Update the processing stage to indicate it's been re-queued on startup
@@ -2763,11 +2884,14 @@ async def check_stuck_items_on_startup():
     except Exception as e:
         logger.error(f"Startup Check: Error during startup check: {e}")
 
-async def check_show_subscriptions():
+async def check_show_subscriptions(browser_driver=None):
     """
     Recurring task to check for new episodes in subscribed shows from database.
     Updates the database with the latest aired episode counts and processes new episodes if found.
     Also reattempts processing of previously failed episodes and checks for the next episode if there's a discrepancy.
+    
+    Args:
+        browser_driver (WebDriver, optional): Driver of a leased browser session; defaults to the primary session
     """
     # Check if show subscription task is enabled
     if not task_config.get_config('enable_show_subscription_task', False):
@@ -2777,7 +2901,8 @@ async def check_show_subscriptions():
     logger.info("Starting show subscription check...")
 
     # Check if browser driver is available
-    from seerr.browser import driver as browser_driver
+    if browser_driver is None:
+        from seerr.browser import driver as browser_driver
     if browser_driver is None:
         log_warning("Browser Warning", "Browser driver not initialized. Attempting to initialize...", module="background_tasks", function="populate_queues_from_overseerr")
         from seerr.browser import initialize_browser
@@ -2789,24 +2914,47 @@ async def check_show_subscriptions():
 
     logger.info("Starting show subscription check processing")
     
-    # Get active show subscriptions from unified_media table
+    # Get the active show subscriptions that are due from unified_media table
     from seerr.unified_models import UnifiedMedia
+    from seerr.air_date_scheduler import air_date_scheduler, next_season_check, to_season_value, FETCH_RETRY_SECONDS
+    subscription_filters = (
+        UnifiedMedia.media_type == 'tv',
+        UnifiedMedia.is_subscribed == True,
+        UnifiedMedia.status != 'ignored'  # Exclude ignored items
+    )
     db = get_db()
     try:
-        subscriptions = db.query(UnifiedMedia).filter(
-            UnifiedMedia.media_type == 'tv',
-            UnifiedMedia.is_subscribed == True,
-            UnifiedMedia.status != 'ignored'  # Exclude ignored items
-        ).all()
-        
-        if not subscriptions:
+        if not air_date_scheduler.seeded:
+            air_date_scheduler.seed(
+                db.query(UnifiedMedia.id, UnifiedMedia.seasons_data).filter(*subscription_filters).all()
+            )
+        subscribed_ids = [row.id for row in db.query(UnifiedMedia.id).filter(*subscription_filters).all()]
+        if not subscribed_ids:
             logger.info("No active show subscriptions found in database. Skipping show subscription check.")
             return
+        
+        # Only shows whose next episode is due (or that still have episodes to confirm) are checked
+        due_ids = air_date_scheduler.pop_due(subscribed_ids)
+        if not due_ids:
+            next_due = air_date_scheduler.next_due()
+            logger.info(f"None of {len(subscribed_ids)} subscribed show(s) is due. "
+                        f"Next due at {to_season_value(next_due) if next_due else 'unknown'} UTC.")
+            return
+        logger.info(f"{len(due_ids)} of {len(subscribed_ids)} subscribed show(s) are due for a check.")
+        
+        subscriptions = db.query(UnifiedMedia).filter(
+            *subscription_filters,
+            UnifiedMedia.id.in_(due_ids)
+        ).all()
     finally:
         db.close()
 
     # Process each show subscription from database
     for subscription in subscriptions:
+        # Back off until the seasons below set the real due time, so a show that is skipped
+        # or fails before that is retried after FETCH_RETRY_SECONDS instead of on every run
+        air_date_scheduler.schedule(subscription.id, time.time() + FETCH_RETRY_SECONDS)
+        
         # Check if item is still in queue before processing subscription
         # If user cleared it from queue, skip processing
         if subscription.is_in_queue == False:
@@ -2822,6 +2970,11 @@ async def check_show_subscriptions():
             logger.warning(f"No seasons_data found for {show_title}. Skipping.")
             continue
         
+        # One Trakt call returns every season with its episode air dates
+        all_seasons = await run_io(get_all_seasons_from_trakt, str(trakt_show_id)) if trakt_show_id and imdb_id else None
+        # When each season needs its next check, from the episode air dates
+        season_due_times = []
+        
         # Process each season in the seasons_data
         for season_data in subscription.seasons_data:
             if not isinstance(season_data, dict):
@@ -2852,9 +3005,10 @@ async def check_show_subscriptions():
                 continue
 
             # Fetch the latest season details from Trakt
-            latest_season_details = get_season_details_from_trakt(str(trakt_show_id), season_number)
+            latest_season_details = await run_io(get_season_details_from_trakt, str(trakt_show_id), season_number, all_seasons)
             if not latest_season_details:
                 logger.error(f"Failed to fetch latest season details for {show_title} Season {season_number}. Skipping.")
+                season_due_times.append(next_season_check(season_data, None, previous_aired_episodes))
                 continue
 
             current_aired_episodes = latest_season_details.get("aired_episodes", 0)
@@ -2863,8 +3017,8 @@ async def check_show_subscriptions():
 
             # Check for the next episode if there's a discrepancy
             if episode_count != current_aired_episodes:
-                has_aired, next_episode_details = check_next_episode_aired(
-                    str(trakt_show_id), season_number, current_aired_episodes
+                has_aired, next_episode_details = await run_io(check_next_episode_aired,
+                    str(trakt_show_id), season_number, current_aired_episodes, latest_season_details
                 )
                 if has_aired:
                     logger.info(f"Next episode (E{current_aired_episodes + 1:02d}) has aired for {show_title} Season {season_number}. Updating aired_episodes.")
@@ -2873,6 +3027,9 @@ async def check_show_subscriptions():
                 else:
                     logger.info(f"Next episode (E{current_aired_episodes + 1:02d}) has not aired for {show_title} Season {season_number}.")
 
+            next_check_at = next_season_check(season_data, latest_season_details, current_aired_episodes)
+            season_due_times.append(next_check_at)
+
             # Update the subscription in the database with latest episode counts
             # Use the unified media system instead of the old subscription system
             from seerr.unified_media_manager import update_media_details
@@ -2893,6 +3050,7 @@ async def check_show_subscriptions():
                             season_data['episode_count'] = episode_count
                             season_data['last_checked'] = datetime.utcnow().isoformat()
                             season_data['updated_at'] = datetime.utcnow().isoformat()
+                            season_data['next_check_at'] = to_season_value(next_check_at)
                             # Update other fields from latest_season_details if available
                             if 'status' in latest_season_details:
                                 season_data['status'] = latest_season_details['status']
@@ -2967,6 +3125,11 @@ async def check_show_subscriptions():
                     new_unprocessed_episodes.append(episode_id)
                     logger.info(f"Episode {episode_id} needs verification - not confirmed in database")
 
+        # The show is next due when its earliest season is
+        air_date_scheduler.schedule(
+            subscription.id, min(season_due_times) if season_due_times else time.time() + FETCH_RETRY_SECONDS
+        )
+
         # Update unprocessed episodes in database if we have new unprocessed episodes
         if new_unprocessed_episodes:
             # Combine with existing unprocessed episodes and remove duplicates
@@ -3003,8 +3166,6 @@ async def check_show_subscriptions():
             continue
 
         # Navigate to the show page
-        from seerr.browser import driver as browser_driver
-        
         # Check queue status before title search or navigation
         if tmdb_id:
             from seerr.search import _check_queue_status
@@ -3093,7 +3254,8 @@ async def check_show_subscriptions():
                     logger.error(f"Unexpected error in click_show_more_results: {e}")
 
                 # Wait for results to update
-                time.sleep(2)
+                adaptive_waits.wait(browser_driver, "episode_results",
+                                    results_settled(RESULT_CARD_XPATH, quiet_seconds=FILTER_QUIET_SECONDS), 2)
 
                 # Check for existing RD (100%) using check_red_buttons
                 confirmation_flag, confirmed_seasons = check_red_buttons(
@@ -3589,47 +3751,70 @@ async def search_individual_episodes(imdb_id, movie_title, season_number, season
     confirmed_seasons = set()
     is_tv_show = True
     
+    # Expand and read the season page once: cached episodes and episodes no result mentions
+    # are answered from memory, only the rest need a filtered search
+    from seerr.result_snapshot_cache import result_snapshot_cache
+    search_started = time.time()
+    season_snapshot = result_snapshot_cache.load(driver, movie_title, season_number, TORRENT_FILTER_REGEX)
+    
     # Process only the episodes that need processing
     for episode_id in episodes_to_process:
         logger.info(f"Searching for {movie_title} Season {season_number} {episode_id}")
         
+        cached_in_snapshot = False
+        if season_snapshot is not None:
+            # An episode is only marked failed on a snapshot read during this search
+            season_snapshot, cached_in_snapshot, absent_from_snapshot = result_snapshot_cache.find_episode_on_page(
+                driver, season_snapshot, movie_title, season_number, f"S{season_number:02d}{episode_id}",
+                confirmed_seasons, filter_text=TORRENT_FILTER_REGEX, fresh_since=search_started
+            )
+            if absent_from_snapshot:
+                logger.warning(f"No result boxes found for {episode_id}")
+                failed_episodes.append(episode_id)
+                all_confirmed = False
+                continue
+        
         # Clear and update the filter box with episode-specific filter
         try:
-            filter_input = WebDriverWait(driver, 3).until(
-                EC.presence_of_element_located((By.ID, "query"))
-            )
-            episode_filter = f"S{season_number:02d}{episode_id}"  # e.g., "S01E01"
-            full_filter = f"{TORRENT_FILTER_REGEX} {episode_filter}"
-            type_slowly(driver, filter_input, full_filter)  # Replace send_keys with slow typing
-            logger.info(f"Applied filter: {full_filter}")
+            if cached_in_snapshot:
+                confirmation_flag = True
+            else:
+                filter_input = WebDriverWait(driver, 3).until(
+                    EC.presence_of_element_located((By.ID, "query"))
+                )
+                episode_filter = f"S{season_number:02d}{episode_id}"  # e.g., "S01E01"
+                full_filter = f"{TORRENT_FILTER_REGEX} {episode_filter}"
+                type_slowly(driver, filter_input, full_filter)  # Replace send_keys with slow typing
+                logger.info(f"Applied filter: {full_filter}")
             
-            try:
-                click_show_more_results(driver, logger)
-            except TimeoutException:
-                logger.warning("Timed out while trying to click 'Show More Results'")
-            except Exception as e:
-                logger.error(f"Unexpected error in click_show_more_results: {e}")
+                try:
+                    click_show_more_results(driver, logger)
+                except TimeoutException:
+                    logger.warning("Timed out while trying to click 'Show More Results'")
+                except Exception as e:
+                    logger.error(f"Unexpected error in click_show_more_results: {e}")
 
             
-            # Wait for results to update after applying the filter
-            time.sleep(1)  # Adjust this delay if needed based on page response time
+                # Wait for results to update after applying the filter
+                adaptive_waits.wait(driver, "episode_results",
+                                    results_settled(RESULT_CARD_XPATH, quiet_seconds=FILTER_QUIET_SECONDS), 1)
             
-            # First pass: Check for existing RD (100%) using check_red_buttons
-            try:
-                confirmation_flag, confirmed_seasons = check_red_buttons(
-                    driver, movie_title, normalized_seasons, confirmed_seasons, is_tv_show, episode_id=episode_id
-                )
-            except StaleElementReferenceException as e:
-                logger.warning(f"Stale element reference in check_red_buttons for {episode_id}: {e}. Retrying...")
-                time.sleep(2)
+                # First pass: Check for existing RD (100%) using check_red_buttons
                 try:
                     confirmation_flag, confirmed_seasons = check_red_buttons(
                         driver, movie_title, normalized_seasons, confirmed_seasons, is_tv_show, episode_id=episode_id
                     )
-                except Exception as retry_e:
-                    logger.error(f"Failed to retry check_red_buttons for {episode_id}: {retry_e}")
-                    confirmation_flag = False
-                    confirmed_seasons = set()
+                except StaleElementReferenceException as e:
+                    logger.warning(f"Stale element reference in check_red_buttons for {episode_id}: {e}. Retrying...")
+                    time.sleep(2)
+                    try:
+                        confirmation_flag, confirmed_seasons = check_red_buttons(
+                            driver, movie_title, normalized_seasons, confirmed_seasons, is_tv_show, episode_id=episode_id
+                        )
+                    except Exception as retry_e:
+                        logger.error(f"Failed to retry check_red_buttons for {episode_id}: {retry_e}")
+                        confirmation_flag = False
+                        confirmed_seasons = set()
             
             if confirmation_flag:
                 logger.success(f"{episode_id} already cached at RD (100%). Skipping further processing.")
@@ -3706,7 +3891,8 @@ async def search_individual_episodes(imdb_id, movie_title, season_number, season
                         rd_zero_button.click()
                         logger.info(f"Clicked RD (0%) button to remove from queue")
                     if rd_zero_buttons:
-                        time.sleep(2)  # Wait for buttons to update
+                        # Wait for the buttons to update
+                        adaptive_waits.wait(driver, "rd_zero_undone", element_absent("//button[contains(text(), 'RD (0%)')]"), 2)
                         logger.info(f"Cleaned up {len(rd_zero_buttons)} RD (0%) buttons")
                 except Exception as e:
                     logger.warning(f"Error cleaning up RD (0%) buttons: {e}")
@@ -3812,8 +3998,11 @@ async def search_individual_episodes(imdb_id, movie_title, season_number, season
                                             rd_button.click()  # Click the RD (0%) button to undo it
                                             logger.info(f"Clicked RD (0%) button for {episode_id} to undo the action.")
                                             
-                                            # Wait a moment for the button state to change back
-                                            time.sleep(2)
+                                            # Wait for the button state to change back
+                                            adaptive_waits.wait(
+                                                driver, "rd_zero_undone",
+                                                lambda d: result_box.find_elements(By.XPATH, ".//button[contains(text(), 'DL with RD')]"), 2
+                                            )
                                             
                                             # Verify the button changed back to "DL with RD" in the same box
                                             try:
@@ -3919,8 +4108,8 @@ async def search_individual_episodes(imdb_id, movie_title, season_number, season
     
     # Reset the filter to the default after processing
     try:
-        filter_input = browser_driver.find_element(By.ID, "query")
-        type_slowly(browser_driver, filter_input, TORRENT_FILTER_REGEX)  # Slow typing for reset
+        filter_input = driver.find_element(By.ID, "query")
+        type_slowly(driver, filter_input, TORRENT_FILTER_REGEX)  # Slow typing for reset
         logger.info(f"Reset filter to default: {TORRENT_FILTER_REGEX}")
     except NoSuchElementException:
         logger.warning("Could not reset filter to default using ID 'query'")
@@ -4046,6 +4235,25 @@ def search_individual_episodes_sync(imdb_id, movie_title, season_number, season_
     finally:
         loop.close() 
 
+def check_show_subscriptions_sync(browser_driver=None):
+    """
+    Synchronous wrapper around check_show_subscriptions, run on a browser thread
+    so the subscription check does not block the main event loop.
+    
+    Args:
+        browser_driver (WebDriver, optional): Driver of a leased browser session
+    """
+    import asyncio
+    
+    # Create a new event loop and run the async function
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    
+    try:
+        return loop.run_until_complete(check_show_subscriptions(browser_driver))
+    finally:
+        loop.close()
+
 # Utility functions for status endpoint
 def get_queue_status():
     """Get the current status of all queues."""
@@ -4060,13 +4268,33 @@ def get_queue_status():
 
 async def get_detailed_queue_status():
     """Get detailed status of queues and processing state."""
+    from seerr.browser_pool import browser_pool
+    from seerr.queue_state_cache import queue_state_cache
+    from seerr.debrid_search_client import debrid_search_client
+    from seerr.utils import get_translation_stats
+    from seerr.result_snapshot_cache import result_snapshot_cache
+    from seerr.trakt_client import trakt_client
+    from seerr.trakt_cache import trakt_cache
+    from seerr.air_date_scheduler import air_date_scheduler
     return {
         "queues": get_queue_status(),
         "scheduled_tasks": {
             "active_jobs": len(scheduler.get_jobs()),
             "scheduler_running": scheduler.running
         },
-        "browser_available": browser_semaphore._value > 0,
+        "browser_available": browser_pool.available() > 0,
+        "browser_pool": browser_pool.get_status(),
+        "priority_classes": request_scheduler.get_wait_stats(),
+        "queue_state_cache": queue_state_cache.get_stats(),
+        "processing_watchdog": processing_watchdog.get_stats(),
+        "executors": executors.get_stats(),
+        "debrid_search_client": debrid_search_client.get_stats(),
+        "translations": get_translation_stats(),
+        "result_snapshot_cache": result_snapshot_cache.get_stats(),
+        "page_waits": adaptive_waits.get_stats(),
+        "trakt_client": trakt_client.get_stats(),
+        "trakt_cache": trakt_cache.get_stats(),
+        "air_date_scheduler": air_date_scheduler.get_stats(),
         "scheduled_task_locked": scheduled_task_semaphore.locked()
     }
 
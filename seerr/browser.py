@@ -17,7 +17,6 @@ from webdriver_manager.chrome import ChromeDriverManager, ChromeType
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import StaleElementReferenceException, NoSuchElementException, TimeoutException, ElementClickInterceptedException
-from fuzzywuzzy import fuzz
 from seerr.config import (
     HEADLESS_MODE,
     RD_ACCESS_TOKEN,
@@ -29,6 +28,14 @@ from seerr.config import (
     MAX_EPISODE_SIZE,
     USE_DATABASE
 )
+from seerr.adaptive_wait import adaptive_waits, all_of, element_absent, element_present, network_idle
+from seerr.browser_profile import (
+    ProfiledChrome,
+    apply_performance_profile,
+    block_unneeded_requests,
+    is_performance_profile_enabled,
+    page_load_stats
+)
 # Global driver variable to hold the Selenium WebDriver
 driver = None
 # Global library stats
@@ -38,6 +45,11 @@ library_stats = {
     "last_updated": None
 }
 
+# Library heading once the torrent count is filled in ("Library, 3132 torrents, 76.5 TB")
+LIBRARY_STATS_LOADED_XPATH = "//h1[contains(text(), 'Library') and contains(text(), 'torrents')]"
+
+SHOW_MORE_RESULTS_XPATH = "//button[contains(@class, 'haptic') and contains(text(), 'Show More Results')]"
+
 # Import database modules if using database
 if USE_DATABASE:
     from seerr.database import get_db, LibraryStats
@@ -111,281 +123,304 @@ def get_latest_chrome_driver():
     except Exception as e:
         logger.error(f"Error downloading Chrome driver: {e}")
         return None
-async def initialize_browser():
-    """Initialize the Selenium WebDriver and set up the browser."""
-    global driver
-    if driver is None:
-        logger.info("Starting persistent browser session.")
-        # Detect the current operating system
-        current_os = platform.system().lower() # Returns 'windows', 'linux', or 'darwin' (macOS)
-        current_arch = platform.machine().lower()
-        logger.info(f"Detected operating system: {current_os}, architecture: {current_arch}")
-        options = Options()
-        ### Handle Docker/Linux-specific configurations
-        if current_os == "linux" and os.getenv("RUNNING_IN_DOCKER", "false").lower() == "true":
-            logger.info("Detected Linux environment inside Docker. Applying Linux-specific configurations.")
-            # Explicitly set the Chrome binary location
-            options.binary_location = os.getenv("CHROME_BIN", "/usr/bin/google-chrome")
-            # Enable headless mode for Linux/Docker environments
-            options.add_argument("--headless=new") # Updated modern headless flag
-            options.add_argument("--no-sandbox") # Required for running as root in Docker
-            options.add_argument("--disable-dev-shm-usage") # Handle shared memory limitations
-            options.add_argument("--disable-gpu") # Disable GPU rendering for headless environments
-            options.add_argument("--disable-setuid-sandbox") # Bypass setuid sandbox
-        ### Handle Windows-specific configurations
-        elif current_os == "windows":
-            logger.info("Detected Windows environment. Applying Windows-specific configurations.")
-        elif current_os == "linux" and current_arch in ['aarch64', 'arm64']:
-            logger.info("Detected ARM Linux environment (likely Raspberry Pi). Applying ARM-specific configurations.")
-            options.binary_location = "/usr/bin/chromium-browser"
-            if HEADLESS_MODE:
-                options.add_argument("--headless=new")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--disable-setuid-sandbox")
+def create_browser_session(slot=0):
+    """
+    Launch a new Chrome session, log in to Debrid Media Manager and apply the DMM settings.
+    
+    Args:
+        slot: Browser pool slot the session is for; each slot keeps its own Chrome profile
+    
+    Returns:
+        WebDriver: The ready-to-use driver, or None if the session could not be started
+    """
+    driver = None
+    started = time.monotonic()
+    performance_profile = is_performance_profile_enabled()
+    logger.info("Starting persistent browser session.")
+    # Detect the current operating system
+    current_os = platform.system().lower() # Returns 'windows', 'linux', or 'darwin' (macOS)
+    current_arch = platform.machine().lower()
+    logger.info(f"Detected operating system: {current_os}, architecture: {current_arch}")
+    options = Options()
+    ### Handle Docker/Linux-specific configurations
+    if current_os == "linux" and os.getenv("RUNNING_IN_DOCKER", "false").lower() == "true":
+        logger.info("Detected Linux environment inside Docker. Applying Linux-specific configurations.")
+        # Explicitly set the Chrome binary location
+        options.binary_location = os.getenv("CHROME_BIN", "/usr/bin/google-chrome")
+        # Enable headless mode for Linux/Docker environments
+        options.add_argument("--headless=new") # Updated modern headless flag
+        options.add_argument("--no-sandbox") # Required for running as root in Docker
+        options.add_argument("--disable-dev-shm-usage") # Handle shared memory limitations
+        options.add_argument("--disable-gpu") # Disable GPU rendering for headless environments
+        options.add_argument("--disable-setuid-sandbox") # Bypass setuid sandbox
+    ### Handle Windows-specific configurations
+    elif current_os == "windows":
+        logger.info("Detected Windows environment. Applying Windows-specific configurations.")
+    elif current_os == "linux" and current_arch in ['aarch64', 'arm64']:
+        logger.info("Detected ARM Linux environment (likely Raspberry Pi). Applying ARM-specific configurations.")
+        options.binary_location = "/usr/bin/chromium-browser"
         if HEADLESS_MODE:
-            options.add_argument("--headless=new") # Modern headless mode for Chrome
-        options.add_argument("--disable-gpu") # Disable GPU for Docker compatibility
-        options.add_argument("--no-sandbox") # Required for running browser as root
-        options.add_argument("--disable-dev-shm-usage") # Disable shared memory usage restrictions
-        options.add_argument("--disable-setuid-sandbox") # Disable sandboxing for root permissions
-        options.add_argument("--enable-logging")
-        options.add_argument("--window-size=1920,1080") # Set explicit window size to avoid rendering issues
-        # WebDriver options to suppress infobars and disable automation detection
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--disable-infobars")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option("useAutomationExtension", False)
-        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36")
-        
-        try:
-            # In Docker, prioritize system-installed chromedriver (matches Chrome version from Dockerfile)
-            chrome_driver_path = None
-            if os.path.exists('/.dockerenv'):
-                # Docker environment - check system-installed chromedriver first
-                system_paths = ["/usr/local/bin/chromedriver", "/usr/bin/chromedriver"]
-                for sys_path in system_paths:
-                    if os.path.exists(sys_path):
-                        chrome_driver_path = sys_path
-                        logger.info(f"Using system-installed Chrome driver: {chrome_driver_path}")
-                        break
-                
-                # If system chromedriver not found, try downloading
-                if not chrome_driver_path:
-                    chrome_driver_path = get_latest_chrome_driver()
-                    if chrome_driver_path and os.path.exists(chrome_driver_path):
-                        logger.info(f"Using Chrome driver from Chrome for Testing: {chrome_driver_path}")
-            else:
-                # Local development - try downloading first
+            options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-setuid-sandbox")
+    if HEADLESS_MODE:
+        options.add_argument("--headless=new") # Modern headless mode for Chrome
+    options.add_argument("--disable-gpu") # Disable GPU for Docker compatibility
+    options.add_argument("--no-sandbox") # Required for running browser as root
+    options.add_argument("--disable-dev-shm-usage") # Disable shared memory usage restrictions
+    options.add_argument("--disable-setuid-sandbox") # Disable sandboxing for root permissions
+    options.add_argument("--enable-logging")
+    options.add_argument("--window-size=1920,1080") # Set explicit window size to avoid rendering issues
+    # WebDriver options to suppress infobars and disable automation detection
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--disable-infobars")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option("useAutomationExtension", False)
+    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36")
+    if performance_profile:
+        # Persistent per-slot profile and no images, fonts or unused Chrome features
+        apply_performance_profile(options, slot)
+    
+    try:
+        # In Docker, prioritize system-installed chromedriver (matches Chrome version from Dockerfile)
+        chrome_driver_path = None
+        if os.path.exists('/.dockerenv'):
+            # Docker environment - check system-installed chromedriver first
+            system_paths = ["/usr/local/bin/chromedriver", "/usr/bin/chromedriver"]
+            for sys_path in system_paths:
+                if os.path.exists(sys_path):
+                    chrome_driver_path = sys_path
+                    logger.info(f"Using system-installed Chrome driver: {chrome_driver_path}")
+                    break
+            
+            # If system chromedriver not found, try downloading
+            if not chrome_driver_path:
                 chrome_driver_path = get_latest_chrome_driver()
                 if chrome_driver_path and os.path.exists(chrome_driver_path):
                     logger.info(f"Using Chrome driver from Chrome for Testing: {chrome_driver_path}")
-          
+        else:
+            # Local development - try downloading first
+            chrome_driver_path = get_latest_chrome_driver()
             if chrome_driver_path and os.path.exists(chrome_driver_path):
-                driver = webdriver.Chrome(service=Service(chrome_driver_path), options=options)
+                logger.info(f"Using Chrome driver from Chrome for Testing: {chrome_driver_path}")
+      
+        if chrome_driver_path and os.path.exists(chrome_driver_path):
+            driver = ProfiledChrome(service=Service(chrome_driver_path), options=options)
+        else:
+            # Fallback to WebDriver Manager if download fails
+            logger.warning("Failed to get Chrome driver from Chrome for Testing. Falling back to appropriate driver.")
+            if current_arch in ['aarch64', 'arm64']:
+                driver = ProfiledChrome(service=Service("/usr/bin/chromedriver"), options=options)
             else:
-                # Fallback to WebDriver Manager if download fails
-                logger.warning("Failed to get Chrome driver from Chrome for Testing. Falling back to appropriate driver.")
-                if current_arch in ['aarch64', 'arm64']:
-                    driver = webdriver.Chrome(service=Service("/usr/bin/chromedriver"), options=options)
-                else:
-                    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-            # Suppress 'webdriver' detection
-            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-                "source": """
-                Object.defineProperty(navigator, 'webdriver', {
-                  get: () => undefined
-                })
-                """
+                driver = ProfiledChrome(service=Service(ChromeDriverManager().install()), options=options)
+        # Suppress 'webdriver' detection
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+            "source": """
+            Object.defineProperty(navigator, 'webdriver', {
+              get: () => undefined
             })
-            logger.info("Initialized Selenium WebDriver successfully.")
-            # Navigate to an initial page to confirm browser works
-            driver.get("https://debridmediamanager.com")
-            logger.info("Navigated to Debrid Media Manager page.")
-        except Exception as e:
-            logger.error(f"Failed to initialize Selenium WebDriver: {e}")
-            logger.warning("Browser automation will be disabled. The application will continue without browser functionality.")
-            driver = None # Ensure driver is None on failure
-            return None  # Return None instead of raising the exception
-        # If initialization succeeded, continue with setup
-        if driver:
+            """
+        })
+        if performance_profile:
+            block_unneeded_requests(driver)
+        page_load_stats.observe_startup(slot, time.monotonic() - started)
+        logger.info(f"Initialized Selenium WebDriver successfully in {time.monotonic() - started:.1f}s.")
+        # Navigate to an initial page to confirm browser works
+        driver.get("https://debridmediamanager.com")
+        logger.info("Navigated to Debrid Media Manager page.")
+    except Exception as e:
+        logger.error(f"Failed to initialize Selenium WebDriver: {e}")
+        logger.warning("Browser automation will be disabled. The application will continue without browser functionality.")
+        driver = None # Ensure driver is None on failure
+        return None  # Return None instead of raising the exception
+    # If initialization succeeded, continue with setup
+    if driver:
+        try:
+            # Inject Real-Debrid access token and other credentials into local storage
+            driver.execute_script(f"""
+                localStorage.setItem('rd:accessToken', '{RD_ACCESS_TOKEN}');
+                localStorage.setItem('rd:clientId', '"{RD_CLIENT_ID}"');
+                localStorage.setItem('rd:clientSecret', '"{RD_CLIENT_SECRET}"');
+                localStorage.setItem('rd:refreshToken', '"{RD_REFRESH_TOKEN}"');
+            """)
+            logger.info("Set Real-Debrid credentials in local storage.")
+            # Refresh the page to apply the local storage values
+            driver.refresh()
+            login(driver)
+            logger.info("Refreshed the page to apply local storage values.")
+            driver.refresh()
+            # Handle potential premium expiration modal
             try:
-                # Inject Real-Debrid access token and other credentials into local storage
-                driver.execute_script(f"""
-                    localStorage.setItem('rd:accessToken', '{RD_ACCESS_TOKEN}');
-                    localStorage.setItem('rd:clientId', '"{RD_CLIENT_ID}"');
-                    localStorage.setItem('rd:clientSecret', '"{RD_CLIENT_SECRET}"');
-                    localStorage.setItem('rd:refreshToken', '"{RD_REFRESH_TOKEN}"');
-                """)
-                logger.info("Set Real-Debrid credentials in local storage.")
-                # Refresh the page to apply the local storage values
-                driver.refresh()
-                login(driver)
-                logger.info("Refreshed the page to apply local storage values.")
-                driver.refresh()
-                # Handle potential premium expiration modal
-                try:
-                    modal_h2 = WebDriverWait(driver, 2).until(
-                        EC.presence_of_element_located((By.XPATH, "//h2[contains(text(), 'Premium Expiring Soon')]"))
-                    )
-                    logger.info("Premium Expiring Soon modal detected.")
-                    # Extract the message to get days
-                    p_element = driver.find_element(By.XPATH, "//p[contains(text(), 'Your Real-Debrid premium subscription will expire in')]")
-                    message = p_element.text.strip()
-                    import re
-                    days_match = re.search(r'expire in (\d+) days', message)
-                    days = int(days_match.group(1)) if days_match else "UNKNOWN"
-                    # Log distinct message in big caps
-                    logger.warning(f"YOUR REAL-DEBRID PREMIUM WILL EXPIRE IN {days} DAYS!!!")
-                    # Click Cancel to dismiss
-                    cancel_button = driver.find_element(By.XPATH, "//button[text()='Cancel']")
-                    cancel_button.click()
-                    logger.info("Dismissed the premium expiration modal by clicking Cancel.")
-                    time.sleep(1) # Wait briefly for modal to disappear
-                except TimeoutException:
-                    logger.info("No premium expiration modal found. Proceeding.")
-              
-                # Navigate to the new settings page
-                try:
-                    logger.info("Navigating to the new settings page.")
-                    driver.get("https://debridmediamanager.com/settings")
-                    WebDriverWait(driver, 3).until(
-                        EC.presence_of_element_located((By.ID, "dmm-movie-max-size"))
-                    )
-                    logger.info("Settings page loaded successfully.")
-                    logger.info("Locating maximum movie size select element in 'Settings'.")
-                    max_movie_select_elem = WebDriverWait(driver, 3).until(
-                        EC.visibility_of_element_located((By.ID, "dmm-movie-max-size"))
-                    )
-                    # Initialize Select class with the <select> WebElement
-                    select_obj = Select(max_movie_select_elem)
-                    
-                    # Get all available options to validate the value
-                    available_options = [option.get_attribute('value') for option in select_obj.options]
-                    logger.info(f"Available movie size options: {available_options}")
-                    
-                    # Validate and select the appropriate movie size
-                    movie_size_value = str(int(MAX_MOVIE_SIZE)) if MAX_MOVIE_SIZE is not None else "0"
-                    if movie_size_value in available_options:
-                        select_obj.select_by_value(movie_size_value)
-                        logger.info("Biggest Movie Size Selected as {} GB.".format(MAX_MOVIE_SIZE))
-                    else:
-                        # Fallback to "Biggest available" (value="0") if the specified value is not available
-                        logger.warning(f"Movie size value '{movie_size_value}' not available. Available options: {available_options}. Using 'Biggest available' (0) as fallback.")
-                        select_obj.select_by_value("0")
-                        logger.info("Biggest Movie Size Selected as 'Biggest available' (0) as fallback.")
-                    # MAX EPISODE SIZE: Locate the maximum series size select element
-                    logger.info("Locating maximum series size select element in 'Settings'.")
-                    max_episode_select_elem = WebDriverWait(driver, 3).until(
-                        EC.visibility_of_element_located((By.ID, "dmm-episode-max-size"))
-                    )
-                    # Initialize Select class with the <select> WebElement
-                    select_obj = Select(max_episode_select_elem)
-                    
-                    # Get all available options to validate the value
-                    available_options = [option.get_attribute('value') for option in select_obj.options]
-                    logger.info(f"Available episode size options: {available_options}")
-                    
-                    # Validate and select the appropriate episode size
-                    # Handle both integer and float values properly
-                    if MAX_EPISODE_SIZE is not None:
-                        if MAX_EPISODE_SIZE == int(MAX_EPISODE_SIZE):
-                            # Integer value (e.g., 1, 3, 5)
-                            episode_size_value = str(int(MAX_EPISODE_SIZE))
-                        else:
-                            # Float value (e.g., 0.1, 0.3, 0.5)
-                            episode_size_value = str(MAX_EPISODE_SIZE)
-                    else:
-                        episode_size_value = "0"
-                    
-                    if episode_size_value in available_options:
-                        select_obj.select_by_value(episode_size_value)
-                        logger.info("Biggest Episode Size Selected as {} GB.".format(MAX_EPISODE_SIZE))
-                    else:
-                        # Fallback to "Biggest available" (value="0") if the specified value is not available
-                        logger.warning(f"Episode size value '{episode_size_value}' not available. Available options: {available_options}. Using 'Biggest available' (0) as fallback.")
-                        select_obj.select_by_value("0")
-                        logger.info("Biggest Episode Size Selected as 'Biggest available' (0) as fallback.")
-                    # Locate the "Default torrents filter" input box and insert the regex
-                    logger.info("Attempting to insert regex into 'Default torrents filter' box.")
-                    default_filter_input = WebDriverWait(driver, 3).until(
-                        EC.presence_of_element_located((By.ID, "dmm-default-torrents-filter"))
-                    )
-                    if TORRENT_FILTER_REGEX is not None:
-                        default_filter_input.clear() # Clear any existing filter
-                        default_filter_input.send_keys(TORRENT_FILTER_REGEX)
-                        logger.info(f"Inserted regex into 'Default torrents filter' input box: {TORRENT_FILTER_REGEX}")
+                modal_h2 = WebDriverWait(driver, 2).until(
+                    EC.presence_of_element_located((By.XPATH, "//h2[contains(text(), 'Premium Expiring Soon')]"))
+                )
+                logger.info("Premium Expiring Soon modal detected.")
+                # Extract the message to get days
+                p_element = driver.find_element(By.XPATH, "//p[contains(text(), 'Your Real-Debrid premium subscription will expire in')]")
+                message = p_element.text.strip()
+                import re
+                days_match = re.search(r'expire in (\d+) days', message)
+                days = int(days_match.group(1)) if days_match else "UNKNOWN"
+                # Log distinct message in big caps
+                logger.warning(f"YOUR REAL-DEBRID PREMIUM WILL EXPIRE IN {days} DAYS!!!")
+                # Click Cancel to dismiss
+                cancel_button = driver.find_element(By.XPATH, "//button[text()='Cancel']")
+                cancel_button.click()
+                logger.info("Dismissed the premium expiration modal by clicking Cancel.")
+                # Wait for the modal to disappear
+                adaptive_waits.wait(driver, "premium_modal_closed", element_absent("//button[text()='Cancel']"), 1)
+            except TimeoutException:
+                logger.info("No premium expiration modal found. Proceeding.")
+          
+            # Navigate to the new settings page
+            try:
+                logger.info("Navigating to the new settings page.")
+                driver.get("https://debridmediamanager.com/settings")
+                WebDriverWait(driver, 3).until(
+                    EC.presence_of_element_located((By.ID, "dmm-movie-max-size"))
+                )
+                logger.info("Settings page loaded successfully.")
+                logger.info("Locating maximum movie size select element in 'Settings'.")
+                max_movie_select_elem = WebDriverWait(driver, 3).until(
+                    EC.visibility_of_element_located((By.ID, "dmm-movie-max-size"))
+                )
+                # Initialize Select class with the <select> WebElement
+                select_obj = Select(max_movie_select_elem)
+                
+                # Get all available options to validate the value
+                available_options = [option.get_attribute('value') for option in select_obj.options]
+                logger.info(f"Available movie size options: {available_options}")
+                
+                # Validate and select the appropriate movie size
+                movie_size_value = str(int(MAX_MOVIE_SIZE)) if MAX_MOVIE_SIZE is not None else "0"
+                if movie_size_value in available_options:
+                    select_obj.select_by_value(movie_size_value)
+                    logger.info("Biggest Movie Size Selected as {} GB.".format(MAX_MOVIE_SIZE))
+                else:
+                    # Fallback to "Biggest available" (value="0") if the specified value is not available
+                    logger.warning(f"Movie size value '{movie_size_value}' not available. Available options: {available_options}. Using 'Biggest available' (0) as fallback.")
+                    select_obj.select_by_value("0")
+                    logger.info("Biggest Movie Size Selected as 'Biggest available' (0) as fallback.")
+                # MAX EPISODE SIZE: Locate the maximum series size select element
+                logger.info("Locating maximum series size select element in 'Settings'.")
+                max_episode_select_elem = WebDriverWait(driver, 3).until(
+                    EC.visibility_of_element_located((By.ID, "dmm-episode-max-size"))
+                )
+                # Initialize Select class with the <select> WebElement
+                select_obj = Select(max_episode_select_elem)
+                
+                # Get all available options to validate the value
+                available_options = [option.get_attribute('value') for option in select_obj.options]
+                logger.info(f"Available episode size options: {available_options}")
+                
+                # Validate and select the appropriate episode size
+                # Handle both integer and float values properly
+                if MAX_EPISODE_SIZE is not None:
+                    if MAX_EPISODE_SIZE == int(MAX_EPISODE_SIZE):
+                        # Integer value (e.g., 1, 3, 5)
+                        episode_size_value = str(int(MAX_EPISODE_SIZE))
                     else:
-                        logger.info("TORRENT_FILTER_REGEX is not set. Skipping insertion into 'Default torrents filter' box.")
-                    # Assume settings are auto-saved; no explicit save button
-                    logger.info("Settings updated successfully.")
-                except (TimeoutException, NoSuchElementException, ElementClickInterceptedException) as ex:
-                    logger.error(f"Error while interacting with the settings: {ex}")
-                    logger.warning("Continuing without applying custom settings (TORRENT_FILTER_REGEX, MAX_MOVIE_SIZE, MAX_EPISODE_SIZE)")
-                except Exception as ex:
-                    logger.error(f"Unexpected error while configuring settings: {ex}")
-                    logger.warning("Continuing without applying custom settings due to unexpected error")
-                # Navigate to the library section
-                logger.info("Navigating to the library section.")
-                driver.get("https://debridmediamanager.com/library")
-                # Wait for 2 seconds on the library page before further processing
-                try:
-                    # Ensure the library page has loaded correctly (e.g., wait for a specific element on the library page)
-                    library_element = WebDriverWait(driver, 2).until(
-                        EC.presence_of_element_located((By.XPATH, "//div[@id='library-content']")) # Adjust the XPath as necessary
-                    )
-                    logger.info("Library section loaded successfully.")
-                except TimeoutException:
-                    logger.info("Library loading.")
-                # Wait for at least 7 seconds on the library page
-                logger.info("Waiting for 7 seconds on the library page.")
-                time.sleep(7)
-                logger.info("Completed waiting on the library page.")
+                        # Float value (e.g., 0.1, 0.3, 0.5)
+                        episode_size_value = str(MAX_EPISODE_SIZE)
+                else:
+                    episode_size_value = "0"
+                
+                if episode_size_value in available_options:
+                    select_obj.select_by_value(episode_size_value)
+                    logger.info("Biggest Episode Size Selected as {} GB.".format(MAX_EPISODE_SIZE))
+                else:
+                    # Fallback to "Biggest available" (value="0") if the specified value is not available
+                    logger.warning(f"Episode size value '{episode_size_value}' not available. Available options: {available_options}. Using 'Biggest available' (0) as fallback.")
+                    select_obj.select_by_value("0")
+                    logger.info("Biggest Episode Size Selected as 'Biggest available' (0) as fallback.")
+                # Locate the "Default torrents filter" input box and insert the regex
+                logger.info("Attempting to insert regex into 'Default torrents filter' box.")
+                default_filter_input = WebDriverWait(driver, 3).until(
+                    EC.presence_of_element_located((By.ID, "dmm-default-torrents-filter"))
+                )
+                if TORRENT_FILTER_REGEX is not None:
+                    default_filter_input.clear() # Clear any existing filter
+                    default_filter_input.send_keys(TORRENT_FILTER_REGEX)
+                    logger.info(f"Inserted regex into 'Default torrents filter' input box: {TORRENT_FILTER_REGEX}")
+                else:
+                    logger.info("TORRENT_FILTER_REGEX is not set. Skipping insertion into 'Default torrents filter' box.")
+                # Assume settings are auto-saved; no explicit save button
+                logger.info("Settings updated successfully.")
+            except (TimeoutException, NoSuchElementException, ElementClickInterceptedException) as ex:
+                logger.error(f"Error while interacting with the settings: {ex}")
+                logger.warning("Continuing without applying custom settings (TORRENT_FILTER_REGEX, MAX_MOVIE_SIZE, MAX_EPISODE_SIZE)")
+            except Exception as ex:
+                logger.error(f"Unexpected error while configuring settings: {ex}")
+                logger.warning("Continuing without applying custom settings due to unexpected error")
+            # Navigate to the library section
+            logger.info("Navigating to the library section.")
+            driver.get("https://debridmediamanager.com/library")
+            # Wait for 2 seconds on the library page before further processing
+            try:
+                # Ensure the library page has loaded correctly (e.g., wait for a specific element on the library page)
+                library_element = WebDriverWait(driver, 2).until(
+                    EC.presence_of_element_located((By.XPATH, "//div[@id='library-content']")) # Adjust the XPath as necessary
+                )
+                logger.info("Library section loaded successfully.")
+            except TimeoutException:
+                logger.info("Library loading.")
+            # Wait until the library stats are rendered and the page stopped loading (was a fixed 7 seconds)
+            logger.info("Waiting for the library page to finish loading.")
+            adaptive_waits.wait(driver, "library_page", all_of(element_present(LIBRARY_STATS_LOADED_XPATH), network_idle()), 7)
+            logger.info("Completed waiting on the library page.")
+         
+            # Extract library stats from the page
+            try:
+                logger.info("Extracting library statistics from the page.")
+                library_stats_element = WebDriverWait(driver, 3).until(
+                    EC.presence_of_element_located((By.XPATH, "//h1[contains(@class, 'text-xl') and contains(@class, 'font-bold') and contains(@class, 'text-white') and contains(text(), 'Library')]"))
+                )
+                library_stats_text = library_stats_element.text.strip()
+                logger.info(f"Found library stats text: {library_stats_text}")
              
-                # Extract library stats from the page
-                try:
-                    logger.info("Extracting library statistics from the page.")
-                    library_stats_element = WebDriverWait(driver, 3).until(
-                        EC.presence_of_element_located((By.XPATH, "//h1[contains(@class, 'text-xl') and contains(@class, 'font-bold') and contains(@class, 'text-white') and contains(text(), 'Library')]"))
-                    )
-                    library_stats_text = library_stats_element.text.strip()
-                    logger.info(f"Found library stats text: {library_stats_text}")
-                 
-                    # Parse the text to extract torrent count and size
-                    # Example: "Library, 3132 torrents, 76.5 TB"
-                    import re
-                    from datetime import datetime
-                 
-                    # Extract torrent count
-                    torrent_match = re.search(r'(\d+)\s+torrents', library_stats_text)
-                    torrents_count = int(torrent_match.group(1)) if torrent_match else 0
-                 
-                    # Extract TB size
-                    size_match = re.search(r'([\d.]+)\s*TB', library_stats_text)
-                    total_size_tb = float(size_match.group(1)) if size_match else 0.0
-                 
-                    # Update global library stats
-                    global library_stats
-                    library_stats = {
-                        "torrents_count": torrents_count,
-                        "total_size_tb": total_size_tb,
-                        "last_updated": datetime.now().isoformat()
-                    }
-                 
-                    logger.info(f"Successfully extracted library stats: {torrents_count} torrents, {total_size_tb} TB")
-                 
-                except TimeoutException:
-                    logger.warning("Could not find library stats element on the page within timeout.")
-                except Exception as e:
-                    logger.error(f"Error extracting library stats: {e}")
+                # Parse the text to extract torrent count and size
+                # Example: "Library, 3132 torrents, 76.5 TB"
+                import re
+                from datetime import datetime
+             
+                # Extract torrent count
+                torrent_match = re.search(r'(\d+)\s+torrents', library_stats_text)
+                torrents_count = int(torrent_match.group(1)) if torrent_match else 0
+             
+                # Extract TB size
+                size_match = re.search(r'([\d.]+)\s*TB', library_stats_text)
+                total_size_tb = float(size_match.group(1)) if size_match else 0.0
+             
+                # Update global library stats
+                global library_stats
+                library_stats = {
+                    "torrents_count": torrents_count,
+                    "total_size_tb": total_size_tb,
+                    "last_updated": datetime.now().isoformat()
+                }
              
-                logger.info("Browser initialization completed successfully.")
+                logger.info(f"Successfully extracted library stats: {torrents_count} torrents, {total_size_tb} TB")
+             
+            except TimeoutException:
+                logger.warning("Could not find library stats element on the page within timeout.")
             except Exception as e:
-                logger.error(f"Error during browser setup: {e}")
-                if driver:
-                    driver.quit()
-                    driver = None
+                logger.error(f"Error extracting library stats: {e}")
+         
+            logger.info("Browser initialization completed successfully.")
+        except Exception as e:
+            logger.error(f"Error during browser setup: {e}")
+            if driver:
+                driver.quit()
+                driver = None
+    return driver
+
+async def initialize_browser():
+    """Initialize the Selenium WebDriver and set up the browser."""
+    global driver
+    if driver is None:
+        driver = create_browser_session()
     else:
         logger.info("Browser already initialized.")
  
@@ -428,32 +463,39 @@ def login(driver):
 def click_show_more_results(driver, logger, max_attempts=3, wait_between=3, initial_timeout=5, subsequent_timeout=5):
     """
     Attempts to click the 'Show More Results' button multiple times with waits in between.
+    After each click it waits until the extra results are rendered instead of sleeping.
     
     Args:
         driver: The WebDriver instance
         logger: Logger instance for logging events
         max_attempts: Number of times to try clicking the button (default: 2)
-        wait_between: Seconds to wait between clicks (default: 3)
+        wait_between: Longest wait in seconds between clicks (default: 3)
         initial_timeout: Initial timeout in seconds for first click (default: 5)
         subsequent_timeout: Timeout in seconds for subsequent clicks (default: 5)
     """
+    from seerr.adaptive_wait import results_settled
+    
     for attempt in range(max_attempts):
         try:
             # Adjust timeout based on whether it's the first attempt
             timeout = initial_timeout if attempt == 0 else subsequent_timeout
             
-            # Locate and click the button
+            # Locate and click the button. After the first click the results have settled,
+            # so a button that is not there now is not coming.
+            if attempt > 0 and not driver.find_elements(By.XPATH, SHOW_MORE_RESULTS_XPATH):
+                logger.info("No further 'Show More Results' button after the results settled.")
+                break
             show_more_button = WebDriverWait(driver, timeout).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(@class, 'haptic') and contains(text(), 'Show More Results')]"))
+                EC.element_to_be_clickable((By.XPATH, SHOW_MORE_RESULTS_XPATH))
             )
+            cards_before = len(driver.find_elements(By.XPATH, RESULT_CARD_XPATH))
             show_more_button.click()
             logger.info(f"Clicked 'Show More Results' button ({attempt + 1}{'st' if attempt == 0 else 'nd/th'} time).")
             
-            # Wait between clicks if not the last attempt
-            if attempt < max_attempts - 1:
-                time.sleep(wait_between)
-                
-            time.sleep(2)    
+            # Wait for the extra results (was wait_between seconds, plus 2 seconds, after each click)
+            baseline = wait_between + 2 if attempt < max_attempts - 1 else 2
+            adaptive_waits.wait(driver, "show_more_results",
+                                results_settled(RESULT_CARD_XPATH, min_count=cards_before + 1), baseline)
         except TimeoutException:
             logger.info(f"No 'Show More Results' button found for {attempt + 1}{'st' if attempt == 0 else 'nd/th'} click after {timeout} seconds. Proceeding anyway.")
             break  # Exit the loop if we can't find the button
@@ -642,6 +684,10 @@ def attempt_button_click_with_state_check(button, result_box):
         button.click()
         logger.info("Clicked the button.")
 
+        # The page's RD states changed; cached result snapshots of it are stale
+        from seerr.result_snapshot_cache import result_snapshot_cache
+        result_snapshot_cache.invalidate_page(result_box)
+
         # Wait for a short period (max 2 seconds) to check for changes in the state
         WebDriverWait(result_box, 2).until(
             lambda driver: button.get_attribute("class") != initial_state
@@ -657,40 +703,104 @@ def attempt_button_click_with_state_check(button, result_box):
 
     return False
 
-def relocate_red_buttons(driver, target_index):
+# Reads every result card in one WebDriver round-trip. Cards are selected with the same XPath
+# the Selenium code uses, so card["index"] - 1 is the position in find_elements() results.
+RESULT_CARDS_SNAPSHOT_SCRIPT = """
+const found = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const units = {TB: 1024, GB: 1, MB: 1 / 1024};
+const cards = [];
+for (let i = 0; i < found.snapshotLength; i++) {
+    const card = found.snapshotItem(i);
+    const heading = card.querySelector('h2');
+    const size = (card.innerText || '').match(/(\\d+(?:\\.\\d+)?)\\s*(TB|GB|MB)\\b/i);
+    cards.push({
+        index: i + 1,
+        title: heading ? heading.innerText.trim() : '',
+        buttons: Array.from(card.querySelectorAll('button')).map(button => ({
+            label: (button.innerText || '').trim(),
+            className: typeof button.className === 'string' ? button.className : ''
+        })),
+        badges: Array.from(card.querySelectorAll('span')).map(span => (span.innerText || '').trim()).filter(Boolean),
+        size: size ? size[0] : null,
+        size_gb: size ? parseFloat(size[1]) * units[size[2].toUpperCase()] : null
+    });
+}
+return cards;
+"""
+
+RESULT_CARD_XPATH = "//div[contains(@class, 'border-2')]"
+
+
+def snapshot_result_cards(driver, card_xpath=RESULT_CARD_XPATH):
     """
-    Re-locate red buttons after stale element reference
-    Returns the button at target_index if found, None otherwise
+    Read the title, button labels, badges and size of every DMM result card at once.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        card_xpath: XPath selecting the result cards
+        
+    Returns:
+        list: One dict per card with index (1-based), title, buttons (label, className),
+            badges, size and size_gb, in page order
     """
     try:
-        # Wait a bit for the page to stabilize
-        time.sleep(1)
-        
-        # Re-find all red buttons
-        all_red_buttons_elements = driver.find_elements(By.XPATH, "//button[contains(@class, 'bg-red-900/30')]")
-        red_buttons_elements = []
-        for button in all_red_buttons_elements:
-            try:
-                button_text = button.text.strip()
-                if "Report" not in button_text and "RD (100%)" in button_text:
-                    red_buttons_elements.append(button)
-            except StaleElementReferenceException:
-                logger.warning("Button became stale during re-location filtering, skipping...")
-                continue
-            except Exception as e:
-                logger.warning(f"Error accessing button text during re-location filtering: {e}")
-                continue
-        
-        logger.info(f"Re-located {len(red_buttons_elements)} red buttons, looking for index {target_index}")
-        
-        if target_index <= len(red_buttons_elements):
-            return red_buttons_elements[target_index-1]
-        return None
+        return driver.execute_script(RESULT_CARDS_SNAPSHOT_SCRIPT, card_xpath) or []
     except Exception as e:
-        logger.warning(f"Error re-locating red buttons: {e}")
+        logger.warning(f"Error taking result card snapshot: {e}")
+        return []
+
+
+def get_result_card(driver, index, card_xpath=RESULT_CARD_XPATH):
+    """
+    Locate a single result card by its snapshot index, e.g. to click one of its buttons.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        index: 1-based card index from snapshot_result_cards
+        card_xpath: XPath selecting the result cards
+        
+    Returns:
+        WebElement: The result card, or None if the page changed and it no longer exists
+    """
+    try:
+        return driver.find_element(By.XPATH, f"({card_xpath})[{index}]")
+    except NoSuchElementException:
         return None
 
-def check_red_buttons(driver, movie_title, normalized_seasons, confirmed_seasons, is_tv_show, episode_id=None, processed_torrents=None, complete_season_pack_only=False):
+def match_cached_torrent_title(torrent_title, movie_title, normalized_seasons, is_tv_show, episode_id=None, complete_season_pack_only=False, label="torrent"):
+    """
+    Check whether the title of a cached (RD 100%) torrent matches the requested media.
+    Shared by the DMM page scraper and the HTTP search client so both apply the same rules.
+    
+    Args:
+        torrent_title: Title of the cached torrent
+        movie_title: Expected title to match
+        normalized_seasons: List of seasons in normalized format
+        is_tv_show: Whether we're checking a TV show
+        episode_id: Optional episode ID for TV shows
+        complete_season_pack_only: If True, only accept complete season packs, not individual episodes
+        label: Name of the torrent in log messages
+        
+    Returns:
+        Tuple[bool, str]: (match flag, requested season confirmed by the torrent or None)
+    """
+    from seerr.title_matcher import score_titles
+    
+    match = score_titles([torrent_title], movie_title, normalized_seasons, is_tv_show,
+                         episode_id=episode_id, complete_season_pack_only=complete_season_pack_only)[0]
+    if episode_id:
+        logger.info(f"{label.capitalize()} matching details - Title: '{torrent_title}', title_ratio: {match.title_ratio:.1f}%, season_match: {match.season_matched}, episode_match: {match.episode_matched}")
+    if match.is_episode:
+        logger.info(f"Skipping individual episode '{torrent_title}' - only looking for complete season packs")
+        return False, None
+    if match.matched:
+        logger.info(f"Found a match on {label} - {match.cleaned_title} with RD (100%). Marking as confirmed.")
+        return True, match.season
+    
+    logger.warning(f"No match for {label}: Title - {match.cleaned_title}, Year - {match.year}, Episode - {episode_id}. Moving on.")
+    return False, None
+
+def check_red_buttons(driver, movie_title, normalized_seasons, confirmed_seasons, is_tv_show, episode_id=None, processed_torrents=None, complete_season_pack_only=False, cards=None):
     """
     Check for red buttons (RD 100%) on the page and verify if they match the expected title
    
@@ -703,204 +813,75 @@ def check_red_buttons(driver, movie_title, normalized_seasons, confirmed_seasons
         episode_id: Optional episode ID for TV shows
         processed_torrents: Set of already processed torrent titles to avoid duplicates
         complete_season_pack_only: If True, only accept complete season packs, not individual episodes
+        cards: Optional result card snapshot to check instead of reading the page
        
     Returns:
         Tuple[bool, set]: (confirmation flag, updated confirmed seasons set)
     """
-    from seerr.utils import clean_title, extract_year, extract_season
-    import re
-   
+    from seerr.result_ranker import rank_results
+    
     confirmation_flag = False
     if processed_torrents is None:
         processed_torrents = set()
     
-    try:
-        all_red_buttons_elements = driver.find_elements(By.XPATH, "//button[contains(@class, 'bg-red-900/30')]")
-        logger.info(f"Total red buttons found: {len(all_red_buttons_elements)}")
-        
-        # Filter out "Report" buttons and buttons that don't contain "RD (100%)"
-        # Use a safer approach to avoid stale element issues
-        red_buttons_elements = []
-        filtered_button_samples = []
-        for button in all_red_buttons_elements:
-            try:
-                button_text = button.text.strip()
-                if "Report" not in button_text and "RD (100%)" in button_text:
-                    red_buttons_elements.append(button)
-                else:
-                    # Collect samples of filtered buttons for debugging
-                    if len(filtered_button_samples) < 10:  # Log up to 10 filtered buttons
-                        filtered_button_samples.append(button_text)
-            except StaleElementReferenceException:
-                logger.warning("Button became stale during filtering, skipping...")
-                continue
-            except Exception as e:
-                logger.warning(f"Error accessing button text during filtering: {e}")
-                continue
-        
-        logger.info(f"Found {len(red_buttons_elements)} red button(s) with 'RD (100%)' without 'Report'. Verifying titles.")
-        
-        # Log samples of filtered buttons for debugging, especially when searching for episodes
-        if episode_id and len(red_buttons_elements) == 0 and filtered_button_samples:
-            logger.info(f"All {len(all_red_buttons_elements)} red buttons were filtered out. Sample button texts: {filtered_button_samples[:10]}")
-            logger.info(f"This likely means the buttons don't contain 'RD (100%)' text. Episode being searched: {episode_id}")
-        
-        # Add a small delay to let the page stabilize after "Show More Results" clicks
-        time.sleep(1)
-        
-        for i, red_button_element in enumerate(red_buttons_elements, start=1):
-            try:
-                # Re-locate the button to avoid stale element issues
-                try:
-                    button_text = red_button_element.text.strip()
-                except StaleElementReferenceException:
-                    logger.info(f"Red button {i} became stale, re-locating...")
-                    red_button_element = relocate_red_buttons(driver, i)
-                    if red_button_element is None:
-                        logger.warning(f"Could not re-locate red button {i}. Skipping.")
-                        continue
-                    button_text = red_button_element.text.strip()
-                
-                if "Report" in button_text:
-                    logger.debug(f"Red button {i} contains 'Report' - skipping")
-                    continue
-               
-                # Double-check that this is actually an RD (100%) button
-                if "RD (100%)" not in button_text:
-                    logger.info(f"Red button {i} does not contain 'RD (100%)' - text: '{button_text}'. Skipping.")
-                    continue
-               
-                logger.info(f"Checking red button {i} with text: '{button_text}'...")
-                try:
-                    # Try to find the title element, with retry on stale reference
-                    try:
-                        logger.info(f"Attempting to find title element for red button {i}...")
-                        red_button_title_element = red_button_element.find_element(By.XPATH, ".//ancestor::div[contains(@class, 'border-2')]//h2")
-                        red_button_title_text = red_button_title_element.text.strip()
-                        logger.info(f"Successfully found title for red button {i}: '{red_button_title_text}'")
-                    except StaleElementReferenceException:
-                        logger.info(f"Title element for red button {i} became stale, re-locating...")
-                        red_button_element = relocate_red_buttons(driver, i)
-                        if red_button_element is None:
-                            logger.warning(f"Could not re-locate red button {i} for title extraction. Skipping.")
-                            continue
-                        red_button_title_element = red_button_element.find_element(By.XPATH, ".//ancestor::div[contains(@class, 'border-2')]//h2")
-                        red_button_title_text = red_button_title_element.text.strip()
-                    # Use original title first, clean it for comparison
-                    red_button_title_cleaned = clean_title(red_button_title_text.split('(')[0].strip(), target_lang='en')
-                    movie_title_cleaned = clean_title(movie_title.split('(')[0].strip(), target_lang='en')
-                    # Extract year for comparison
-                    red_button_year = extract_year(red_button_title_text, ignore_resolution=True)
-                    expected_year = extract_year(movie_title)
-                    logger.info(f"Red button {i} title: {red_button_title_cleaned}, Expected movie title: {movie_title_cleaned}")
-                    
-                    # Check if we've already processed this torrent
-                    if red_button_title_text in processed_torrents:
-                        logger.info(f"Skipping red button {i} - already processed torrent: {red_button_title_text}")
-                        continue
-                    
-                    # Fuzzy matching with a slightly lower threshold for robustness
-                    title_match_ratio = fuzz.partial_ratio(red_button_title_cleaned.lower(), movie_title_cleaned.lower())
-                    title_match_threshold = 65  # Lowered from 69 to allow more flexibility
-                    
-                    # If initial match fails, try matching with original title (handles cases where extraction failed)
-                    if title_match_ratio < title_match_threshold:
-                        # Try matching original torrent title directly (fuzz.partial_ratio can find matches in longer strings)
-                        original_match_ratio = fuzz.partial_ratio(
-                            red_button_title_text.lower(), 
-                            movie_title.split('(')[0].strip().lower()
-                        )
-                        if original_match_ratio > title_match_ratio:
-                            title_match_ratio = original_match_ratio
-                            logger.info(f"Trying original title match - ratio improved to {title_match_ratio}%")
-                    
-                    title_matched = title_match_ratio >= title_match_threshold
-                    # Year comparison (skip for TV shows or if missing)
-                    year_matched = True
-                    if not is_tv_show and red_button_year and expected_year:
-                        year_matched = abs(red_button_year - expected_year) <= 1
-                    # Episode and season matching (for TV shows)
-                    season_matched = False
-                    episode_matched = True
-                    if is_tv_show and normalized_seasons:
-                        # Use improved season matching that handles ranges like S01-04
-                        from seerr.utils import match_single_season
-                        for requested_season in normalized_seasons:
-                            if match_single_season(red_button_title_text, requested_season):
-                                season_matched = True
-                                logger.info(f"Season match found: {requested_season} matches torrent '{red_button_title_text}'")
-                                break
-                        
-                        if episode_id:
-                            episode_matched = episode_id.lower() in red_button_title_text.lower()
-                            # Log episode matching details
-                            if episode_id:
-                                logger.info(f"Checking episode match for episode_id='{episode_id}' in title='{red_button_title_text}': match={episode_matched}")
-                            # If we're searching for a specific episode and it matches, we can auto-match the season
-                            # since the filter already ensures season match (avoiding redundant checks)
-                            if episode_matched and not season_matched:
-                                # First, try to extract season from episode_id if it contains it (e.g., "S08E01")
-                                if episode_id.startswith('S') and 'E' in episode_id:
-                                    try:
-                                        season_from_episode = int(episode_id[1:episode_id.index('E')])
-                                        # Check if the title contains the same season
-                                        if f"S{season_from_episode:02d}" in red_button_title_text or f"Season {season_from_episode}" in red_button_title_text:
-                                            season_matched = True
-                                            logger.info(f"Auto-matched season from episode_id: {episode_id}")
-                                    except (ValueError, IndexError):
-                                        pass
-                                # If we have an episode match but no season match, auto-match the season
-                                # The filter already narrowed results to the correct season, so if episode matches, season must too
-                                if not season_matched:
-                                    season_matched = True
-                                    logger.info(f"Auto-matched season based on episode filter and episode match: episode_id={episode_id}")
-                    
-                    # Log matching details when searching for episodes
-                    if episode_id:
-                        logger.info(f"Red button {i} matching details - Title: '{red_button_title_text}', title_ratio: {title_match_ratio:.1f}%, title_match: {title_matched}, season_match: {season_matched}, episode_match: {episode_matched}")
-                    
-                    # If we're looking for complete season packs only, check if this is an individual episode
-                    if complete_season_pack_only and is_tv_show:
-                        # Check for episode patterns like E01, E1, Episode 1, etc.
-                        episode_patterns = [
-                            r'[sS]\d+[eE]\d+',  # S02E01, s2e3, etc.
-                            r'episode\s+\d+',  # Episode 1, Episode 25, etc.
-                            r'ep\s+\d+',  # Ep 1, Ep 25, etc.
-                            r'[eE]\d+',  # E01, E1, E25, etc.
-                        ]
-                        
-                        is_individual_episode = False
-                        for ep_pattern in episode_patterns:
-                            if re.search(ep_pattern, red_button_title_text):
-                                is_individual_episode = True
-                                logger.info(f"Found individual episode pattern in torrent '{red_button_title_text}' - rejecting for complete season pack search")
-                                break
-                        
-                        if is_individual_episode:
-                            logger.info(f"Skipping individual episode '{red_button_title_text}' - only looking for complete season packs")
-                            continue
-                    
-                    if title_matched and year_matched and (not is_tv_show or (season_matched and episode_matched)):
-                        logger.info(f"Found a match on red button {i} - {red_button_title_cleaned} with RD (100%). Marking as confirmed.")
-                        confirmation_flag = True
-                        # Add this torrent to processed set to avoid duplicate processing
-                        processed_torrents.add(red_button_title_text)
-                        if is_tv_show and season_matched and not episode_id:
-                            # Add the matched season to confirmed seasons
-                            for requested_season in normalized_seasons:
-                                if match_single_season(red_button_title_text, requested_season):
-                                    confirmed_seasons.add(requested_season)
-                                    break
-                        return confirmation_flag, confirmed_seasons  # Early exit on match
-                    else:
-                        logger.warning(f"No match for red button {i}: Title - {red_button_title_cleaned}, Year - {red_button_year}, Episode - {episode_id}. Moving to next red button.")
-                except NoSuchElementException as e:
-                    logger.warning(f"Could not find title associated with red button {i}: {e}")
-                    continue
-            except StaleElementReferenceException as e:
-                logger.warning(f"Stale element reference encountered for red button {i}: {e}. Skipping this button.")
+    # One snapshot of every card replaces per-button .text and h2 lookups, so there are
+    # no stale elements to re-locate and no need to wait for the page to settle
+    red_buttons = []
+    filtered_button_samples = []
+    total_red_buttons = 0
+    if cards is None:
+        cards = snapshot_result_cards(driver)
+    for card in cards:
+        for button in card["buttons"]:
+            if "bg-red-900/30" not in button["className"]:
                 continue
-    except NoSuchElementException:
+            total_red_buttons += 1
+            button_text = button["label"]
+            if "Report" not in button_text and "RD (100%)" in button_text:
+                red_buttons.append((card, button_text))
+            elif len(filtered_button_samples) < 10:  # Log up to 10 filtered buttons
+                filtered_button_samples.append(button_text)
+    
+    logger.info(f"Total red buttons found: {total_red_buttons}")
+    logger.info(f"Found {len(red_buttons)} red button(s) with 'RD (100%)' without 'Report'. Verifying titles.")
+    
+    # Log samples of filtered buttons for debugging, especially when searching for episodes
+    if episode_id and len(red_buttons) == 0 and filtered_button_samples:
+        logger.info(f"All {total_red_buttons} red buttons were filtered out. Sample button texts: {filtered_button_samples[:10]}")
+        logger.info(f"This likely means the buttons don't contain 'RD (100%)' text. Episode being searched: {episode_id}")
+    
+    # Rank every candidate at once, then keep the best one instead of the first
+    candidates = []
+    for i, (card, button_text) in enumerate(red_buttons, start=1):
+        red_button_title_text = card["title"]
+        if not red_button_title_text:
+            logger.warning(f"Could not find title associated with red button {i} ('{button_text}'). Skipping.")
+            continue
+        # Check if we've already processed this torrent
+        if red_button_title_text in processed_torrents:
+            logger.info(f"Skipping red button {i} - already processed torrent: {red_button_title_text}")
+            continue
+        candidates.append(card)
+    
+    ranked = rank_results(
+        candidates, movie_title, normalized_seasons, is_tv_show,
+        episode_id=episode_id, complete_season_pack_only=complete_season_pack_only
+    )
+    if ranked:
+        best = ranked[0]
+        logger.info(f"Found a match on red button - {best.match.cleaned_title} with RD (100%) "
+                    f"(best of {len(ranked)} matching, score {best.score:.0f}). Marking as confirmed.")
+        confirmation_flag = True
+        # Add this torrent to processed set to avoid duplicate processing
+        processed_torrents.add(best.title)
+        if not episode_id:
+            # A multi-season pack confirms every requested season it covers
+            confirmed_seasons.update(best.covered_seasons)
+        return confirmation_flag, confirmed_seasons
+    elif candidates:
+        logger.info(f"None of the {len(candidates)} red button title(s) matched '{movie_title}'.")
+    
+    if not red_buttons:
         logger.info("No red buttons with 'RD (100%)' detected. Proceeding with optional fallback.")
     return confirmation_flag, confirmed_seasons
 
@@ -930,7 +911,7 @@ def refresh_library_stats():
         if "library" not in current_url:
             logger.info("Navigating to library page to refresh stats.")
             driver.get("https://debridmediamanager.com/library")
-            time.sleep(7)  # Wait for page to load
+            adaptive_waits.wait(driver, "library_page", all_of(element_present(LIBRARY_STATS_LOADED_XPATH), network_idle()), 7)
         
         logger.info("Refreshing library statistics.")
         library_stats_element = WebDriverWait(driver, 10).until(
@@ -0,0 +1,241 @@
+"""
+Browser pool module for SeerrBridge
+Keeps several independent Chrome sessions logged in to Debrid Media Manager
+and leases them to queue workers so requests can be processed in parallel
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Any, List, Optional
+
+from loguru import logger
+from selenium.common.exceptions import WebDriverException
+
+from seerr.task_config_manager import task_config
+from seerr.executors import executors, run_in_browser
+from seerr.db_logger import log_info, log_success, log_warning, log_error
+
+# Hard upper bound so a typo in the configuration cannot start dozens of Chrome processes
+MAX_BROWSER_POOL_SIZE = 8
+
+
+def get_browser_pool_size() -> int:
+    """Get the configured number of browser sessions"""
+    try:
+        size = int(task_config.get_config('browser_pool_size', 1))
+    except (TypeError, ValueError):
+        size = 1
+    return max(1, min(size, MAX_BROWSER_POOL_SIZE))
+
+
+class BrowserSession:
+    """A single Chrome session owned by the pool"""
+
+    def __init__(self, slot: int, driver=None):
+        self.slot = slot
+        self.driver = driver
+        self.created_at = time.time()
+        self.leased_at = None
+        self.items_processed = 0
+        self.recycle_count = 0
+        self.needs_recycle = False
+        self.last_error = None
+
+    def mark_failed(self, error: Exception):
+        """
+        Record an error raised while this session was in use.
+        WebDriver errors usually mean the browser crashed or the session died,
+        so the session is flagged to be recycled when it is released.
+
+        Args:
+            error (Exception): The error raised by the caller
+        """
+        self.last_error = str(error)
+        if isinstance(error, WebDriverException):
+            self.needs_recycle = True
+
+    def is_healthy(self) -> bool:
+        """Check that the underlying browser still answers WebDriver commands"""
+        if self.driver is None:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the session state for status endpoints"""
+        return {
+            "slot": self.slot,
+            "initialized": self.driver is not None,
+            "leased": self.leased_at is not None,
+            "leased_for_seconds": round(time.time() - self.leased_at, 1) if self.leased_at else None,
+            "items_processed": self.items_processed,
+            "recycle_count": self.recycle_count,
+            "uptime_seconds": round(time.time() - self.created_at, 1),
+            "last_error": self.last_error
+        }
+
+
+class BrowserPool:
+    """
+    Pool of independent browser sessions.
+
+    Slot 0 is the primary session exposed as ``seerr.browser.driver`` so existing
+    callers (library refresh, webhook checks) keep working. Every slot's WebDriver calls
+    run on that slot's own thread so the event loop is never blocked by Chrome.
+    """
+
+    def __init__(self):
+        self._sessions: Dict[int, BrowserSession] = {}
+        self._idle: Optional[asyncio.Queue] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def size(self) -> int:
+        """Number of sessions managed by the pool"""
+        return len(self._sessions)
+
+    def available(self) -> int:
+        """Number of sessions that are currently idle"""
+        return self._idle.qsize() if self._idle is not None else 0
+
+    async def initialize(self, size: int = None):
+        """
+        Start the pool, reusing the primary browser session for slot 0.
+
+        Args:
+            size (int, optional): Number of sessions; defaults to browser_pool_size config
+        """
+        async with self._lock:
+            if self._sessions:
+                return
+
+            from seerr import browser
+
+            size = size or get_browser_pool_size()
+            self._idle = asyncio.Queue()
+
+            if browser.driver is None:
+                await browser.initialize_browser()
+            self._sessions[0] = BrowserSession(0, browser.driver)
+
+            if size > 1:
+                drivers = await asyncio.gather(
+                    *[run_in_browser(slot, browser.create_browser_session, slot) for slot in range(1, size)],
+                    return_exceptions=True
+                )
+                for slot, driver in enumerate(drivers, start=1):
+                    if isinstance(driver, Exception):
+                        log_error("Browser Pool", f"Failed to start browser session {slot}: {driver}",
+                                 module="browser_pool", function="initialize")
+                        driver = None
+                    self._sessions[slot] = BrowserSession(slot, driver)
+
+            for session in self._sessions.values():
+                self._idle.put_nowait(session)
+
+            ready = sum(1 for session in self._sessions.values() if session.driver is not None)
+            log_success("Browser Pool", f"Browser pool ready with {ready}/{size} session(s)",
+                       module="browser_pool", function="initialize")
+
+    async def _start_driver(self, session: BrowserSession):
+        """Start a fresh browser for a session, keeping seerr.browser.driver in sync for slot 0"""
+        from seerr import browser
+
+        driver = await run_in_browser(session.slot, browser.create_browser_session, session.slot)
+        session.driver = driver
+        session.created_at = time.time()
+        session.needs_recycle = False
+        if session.slot == 0:
+            browser.driver = driver
+
+    async def recycle(self, session: BrowserSession, reason: str = "unhealthy"):
+        """
+        Quit a session's browser and start a new one in its place.
+        Only the affected slot is restarted; other sessions keep working.
+
+        Args:
+            session (BrowserSession): Session to recycle
+            reason (str): Why the session is being recycled, for logging
+        """
+        log_warning("Browser Pool", f"Recycling browser session {session.slot} ({reason})",
+                   module="browser_pool", function="recycle")
+        old_driver = session.driver
+        session.driver = None
+        # The slot's thread may still be stuck in a call to the old browser
+        executors.reset_browser_executor(session.slot)
+        if old_driver is not None:
+            try:
+                await run_in_browser(session.slot, old_driver.quit)
+            except Exception as e:
+                logger.debug(f"Error quitting browser session {session.slot}: {e}")
+
+        await self._start_driver(session)
+        session.recycle_count += 1
+
+        if session.driver is None:
+            log_error("Browser Pool", f"Browser session {session.slot} could not be restarted",
+                     module="browser_pool", function="recycle")
+        else:
+            log_info("Browser Pool", f"Browser session {session.slot} restarted",
+                    module="browser_pool", function="recycle")
+
+    @asynccontextmanager
+    async def lease(self):
+        """
+        Lease an idle browser session for the duration of one queue item.
+        The session is health-checked on release and recycled if its browser died.
+
+        Yields:
+            BrowserSession: The leased session (its driver may be None if Chrome cannot start)
+        """
+        if self._idle is None:
+            await self.initialize()
+
+        session = await self._idle.get()
+        try:
+            if session.driver is None:
+                await self._start_driver(session)
+            session.leased_at = time.time()
+            yield session
+        finally:
+            session.leased_at = None
+            session.items_processed += 1
+            try:
+                if session.needs_recycle or not await run_in_browser(session.slot, session.is_healthy):
+                    await self.recycle(session, session.last_error or "browser stopped responding")
+            except Exception as e:
+                log_error("Browser Pool", f"Error recycling browser session {session.slot}: {e}",
+                         module="browser_pool", function="lease")
+            finally:
+                self._idle.put_nowait(session)
+
+    def get_drivers(self) -> Dict[int, Any]:
+        """Get the WebDriver of every session by slot (None while a session is restarting)"""
+        return {slot: session.driver for slot, session in self._sessions.items()}
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get the state of every session in the pool"""
+        return {
+            "size": self.size,
+            "available": self.available(),
+            "sessions": [session.to_dict() for session in self._sessions.values()]
+        }
+
+    async def shutdown(self):
+        """Quit all secondary sessions; the primary session is closed by shutdown_browser"""
+        for session in list(self._sessions.values()):
+            if session.slot == 0 or session.driver is None:
+                continue
+            try:
+                await run_in_browser(session.slot, session.driver.quit)
+            except Exception as e:
+                logger.debug(f"Error quitting browser session {session.slot}: {e}")
+            session.driver = None
+        logger.warning("Browser pool closed.")
+
+
+# Global instance
+browser_pool = BrowserPool()
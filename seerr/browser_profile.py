@@ -0,0 +1,248 @@
+"""
+Browser profile module for SeerrBridge
+Lightweight Chrome profile for the DMM sessions: blocks images, media, fonts and analytics
+hosts, turns off Chrome features the automation never uses, keeps a persistent user-data
+dir per session, and measures page-load time and browser memory
+"""
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from loguru import logger
+from selenium import webdriver
+
+from seerr.task_config_manager import task_config
+
+# One user-data dir per browser slot below this directory (Chrome locks a profile to one process)
+CHROME_PROFILE_DIR = os.getenv(
+    'CHROME_PROFILE_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'chrome-profile')
+)
+
+# Resources DMM pages load that the automation never looks at (Network.setBlockedURLs patterns)
+BLOCKED_URL_PATTERNS = [
+    # Images (posters, backdrops, avatars)
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    # Fonts
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    # Media
+    "*.mp4", "*.webm", "*.mp3", "*.m4a", "*.ogg",
+    # Analytics and ads; DMM's own API and Real-Debrid are left alone because the pages need them
+    "*googletagmanager.com*", "*google-analytics.com*", "*doubleclick.net*", "*googlesyndication.com*",
+    "*static.cloudflareinsights.com*", "*plausible.io*", "*umami.is*", "*hotjar.com*",
+    "*clarity.ms*", "*sentry.io*", "*posthog.com*", "*segment.io*"
+]
+
+# Chrome features the automation never uses
+LIGHTWEIGHT_CHROME_ARGUMENTS = [
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--disable-notifications",
+    "--disable-client-side-phishing-detection",
+    "--disable-domain-reliability",
+    "--disable-breakpad",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication,CalculateNativeWinOcclusion",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--renderer-process-limit=2"
+]
+
+LIGHTWEIGHT_CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_setting_values.geolocation": 2,
+    "credentials_enable_service": False,
+    "profile.password_manager_enabled": False
+}
+
+# Left behind when Chrome is killed; a new Chrome refuses a profile that still has them
+PROFILE_LOCK_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie")
+
+# Recent page loads kept for percentile reporting
+PAGE_LOAD_SAMPLE_SIZE = 200
+
+
+def is_performance_profile_enabled() -> bool:
+    """Whether new browser sessions use the lightweight profile"""
+    value = task_config.get_config('browser_performance_profile_enabled', True)
+    if isinstance(value, str):
+        return value.strip().lower() in ('true', '1', 'yes', 'on')
+    return bool(value)
+
+
+def get_profile_dir(slot: int) -> str:
+    """User-data dir of a browser slot"""
+    return os.path.join(CHROME_PROFILE_DIR, f"slot-{slot}")
+
+
+def _clear_profile_locks(profile_dir: str):
+    """Remove lock files a killed Chrome left in a slot's profile (only this slot ever uses it)"""
+    for name in PROFILE_LOCK_FILES:
+        path = os.path.join(profile_dir, name)
+        if os.path.lexists(path):
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.debug(f"Could not remove {path}: {e}")
+
+
+def apply_performance_profile(options, slot: int):
+    """
+    Add the lightweight profile to Chrome options: feature switches, content settings and
+    the slot's persistent user-data dir, so login and DMM settings survive restarts.
+
+    Args:
+        options: selenium ChromeOptions being built
+        slot (int): Browser pool slot the session is for
+    """
+    profile_dir = get_profile_dir(slot)
+    try:
+        os.makedirs(profile_dir, exist_ok=True)
+        _clear_profile_locks(profile_dir)
+        options.add_argument(f"--user-data-dir={profile_dir}")
+    except OSError as e:
+        logger.warning(f"Could not use Chrome profile dir {profile_dir}, starting with a temporary profile: {e}")
+    for argument in LIGHTWEIGHT_CHROME_ARGUMENTS:
+        options.add_argument(argument)
+    options.add_experimental_option("prefs", LIGHTWEIGHT_CHROME_PREFS)
+
+
+def block_unneeded_requests(driver):
+    """
+    Block images, fonts, media and analytics hosts for every page of a session via CDP.
+
+    Args:
+        driver: Selenium WebDriver instance
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        logger.info(f"Blocking {len(BLOCKED_URL_PATTERNS)} resource pattern(s) in the browser.")
+    except Exception as e:
+        logger.warning(f"Could not enable request blocking: {e}")
+
+
+class PageLoadStats:
+    """Durations of driver.get calls and browser start-ups"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_seconds = 0.0
+        self.samples: Deque[float] = deque(maxlen=PAGE_LOAD_SAMPLE_SIZE)
+        self.startup_seconds: Dict[int, float] = {}
+
+    def observe(self, seconds: float):
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.samples.append(seconds)
+
+    def observe_startup(self, slot: int, seconds: float):
+        with self._lock:
+            self.startup_seconds[slot] = round(seconds, 2)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            samples = sorted(self.samples)
+            return {
+                "count": self.count,
+                "avg_seconds": round(self.total_seconds / self.count, 2) if self.count else None,
+                "p50_seconds": round(samples[len(samples) // 2], 2) if samples else None,
+                "p95_seconds": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 2) if samples else None,
+                "startup_seconds": dict(self.startup_seconds)
+            }
+
+
+# Global instance
+page_load_stats = PageLoadStats()
+
+
+class ProfiledChrome(webdriver.Chrome):
+    """Chrome WebDriver that records how long each page load takes"""
+
+    def get(self, url: str) -> None:
+        started = time.monotonic()
+        try:
+            super().get(url)
+        finally:
+            page_load_stats.observe(time.monotonic() - started)
+
+
+def _process_tree_pids(pid: int) -> List[int]:
+    """A process and all of its descendants (Linux /proc)"""
+    pids = [pid]
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children") as f:
+                for child in f.read().split():
+                    pids.extend(_process_tree_pids(int(child)))
+    except (OSError, ValueError):
+        pass
+    return pids
+
+
+def _rss_bytes(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+
+def get_driver_rss_bytes(driver) -> Optional[int]:
+    """
+    Resident memory of a session's chromedriver and every Chrome process it started.
+
+    Args:
+        driver: Selenium WebDriver instance
+
+    Returns:
+        int: Bytes, or None when the process tree cannot be read (e.g. not on Linux)
+    """
+    try:
+        process = driver.service.process
+    except AttributeError:
+        return None
+    if process is None or process.poll() is not None or not os.path.exists(f"/proc/{process.pid}"):
+        return None
+    return sum(_rss_bytes(pid) for pid in _process_tree_pids(process.pid))
+
+
+def get_browser_performance_stats() -> Dict[str, Any]:
+    """
+    Page-load times and browser memory for the /status endpoint.
+
+    Returns:
+        dict: Profile state, page-load percentiles, start-up time and RSS per session
+    """
+    import seerr.browser
+    from seerr.browser_pool import browser_pool
+
+    drivers = browser_pool.get_drivers()
+    if not drivers:
+        drivers = {0: seerr.browser.driver}
+
+    sessions = {}
+    for slot, driver in drivers.items():
+        rss = get_driver_rss_bytes(driver) if driver is not None else None
+        sessions[slot] = round(rss / (1024 * 1024), 1) if rss is not None else None
+    known = [rss for rss in sessions.values() if rss is not None]
+
+    return {
+        "performance_profile": is_performance_profile_enabled(),
+        "page_loads": page_load_stats.to_dict(),
+        "rss_mb": round(sum(known), 1) if known else None,
+        "rss_mb_per_session": sessions
+    }
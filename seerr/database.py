@@ -203,6 +203,35 @@ class ServiceStatus(Base):
     last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+class TranslationCache(Base):
+    """Persistent cache of title translations"""
+    __tablename__ = "translation_cache"
+    
+    id = Column(Integer, primary_key=True)
+    source_hash = Column(String(64), nullable=False, unique=True, index=True)  # sha256 of target_lang:source_text
+    source_text = Column(String(500), nullable=False)
+    target_lang = Column(String(10), nullable=False)
+    translated_text = Column(String(500), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+class TraktCache(Base):
+    """Persistent cache of Trakt API responses"""
+    __tablename__ = "trakt_cache"
+    
+    id = Column(Integer, primary_key=True)
+    cache_key = Column(String(64), nullable=False, unique=True, index=True)  # sha256 of endpoint|item_id|extended
+    endpoint = Column(String(100), nullable=False)
+    item_id = Column(String(100), nullable=False)
+    extended = Column(String(50), nullable=False, default='')
+    data_class = Column(String(20), nullable=False, index=True)
+    status_code = Column(Integer, nullable=False)  # 200, or 404 for "does not exist (yet)"
+    payload = Column(JSON, nullable=True)
+    etag = Column(String(200), nullable=True)
+    last_modified = Column(String(100), nullable=True)
+    fetched_at = Column(DateTime, default=datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
 class TraktList(Base):
     """Trakt list configuration table"""
     __tablename__ = "trakt_lists"
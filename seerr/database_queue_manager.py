@@ -12,7 +12,10 @@ from seerr.database import get_db
 from seerr.unified_models import UnifiedMedia
 from seerr.db_logger import log_info, log_success, log_warning, log_error
 from seerr.background_tasks import add_movie_to_queue, add_tv_to_queue
+from seerr.request_queue import PRIORITY_RECONCILE
+from seerr.queue_state_cache import queue_state_cache
 from seerr.config import USE_DATABASE
+from seerr.executors import run_io
 
 
 class DatabaseQueueManager:
@@ -149,7 +152,8 @@ class DatabaseQueueManager:
                     extra_data,
                     item.overseerr_media_id,
                     item.tmdb_id,
-                    item.overseerr_request_id
+                    item.overseerr_request_id,
+                    priority=PRIORITY_RECONCILE
                 )
             else:  # tv
                 # For TV shows, add requested seasons info
@@ -190,7 +194,8 @@ class DatabaseQueueManager:
                     extra_data,
                     item.overseerr_media_id,
                     item.tmdb_id,
-                    item.overseerr_request_id
+                    item.overseerr_request_id,
+                    priority=PRIORITY_RECONCILE
                 )
             
             if success:
@@ -208,7 +213,7 @@ class DatabaseQueueManager:
                         from datetime import datetime
                         from seerr.trakt import get_media_details_from_trakt
                         from seerr.enhanced_season_manager import EnhancedSeasonManager
-                        from seerr.trakt import get_season_details_from_trakt, check_next_episode_aired
+                        from seerr.trakt import get_season_details_from_trakt, get_all_seasons_from_trakt, check_next_episode_aired
                         
                         log_info("Database Queue Manager", f"Imports successful for {item.title}", 
                                module="database_queue_manager", function="_queue_item")
@@ -220,7 +225,7 @@ class DatabaseQueueManager:
                                module="database_queue_manager", function="_queue_item")
                         
                         # Get media details from Trakt
-                        media_details = get_media_details_from_trakt(str(item.tmdb_id), 'tv')
+                        media_details = await run_io(get_media_details_from_trakt, str(item.tmdb_id), 'tv')
                         
                         if media_details and media_details.get('trakt_id'):
                             log_info("Database Queue Manager", f"Processing {len(seasons_list)} seasons for {item.title}: {seasons_list}", 
@@ -230,11 +235,14 @@ class DatabaseQueueManager:
                             trakt_show_id = media_details['trakt_id']
                             seasons_data = []
                             
+                            # One Trakt call returns every season with its episode air dates
+                            all_seasons = await run_io(get_all_seasons_from_trakt, str(trakt_show_id))
+                            
                             for season in seasons_list:
                                 season_number = int(season.split()[-1])  # Extract number from "Season X"
                                 
                                 # Fetch season details from Trakt
-                                season_details = get_season_details_from_trakt(str(trakt_show_id), season_number)
+                                season_details = await run_io(get_season_details_from_trakt, str(trakt_show_id), season_number, all_seasons)
                                 
                                 if season_details:
                                     episode_count = season_details.get('episode_count', 0)
@@ -242,8 +250,8 @@ class DatabaseQueueManager:
                                     
                                     # Check for next episode if there's a discrepancy
                                     if episode_count != aired_episodes:
-                                        has_aired, next_episode_details = check_next_episode_aired(
-                                            str(trakt_show_id), season_number, aired_episodes
+                                        has_aired, next_episode_details = await run_io(check_next_episode_aired,
+                                            str(trakt_show_id), season_number, aired_episodes, season_details
                                         )
                                         if has_aired:
                                             aired_episodes += 1
@@ -318,6 +326,7 @@ class DatabaseQueueManager:
                     fresh_item.queue_added_at = None
                 
                 db.commit()
+                queue_state_cache.update(fresh_item.tmdb_id, fresh_item.media_type, is_in_queue=in_queue)
                 log_info("Database Queue Manager", f"Updated queue tracking for {fresh_item.title}: in_queue={in_queue}", 
                         module="database_queue_manager", function="_update_queue_tracking")
             else:
@@ -340,6 +349,7 @@ class DatabaseQueueManager:
                 media.is_in_queue = False
                 media.queue_added_at = None
                 db.commit()
+                queue_state_cache.update(media.tmdb_id, media.media_type, is_in_queue=False)
                 log_info("Database Queue Manager", f"Cleared queue tracking for {media.title} (ID: {media_id})", 
                         module="database_queue_manager", function="clear_queue_tracking_on_completion")
         except Exception as e:
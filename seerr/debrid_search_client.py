@@ -0,0 +1,225 @@
+"""
+Debrid search client module for SeerrBridge
+Answers "is this title already cached in Real-Debrid (RD 100%)?" over plain HTTP from the
+Real-Debrid library, so most lookups no longer need a Chrome page on Debrid Media Manager
+"""
+import json
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import requests
+from rapidfuzz import fuzz, process
+from loguru import logger
+
+from seerr.task_config_manager import task_config
+from seerr.db_logger import log_info, log_warning
+
+RD_API_BASE_URL = "https://api.real-debrid.com/rest/1.0"
+
+# Torrents requested per page of /torrents (the API accepts up to 5000)
+RD_TORRENTS_PAGE_SIZE = 2500
+
+# The library listing is shared by every lookup for this long
+LIBRARY_CACHE_TTL_SECONDS = 120
+
+REQUEST_TIMEOUT_SECONDS = 15
+
+# Cheap raw-name similarity a torrent needs before the full (translating) title match runs
+CANDIDATE_MIN_RATIO = 50
+MAX_CANDIDATES = 25
+
+
+class DebridSearchClient:
+    """
+    HTTP client for cached-torrent lookups.
+
+    The "RD (100%)" buttons that check_red_buttons scrapes from DMM mark torrents that are
+    already downloaded in the user's Real-Debrid account. The same list is available from the
+    Real-Debrid REST API, so it is fetched once, cached briefly, and matched against requested
+    titles with the same rules as the browser (seerr.title_matcher).
+
+    A lookup returns None when the client is disabled or Real-Debrid cannot be reached;
+    callers then fall back to Selenium.
+    """
+
+    def __init__(self):
+        self._session = requests.Session()
+        self._library: List[Dict[str, Any]] = []
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.matches = 0
+        self.fallbacks = 0
+        self.library_fetches = 0
+        self.lookup_seconds = 0.0
+
+    def is_enabled(self) -> bool:
+        """Check whether HTTP lookups are enabled in the task configuration"""
+        value = task_config.get_config('http_search_client_enabled', True)
+        if isinstance(value, str):
+            return value.strip().lower() in ('true', '1', 'yes', 'on')
+        return bool(value)
+
+    def _get_access_token(self) -> Optional[str]:
+        """Get the current Real-Debrid access token (stored as JSON with value and expiry)"""
+        import seerr.config
+
+        token = seerr.config.RD_ACCESS_TOKEN
+        if not token:
+            return None
+        token = token.strip('"\'')
+        try:
+            parsed = json.loads(token)
+            if isinstance(parsed, dict):
+                return parsed.get('value')
+        except (json.JSONDecodeError, TypeError):
+            pass
+        return token
+
+    def _get(self, path: str, params: Dict[str, Any] = None, retry_auth: bool = True) -> requests.Response:
+        """GET a Real-Debrid endpoint, refreshing the access token once on 401"""
+        token = self._get_access_token()
+        if not token:
+            raise RuntimeError("No Real-Debrid access token configured")
+
+        response = self._session.get(
+            f"{RD_API_BASE_URL}{path}",
+            params=params,
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=REQUEST_TIMEOUT_SECONDS
+        )
+        if response.status_code == 401 and retry_auth:
+            from seerr.realdebrid import refresh_access_token
+            logger.info("Real-Debrid rejected the access token; refreshing it before retrying.")
+            if refresh_access_token():
+                return self._get(path, params, retry_auth=False)
+        response.raise_for_status()
+        return response
+
+    def _fetch_library(self) -> List[Dict[str, Any]]:
+        """Fetch every fully downloaded torrent in the Real-Debrid account"""
+        torrents: List[Dict[str, Any]] = []
+        page = 1
+        while True:
+            response = self._get("/torrents", {"page": page, "limit": RD_TORRENTS_PAGE_SIZE})
+            # 204 means the page is past the end of the list
+            batch = response.json() if response.status_code != 204 and response.content else []
+            torrents.extend(
+                {"filename": t.get("filename", ""), "hash": t.get("hash"), "bytes": t.get("bytes", 0)}
+                for t in batch
+                if t.get("status") == "downloaded" and t.get("progress") == 100 and t.get("filename")
+            )
+            total = int(response.headers.get("X-Total-Count", 0) or 0)
+            if len(batch) < RD_TORRENTS_PAGE_SIZE or page * RD_TORRENTS_PAGE_SIZE >= total:
+                break
+            page += 1
+        return torrents
+
+    def get_cached_torrents(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get the downloaded torrents of the Real-Debrid account.
+
+        Args:
+            force_refresh (bool): Ignore the cached listing
+
+        Returns:
+            list: Dicts with filename, hash and bytes
+        """
+        with self._lock:
+            if force_refresh or not self._loaded_at or time.time() - self._loaded_at > LIBRARY_CACHE_TTL_SECONDS:
+                started = time.time()
+                self._library = self._fetch_library()
+                self._loaded_at = time.time()
+                self.library_fetches += 1
+                log_info("Debrid Search", f"Loaded {len(self._library)} cached torrent(s) from Real-Debrid in {self._loaded_at - started:.2f}s",
+                        module="debrid_search_client", function="get_cached_torrents")
+            return self._library
+
+    def load_library(self, torrents: Iterable[Dict[str, Any]]):
+        """Use a recorded library listing instead of fetching it (benchmarks, replays)"""
+        with self._lock:
+            self._library = [t for t in torrents if t.get("filename")]
+            self._loaded_at = time.time()
+
+    def invalidate(self):
+        """Drop the cached listing so the next lookup fetches it again"""
+        with self._lock:
+            self._loaded_at = 0.0
+
+    def _candidates(self, movie_title: str, torrents: List[Dict[str, Any]]) -> List[str]:
+        """Torrent names that resemble the title, best first, before the full match runs"""
+        base_title = movie_title.split('(')[0].strip().lower()
+        names = [torrent["filename"].lower().replace('.', ' ') for torrent in torrents]
+        best = process.extract(base_title, names, scorer=fuzz.partial_ratio,
+                               score_cutoff=CANDIDATE_MIN_RATIO, limit=MAX_CANDIDATES)
+        return [torrents[index]["filename"] for _, _, index in best]
+
+    def find_cached(self, movie_title: str, normalized_seasons: List[str], is_tv_show: bool,
+                    episode_id: str = None, complete_season_pack_only: bool = False,
+                    processed_torrents: Set[str] = None) -> Optional[Tuple[bool, Set[str]]]:
+        """
+        Look for a cached torrent matching the requested media.
+
+        Args:
+            movie_title (str): Expected title, with the year for movies (e.g. "Heat (1995)")
+            normalized_seasons (list): Requested seasons in normalized format
+            is_tv_show (bool): Whether we're checking a TV show
+            episode_id (str, optional): Episode ID for TV shows (e.g. "S01E02")
+            complete_season_pack_only (bool): Only accept complete season packs
+            processed_torrents (set, optional): Torrent titles already handled by the caller
+
+        Returns:
+            Tuple[bool, set]: (confirmation flag, confirmed seasons), the same shape as
+                check_red_buttons, or None if the caller has to fall back to Selenium
+        """
+        from seerr.title_matcher import find_best_match
+
+        if not self.is_enabled():
+            return None
+
+        started = time.time()
+        self.lookups += 1
+        try:
+            torrents = self.get_cached_torrents()
+        except Exception as e:
+            self.fallbacks += 1
+            log_warning("Debrid Search", f"Real-Debrid library lookup failed, falling back to browser search: {e}",
+                       module="debrid_search_client", function="find_cached")
+            return None
+
+        if processed_torrents is None:
+            processed_torrents = set()
+        confirmed_seasons: Set[str] = set()
+        try:
+            candidates = [name for name in self._candidates(movie_title, torrents) if name not in processed_torrents]
+            best = find_best_match(
+                candidates, movie_title, normalized_seasons, is_tv_show,
+                episode_id=episode_id, complete_season_pack_only=complete_season_pack_only,
+                label="cached torrent"
+            )
+            if best is None:
+                return False, confirmed_seasons
+            self.matches += 1
+            processed_torrents.add(best.title)
+            if best.season:
+                confirmed_seasons.add(best.season)
+            return True, confirmed_seasons
+        finally:
+            self.lookup_seconds += time.time() - started
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Lookup counters for status endpoints"""
+        return {
+            "enabled": self.is_enabled(),
+            "lookups": self.lookups,
+            "matches": self.matches,
+            "fallbacks": self.fallbacks,
+            "library_fetches": self.library_fetches,
+            "cached_torrents": len(self._library),
+            "avg_lookup_seconds": round(self.lookup_seconds / self.lookups, 3) if self.lookups else None
+        }
+
+
+# Global instance
+debrid_search_client = DebridSearchClient()
@@ -17,6 +17,7 @@ from seerr.overseerr import get_overseerr_media_requests, get_all_overseerr_requ
 from seerr.trakt import get_media_details_from_trakt
 from seerr.background_tasks import add_movie_to_queue, add_tv_to_queue
 from seerr.config import USE_DATABASE
+from seerr.executors import run_io
 
 
 class EnhancedSyncManager:
@@ -25,23 +26,32 @@ class EnhancedSyncManager:
     def __init__(self):
         self.processed_items = set()  # Track processed items to avoid duplicates
     
-    async def sync_all_requests_with_status_check(self):
+    async def sync_all_requests_with_status_check(self, processing_requests: Optional[List[Dict[str, Any]]] = None) -> set:
         """
         Enhanced sync that checks database status and adds items to queue as needed
+        
+        Args:
+            processing_requests: Aggregated processing requests already fetched by the caller
+                (e.g. only the ones that changed); fetched from Overseerr when omitted
+                
+        Returns:
+            set: Overseerr media IDs whose requests could not be synced and should be retried
         """
+        failed_media_ids = set()
         if not USE_DATABASE:
-            return
+            return failed_media_ids
         
         log_info("Enhanced Sync", "Starting enhanced database sync with status checking", 
                 module="enhanced_sync_manager", function="sync_all_requests_with_status_check")
         
         try:
             # Get all processing requests from Overseerr
-            processing_requests = get_overseerr_media_requests()
+            if processing_requests is None:
+                processing_requests = get_overseerr_media_requests()
             if not processing_requests:
                 log_info("Enhanced Sync", "No processing requests found in Overseerr", 
                         module="enhanced_sync_manager", function="sync_all_requests_with_status_check")
-                return
+                return failed_media_ids
             
             log_info("Enhanced Sync", f"Found {len(processing_requests)} processing requests to check", 
                     module="enhanced_sync_manager", function="sync_all_requests_with_status_check")
@@ -57,10 +67,13 @@ class EnhancedSyncManager:
                         synced_count += 1
                     if result['queued']:
                         queued_count += 1
+                    if result.get('failed'):
+                        failed_media_ids.add(request.get('media', {}).get('id'))
                         
                 except Exception as e:
                     log_error("Enhanced Sync Error", f"Error processing request {request.get('id', 'unknown')}: {e}", 
                              module="enhanced_sync_manager", function="sync_all_requests_with_status_check")
+                    failed_media_ids.add(request.get('media', {}).get('id'))
                     continue
             
             log_success("Enhanced Sync", f"Sync completed: {synced_count} synced, {queued_count} queued for processing", 
@@ -69,6 +82,9 @@ class EnhancedSyncManager:
         except Exception as e:
             log_error("Enhanced Sync Error", f"Error in enhanced sync: {e}", 
                      module="enhanced_sync_manager", function="sync_all_requests_with_status_check")
+            failed_media_ids.update(request.get('media', {}).get('id') for request in processing_requests or [])
+        
+        return failed_media_ids
     
     async def _process_request_with_status_check(self, request: Dict[str, Any]) -> Dict[str, bool]:
         """
@@ -147,11 +163,11 @@ class EnhancedSyncManager:
             
             # Only make Trakt API call if we don't have complete data
             if needs_trakt_call:
-                media_details = get_media_details_from_trakt(tmdb_id, media_type)
+                media_details = await run_io(get_media_details_from_trakt, tmdb_id, media_type)
                 if not media_details:
                     log_warning("Enhanced Sync Warning", f"Could not get details for TMDB ID {tmdb_id}, skipping", 
                                module="enhanced_sync_manager", function="_process_request_with_status_check")
-                    return {'synced': False, 'queued': False}
+                    return {'synced': False, 'queued': False, 'failed': True}
                 
                 # Validate media_details structure
                 if not isinstance(media_details, dict):
@@ -165,7 +181,7 @@ class EnhancedSyncManager:
                         module="enhanced_sync_manager", function="_process_request_with_status_check")
                 
                 success = await self._create_and_queue_media(request, media_details)
-                return {'synced': success, 'queued': success}
+                return {'synced': success, 'queued': success, 'failed': not success}
             
             # Media exists - check its status and decide what to do
             return await self._handle_existing_media(existing_media, request, media_details)
@@ -174,7 +190,7 @@ class EnhancedSyncManager:
             error_traceback = traceback.format_exc()
             log_error("Enhanced Sync Error", f"Error processing request: {e}\nTraceback:\n{error_traceback}", 
                      module="enhanced_sync_manager", function="_process_request_with_status_check")
-            return {'synced': False, 'queued': False}
+            return {'synced': False, 'queued': False, 'failed': True}
     
     def _get_media_by_tmdb(self, tmdb_id: int, media_type: str) -> Optional[UnifiedMedia]:
         """Get media by TMDB ID and type"""
@@ -212,7 +228,7 @@ class EnhancedSyncManager:
             
             # Start media processing (creates database record)
             # Pass media_details so it can handle released_date and set status to unreleased if needed
-            success = start_media_processing(
+            success = await run_io(start_media_processing,
                 tmdb_id=tmdb_id,
                 imdb_id=media_details.get('imdb_id'),
                 trakt_id=media_details.get('trakt_id'),
@@ -303,7 +319,7 @@ class EnhancedSyncManager:
         except Exception as e:
             log_error("Enhanced Sync Error", f"Error handling existing media {existing_media.title}: {e}", 
                      module="enhanced_sync_manager", function="_handle_existing_media")
-            return {'synced': False, 'queued': False}
+            return {'synced': False, 'queued': False, 'failed': True}
     
     def _is_eligible_for_retry(self, media: UnifiedMedia) -> bool:
         """Check if failed media is eligible for retry"""
@@ -440,6 +456,6 @@ class EnhancedSyncManager:
 enhanced_sync_manager = EnhancedSyncManager()
 
 
-async def enhanced_sync_all_requests():
-    """Enhanced sync function that checks status and manages queues properly"""
-    await enhanced_sync_manager.sync_all_requests_with_status_check()
+async def enhanced_sync_all_requests(processing_requests: Optional[List[Dict[str, Any]]] = None) -> set:
+    """Enhanced sync function that checks status and manages queues properly; returns the media IDs that failed"""
+    return await enhanced_sync_manager.sync_all_requests_with_status_check(processing_requests)
@@ -0,0 +1,142 @@
+"""
+Executors module for SeerrBridge
+Runs blocking HTTP, database and Selenium work off the asyncio event loop so API
+requests stay responsive while searches and syncs are in progress
+"""
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from loguru import logger
+
+# Worker threads shared by blocking HTTP (Overseerr, Trakt) and database calls
+IO_EXECUTOR_WORKERS = 16
+
+
+class ExecutorLayer:
+    """
+    Dedicated executors for blocking work.
+
+    HTTP and database calls share a thread pool. Each browser slot gets its own
+    single-thread executor, so all WebDriver commands for a session run on the same
+    thread in submission order and never compete for the default executor used by
+    asyncio.to_thread.
+    """
+
+    def __init__(self, io_workers: int = IO_EXECUTOR_WORKERS):
+        self.io_executor = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="seerr-io")
+        self._browser_executors: Dict[int, ThreadPoolExecutor] = {}
+        self._lock = threading.Lock()
+        self._pending = {"io": 0, "browser": 0}
+        self._completed = {"io": 0, "browser": 0}
+        self._busy_seconds = {"io": 0.0, "browser": 0.0}
+
+    def get_browser_executor(self, slot: int) -> ThreadPoolExecutor:
+        """Get the single-thread executor that owns a browser slot"""
+        with self._lock:
+            executor = self._browser_executors.get(slot)
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"seerr-browser-{slot}")
+                self._browser_executors[slot] = executor
+            return executor
+
+    def reset_browser_executor(self, slot: int):
+        """
+        Replace the thread of a browser slot.
+        Used when a session is recycled after a timeout: the old thread may still be stuck
+        in a call to the killed browser, and new work must not queue up behind it.
+        """
+        with self._lock:
+            executor = self._browser_executors.pop(slot, None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _track(self, kind: str, func: Callable, *args, **kwargs) -> Any:
+        started = time.time()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._pending[kind] -= 1
+                self._completed[kind] += 1
+                self._busy_seconds[kind] += time.time() - started
+
+    async def _submit(self, kind: str, executor: ThreadPoolExecutor, func: Callable, *args, **kwargs) -> Any:
+        with self._lock:
+            self._pending[kind] += 1
+        loop = asyncio.get_running_loop()
+        call = functools.partial(self._track, kind, func, *args, **kwargs)
+        try:
+            future = loop.run_in_executor(executor, call)
+        except RuntimeError:
+            # Executor was shut down while the call was being submitted (e.g. slot reset)
+            with self._lock:
+                self._pending[kind] -= 1
+            raise
+        return await future
+
+    async def run_io(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking HTTP or database call on the shared I/O pool.
+
+        Args:
+            func (callable): Blocking function to run
+            *args, **kwargs: Arguments for func
+
+        Returns:
+            The return value of func
+        """
+        return await self._submit("io", self.io_executor, func, *args, **kwargs)
+
+    async def run_in_browser(self, slot: int, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run blocking Selenium work on the thread that owns a browser slot.
+
+        Args:
+            slot (int): Browser pool slot whose thread runs the work
+            func (callable): Blocking function to run
+            *args, **kwargs: Arguments for func
+
+        Returns:
+            The return value of func
+        """
+        return await self._submit("browser", self.get_browser_executor(slot), func, *args, **kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pending and completed calls per executor kind, for status endpoints"""
+        with self._lock:
+            return {
+                kind: {
+                    "pending": self._pending[kind],
+                    "completed": self._completed[kind],
+                    "busy_seconds": round(self._busy_seconds[kind], 1)
+                }
+                for kind in self._pending
+            } | {"browser_threads": sorted(self._browser_executors)}
+
+    def shutdown(self):
+        """Stop accepting work; running calls are left to finish on their own"""
+        self.io_executor.shutdown(wait=False)
+        with self._lock:
+            executors = list(self._browser_executors.values())
+            self._browser_executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=False)
+        logger.info("Executors shut down.")
+
+
+# Global instance
+executors = ExecutorLayer()
+
+
+async def run_io(func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking HTTP or database call on the shared I/O pool"""
+    return await executors.run_io(func, *args, **kwargs)
+
+
+async def run_in_browser(slot: int, func: Callable, *args, **kwargs) -> Any:
+    """Run blocking Selenium work on the thread that owns a browser slot"""
+    return await executors.run_in_browser(slot, func, *args, **kwargs)
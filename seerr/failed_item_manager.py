@@ -127,10 +127,11 @@ class FailedItemManager:
         time_since_error = datetime.utcnow() - media.last_error_at
         return time_since_error >= timedelta(hours=retry_delay_hours)
     
-    def retry_failed_movie(self, movie: UnifiedMedia) -> bool:
+    async def retry_failed_movie(self, movie: UnifiedMedia) -> bool:
         """Retry a failed movie by adding it back to the queue"""
         try:
             from seerr.background_tasks import add_movie_to_queue
+            from seerr.request_queue import PRIORITY_RECONCILE
             
             # Prepare the movie data for re-queuing
             movie_data = {
@@ -148,14 +149,15 @@ class FailedItemManager:
             }
             
             # Add to queue
-            success = add_movie_to_queue(
+            success = await add_movie_to_queue(
                 movie_data['imdb_id'],
                 movie_data['movie_title'],
                 movie_data['media_type'],
                 movie_data['extra_data'],
                 movie_data['media_id'],
                 movie_data['tmdb_id'],
-                movie_data['request_id']
+                movie_data['request_id'],
+                priority=PRIORITY_RECONCILE
             )
             
             if success:
@@ -174,10 +176,11 @@ class FailedItemManager:
                      module="failed_item_manager", function="retry_failed_movie")
             return False
     
-    def retry_failed_tv_show(self, show: UnifiedMedia) -> bool:
+    async def retry_failed_tv_show(self, show: UnifiedMedia) -> bool:
         """Retry a failed TV show by adding it back to the queue"""
         try:
             from seerr.background_tasks import add_tv_to_queue
+            from seerr.request_queue import PRIORITY_RECONCILE
             
             # Prepare the TV show data for re-queuing
             show_data = {
@@ -196,14 +199,15 @@ class FailedItemManager:
             }
             
             # Add to queue
-            success = add_tv_to_queue(
+            success = await add_tv_to_queue(
                 show_data['imdb_id'],
                 show_data['movie_title'],
                 show_data['media_type'],
                 show_data['extra_data'],
                 show_data['media_id'],
                 show_data['tmdb_id'],
-                show_data['request_id']
+                show_data['request_id'],
+                priority=PRIORITY_RECONCILE
             )
             
             if success:
@@ -303,12 +307,12 @@ async def process_failed_items():
         
         # Retry failed movies
         for movie in failed_movies:
-            if failed_item_manager.retry_failed_movie(movie):
+            if await failed_item_manager.retry_failed_movie(movie):
                 retry_count += 1
         
         # Retry failed TV shows
         for show in failed_tv_shows:
-            if failed_item_manager.retry_failed_tv_show(show):
+            if await failed_item_manager.retry_failed_tv_show(show):
                 retry_count += 1
         
         if retry_count > 0:
@@ -20,10 +20,7 @@ def fetch_trakt_show_images(trakt_show_id: str) -> Optional[Dict[str, str]]:
     """
     try:
         from seerr.config import TRAKT_API_KEY
-        import time
-        
-        # Simple rate limiting - wait a bit to avoid hitting rate limits
-        time.sleep(0.1)  # 100ms delay between requests
+        from seerr.trakt_client import trakt_client
         
         headers = {
             'Content-Type': 'application/json',
@@ -34,7 +31,7 @@ def fetch_trakt_show_images(trakt_show_id: str) -> Optional[Dict[str, str]]:
         
         # Use the correct endpoint format with extended=images parameter
         url = f"https://api.trakt.tv/shows/{trakt_show_id}?extended=images"
-        response = requests.get(url, headers=headers, timeout=10)
+        response = trakt_client.get(url, headers=headers, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -101,10 +98,7 @@ def fetch_trakt_movie_images(trakt_movie_id: str) -> Optional[Dict[str, str]]:
     """
     try:
         from seerr.config import TRAKT_API_KEY
-        import time
-        
-        # Simple rate limiting - wait a bit to avoid hitting rate limits
-        time.sleep(0.1)  # 100ms delay between requests
+        from seerr.trakt_client import trakt_client
         
         headers = {
             'Content-Type': 'application/json',
@@ -115,7 +109,7 @@ def fetch_trakt_movie_images(trakt_movie_id: str) -> Optional[Dict[str, str]]:
         
         # Use the correct endpoint format with extended=images parameter
         url = f"https://api.trakt.tv/movies/{trakt_movie_id}?extended=images"
-        response = requests.get(url, headers=headers, timeout=10)
+        response = trakt_client.get(url, headers=headers, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
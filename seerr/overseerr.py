@@ -3,8 +3,10 @@ Overseerr integration module
 Handles interaction with the Overseerr API
 """
 import json
+import time
 import requests
-from typing import List, Dict, Any, Optional
+from datetime import datetime
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from loguru import logger
 
 from seerr.config import OVERSEERR_API_BASE_URL, OVERSEERR_API_KEY, USE_DATABASE
@@ -13,6 +15,17 @@ from seerr.unified_media_manager import track_media_request, update_media_reques
 from seerr.unified_models import UnifiedMedia
 from seerr.db_logger import log_info, log_success, log_error
 
+# Requests fetched per page of /api/v1/request
+OVERSEERR_PAGE_SIZE = 100
+
+OVERSEERR_REQUEST_TIMEOUT_SECONDS = 30
+
+# Incremental syncs only see requests whose updatedAt moved; a full pass catches anything missed
+FULL_SYNC_INTERVAL_SECONDS = 24 * 60 * 60
+
+# system_config key holding the incremental sync high-water mark
+SYNC_CURSOR_CONFIG_KEY = 'overseerr_sync_cursor'
+
 def aggregate_tv_requests_by_media_id(requests: list[dict]) -> list[dict]:
     """
     Aggregate TV show requests with the same media ID to collect all season numbers
@@ -89,53 +102,202 @@ def aggregate_tv_requests_by_media_id(requests: list[dict]) -> list[dict]:
     return aggregated_requests
 
 
-def get_overseerr_media_requests() -> list[dict]:
+def iter_overseerr_requests(filter_name: str = 'approved', sort: str = 'added',
+                            page_size: int = OVERSEERR_PAGE_SIZE) -> Iterator[dict]:
     """
-    Fetch media requests from Overseerr API and aggregate TV show requests by media ID
+    Stream every Overseerr request matching a filter, one page at a time
     
-    Returns:
-        list[dict]: List of aggregated media request objects
+    Args:
+        filter_name (str): Overseerr request filter, e.g. 'approved' or 'all'
+        sort (str): 'added' (newest request first) or 'modified' (most recently updated first)
+        page_size (int): Requests per page
+        
+    Yields:
+        dict: Overseerr request objects in the requested order
+        
+    Raises:
+        requests.exceptions.RequestException: If a page cannot be fetched
+        ValueError: If a page is not valid JSON
     """
-    url = f"{OVERSEERR_API_BASE_URL}/api/v1/request?take=500&filter=approved&sort=added"
     headers = {
         "X-Api-Key": OVERSEERR_API_KEY
     }
+    skip = 0
+    while True:
+        url = f"{OVERSEERR_API_BASE_URL}/api/v1/request?take={page_size}&skip={skip}&filter={filter_name}&sort={sort}"
+        response = requests.get(url, headers=headers, timeout=OVERSEERR_REQUEST_TIMEOUT_SECONDS)
+        response.raise_for_status()
+        data = response.json()
+        
+        results = data.get('results') or []
+        yield from results
+        
+        total = (data.get('pageInfo') or {}).get('results')
+        skip += len(results)
+        if len(results) < page_size or (total is not None and skip >= total):
+            return
+
+def select_processing_requests(all_requests: list[dict]) -> list[dict]:
+    """
+    Keep the approved requests whose media is processing and aggregate TV show requests by media ID
+    
+    Args:
+        all_requests: Overseerr request objects
+        
+    Returns:
+        list[dict]: List of aggregated media request objects
+    """
+    # Filter requests that are approved (status 2) and processing (status 3), excluding available (status 5) and unavailable (status 7)
+    processing_requests = [item for item in all_requests if item['status'] == 2 and item['media']['status'] == 3]
+    logger.info(f"Filtered {len(processing_requests)} approved requests (processing items only, excluding status 5 and 7)")
     
-    # API request logging
+    # Aggregate TV show requests by media ID
+    aggregated_requests = aggregate_tv_requests_by_media_id(processing_requests)
+    logger.info(f"Aggregated to {len(aggregated_requests)} requests (TV shows combined by media ID)")
     
+    return aggregated_requests
+
+def get_overseerr_media_requests() -> list[dict]:
+    """
+    Fetch media requests from Overseerr API and aggregate TV show requests by media ID
+    
+    Returns:
+        list[dict]: List of aggregated media request objects
+    """
     try:
-        response = requests.get(url, headers=headers)
+        all_requests = list(iter_overseerr_requests('approved', 'added'))
+        logger.info(f"Fetched {len(all_requests)} requests from Overseerr")
         
-        if response.status_code != 200:
-            logger.error(f"Failed to fetch requests from Overseerr: {response.status_code}")
-            logger.error(f"Response text: {response.text}")
+        if not all_requests:
             return []
         
-        # Response processing
-        
+        return select_processing_requests(all_requests)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        logger.error(f"Failed to fetch requests from Overseerr: {e}")
+        return []
+    except Exception as e:
+        logger.error(f"Error fetching media requests from Overseerr: {e}")
+        return []
+
+def _parse_updated_at(value: Any) -> Optional[datetime]:
+    """Parse an Overseerr updatedAt timestamp"""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+def load_sync_cursor() -> Optional[dict]:
+    """
+    Get the stored incremental sync high-water mark
+    
+    Returns:
+        Optional[dict]: {"updated_at", "ids", "retry_ids", "full_sync_at"}, or None before the first sync
+    """
+    from seerr.task_config_manager import task_config
+    cursor = task_config.get_config(SYNC_CURSOR_CONFIG_KEY)
+    if isinstance(cursor, str):
         try:
-            data = response.json()
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            logger.error(f"Raw response: {response.text}")
-            return []
-        logger.info(f"Fetched {len(data.get('results', []))} requests from Overseerr")
+            cursor = json.loads(cursor)
+        except ValueError:
+            return None
+    return cursor if isinstance(cursor, dict) else None
+
+def save_sync_cursor(cursor: dict) -> bool:
+    """Store the incremental sync high-water mark so it survives restarts"""
+    from seerr.task_config_manager import task_config
+    return task_config.set_config(SYNC_CURSOR_CONFIG_KEY, cursor, 'json',
+                                  'High-water mark (updatedAt) of the incremental Overseerr request sync')
+
+def fetch_changed_overseerr_requests(cursor: Optional[dict]) -> Tuple[list[dict], dict]:
+    """
+    Fetch the approved requests that changed since a high-water mark
+    
+    Pages through the requests most recently updated first and stops at the first one that
+    is older than the mark, so an unchanged instance costs one page. Requests updated at
+    exactly the mark are compared by ID, so none is skipped or processed twice. Requests the
+    previous sync failed to process (the cursor's retry_ids) are fetched again by ID. Without
+    a cursor, or once FULL_SYNC_INTERVAL_SECONDS has passed since the last full pass, every
+    request is returned.
+    
+    Args:
+        cursor (dict, optional): Cursor from load_sync_cursor
         
-        if not data.get('results'):
-            return []
+    Returns:
+        Tuple[list[dict], dict]: (changed request objects, cursor to store after they are processed)
         
-        # Filter requests that are approved (status 2) and processing (status 3), excluding available (status 5) and unavailable (status 7)
-        processing_requests = [item for item in data['results'] if item['status'] == 2 and item['media']['status'] == 3]
-        logger.info(f"Filtered {len(processing_requests)} approved requests (processing items only, excluding status 5 and 7)")
+    Raises:
+        requests.exceptions.RequestException: If a page cannot be fetched
+    """
+    now = time.time()
+    full = not cursor or now - float(cursor.get('full_sync_at') or 0) >= FULL_SYNC_INTERVAL_SECONDS
+    mark = None if full else _parse_updated_at(cursor.get('updated_at'))
+    ids_at_mark = set() if full else set(cursor.get('ids') or [])
+    if mark is None:
+        full = True
+    
+    changed = []
+    newest = None
+    newest_ids = set()
+    for request in iter_overseerr_requests('approved', 'modified'):
+        updated_at = _parse_updated_at(request.get('updatedAt'))
+        if not full and updated_at is not None:
+            if updated_at < mark:
+                break
+            if updated_at == mark and request['id'] in ids_at_mark:
+                continue
+        changed.append(request)
+        if updated_at is not None:
+            if newest is None or updated_at > newest:
+                newest = updated_at
+                newest_ids = {request['id']}
+            elif updated_at == newest:
+                newest_ids.add(request['id'])
+    
+    if not full:
+        # Behind the mark, but not processed yet
+        seen_ids = {request['id'] for request in changed}
+        for request_id in cursor.get('retry_ids') or []:
+            if request_id not in seen_ids:
+                request = get_overseerr_request(request_id)
+                if request is not None and request.get('status') == 2:
+                    changed.append(request)
+    
+    if newest is None or (mark is not None and newest < mark):
+        # Nothing newer than the mark: keep it
+        new_cursor = {'updated_at': cursor.get('updated_at') if cursor else None,
+                      'ids': sorted(ids_at_mark)}
+    elif mark is not None and newest == mark:
+        new_cursor = {'updated_at': cursor.get('updated_at'), 'ids': sorted(ids_at_mark | newest_ids)}
+    else:
+        new_cursor = {'updated_at': newest.isoformat(), 'ids': sorted(newest_ids)}
+    new_cursor['full_sync_at'] = now if full else cursor.get('full_sync_at')
+    
+    new_cursor['retry_ids'] = []
+    
+    logger.info(f"{'Full' if full else 'Incremental'} Overseerr sync: {len(changed)} changed request(s)")
+    return changed, new_cursor
+
+def get_overseerr_request(request_id: int) -> Optional[dict]:
+    """
+    Fetch a single Overseerr request by ID
+    
+    Args:
+        request_id (int): Overseerr request ID
         
-        # Aggregate TV show requests by media ID
-        aggregated_requests = aggregate_tv_requests_by_media_id(processing_requests)
-        logger.info(f"Aggregated to {len(aggregated_requests)} requests (TV shows combined by media ID)")
+    Returns:
+        Optional[dict]: The request object, or None if it no longer exists
         
-        return aggregated_requests
-    except Exception as e:
-        logger.error(f"Error fetching media requests from Overseerr: {e}")
-        return []
+    Raises:
+        requests.exceptions.RequestException: If the request cannot be fetched
+    """
+    url = f"{OVERSEERR_API_BASE_URL}/api/v1/request/{request_id}"
+    response = requests.get(url, headers={"X-Api-Key": OVERSEERR_API_KEY}, timeout=OVERSEERR_REQUEST_TIMEOUT_SECONDS)
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return response.json()
 
 def get_all_overseerr_requests_for_media(overseerr_media_id: int) -> list[dict]:
     """
@@ -147,25 +309,12 @@ def get_all_overseerr_requests_for_media(overseerr_media_id: int) -> list[dict]:
     Returns:
         list[dict]: List of all requests for this media ID
     """
-    url = f"{OVERSEERR_API_BASE_URL}/api/v1/request?take=500&filter=all&sort=added"
-    headers = {
-        "X-Api-Key": OVERSEERR_API_KEY
-    }
-    
     try:
-        response = requests.get(url, headers=headers)
-        
-        if response.status_code != 200:
-            logger.error(f"Failed to fetch all requests from Overseerr: {response.status_code}")
-            return []
-        
-        data = response.json()
-        
-        if not data.get('results'):
-            return []
-        
         # Filter requests for the specific media ID, only processing (status 3), excluding available (status 5) and unavailable (status 7)
-        media_requests = [item for item in data['results'] if item['media']['id'] == overseerr_media_id and item['media']['status'] == 3]
+        media_requests = [
+            item for item in iter_overseerr_requests('all', 'added')
+            if item['media']['id'] == overseerr_media_id and item['media']['status'] == 3
+        ]
         logger.info(f"Found {len(media_requests)} total requests for media ID {overseerr_media_id} (processing items only, excluding status 5 and 7)")
         return media_requests
         
@@ -0,0 +1,280 @@
+"""
+Processing watchdog module for SeerrBridge
+Runs blocking browser work for a queue item in a worker thread with a hard deadline,
+kills the browser of items that overrun it and keeps per-stage duration histograms
+"""
+import asyncio
+import os
+import signal
+import subprocess
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Tuple
+
+from loguru import logger
+
+from seerr.task_config_manager import task_config
+from seerr.executors import run_io, run_in_browser
+from seerr.db_logger import log_error, log_warning
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Processing stages that run under a deadline
+STAGE_MOVIE_SEARCH = 'movie_search'
+STAGE_TV_SEARCH = 'tv_search'
+
+# Config key and default deadline (seconds) for each stage
+STAGE_TIMEOUTS = {
+    STAGE_MOVIE_SEARCH: ('movie_item_timeout_seconds', 900),
+    STAGE_TV_SEARCH: ('tv_item_timeout_seconds', 3600)
+}
+
+# Upper bounds (seconds) of the duration histogram buckets; the last bucket is open-ended
+HISTOGRAM_BUCKETS = (30, 60, 120, 300, 600, 900, 1800, 3600)
+
+# Number of recent durations kept per stage for percentile reporting
+DURATION_SAMPLE_SIZE = 200
+
+# Retry backoff for timed-out items: base * 2^(timeouts - 1), capped
+RETRY_BACKOFF_BASE_SECONDS = 300
+RETRY_BACKOFF_MAX_SECONDS = 3600
+
+# How long to wait for killed browser processes to exit
+KILL_WAIT_SECONDS = 5
+
+
+class ItemTimeoutError(Exception):
+    """Raised when a queue item overruns the deadline of its processing stage"""
+
+    def __init__(self, stage: str, timeout: float):
+        super().__init__(f"{stage} did not finish within {timeout:.0f}s")
+        self.stage = stage
+        self.timeout = timeout
+
+
+def _linux_children(pid: int) -> List[int]:
+    """Child process IDs from /proc (Linux only)"""
+    children: List[int] = []
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children") as f:
+                children.extend(int(child) for child in f.read().split())
+    except (OSError, ValueError):
+        pass
+    return children
+
+
+def _kill_linux_tree(pid: int):
+    """Kill a process and its descendants found through /proc"""
+    for child in _linux_children(pid):
+        _kill_linux_tree(child)
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except OSError:
+        pass
+
+
+def _kill_process_tree(process: subprocess.Popen) -> bool:
+    """
+    Kill a process and all of its descendants.
+    Uses psutil on every platform when it is installed; otherwise taskkill /T on Windows and
+    /proc on Linux. Elsewhere only the process itself can be killed.
+
+    Args:
+        process (subprocess.Popen): The chromedriver process
+
+    Returns:
+        bool: True if the process has exited
+    """
+    pid = process.pid
+    if PSUTIL_AVAILABLE:
+        try:
+            parent = psutil.Process(pid)
+            processes = parent.children(recursive=True) + [parent]
+            for proc in processes:
+                try:
+                    proc.kill()
+                except psutil.NoSuchProcess:
+                    pass
+            psutil.wait_procs(processes, timeout=KILL_WAIT_SECONDS)
+        except psutil.NoSuchProcess:
+            pass
+        except psutil.Error as e:
+            logger.debug(f"psutil could not kill browser process tree {pid}: {e}")
+    elif os.name == 'nt':
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(pid)], capture_output=True, timeout=KILL_WAIT_SECONDS)
+    elif os.path.isdir(f"/proc/{pid}"):
+        _kill_linux_tree(pid)
+    else:
+        log_warning("Processing Watchdog", f"Install psutil to stop Chrome processes started by chromedriver {pid}; only chromedriver is killed",
+                   module="processing_watchdog", function="_kill_process_tree")
+
+    # Whatever ran above, make sure the process itself is gone
+    try:
+        if process.poll() is None:
+            process.kill()
+        process.wait(timeout=KILL_WAIT_SECONDS)
+    except subprocess.TimeoutExpired:
+        return False
+    except OSError:
+        pass
+    return process.poll() is not None
+
+
+def kill_driver(driver) -> bool:
+    """
+    Forcefully stop a browser that no longer responds.
+    Killing chromedriver and Chrome makes any WebDriver call blocked in another thread fail
+    immediately, which lets that thread finish.
+
+    Args:
+        driver: Selenium WebDriver instance
+
+    Returns:
+        bool: True if the browser was stopped (or was not running)
+    """
+    if driver is None:
+        return True
+    try:
+        process = driver.service.process
+        if process is None or process.poll() is not None:
+            return True
+        if _kill_process_tree(process):
+            return True
+        log_error("Processing Watchdog", f"Browser process {process.pid} is still running after kill",
+                 module="processing_watchdog", function="kill_driver")
+    except Exception as e:
+        log_error("Processing Watchdog", f"Error killing browser process: {e}",
+                 module="processing_watchdog", function="kill_driver")
+    return False
+
+
+class StageStats:
+    """Duration histogram and timeout counter for one processing stage"""
+
+    def __init__(self):
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        self.count = 0
+        self.timeouts = 0
+        self.total_seconds = 0.0
+        self.samples: Deque[float] = deque(maxlen=DURATION_SAMPLE_SIZE)
+
+    def observe(self, duration: float):
+        index = next((i for i, bound in enumerate(HISTOGRAM_BUCKETS) if duration <= bound), len(HISTOGRAM_BUCKETS))
+        self.buckets[index] += 1
+        self.count += 1
+        self.total_seconds += duration
+        self.samples.append(duration)
+
+    def to_dict(self) -> Dict[str, Any]:
+        samples = sorted(self.samples)
+        labels = [f"<={bound}s" for bound in HISTOGRAM_BUCKETS] + [f">{HISTOGRAM_BUCKETS[-1]}s"]
+        return {
+            "count": self.count,
+            "timeouts": self.timeouts,
+            "avg_seconds": round(self.total_seconds / self.count, 1) if self.count else None,
+            "p50_seconds": round(samples[len(samples) // 2], 1) if samples else None,
+            "p95_seconds": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 1) if samples else None,
+            "histogram": dict(zip(labels, self.buckets))
+        }
+
+
+class ProcessingWatchdog:
+    """
+    Enforces per-stage deadlines on blocking queue work.
+
+    The work runs on the browser slot's own thread so the event loop stays responsive. When the deadline
+    passes, the browser session is killed and flagged for recycling; the pool starts a fresh
+    browser when the session is released.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, StageStats] = {stage: StageStats() for stage in STAGE_TIMEOUTS}
+        self._timeout_counts: Dict[Tuple[Any, str], int] = {}
+
+    def get_timeout(self, stage: str) -> float:
+        """Get the configured deadline of a stage in seconds"""
+        key, default = STAGE_TIMEOUTS.get(stage, (None, 900))
+        try:
+            return float(task_config.get_config(key, default)) if key else float(default)
+        except (TypeError, ValueError):
+            return float(default)
+
+    async def run(self, stage: str, session, func: Callable, *args) -> Any:
+        """
+        Run blocking work for a queue item on the session's browser thread with the stage deadline.
+
+        Args:
+            stage (str): Processing stage, used for the deadline and the histogram
+            session (BrowserSession): Leased browser session the work uses, killed on timeout
+            func (callable): Blocking function to run
+            *args: Arguments for func
+
+        Returns:
+            The return value of func
+
+        Raises:
+            ItemTimeoutError: If the deadline passed
+        """
+        timeout = self.get_timeout(stage)
+        stats = self.stages.setdefault(stage, StageStats())
+        started = time.time()
+        try:
+            work = run_in_browser(session.slot, func, *args) if session is not None else run_io(func, *args)
+            result = await asyncio.wait_for(work, timeout)
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            stats.observe(time.time() - started)
+            log_error("Processing Watchdog", f"{stage} exceeded its {timeout:.0f}s deadline; killing browser session {session.slot if session else '-'}",
+                     module="processing_watchdog", function="run")
+            if session is not None:
+                session.needs_recycle = True
+                session.last_error = f"{stage} timed out after {timeout:.0f}s"
+                # The browser thread is busy with the overrunning call, so kill from the I/O pool
+                await run_io(kill_driver, session.driver)
+            raise ItemTimeoutError(stage, timeout)
+        stats.observe(time.time() - started)
+        return result
+
+    def record_timeout(self, key: Tuple[Any, str]) -> int:
+        """
+        Count a timeout for an item.
+
+        Returns:
+            int: Number of consecutive timeouts for the item
+        """
+        self._timeout_counts[key] = self._timeout_counts.get(key, 0) + 1
+        return self._timeout_counts[key]
+
+    def clear(self, key: Tuple[Any, str]):
+        """Forget the timeouts of an item once it finished without timing out"""
+        self._timeout_counts.pop(key, None)
+
+    def get_max_retries(self) -> int:
+        """Number of times a timed-out item is requeued before it is marked as failed"""
+        try:
+            return max(0, int(task_config.get_config('item_timeout_max_retries', 2)))
+        except (TypeError, ValueError):
+            return 2
+
+    def get_retry_delay(self, timeouts: int) -> float:
+        """Backoff before a timed-out item is requeued"""
+        return min(RETRY_BACKOFF_BASE_SECONDS * (2 ** max(0, timeouts - 1)), RETRY_BACKOFF_MAX_SECONDS)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-stage deadlines, duration histograms and timeout counts"""
+        return {
+            "stages": {
+                stage: {"timeout_seconds": self.get_timeout(stage), **stats.to_dict()}
+                for stage, stats in self.stages.items()
+            },
+            "items_with_timeouts": len(self._timeout_counts)
+        }
+
+
+# Global instance
+processing_watchdog = ProcessingWatchdog()
@@ -0,0 +1,250 @@
+"""
+Queue journal module for SeerrBridge
+Append-only SQLite journal of queue events so the movie and TV queues can be
+restored on restart with their original order, attempt counts and retry times
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from seerr.db_logger import log_info, log_success, log_warning, log_error
+
+QUEUE_JOURNAL_PATH = os.getenv(
+    'QUEUE_JOURNAL_PATH',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'queue_journal.db')
+)
+
+# Rewrite the journal as a snapshot once it holds this many events
+JOURNAL_COMPACT_THRESHOLD = 5000
+
+# Items handed to a worker this many times without completing (each one a crash or stop
+# mid-processing) are dropped on replay instead of being restored again
+MAX_REPLAY_ATTEMPTS = 3
+
+EVENT_ENQUEUE = 'enqueue'    # New item, a merged/promoted duplicate (same enqueue time) or a deferred retry
+EVENT_DEQUEUE = 'dequeue'    # Item handed to a worker; counts as one attempt
+EVENT_COMPLETE = 'complete'  # Worker finished the item, whatever the outcome
+EVENT_REMOVE = 'remove'      # Item cancelled or cleared while queued
+
+
+class QueueJournal:
+    """
+    Write-ahead journal for MediaRequestQueue.
+
+    Only media items keyed by (tmdb_id, media_type) are journaled; special tasks such as
+    ("subscription_check",) are recreated by the scheduler and are not worth restoring.
+    """
+
+    def __init__(self, path: str = QUEUE_JOURNAL_PATH):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._event_count = 0
+        self.enabled = True
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None or not self.enabled:
+            return self._conn
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS queue_events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    event TEXT NOT NULL,
+                    media_type TEXT NOT NULL,
+                    tmdb_id TEXT NOT NULL,
+                    priority TEXT,
+                    enqueued_at REAL,
+                    item TEXT,
+                    recorded_at REAL NOT NULL,
+                    not_before REAL
+                )
+            """)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(queue_events)")}
+            if 'not_before' not in columns:
+                conn.execute("ALTER TABLE queue_events ADD COLUMN not_before REAL")
+            self._event_count = conn.execute("SELECT COUNT(*) FROM queue_events").fetchone()[0]
+            self._conn = conn
+        except Exception as e:
+            log_error("Queue Journal", f"Could not open queue journal at {self.path}, journaling disabled: {e}",
+                     module="queue_journal", function="_connect")
+            self.enabled = False
+        return self._conn
+
+    def _append(self, event: str, key: Tuple[Any, str], priority: str = None,
+                enqueued_at: float = None, item: Tuple = None, not_before: float = None):
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            with self._lock:
+                conn.execute(
+                    "INSERT INTO queue_events (event, media_type, tmdb_id, priority, enqueued_at, item, recorded_at, not_before) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (event, key[1], str(key[0]), priority, enqueued_at,
+                     json.dumps(list(item), default=str) if item is not None else None, time.time(), not_before)
+                )
+                self._event_count += 1
+        except Exception as e:
+            log_warning("Queue Journal", f"Failed to record {event} event for {key}: {e}",
+                       module="queue_journal", function="_append")
+
+    def record_enqueue(self, key: Tuple[Any, str], priority: str, enqueued_at: float, item: Tuple,
+                       not_before: float = None):
+        """Record a new or updated queued item; not_before is set for deferred retries"""
+        self._append(EVENT_ENQUEUE, key, priority, enqueued_at, item, not_before)
+
+    def record_dequeue(self, key: Tuple[Any, str]):
+        """Record that an item was handed to a worker"""
+        self._append(EVENT_DEQUEUE, key)
+
+    def record_complete(self, key: Tuple[Any, str]):
+        """Record that a worker finished an item"""
+        self._append(EVENT_COMPLETE, key)
+
+    def record_remove(self, key: Tuple[Any, str]):
+        """Record that a queued item was cancelled"""
+        self._append(EVENT_REMOVE, key)
+
+    def load_pending(self) -> List[Dict[str, Any]]:
+        """
+        Fold the journal into the items that were queued or in flight when the process stopped.
+
+        Returns:
+            list: Dicts with media_type, priority, enqueued_at, not_before, attempts and item, in journal order
+        """
+        conn = self._connect()
+        if conn is None:
+            return []
+
+        pending: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        with self._lock:
+            rows = conn.execute(
+                "SELECT event, media_type, tmdb_id, priority, enqueued_at, item, not_before FROM queue_events ORDER BY id"
+            ).fetchall()
+
+        for event, media_type, tmdb_id, priority, enqueued_at, item, not_before in rows:
+            key = (tmdb_id, media_type)
+            if event == EVENT_ENQUEUE:
+                state = pending.get(key)
+                if state is None or state['completed']:
+                    pending[key] = state = {'attempts': 0, 'completed': False}
+                state.update(media_type=media_type, priority=priority, enqueued_at=enqueued_at,
+                             not_before=not_before, item=tuple(json.loads(item)), in_flight=False)
+            elif key in pending:
+                state = pending[key]
+                if event == EVENT_DEQUEUE:
+                    state['attempts'] += 1
+                    state['in_flight'] = True
+                elif event in (EVENT_COMPLETE, EVENT_REMOVE):
+                    state['completed'] = True
+
+        return [state for state in pending.values() if not state['completed']]
+
+    def replay(self, queues: Dict[str, Any], on_abandon: Callable[[Tuple, int], None] = None) -> int:
+        """
+        Restore pending items into the queues and compact the journal.
+
+        Items that were in flight when the process stopped are restored too; their
+        interrupted attempt is kept in the attempt count. Items that reached
+        MAX_REPLAY_ATTEMPTS are dropped instead, so an item that crashes the process
+        is not replayed on every start.
+
+        Args:
+            queues (dict): MediaRequestQueue instances keyed by media type
+            on_abandon (callable, optional): Called with (item, attempts) for each dropped item
+
+        Returns:
+            int: Number of items restored
+        """
+        started = time.time()
+        restored = 0
+        try:
+            for state in sorted(self.load_pending(), key=lambda s: s['enqueued_at'] or 0):
+                queue = queues.get(state['media_type'])
+                if queue is None:
+                    continue
+                if state['attempts'] >= MAX_REPLAY_ATTEMPTS:
+                    log_error("Queue Journal", f"Dropping {state['media_type']} item {state['item'][:3]} after "
+                             f"{state['attempts']} interrupted attempt(s)", module="queue_journal", function="replay")
+                    if on_abandon is not None:
+                        try:
+                            on_abandon(state['item'], state['attempts'])
+                        except Exception as e:
+                            log_error("Queue Journal", f"Error handling dropped item {state['item'][:3]}: {e}",
+                                     module="queue_journal", function="replay")
+                    continue
+                if queue.restore(state['item'], state['priority'], state['enqueued_at'], state['attempts'],
+                                 state['not_before']):
+                    restored += 1
+        except Exception as e:
+            log_error("Queue Journal", f"Error replaying queue journal: {e}",
+                     module="queue_journal", function="replay")
+            return restored
+
+        self.compact(queues)
+        if restored:
+            log_success("Queue Journal", f"Restored {restored} queued item(s) from journal in {(time.time() - started) * 1000:.0f} ms",
+                       module="queue_journal", function="replay")
+        return restored
+
+    def compact(self, queues: Dict[str, Any]):
+        """
+        Rewrite the journal as one enqueue event per currently queued item.
+
+        Args:
+            queues (dict): MediaRequestQueue instances keyed by media type
+        """
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            snapshot = [entry for queue in queues.values() for entry in queue.entries(include_in_flight=True)]
+            with self._lock:
+                conn.execute("BEGIN")
+                conn.execute("DELETE FROM queue_events")
+                for entry in sorted(snapshot, key=lambda e: e.enqueued_at):
+                    key = entry.key
+                    conn.execute(
+                        "INSERT INTO queue_events (event, media_type, tmdb_id, priority, enqueued_at, item, recorded_at, not_before) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (EVENT_ENQUEUE, key[1], str(key[0]), entry.priority, entry.enqueued_at,
+                         json.dumps(list(entry.item), default=str), time.time(), entry.not_before or None)
+                    )
+                    for _ in range(entry.attempts):
+                        conn.execute(
+                            "INSERT INTO queue_events (event, media_type, tmdb_id, recorded_at) VALUES (?, ?, ?, ?)",
+                            (EVENT_DEQUEUE, key[1], str(key[0]), time.time())
+                        )
+                conn.execute("COMMIT")
+                self._event_count = conn.execute("SELECT COUNT(*) FROM queue_events").fetchone()[0]
+            log_info("Queue Journal", f"Compacted queue journal to {len(snapshot)} item(s)",
+                    module="queue_journal", function="compact")
+        except Exception as e:
+            log_error("Queue Journal", f"Error compacting queue journal: {e}",
+                     module="queue_journal", function="compact")
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
+
+    def needs_compaction(self) -> bool:
+        """Check whether the journal has grown past the compaction threshold"""
+        return self._event_count >= JOURNAL_COMPACT_THRESHOLD
+
+    def close(self):
+        """Close the journal database"""
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+                self._conn = None
+
+
+# Global instance
+queue_journal = QueueJournal()
@@ -2,6 +2,7 @@
 Queue Persistence Manager for SeerrBridge
 Handles persistent queue storage in the database using queue_status table
 """
+import asyncio
 import json
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
@@ -12,6 +13,8 @@ from seerr.database import get_db
 from seerr.unified_models import UnifiedMedia
 from seerr.db_logger import log_info, log_success, log_warning, log_error
 from seerr.config import USE_DATABASE
+from seerr.request_queue import PRIORITY_RECONCILE
+from seerr.queue_state_cache import queue_state_cache
 from sqlalchemy import text
 
 
@@ -233,6 +236,7 @@ class QueuePersistenceManager:
                 SET is_in_queue = FALSE, queue_added_at = NULL
                 WHERE media_type = :queue_type AND is_in_queue = TRUE
             """), {"queue_type": queue_type})
+            queue_state_cache.invalidate()
             
             # Update queue status
             self.update_queue_status(queue_type, 0, False)
@@ -331,7 +335,7 @@ class QueuePersistenceManager:
         
         Args:
             queue_type: 'movie' or 'tv'
-            in_memory_queue: The asyncio.Queue instance
+            in_memory_queue: The MediaRequestQueue instance
             
         Returns:
             Dict with validation results including discrepancies
@@ -344,31 +348,9 @@ class QueuePersistenceManager:
             db_items = self.get_queued_items_from_database(queue_type)
             db_tmdb_ids = {item['tmdb_id'] for item in db_items}
             
-            # Get items currently in memory queue (non-destructive peek)
-            memory_tmdb_ids = set()
-            temp_items = []
-            try:
-                # Drain queue temporarily to inspect
-                while not in_memory_queue.empty():
-                    item = in_memory_queue.get_nowait()
-                    temp_items.append(item)
-                    # Extract tmdb_id from queue item
-                    if len(item) >= 6:
-                        # Regular item format: (imdb_id, title, media_type, extra_data, media_id, tmdb_id, ...)
-                        if not isinstance(item[0], str):  # Not a special task
-                            memory_tmdb_ids.add(item[5])  # tmdb_id is at index 5
-                        elif item[0] == "tv_processing" and len(item) >= 8:
-                            memory_tmdb_ids.add(item[7])  # tmdb_id is at index 7 for TV
-                
-                # Put items back
-                for item in temp_items:
-                    try:
-                        in_memory_queue.put_nowait(item)
-                    except:
-                        pass  # Queue might be full, but we tried
-            except Exception as e:
-                log_warning("Queue Validation", f"Error inspecting memory queue: {e}", 
-                           module="queue_persistence_manager", function="validate_queue_sync")
+            # Get items currently in memory queue from its key index (no draining); items a
+            # worker is processing count as present
+            memory_tmdb_ids = {tmdb_id for tmdb_id, _ in in_memory_queue.keys() + in_memory_queue.in_flight_keys()}
             
             # Find discrepancies
             in_db_not_in_memory = db_tmdb_ids - memory_tmdb_ids
@@ -405,7 +387,7 @@ class QueuePersistenceManager:
         
         Args:
             queue_type: 'movie' or 'tv'
-            in_memory_queue: The asyncio.Queue instance
+            in_memory_queue: The MediaRequestQueue instance
             
         Returns:
             Dict with reconciliation results
@@ -418,46 +400,14 @@ class QueuePersistenceManager:
             db_items = self.get_queued_items_from_database(queue_type)
             db_tmdb_ids = {item['tmdb_id']: item for item in db_items}
             
-            # Collect all items from memory queue
-            memory_items = []
-            memory_tmdb_ids = set()
-            
-            try:
-                # Drain queue
-                while not in_memory_queue.empty():
-                    item = in_memory_queue.get_nowait()
-                    memory_items.append(item)
-                    # Extract tmdb_id
-                    if len(item) >= 6:
-                        if not isinstance(item[0], str):  # Regular movie item
-                            memory_tmdb_ids.add(item[5])
-                        elif item[0] == "tv_processing" and len(item) >= 8:
-                            memory_tmdb_ids.add(item[7])
-            except Exception as e:
-                log_error("Queue Reconciliation", f"Error draining memory queue: {e}", 
-                         module="queue_persistence_manager", function="reconcile_queue_from_database")
-                return {'success': False, 'error': str(e)}
-            
-            # Filter: keep only items that are in database
-            items_to_keep = []
+            # Remove items that are no longer queued in the database; the rest keep their position.
+            # Items a worker is processing are left alone and not added a second time.
+            memory_tmdb_ids = {tmdb_id for tmdb_id, _ in in_memory_queue.in_flight_keys()}
             removed_count = 0
-            
-            for item in memory_items:
-                keep_item = False
-                if len(item) >= 6:
-                    if not isinstance(item[0], str):  # Regular movie item
-                        if item[5] in db_tmdb_ids:
-                            keep_item = True
-                    elif item[0] == "tv_processing" and len(item) >= 8:
-                        if item[7] in db_tmdb_ids:
-                            keep_item = True
-                    else:
-                        # Special tasks (like "movie_processing_check") - keep them
-                        keep_item = True
-                
-                if keep_item:
-                    items_to_keep.append(item)
-                else:
+            for key in in_memory_queue.keys():
+                if key[0] in db_tmdb_ids:
+                    memory_tmdb_ids.add(key[0])
+                elif in_memory_queue.remove(key):
                     removed_count += 1
             
             # Add items from database that aren't in memory
@@ -496,20 +446,16 @@ class QueuePersistenceManager:
                                 db_item.get('overseerr_request_id')
                             )
                         
-                        items_to_keep.append(queue_item)
-                        added_count += 1
+                        if in_memory_queue.put_nowait(queue_item, PRIORITY_RECONCILE):
+                            added_count += 1
+                    except asyncio.QueueFull:
+                        log_warning("Queue Reconciliation", f"Queue full, could not add item {db_item.get('title', 'Unknown')}", 
+                                   module="queue_persistence_manager", function="reconcile_queue_from_database")
+                        break
                     except Exception as e:
                         log_warning("Queue Reconciliation", f"Error adding item {db_item.get('title', 'Unknown')} to queue: {e}", 
                                    module="queue_persistence_manager", function="reconcile_queue_from_database")
             
-            # Put items back into queue
-            for item in items_to_keep:
-                try:
-                    in_memory_queue.put_nowait(item)
-                except Exception as e:
-                    log_warning("Queue Reconciliation", f"Queue full, could not add item: {e}", 
-                               module="queue_persistence_manager", function="reconcile_queue_from_database")
-            
             # Update queue status
             self.update_queue_status_from_database(queue_type, False)
             
@@ -518,11 +464,11 @@ class QueuePersistenceManager:
                 'queue_type': queue_type,
                 'removed_from_memory': removed_count,
                 'added_to_memory': added_count,
-                'final_count': len(items_to_keep)
+                'final_count': in_memory_queue.qsize()
             }
             
             log_success("Queue Reconciliation", 
-                       f"Reconciled {queue_type} queue: removed {removed_count}, added {added_count}, final count {len(items_to_keep)}", 
+                       f"Reconciled {queue_type} queue: removed {removed_count}, added {added_count}, final count {in_memory_queue.qsize()}", 
                        module="queue_persistence_manager", function="reconcile_queue_from_database")
             
             return result
@@ -0,0 +1,155 @@
+"""
+Queue state cache module for SeerrBridge
+Keeps is_in_queue/status/processing_stage of queued media in memory so cancellation
+checks do not open a database session for every lookup
+"""
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from seerr.config import USE_DATABASE
+from seerr.db_logger import log_error
+
+# Safety net for changes made outside this process (e.g. the web UI clearing the queue)
+QUEUE_STATE_TTL_SECONDS = 5
+
+# Keys looked up by a worker stay in the batch for this long after their last lookup,
+# so items that have been dequeued and are being processed keep being refreshed
+ACTIVE_KEY_TTL_SECONDS = 300
+
+STATE_FIELDS = ('id', 'is_in_queue', 'status', 'processing_stage', 'last_checked_at')
+
+
+class QueueStateCache:
+    """
+    Snapshot of the unified_media queue state for every queued or in-flight item.
+
+    The snapshot is loaded for all keys in one query and reloaded at most every
+    QUEUE_STATE_TTL_SECONDS. Writers in this process (queue tracking, status updates)
+    push their changes with update(), so cancellations are visible immediately.
+    """
+
+    def __init__(self):
+        self._states: Dict[Tuple[Any, str], Optional[Dict[str, Any]]] = {}
+        self._active: Dict[Tuple[Any, str], float] = {}
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.refreshes = 0
+
+    def _batch_keys(self, now: float) -> set:
+        """Queued keys from the request queues plus recently looked-up keys"""
+        from seerr.request_queue import request_scheduler
+
+        self._active = {key: seen for key, seen in self._active.items() if now - seen < ACTIVE_KEY_TTL_SECONDS}
+        keys = set(self._active)
+        for queue in list(request_scheduler.queues.values()):
+            keys.update(queue.keys())
+        return keys
+
+    def refresh(self, extra_keys: Iterable[Tuple[Any, str]] = ()):
+        """
+        Reload the snapshot for all queued and active items in one query.
+
+        Args:
+            extra_keys (iterable): Additional (tmdb_id, media_type) keys to load
+        """
+        if not USE_DATABASE:
+            return
+
+        from seerr.database import get_db
+        from seerr.unified_models import UnifiedMedia
+
+        now = time.time()
+        with self._lock:
+            keys = self._batch_keys(now)
+            keys.update(extra_keys)
+            states: Dict[Tuple[Any, str], Optional[Dict[str, Any]]] = {key: None for key in keys}
+
+            if keys:
+                db = get_db()
+                try:
+                    rows = db.query(
+                        UnifiedMedia.tmdb_id,
+                        UnifiedMedia.media_type,
+                        *[getattr(UnifiedMedia, field) for field in STATE_FIELDS]
+                    ).filter(UnifiedMedia.tmdb_id.in_({tmdb_id for tmdb_id, _ in keys})).all()
+
+                    for row in rows:
+                        key = (row[0], row[1])
+                        if key in states:
+                            states[key] = dict(zip(STATE_FIELDS, row[2:]))
+                except Exception as e:
+                    log_error("Queue State Cache", f"Error loading queue state snapshot: {e}",
+                             module="queue_state_cache", function="refresh")
+                    return
+                finally:
+                    db.close()
+
+            self._states = states
+            self._loaded_at = now
+            self.refreshes += 1
+
+    def get(self, tmdb_id, media_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached queue state of an item.
+
+        Args:
+            tmdb_id (int): TMDB ID of the media
+            media_type (str): Type of media ('movie' or 'tv')
+
+        Returns:
+            dict: id, is_in_queue, status, processing_stage and last_checked_at,
+                or None if the item has no media record
+        """
+        key = (tmdb_id, media_type)
+        now = time.time()
+        with self._lock:
+            self._active[key] = now
+            stale = key not in self._states or now - self._loaded_at > QUEUE_STATE_TTL_SECONDS
+            if not stale:
+                self.hits += 1
+        if stale:
+            self.refresh((key,))
+        state = self._states.get(key)
+        return dict(state) if state else None
+
+    def update(self, tmdb_id, media_type: str, **fields):
+        """
+        Push a change made to an item's media record.
+
+        Args:
+            tmdb_id (int): TMDB ID of the media
+            media_type (str): Type of media ('movie' or 'tv')
+            **fields: Changed state fields (is_in_queue, status, processing_stage, last_checked_at)
+        """
+        with self._lock:
+            state = self._states.get((tmdb_id, media_type))
+            if state is not None:
+                state.update({field: value for field, value in fields.items() if field in STATE_FIELDS})
+            else:
+                # Unknown or missing record: force a reload on the next lookup
+                self._states.pop((tmdb_id, media_type), None)
+
+    def invalidate(self, tmdb_id=None, media_type: str = None):
+        """Drop one item, or the whole snapshot when no key is given"""
+        with self._lock:
+            if tmdb_id is None:
+                self._states = {}
+                self._loaded_at = 0.0
+            else:
+                self._states.pop((tmdb_id, media_type), None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics for status endpoints"""
+        return {
+            "cached_items": len(self._states),
+            "active_items": len(self._active),
+            "hits": self.hits,
+            "refreshes": self.refreshes,
+            "snapshot_age_seconds": round(time.time() - self._loaded_at, 1) if self._loaded_at else None
+        }
+
+
+# Global instance
+queue_state_cache = QueueStateCache()
@@ -0,0 +1,715 @@
+"""
+Request queue module for SeerrBridge
+Priority queues for movie and TV requests with aging and per-media-type quotas
+"""
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from seerr.task_config_manager import task_config
+
+# Priority classes, from most to least urgent
+PRIORITY_WEBHOOK = 'webhook'      # Requests coming straight from Overseerr/Jellyseerr or a user retrigger
+PRIORITY_SYNC = 'sync'            # Overseerr/list sync and scheduled maintenance tasks
+PRIORITY_RECONCILE = 'reconcile'  # Items re-queued from the database (reconciliation, retries, stuck items)
+
+# Head start of each class in seconds. Items are ordered by enqueue time plus this delay,
+# so a sync item that has waited 10 minutes is served before a webhook item that just
+# arrived. This is the aging rule: every item eventually reaches the front.
+PRIORITY_CLASS_DELAYS = {
+    PRIORITY_WEBHOOK: 0,
+    PRIORITY_SYNC: 600,
+    PRIORITY_RECONCILE: 1800
+}
+
+# Number of recent dispatches used to enforce the per-media-type quota
+QUOTA_WINDOW = 10
+
+# Number of recent wait times kept per class for percentile reporting
+WAIT_SAMPLE_SIZE = 200
+
+
+def get_item_key(item: Tuple) -> Optional[Tuple[Any, str]]:
+    """
+    Get the (tmdb_id, media_type) key of a queue item.
+
+    Args:
+        item (tuple): Movie item (imdb_id, title, media_type, extra_data, media_id, tmdb_id, request_id)
+            or TV item ("tv_processing", imdb_id, title, media_type, extra_data, media_id, tmdb_id, request_id)
+
+    Returns:
+        tuple: (tmdb_id, media_type), or None for special tasks such as ("subscription_check",)
+    """
+    if len(item) == 8 and item[0] == "tv_processing":
+        return (item[6], item[3]) if item[6] is not None else None
+    if len(item) == 7:
+        return (item[5], item[2]) if item[5] is not None else None
+    return None
+
+
+def _merge_items(queued: Tuple, latest: Tuple) -> Tuple:
+    """Use the latest request data, keeping queued values the new request does not provide"""
+    return tuple(new if new is not None else old for old, new in zip(queued, latest))
+
+
+# Rebuild the heap once removed entries outnumber live ones (and there are at least this many)
+COMPACT_MIN_REMOVED = 64
+
+
+class QueueEntry:
+    """
+    Handle for one queued item.
+    Removing an item only marks its entry; the heap drops it when it reaches the top.
+    A deferred entry has a not_before time and stays out of the heap until it is due.
+    """
+
+    __slots__ = ('sort_key', 'seq', 'enqueued_at', 'priority', 'item', 'key', 'attempts', 'removed', 'not_before')
+
+    def __init__(self, sort_key: float, seq: int, enqueued_at: float, priority: str, item: Tuple, attempts: int = 0):
+        self.sort_key = sort_key
+        self.seq = seq
+        self.enqueued_at = enqueued_at
+        self.priority = priority
+        self.item = item
+        self.key = get_item_key(item)
+        self.attempts = attempts
+        self.removed = False
+        self.not_before = 0.0
+
+    def __lt__(self, other: 'QueueEntry') -> bool:
+        return (self.sort_key, self.seq) < (other.sort_key, other.seq)
+
+
+class MediaRequestQueue:
+    """
+    Bounded priority queue for one media type.
+    Exposes the subset of the asyncio.Queue API used by the background tasks, plus
+    keyed lookup and removal so items can be cancelled without draining the queue.
+    """
+
+    def __init__(self, media_type: str, maxsize: int = 0):
+        self.media_type = media_type
+        self.maxsize = maxsize
+        self._heap: List[QueueEntry] = []
+        self._index: Dict[Tuple[Any, str], QueueEntry] = {}
+        self._in_flight: Dict[Tuple[Any, str], QueueEntry] = {}
+        # Requests for in-flight titles, queued again once the worker completes them
+        self._requeue: Dict[Tuple[Any, str], Tuple[Tuple, str]] = {}
+        # Retries scheduled for in-flight items, deferred once the worker completes them
+        self._retry: Dict[Tuple[Any, str], Tuple[Tuple, str, float]] = {}
+        # Items waiting for their not_before time; they do not count towards capacity
+        self._deferred: Dict[Tuple[Any, str], QueueEntry] = {}
+        self._live = 0
+        self._removed = 0
+        self._counter = itertools.count()
+        self._unfinished_tasks = 0
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._wait_samples: Dict[str, Deque[float]] = {name: deque(maxlen=WAIT_SAMPLE_SIZE) for name in PRIORITY_CLASS_DELAYS}
+        self._dequeued_counts: Dict[str, int] = {name: 0 for name in PRIORITY_CLASS_DELAYS}
+        self.duplicates_merged = 0
+        self.on_change: Optional[Callable[[], None]] = None
+        self.journal = None
+        self._waiting_producers = 0
+        self.blocked_enqueues = 0
+        self.rejected_enqueues = 0
+        self.blocked_seconds = 0.0
+
+    def qsize(self) -> int:
+        return self._live
+
+    def empty(self) -> bool:
+        return self._live == 0
+
+    def full(self) -> bool:
+        return self.maxsize > 0 and self._live >= self.maxsize
+
+    def resize(self, maxsize: int):
+        """
+        Change the capacity in place.
+        Shrinking below the current size keeps every queued item; new items wait until the queue
+        drains below the new limit. Growing releases producers blocked on capacity right away.
+
+        Args:
+            maxsize (int): New capacity (0 for unbounded)
+        """
+        self.maxsize = maxsize
+        self._update_events()
+
+    async def wait_for_capacity(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the queue has room for one more item.
+        Producers call this instead of dropping a request when the queue is full.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait; None waits indefinitely
+
+        Returns:
+            bool: True if there is capacity, False if the wait timed out (counted as a rejection)
+        """
+        if not self.full():
+            return True
+
+        self.blocked_enqueues += 1
+        self._waiting_producers += 1
+        started = time.time()
+        try:
+            deadline = started + timeout if timeout is not None else None
+            while self.full():
+                self._not_full.clear()
+                remaining = deadline - time.time() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    self.rejected_enqueues += 1
+                    return False
+                try:
+                    await asyncio.wait_for(self._not_full.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+            return True
+        finally:
+            self._waiting_producers -= 1
+            self.blocked_seconds += time.time() - started
+
+    def get_backpressure_stats(self) -> Dict[str, Any]:
+        """Capacity and producer backpressure counters"""
+        return {
+            "size": self._live,
+            "maxsize": self.maxsize,
+            "waiting_producers": self._waiting_producers,
+            "blocked_enqueues": self.blocked_enqueues,
+            "rejected_enqueues": self.rejected_enqueues,
+            "requeue_after_completion": len(self._requeue),
+            "deferred": len(self._deferred) + len(self._retry),
+            "avg_blocked_seconds": round(self.blocked_seconds / self.blocked_enqueues, 2) if self.blocked_enqueues else None
+        }
+
+    def __contains__(self, key: Tuple[Any, str]) -> bool:
+        """Check whether a (tmdb_id, media_type) key is queued, deferred or being processed by a worker"""
+        return key in self._index or key in self._in_flight or key in self._deferred
+
+    def keys(self) -> List[Tuple[Any, str]]:
+        """(tmdb_id, media_type) keys of all queued media items, including deferred ones"""
+        return list(self._index) + list(self._deferred)
+
+    def in_flight_keys(self) -> List[Tuple[Any, str]]:
+        """(tmdb_id, media_type) keys of items dequeued but not yet completed"""
+        return list(self._in_flight)
+
+    def get_handle(self, key: Tuple[Any, str]) -> Optional[QueueEntry]:
+        """Get the entry for a queued (tmdb_id, media_type) key, or None if it is not queued"""
+        return self._index.get(key)
+
+    def entries(self, include_in_flight: bool = False) -> List[QueueEntry]:
+        """
+        Get the entries of all queued media items, including deferred ones.
+
+        Args:
+            include_in_flight (bool): Also include items dequeued but not yet completed
+        """
+        entries = list(self._index.values()) + list(self._deferred.values())
+        if include_in_flight:
+            entries.extend(entry for key, entry in self._in_flight.items() if key not in self._index)
+        return entries
+
+    def _discard_removed(self):
+        """Pop removed entries off the top of the heap"""
+        while self._heap and self._heap[0].removed:
+            heapq.heappop(self._heap)
+            self._removed -= 1
+
+    def _compact(self):
+        """Rebuild the heap without removed entries once they dominate it"""
+        if self._removed >= COMPACT_MIN_REMOVED and self._removed > self._live:
+            self._heap = [entry for entry in self._heap if not entry.removed]
+            heapq.heapify(self._heap)
+            self._removed = 0
+
+    def _update_events(self):
+        if self._live:
+            self._not_empty.set()
+        else:
+            self._not_empty.clear()
+        if self.full():
+            self._not_full.clear()
+        else:
+            self._not_full.set()
+
+    def head_key(self) -> Optional[float]:
+        """Ordering key of the next item, or None if the queue is empty"""
+        self._discard_removed()
+        return self._heap[0].sort_key if self._heap else None
+
+    def _push(self, sort_key: float, enqueued_at: float, priority: str, item: Tuple, attempts: int = 0) -> QueueEntry:
+        entry = QueueEntry(sort_key, next(self._counter), enqueued_at, priority, item, attempts)
+        heapq.heappush(self._heap, entry)
+        if entry.key is not None:
+            self._index[entry.key] = entry
+        return entry
+
+    def _record(self, event: str, entry: QueueEntry):
+        """Write an event for a media item to the queue journal, if one is attached"""
+        if self.journal is None or entry.key is None:
+            return
+        if event == 'enqueue':
+            self.journal.record_enqueue(entry.key, entry.priority, entry.enqueued_at, entry.item,
+                                        entry.not_before or None)
+        elif event == 'dequeue':
+            self.journal.record_dequeue(entry.key)
+        elif event == 'complete':
+            self.journal.record_complete(entry.key)
+        elif event == 'remove':
+            self.journal.record_remove(entry.key)
+
+    def merge_duplicate(self, item: Tuple, priority: str = PRIORITY_SYNC) -> bool:
+        """
+        Fold a request into the queued item for the same title, if there is one.
+        The queued item takes the latest request data (extra_data, request id) and
+        is promoted if the new request has a more urgent priority class. A request for
+        a title a worker is processing is held and queued once that worker completes it,
+        so the same title is never processed twice at the same time. A deferred retry
+        keeps its not_before time.
+
+        Args:
+            item (tuple): Queue item
+            priority (str): Priority class of the new request
+
+        Returns:
+            bool: True if the request was merged into an existing item
+        """
+        item_key = get_item_key(item)
+        if item_key is None:
+            return False
+        if item_key not in self._index and item_key in self._in_flight:
+            held = self._requeue.get(item_key)
+            if held is not None:
+                item = _merge_items(held[0], item)
+                if priority not in PRIORITY_CLASS_DELAYS or (
+                        held[1] in PRIORITY_CLASS_DELAYS and PRIORITY_CLASS_DELAYS[held[1]] <= PRIORITY_CLASS_DELAYS[priority]):
+                    priority = held[1]
+            self._requeue[item_key] = (item, priority)
+            self.duplicates_merged += 1
+            return True
+        deferred = self._deferred.get(item_key)
+        if deferred is not None:
+            # The retry keeps its backoff; it only takes the latest data and a more urgent class
+            deferred.item = _merge_items(deferred.item, item)
+            if priority in PRIORITY_CLASS_DELAYS and PRIORITY_CLASS_DELAYS[priority] < PRIORITY_CLASS_DELAYS[deferred.priority]:
+                deferred.priority = priority
+                deferred.sort_key = deferred.enqueued_at + PRIORITY_CLASS_DELAYS[priority]
+            self._record('enqueue', deferred)
+            self.duplicates_merged += 1
+            return True
+        entry = self._index.get(item_key)
+        if entry is None:
+            return False
+
+        entry.item = _merge_items(entry.item, item)
+        if priority in PRIORITY_CLASS_DELAYS and PRIORITY_CLASS_DELAYS[priority] < PRIORITY_CLASS_DELAYS[entry.priority]:
+            # Re-insert with the promoted key, keeping the original enqueue time
+            entry.removed = True
+            self._removed += 1
+            entry = self._push(entry.enqueued_at + PRIORITY_CLASS_DELAYS[priority], entry.enqueued_at, priority,
+                               entry.item, entry.attempts)
+        self._record('enqueue', entry)
+        self.duplicates_merged += 1
+        return True
+
+    def put_nowait(self, item: Tuple, priority: str = PRIORITY_SYNC) -> bool:
+        """
+        Add an item without waiting. A request for a title that is already queued
+        is merged into the queued item instead of being added a second time; one for
+        a title that is in flight is queued after its worker completes it.
+
+        Args:
+            item (tuple): Queue item
+            priority (str): Priority class of the item
+
+        Returns:
+            bool: True if a new item was added, False if it was merged into a queued one
+
+        Raises:
+            asyncio.QueueFull: If the queue is at capacity
+        """
+        if self.merge_duplicate(item, priority):
+            return False
+        if self.full():
+            self.rejected_enqueues += 1
+            raise asyncio.QueueFull
+        if priority not in PRIORITY_CLASS_DELAYS:
+            priority = PRIORITY_SYNC
+        enqueued_at = time.time()
+        entry = self._push(enqueued_at + PRIORITY_CLASS_DELAYS[priority], enqueued_at, priority, item)
+        self._record('enqueue', entry)
+        self._live += 1
+        self._unfinished_tasks += 1
+        self._update_events()
+        if self.on_change:
+            self.on_change()
+        return True
+
+    async def put(self, item: Tuple, priority: str = PRIORITY_SYNC, timeout: Optional[float] = None) -> bool:
+        """
+        Add an item, waiting for free capacity if the queue is full.
+
+        Raises:
+            asyncio.QueueFull: If no capacity became available within the timeout
+        """
+        if self.merge_duplicate(item, priority):
+            return False
+        if not await self.wait_for_capacity(timeout):
+            raise asyncio.QueueFull
+        return self.put_nowait(item, priority)
+
+    def get_nowait(self) -> Tuple:
+        """
+        Remove and return the highest-priority item.
+
+        Raises:
+            asyncio.QueueEmpty: If the queue is empty
+        """
+        self._discard_removed()
+        if not self._heap:
+            raise asyncio.QueueEmpty
+        entry = heapq.heappop(self._heap)
+        if entry.key is not None:
+            self._index.pop(entry.key, None)
+            entry.attempts += 1
+            self._in_flight[entry.key] = entry
+            self._record('dequeue', entry)
+        self._live -= 1
+        self._wait_samples[entry.priority].append(time.time() - entry.enqueued_at)
+        self._dequeued_counts[entry.priority] += 1
+        self._update_events()
+        return entry.item
+
+    async def get(self) -> Tuple:
+        """Remove and return the highest-priority item, waiting if the queue is empty"""
+        while not self._live:
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def remove(self, key: Tuple[Any, str]) -> bool:
+        """
+        Remove a queued item by its (tmdb_id, media_type) key in constant time.
+        The entry is marked as removed and skipped when it reaches the top of the heap,
+        so the order of the remaining items is unchanged.
+
+        Args:
+            key (tuple): (tmdb_id, media_type)
+
+        Returns:
+            bool: True if the item was queued and has been removed
+        """
+        requeued = self._requeue.pop(key, None)
+        retry = self._retry.pop(key, None)
+        deferred = self._deferred.pop(key, None)
+        if deferred is not None:
+            self._record('remove', deferred)
+            if self.on_change:
+                self.on_change()
+            return True
+        entry = self._index.pop(key, None)
+        if entry is None:
+            return requeued is not None or retry is not None
+        entry.removed = True
+        self._removed += 1
+        self._live -= 1
+        self._record('remove', entry)
+        self.task_done()
+        self._compact()
+        self._update_events()
+        if self.on_change:
+            self.on_change()
+        return True
+
+    def remove_keys(self, keys) -> int:
+        """
+        Remove several queued items by key.
+
+        Args:
+            keys (iterable): (tmdb_id, media_type) keys
+
+        Returns:
+            int: Number of items removed
+        """
+        return sum(1 for key in keys if self.remove(key))
+
+    def restore(self, item: Tuple, priority: str, enqueued_at: float, attempts: int = 0,
+                not_before: Optional[float] = None) -> bool:
+        """
+        Put back an item recovered from the queue journal with its original enqueue time.
+
+        Args:
+            item (tuple): Queue item
+            priority (str): Priority class the item was queued with
+            enqueued_at (float): Original enqueue timestamp
+            attempts (int): Number of times the item was already handed to a worker
+            not_before (float, optional): Time a deferred retry becomes due
+
+        Returns:
+            bool: True if the item was restored
+        """
+        if get_item_key(item) in self:
+            return False
+        if priority not in PRIORITY_CLASS_DELAYS:
+            priority = PRIORITY_SYNC
+        if not_before and not_before > time.time():
+            self._defer(item, priority, not_before, attempts, record=False)
+            return True
+        if self.full():
+            return False
+        self._push(enqueued_at + PRIORITY_CLASS_DELAYS[priority], enqueued_at, priority, item, attempts)
+        self._live += 1
+        self._unfinished_tasks += 1
+        self._update_events()
+        if self.on_change:
+            self.on_change()
+        return True
+
+    def complete(self, item: Tuple):
+        """
+        Mark a dequeued item as finished by its worker.
+        A request that arrived for the title while it was in flight is queued now;
+        otherwise a retry scheduled with defer() is deferred until its not_before time.
+
+        Args:
+            item (tuple): The item returned by get_nowait()
+        """
+        item_key = get_item_key(item)
+        entry = self._in_flight.pop(item_key, None) if item_key is not None else None
+        if entry is None:
+            return
+        self._record('complete', entry)
+
+        retry = self._retry.pop(item_key, None)
+        held = self._requeue.pop(item_key, None)
+        if held is None and retry is not None:
+            retry_item, priority, not_before = retry
+            self._defer(_merge_items(entry.item, retry_item), priority, not_before)
+        if held is not None:
+            # Accepted while in flight, so it is queued even if the queue has filled up since
+            requeued_item, priority = held
+            if priority not in PRIORITY_CLASS_DELAYS:
+                priority = PRIORITY_SYNC
+            enqueued_at = time.time()
+            requeued = self._push(enqueued_at + PRIORITY_CLASS_DELAYS[priority], enqueued_at, priority,
+                                  _merge_items(entry.item, requeued_item))
+            self._record('enqueue', requeued)
+            self._live += 1
+            self._unfinished_tasks += 1
+            self._update_events()
+            if self.on_change:
+                self.on_change()
+
+    def defer(self, item: Tuple, not_before: float, priority: str = PRIORITY_RECONCILE) -> bool:
+        """
+        Queue an item again once not_before has passed.
+        The deferred item is journaled, so a retry survives a restart. For an item a worker
+        is processing, the retry is scheduled when the worker completes it.
+
+        Args:
+            item (tuple): Queue item
+            not_before (float): Timestamp before which the item is not handed to a worker
+            priority (str): Priority class the item is queued with once it is due
+
+        Returns:
+            bool: True if the retry was scheduled, False if the title is already queued
+        """
+        item_key = get_item_key(item)
+        if item_key is None or item_key in self._index or item_key in self._deferred:
+            return False
+        if priority not in PRIORITY_CLASS_DELAYS:
+            priority = PRIORITY_SYNC
+        if item_key in self._in_flight:
+            self._retry[item_key] = (item, priority, not_before)
+        else:
+            self._defer(item, priority, not_before)
+        return True
+
+    def _defer(self, item: Tuple, priority: str, not_before: float, attempts: int = 0, record: bool = True):
+        # Ages from its due time, like an item enqueued at that moment
+        entry = QueueEntry(not_before + PRIORITY_CLASS_DELAYS[priority], next(self._counter), not_before,
+                           priority, item, attempts)
+        entry.not_before = not_before
+        self._deferred[entry.key] = entry
+        if record:
+            self._record('enqueue', entry)
+        if self.on_change:
+            self.on_change()
+
+    def has_pending_retry(self, key: Tuple[Any, str]) -> bool:
+        """Check whether a retry is scheduled or deferred for a (tmdb_id, media_type) key"""
+        return key in self._retry or key in self._deferred
+
+    def next_due(self) -> Optional[float]:
+        """Earliest not_before time of the deferred items, or None if there are none"""
+        return min((entry.not_before for entry in self._deferred.values()), default=None)
+
+    def release_due(self, now: Optional[float] = None) -> int:
+        """
+        Move deferred items whose not_before time has passed into the queue.
+        Like held requests, they were accepted earlier and are queued even if the queue is full.
+
+        Returns:
+            int: Number of items released
+        """
+        if not self._deferred:
+            return 0
+        now = time.time() if now is None else now
+        due = [entry for entry in self._deferred.values() if entry.not_before <= now]
+        for entry in due:
+            del self._deferred[entry.key]
+            heapq.heappush(self._heap, entry)
+            self._index[entry.key] = entry
+            self._live += 1
+            self._unfinished_tasks += 1
+        if due:
+            self._update_events()
+            if self.on_change:
+                self.on_change()
+        return len(due)
+
+    def task_done(self):
+        if self._unfinished_tasks > 0:
+            self._unfinished_tasks -= 1
+
+    def get_wait_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Wait-time statistics per priority class, in seconds"""
+        now = time.time()
+        stats = {}
+        for priority in PRIORITY_CLASS_DELAYS:
+            samples = sorted(self._wait_samples[priority])
+            waiting = [entry.enqueued_at for entry in self._heap if entry.priority == priority and not entry.removed]
+            stats[priority] = {
+                "queued": len(waiting),
+                "dequeued": self._dequeued_counts[priority],
+                "avg_wait_seconds": round(sum(samples) / len(samples), 1) if samples else None,
+                "p95_wait_seconds": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 1) if samples else None,
+                "oldest_waiting_seconds": round(now - min(waiting), 1) if waiting else None
+            }
+        return stats
+
+
+class RequestScheduler:
+    """
+    Chooses the next request across the movie and TV queues.
+    The item with the lowest aged priority key wins, unless its media type has already
+    used its quota of the recent dispatches while the other type has work waiting.
+    """
+
+    def __init__(self):
+        self.queues: Dict[str, MediaRequestQueue] = {}
+        self._recent_dispatches: Deque[str] = deque(maxlen=QUOTA_WINDOW)
+        self._wakeup = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def register(self, queue: MediaRequestQueue):
+        """Register (or replace) the queue for a media type"""
+        queue.on_change = self.notify
+        self.queues[queue.media_type] = queue
+        self.notify()
+
+    def has_work(self) -> bool:
+        """Check whether any registered queue has items"""
+        return any(not queue.empty() for queue in self.queues.values())
+
+    def release_due(self) -> int:
+        """Queue the deferred items of every registered queue that have become due"""
+        return sum(queue.release_due() for queue in self.queues.values())
+
+    def next_due(self) -> Optional[float]:
+        """Earliest time a deferred item becomes due, or None if nothing is deferred"""
+        return min((due for due in (queue.next_due() for queue in self.queues.values()) if due is not None), default=None)
+
+    def notify(self):
+        """
+        Wake the queue consumer.
+        Called on enqueue, cancellation and configuration changes; safe to call from worker threads.
+        """
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if self._loop is not None and running_loop is not self._loop:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        else:
+            self._wakeup.set()
+
+    async def wait_for_work(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until an item is queued, a deferred item becomes due or notify() is called.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait; None waits indefinitely
+
+        Returns:
+            bool: True if there are items to process
+        """
+        self._loop = asyncio.get_running_loop()
+        self._wakeup.clear()
+        self.release_due()
+        if self.has_work():
+            return True
+        next_due = self.next_due()
+        if next_due is not None:
+            until_due = max(0.0, next_due - time.time())
+            timeout = until_due if timeout is None else min(timeout, until_due)
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self.release_due()
+        return self.has_work()
+
+    def get_quotas(self) -> Dict[str, float]:
+        """Share of recent dispatches each media type may take while the other type is waiting"""
+        try:
+            movie_share = float(task_config.get_config('movie_queue_share', 0.5))
+        except (TypeError, ValueError):
+            movie_share = 0.5
+        movie_share = min(max(movie_share, 0.1), 0.9)
+        return {'movie': movie_share, 'tv': 1.0 - movie_share}
+
+    def _over_quota(self, media_type: str, quotas: Dict[str, float]) -> bool:
+        if not self._recent_dispatches:
+            return False
+        used = sum(1 for dispatched in self._recent_dispatches if dispatched == media_type)
+        return used / QUOTA_WINDOW >= quotas.get(media_type, 0.5)
+
+    def get_nowait(self) -> Tuple[Optional[str], Optional[Tuple]]:
+        """
+        Take the next item to process.
+
+        Returns:
+            tuple: (media_type, queue_item), or (None, None) if all queues are empty
+        """
+        self.release_due()
+        candidates = [(queue.head_key(), media_type) for media_type, queue in self.queues.items() if not queue.empty()]
+        if not candidates:
+            return None, None
+
+        candidates.sort()
+        media_type = candidates[0][1]
+        if len(candidates) > 1 and self._over_quota(media_type, self.get_quotas()):
+            media_type = candidates[1][1]
+
+        self._recent_dispatches.append(media_type)
+        return media_type, self.queues[media_type].get_nowait()
+
+    def get_wait_stats(self) -> Dict[str, Any]:
+        """Wait-time statistics per media type and priority class"""
+        return {
+            "quotas": self.get_quotas(),
+            "recent_dispatches": list(self._recent_dispatches),
+            "duplicates_merged": {media_type: queue.duplicates_merged for media_type, queue in self.queues.items()},
+            "backpressure": {media_type: queue.get_backpressure_stats() for media_type, queue in self.queues.items()},
+            "classes": {media_type: queue.get_wait_stats() for media_type, queue in self.queues.items()}
+        }
+
+
+# Global instance
+request_scheduler = RequestScheduler()
@@ -0,0 +1,178 @@
+"""
+Result ranker module for SeerrBridge
+Ranks every DMM result on a page so the best torrent is clicked first, instead of the
+first one that happens to pass the title checks
+"""
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from seerr.title_matcher import TitleMatch, score_titles
+from seerr.utils import match_single_season, parse_release_name
+
+# Points each criterion adds to a candidate that matched the requested title
+SEASON_COVERAGE_WEIGHT = 40  # scaled by the share of requested seasons the torrent covers
+COMPLETENESS_WEIGHT = 20     # complete packs, which need one RD action instead of one per episode
+RESOLUTION_WEIGHT = 20       # half scaled by height, half for resolutions the filter asks for
+SIZE_WEIGHT = 10             # torrents within the configured size limit
+SIZE_OVER_LIMIT_PENALTY = 30
+SINGLE_EPISODE_PENALTY = 20  # episode torrents when a season pack is wanted
+
+RESOLUTION_HEIGHT_PATTERN = re.compile(r'(\d{3,4})p', re.IGNORECASE)
+MAX_RESOLUTION_HEIGHT = 2160
+
+# Resolution tags parse_release_name returns without a height
+RESOLUTION_ALIASES = {'uhd': 2160, '4k': 2160}
+
+
+class RankedResult(NamedTuple):
+    """A result card with its match and ranking score"""
+    index: int
+    title: str
+    match: TitleMatch
+    covered_seasons: Tuple[str, ...]
+    score: float
+
+
+def get_preferred_resolutions() -> Tuple[str, ...]:
+    """
+    Resolutions the configured TORRENT_FILTER_REGEX asks for, following it across config reloads.
+    A filter that names no resolution prefers none, so every height is scored in full.
+
+    Returns:
+        tuple: Lowercase resolutions such as ('1080p', '2160p')
+    """
+    import seerr.config
+
+    return _preferred_resolutions(seerr.config.TORRENT_FILTER_REGEX or '')
+
+
+@lru_cache(maxsize=8)
+def _preferred_resolutions(torrent_filter_regex: str) -> Tuple[str, ...]:
+    """Preferred resolutions for one TORRENT_FILTER_REGEX value"""
+    resolutions = {f"{height}p" for height in RESOLUTION_HEIGHT_PATTERN.findall(torrent_filter_regex)}
+    return tuple(sorted(resolutions, key=lambda r: int(r[:-1])))
+
+
+def _size_limit_gb(is_tv_show: bool, episode_count: Optional[int]) -> Optional[float]:
+    """The size limit a torrent is compared with, or None when there is no limit"""
+    import seerr.config
+
+    if not is_tv_show:
+        limit = seerr.config.MAX_MOVIE_SIZE
+    elif episode_count:
+        limit = seerr.config.MAX_EPISODE_SIZE * episode_count if seerr.config.MAX_EPISODE_SIZE else None
+    else:
+        limit = None
+    # 0 means "biggest available" on DMM's settings page
+    return float(limit) if limit else None
+
+
+def _resolution_height(resolution: Optional[str]) -> Optional[int]:
+    """Height of a parsed resolution such as '1080p', 'uhd' or '4k', or None if it has none"""
+    if not resolution:
+        return None
+    resolution = resolution.lower()
+    if resolution in RESOLUTION_ALIASES:
+        return RESOLUTION_ALIASES[resolution]
+    match = RESOLUTION_HEIGHT_PATTERN.fullmatch(resolution)
+    return int(match.group(1)) if match else None
+
+
+def _resolution_score(resolution: Optional[str], preferred: Sequence[str]) -> float:
+    height = _resolution_height(resolution)
+    if not height:
+        return 0.0
+    # Half the weight scales with height; the other half goes to the resolutions the filter
+    # asks for, so any preferred resolution outranks a higher one the filter does not name
+    score = RESOLUTION_WEIGHT / 2 * min(height, MAX_RESOLUTION_HEIGHT) / MAX_RESOLUTION_HEIGHT
+    return score + RESOLUTION_WEIGHT / 2 if not preferred or f"{height}p" in preferred else score
+
+
+def rank_results(cards: Sequence[Dict[str, Any]], movie_title: str, normalized_seasons: List[str],
+                 is_tv_show: bool, episode_id: str = None, complete_season_pack_only: bool = False,
+                 episode_count: Optional[int] = None) -> List[RankedResult]:
+    """
+    Rank the result cards of a page, best first.
+
+    Only cards whose title matches the requested media are ranked. Among those, the score
+    adds season coverage, completeness, resolution and size against MAX_MOVIE_SIZE /
+    MAX_EPISODE_SIZE to the title match score.
+
+    Args:
+        cards (list): Result cards from snapshot_result_cards
+        movie_title (str): Expected title
+        normalized_seasons (list): Requested seasons in normalized format
+        is_tv_show (bool): Whether we're ranking TV show results
+        episode_id (str, optional): Episode ID for TV shows
+        complete_season_pack_only (bool): Reject individual episodes
+        episode_count (int, optional): Episodes the torrent should contain, for the size limit
+
+    Returns:
+        list: RankedResult for every matching card, best first (page order on ties)
+    """
+    titles = [card.get('title') or '' for card in cards]
+    matches = score_titles(titles, movie_title, normalized_seasons, is_tv_show,
+                           episode_id=episode_id, complete_season_pack_only=complete_season_pack_only)
+    preferred = get_preferred_resolutions()
+    size_limit = _size_limit_gb(is_tv_show, episode_count)
+
+    ranked = []
+    for card, match in zip(cards, matches):
+        if not match.matched:
+            continue
+        info = parse_release_name(match.title)
+        badges = card.get('badges') or []
+        score = match.score
+
+        covered: Tuple[str, ...] = ()
+        if is_tv_show and normalized_seasons:
+            covered = tuple(s for s in normalized_seasons if match_single_season(match.title, s))
+            score += SEASON_COVERAGE_WEIGHT * len(covered) / len(normalized_seasons)
+
+        is_single_episode = bool(info.episodes) or any('Single' in badge for badge in badges)
+        is_season_pack = is_tv_show and bool(info.seasons) and not is_single_episode
+        if info.is_complete or is_season_pack or any(badge.startswith('Complete') for badge in badges):
+            score += COMPLETENESS_WEIGHT
+        if is_tv_show and not episode_id and is_single_episode:
+            score -= SINGLE_EPISODE_PENALTY
+
+        score += _resolution_score(info.resolution, preferred)
+
+        size_gb = card.get('size_gb')
+        if size_limit and size_gb:
+            score += SIZE_WEIGHT if size_gb <= size_limit else -SIZE_OVER_LIMIT_PENALTY
+
+        ranked.append(RankedResult(index=card.get('index', match.index + 1), title=match.title,
+                                   match=match, covered_seasons=covered, score=score))
+
+    ranked.sort(key=lambda result: result.score, reverse=True)
+    return ranked
+
+
+def order_result_indexes(cards: Sequence[Dict[str, Any]], movie_title: str, normalized_seasons: List[str],
+                         is_tv_show: bool, **kwargs) -> List[int]:
+    """
+    Order in which the result boxes of a page should be tried: ranked matches first,
+    then the remaining boxes in page order (their own checks still decide whether to skip them).
+
+    Args:
+        cards (list): Result cards from snapshot_result_cards
+        movie_title (str): Expected title
+        normalized_seasons (list): Requested seasons in normalized format
+        is_tv_show (bool): Whether we're ranking TV show results
+        **kwargs: Passed on to rank_results
+
+    Returns:
+        list: 1-based box indexes
+    """
+    ranked = rank_results(cards, movie_title, normalized_seasons, is_tv_show, **kwargs)
+    if ranked:
+        best = ranked[0]
+        logger.info(f"Ranked {len(ranked)} of {len(cards)} result(s) for '{movie_title}'; best is box {best.index} "
+                    f"'{best.title}' (score {best.score:.0f}, seasons {list(best.covered_seasons) or '-'})")
+    ranked_indexes = [result.index for result in ranked]
+    ranked_set = set(ranked_indexes)
+    return ranked_indexes + [card['index'] for card in cards if card['index'] not in ranked_set]
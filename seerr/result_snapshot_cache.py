@@ -0,0 +1,270 @@
+"""
+Result snapshot cache module for SeerrBridge
+Keeps the parsed result cards of a show's season page in memory for the session, so the
+episodes of a season are matched against one page load instead of one filtered search each
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+from loguru import logger
+
+# A snapshot is trusted for this long; RD states change as torrents are added elsewhere
+SNAPSHOT_TTL_SECONDS = 600
+
+MAX_SNAPSHOTS = 64
+
+
+class ResultSnapshot(NamedTuple):
+    """The result cards of one season page under one filter"""
+    cards: List[Dict[str, Any]]
+    # No 'Show More Results' button was left, so every result of the filter is in cards
+    complete: bool
+    taken_at: float
+    # Season page the cards were read from, so an RD action on that page can drop the snapshot
+    page_url: str = ''
+
+
+def _page_url(driver) -> str:
+    """The page open in a browser, without query string or fragment (the filter box may add them)"""
+    try:
+        url = driver.current_url or ''
+    except Exception:
+        return ''
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}".rstrip('/') if parts.netloc else ''
+
+
+class ResultSnapshotCache:
+    """
+    Per-session cache of result card snapshots, keyed by show, season and filter.
+
+    The per-episode searches used to type "<filter> S08E01" into the DMM filter box, expand
+    the results and scrape the page for every episode. The season page already lists those
+    torrents, so it is expanded and read once; an episode with a matching RD (100%) torrent
+    is confirmed from memory, and one that no result mentions is known to have nothing to
+    click. Only episodes that need an Instant RD click still go through the page.
+
+    Every Instant RD / DL with RD click drops the snapshots of the page it was made on
+    (invalidate_page), and an episode is only reported absent from a snapshot read during
+    the current search (find_episode_on_page), so a stale snapshot never gets an episode
+    marked failed.
+    """
+
+    def __init__(self, ttl_seconds: float = SNAPSHOT_TTL_SECONDS, max_entries: int = MAX_SNAPSHOTS):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._snapshots: "OrderedDict[Tuple[str, int, str], ResultSnapshot]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Counters reported by get_stats()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.page_loads = 0
+        self.episodes_from_memory = 0
+
+    @staticmethod
+    def _key(show: str, season: int, filter_text: str) -> Tuple[str, int, str]:
+        return (show.strip().lower(), int(season), (filter_text or '').strip())
+
+    def get(self, show: str, season: int, filter_text: str = '') -> Optional[ResultSnapshot]:
+        """
+        Cached snapshot of a season page, or None when there is none or it went stale.
+
+        Args:
+            show (str): Show title or IMDb ID
+            season (int): Season number
+            filter_text (str): Text that was in the DMM filter box
+
+        Returns:
+            ResultSnapshot: The snapshot, or None
+        """
+        key = self._key(show, season, filter_text)
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None and time.time() - snapshot.taken_at > self.ttl_seconds:
+                del self._snapshots[key]
+                self.stale += 1
+                snapshot = None
+            if snapshot is None:
+                self.misses += 1
+                return None
+            self._snapshots.move_to_end(key)
+            self.hits += 1
+            return snapshot
+
+    def put(self, show: str, season: int, filter_text: str, cards: List[Dict[str, Any]],
+            complete: bool, page_url: str = '') -> ResultSnapshot:
+        """Store the snapshot of a season page, evicting the least recently used one when full"""
+        snapshot = ResultSnapshot(cards=list(cards), complete=complete, taken_at=time.time(), page_url=page_url)
+        key = self._key(show, season, filter_text)
+        with self._lock:
+            self._snapshots[key] = snapshot
+            self._snapshots.move_to_end(key)
+            while len(self._snapshots) > self.max_entries:
+                self._snapshots.popitem(last=False)
+        return snapshot
+
+    def invalidate(self, show: str, season: Optional[int] = None):
+        """Drop the snapshots of a show, or of one of its seasons"""
+        show_key = show.strip().lower()
+        with self._lock:
+            for key in [key for key in self._snapshots
+                        if key[0] == show_key and (season is None or key[1] == int(season))]:
+                del self._snapshots[key]
+
+    def invalidate_page(self, driver):
+        """
+        Drop the snapshots of the page open in a browser, after an RD action changed it.
+        When the page cannot be told, every snapshot is dropped.
+
+        Args:
+            driver: Selenium WebDriver (or a result box, whose parent is the driver)
+        """
+        page_url = _page_url(getattr(driver, 'parent', driver))
+        with self._lock:
+            for key in [key for key, snapshot in self._snapshots.items()
+                        if not page_url or not snapshot.page_url or snapshot.page_url == page_url]:
+                del self._snapshots[key]
+
+    def load(self, driver, show: str, season: int, filter_text: str = '') -> Optional[ResultSnapshot]:
+        """
+        Snapshot of the season page currently open in the browser, from memory when fresh.
+
+        On a miss the filter box is set to filter_text, every 'Show More Results' page is
+        expanded and the cards are read with one script call.
+
+        Args:
+            driver: Selenium WebDriver instance, on the show's season page
+            show (str): Show title or IMDb ID
+            season (int): Season number
+            filter_text (str): Base filter, e.g. TORRENT_FILTER_REGEX
+
+        Returns:
+            ResultSnapshot: The snapshot, or None if the page could not be read
+        """
+        snapshot = self.get(show, season, filter_text)
+        if snapshot is not None:
+            logger.info(f"Using cached results for {show} Season {season} "
+                        f"({len(snapshot.cards)} card(s), {time.time() - snapshot.taken_at:.0f}s old)")
+            return snapshot
+
+        from selenium.webdriver.common.by import By
+        from seerr.background_tasks import type_slowly
+        from seerr.adaptive_wait import adaptive_waits, filter_applied
+        from seerr.browser import (RESULT_CARD_XPATH, SHOW_MORE_RESULTS_XPATH, click_show_more_results,
+                                   snapshot_result_cards)
+
+        try:
+            filter_inputs = driver.find_elements(By.ID, "query")
+            if filter_inputs:
+                type_slowly(driver, filter_inputs[0], filter_text or '')
+                adaptive_waits.wait(driver, "filter_applied",
+                                    filter_applied(filter_inputs[0], filter_text or '', RESULT_CARD_XPATH), 1)
+            click_show_more_results(driver, logger)
+            cards = snapshot_result_cards(driver)
+            complete = not driver.find_elements(By.XPATH, SHOW_MORE_RESULTS_XPATH)
+        except Exception as e:
+            logger.warning(f"Could not snapshot results for {show} Season {season}: {e}")
+            return None
+
+        self.page_loads += 1
+        logger.info(f"Cached {len(cards)} result card(s) for {show} Season {season}"
+                    f"{'' if complete else ' (more results not expanded)'}")
+        return self.put(show, season, filter_text, cards, complete, _page_url(driver))
+
+    def find_episode(self, snapshot: ResultSnapshot, movie_title: str, season: int, episode_id: str,
+                     confirmed_seasons: set, processed_torrents: set = None) -> Tuple[bool, bool]:
+        """
+        Answer an episode search from a snapshot.
+
+        Args:
+            snapshot (ResultSnapshot): Snapshot from load()
+            movie_title (str): Title of the show
+            season (int): Season number
+            episode_id (str): Full episode ID (e.g. "S08E01")
+            confirmed_seasons (set): Confirmed seasons, updated like check_red_buttons does
+            processed_torrents (set, optional): Torrent titles already used, updated on a match
+
+        Returns:
+            Tuple[bool, bool]: (an RD (100%) torrent matches the episode,
+                the snapshot is complete and no result mentions the episode at all)
+        """
+        from seerr.browser import check_red_buttons
+
+        episode_lower = episode_id.lower()
+        mentioned = [card for card in snapshot.cards if episode_lower in (card.get('title') or '').lower()]
+        if not mentioned:
+            absent = snapshot.complete
+            if absent:
+                self.episodes_from_memory += 1
+                logger.info(f"No result mentions {episode_id} in the cached Season {season} results.")
+            return False, absent
+
+        cached, _ = check_red_buttons(
+            None, movie_title, [f"Season {season}"], confirmed_seasons, True,
+            episode_id=episode_id, processed_torrents=processed_torrents, cards=mentioned
+        )
+        if cached:
+            self.episodes_from_memory += 1
+        return cached, False
+
+    def find_episode_on_page(self, driver, snapshot: ResultSnapshot, movie_title: str, season: int,
+                             episode_id: str, confirmed_seasons: set, processed_torrents: set = None,
+                             filter_text: str = '', fresh_since: float = 0.0
+                             ) -> Tuple[Optional[ResultSnapshot], bool, bool]:
+        """
+        find_episode, re-reading the page before trusting that an episode is absent.
+
+        A snapshot taken before fresh_since (cached by an earlier search) may miss torrents
+        added since, so when it has no result for the episode it is dropped and the page is
+        read again.
+
+        Args:
+            driver: Selenium WebDriver instance, on the show's season page
+            snapshot (ResultSnapshot): Snapshot from load()
+            movie_title (str): Title of the show (the key snapshot was loaded under)
+            season (int): Season number
+            episode_id (str): Full episode ID (e.g. "S08E01")
+            confirmed_seasons (set): Confirmed seasons, updated like check_red_buttons does
+            processed_torrents (set, optional): Torrent titles already used, updated on a match
+            filter_text (str): Base filter the snapshot was loaded with
+            fresh_since (float): Epoch seconds the current search started
+
+        Returns:
+            Tuple[Optional[ResultSnapshot], bool, bool]: (snapshot to use for the next episodes,
+                an RD (100%) torrent matches, no result mentions the episode)
+        """
+        cached, absent = self.find_episode(snapshot, movie_title, season, episode_id,
+                                           confirmed_seasons, processed_torrents)
+        if absent and snapshot.taken_at < fresh_since:
+            logger.info(f"Cached Season {season} results predate this search; re-reading the page for {episode_id}.")
+            self.invalidate(movie_title, season)
+            snapshot = self.load(driver, movie_title, season, filter_text)
+            if snapshot is None:
+                return None, False, False
+            cached, absent = self.find_episode(snapshot, movie_title, season, episode_id,
+                                               confirmed_seasons, processed_torrents)
+        return snapshot, cached, absent
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache counters for status endpoints"""
+        with self._lock:
+            entries = len(self._snapshots)
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+            "page_loads": self.page_loads,
+            "episodes_from_memory": self.episodes_from_memory
+        }
+
+
+# Global instance
+result_snapshot_cache = ResultSnapshotCache()
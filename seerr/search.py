@@ -19,7 +19,7 @@ from seerr.config import TORRENT_FILTER_REGEX, USE_DATABASE
 from seerr.database import get_db, LogEntry
 from seerr.db_logger import log_info, log_success, log_error
 from datetime import datetime
-from seerr.browser import driver, click_show_more_results, check_red_buttons, prioritize_buttons_in_box
+from seerr.browser import driver, click_show_more_results, check_red_buttons, prioritize_buttons_in_box, RESULT_CARD_XPATH
 from seerr.utils import (
     clean_title,
     normalize_title,
@@ -34,6 +34,19 @@ from seerr.utils import (
     match_single_season
 )
 from seerr.background_tasks import search_individual_episodes
+from seerr.adaptive_wait import (
+    adaptive_waits,
+    element_absent,
+    element_present,
+    filter_applied,
+    input_has_value,
+    results_settled,
+    LOADING_INDICATOR_XPATH
+)
+
+# Rows of the file list in the modal a "Complete" badge opens
+COMPLETE_MODAL_FILE_ROW_XPATH = "//div[contains(@class, 'max-h-[90vh]')]//tr[@class='bg-gray-800 font-bold hover:bg-gray-700 rounded']"
+MODAL_OVERLAY_XPATH = "//div[contains(@class, 'fixed inset-0') and contains(@class, 'bg-black')]"
 
 def search_dmm_by_title_and_extract_id(driver, title, media_type, year=None, tmdb_id=None):
     """
@@ -78,25 +91,14 @@ def search_dmm_by_title_and_extract_id(driver, title, media_type, year=None, tmd
             logger.info(f"Navigating to search URL: {search_url}")
             driver.get(search_url)
             
-            # Wait a bit for page to load and JavaScript to execute
-            time.sleep(3)
-            
-            # Wait for results to load - try multiple selectors with retries
-            max_retries = 3
-            results_found = False
-            for attempt in range(max_retries):
-                try:
-                    result_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/show/'], a[href*='/movie/'], a.haptic")
-                    if len(result_links) > 0:
-                        results_found = True
-                        logger.info(f"Found {len(result_links)} result links on attempt {attempt + 1}")
-                        break
-                    else:
-                        logger.debug(f"No results found on attempt {attempt + 1}, waiting...")
-                        time.sleep(2)
-                except Exception as e:
-                    logger.debug(f"Error finding results on attempt {attempt + 1}: {e}")
-                    time.sleep(2)
+            # Wait for the result links to render (was a fixed 3 seconds plus up to three 2 second retries)
+            results_found = adaptive_waits.wait(
+                driver, "title_search_results",
+                lambda d: d.find_elements(By.CSS_SELECTOR, "a[href*='/show/'], a[href*='/movie/'], a.haptic"), 9
+            )
+            if results_found:
+                result_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/show/'], a[href*='/movie/'], a.haptic")
+                logger.info(f"Found {len(result_links)} result links")
             
             if not results_found:
                 logger.warning(f"Timeout waiting for search results for '{title}'. Trying alternative approach...")
@@ -120,7 +122,7 @@ def search_dmm_by_title_and_extract_id(driver, title, media_type, year=None, tmd
                 )
                 search_input.clear()
                 search_input.send_keys(title)
-                time.sleep(1)  # Wait a bit before sending return
+                adaptive_waits.wait(driver, "search_input", input_has_value(search_input, title), 1)
                 search_input.send_keys(Keys.RETURN)
                 
                 # Wait for results to load
@@ -345,6 +347,62 @@ def update_database_with_confirmed_episodes(movie_title, season_num, confirmed_e
         logger.error(f"Error updating database with confirmed episodes: {e}")
 
 
+def get_expected_episode_count(movie_title, season_num):
+    """
+    Get the number of episodes stored for a season, used to verify complete packs.
+    
+    Args:
+        movie_title: Title of the show
+        season_num: Season number
+    
+    Returns:
+        int: Episode count, or None if unknown
+    """
+    from seerr.database import get_db, UnifiedMedia
+    expected_episode_count = None
+    try:
+        db = get_db()
+        media = db.query(UnifiedMedia).filter(
+            UnifiedMedia.title == movie_title,
+            UnifiedMedia.type == 'tv'
+        ).first()
+        
+        if media and media.seasons:
+            season_data = next((s for s in media.seasons if s.get('season_number') == season_num), None)
+            if season_data:
+                episodes = season_data.get('episodes', [])
+                expected_episode_count = len(episodes) if episodes else None
+                logger.info(f"Expected episode count for Season {season_num}: {expected_episode_count}")
+    except:
+        pass
+    return expected_episode_count
+
+
+def rank_season_pack_boxes(driver, result_boxes, movie_title, season_num, expected_episode_count=None):
+    """
+    Order in which season pack result boxes are tried: best-ranked first (season coverage,
+    completeness, resolution, size), page order if the page could not be snapshotted.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        result_boxes: Result box elements, in page order
+        movie_title: Title of the show
+        season_num: Season number
+        expected_episode_count: Episodes in the season, for the size limit
+    
+    Returns:
+        list: 1-based box indexes
+    """
+    from seerr.browser import snapshot_result_cards
+    from seerr.result_ranker import order_result_indexes
+    
+    result_cards = snapshot_result_cards(driver)
+    if len(result_cards) != len(result_boxes):
+        return list(range(1, len(result_boxes) + 1))
+    return order_result_indexes(result_cards, movie_title, [f"Season {season_num}"], True,
+                                complete_season_pack_only=True, episode_count=expected_episode_count)
+
+
 def try_complete_season_pack(driver, movie_title, season_num, normalized_seasons):
     """
     Try to find a Complete season pack by clicking the Complete button.
@@ -381,24 +439,26 @@ def try_complete_season_pack(driver, movie_title, season_num, normalized_seasons
         except NoSuchElementException:
             logger.info(f"'Show more results' button not found for Season {season_num}, proceeding without it")
         
-        # Wait 10 seconds for results to load
-        logger.info(f"Waiting 10 seconds for Complete results to load for Season {season_num}")
-        time.sleep(10)
+        # Wait for the Complete results to load (was a fixed 10 seconds)
+        logger.info(f"Waiting for Complete results to load for Season {season_num}")
+        adaptive_waits.wait(driver, "pack_results", results_settled(RESULT_CARD_XPATH), 10)
         
         # Try to click "Show more results" again after initial load
         try:
             show_more_button = driver.find_element(By.XPATH, "//button[contains(text(), 'Show more results')]")
             logger.info(f"Found 'Show more results' button again for Season {season_num}, clicking it")
+            cards_before = len(driver.find_elements(By.XPATH, RESULT_CARD_XPATH))
             show_more_button.click()
-            logger.info(f"Waiting 3 seconds after clicking 'Show more results' for Season {season_num}")
-            time.sleep(3)
+            logger.info(f"Waiting for more results after clicking 'Show more results' for Season {season_num}")
+            adaptive_waits.wait(driver, "show_more_results",
+                                results_settled(RESULT_CARD_XPATH, min_count=cards_before + 1), 3)
         except NoSuchElementException:
             logger.info(f"'Show more results' button not available for Season {season_num}, proceeding with available results")
         
         # Check if page is still loading and wait longer if needed
         if not check_page_loading_state(driver, season_num, "Complete"):
-            logger.info(f"Page still loading after 10 seconds, waiting additional 5 seconds for Season {season_num}")
-            time.sleep(5)
+            logger.info(f"Page still loading, waiting up to 5 more seconds for Season {season_num}")
+            adaptive_waits.wait(driver, "pack_results_slow", element_absent(LOADING_INDICATOR_XPATH), 5)
             check_page_loading_state(driver, season_num, "Complete")
         
         # Log page state after waiting
@@ -437,9 +497,11 @@ def try_complete_season_pack(driver, movie_title, season_num, normalized_seasons
                 EC.presence_of_all_elements_located((By.XPATH, "//div[contains(@class, 'border-2')]"))
             )
             logger.info(f"Found {len(result_boxes)} result boxes to process (will stop on first success)")
+            expected_episode_count = get_expected_episode_count(movie_title, season_num)
             
-            # Process each result box ONE BY ONE until success
-            for i, result_box in enumerate(result_boxes, 1):
+            # Process each result box ONE BY ONE until success, best-ranked pack first
+            for i in rank_season_pack_boxes(driver, result_boxes, movie_title, season_num, expected_episode_count):
+                result_box = result_boxes[i-1]
                 try:
                     # Extract title from result box
                     title_element = result_box.find_element(By.XPATH, ".//h2")
@@ -480,25 +542,6 @@ def try_complete_season_pack(driver, movie_title, season_num, normalized_seasons
                     
                     # Verify the complete pack by checking the modal before clicking Instant RD
                     try:
-                        # Get expected episode count for this season from database if available
-                        from seerr.database import get_db, UnifiedMedia
-                        expected_episode_count = None
-                        try:
-                            db = get_db()
-                            media = db.query(UnifiedMedia).filter(
-                                UnifiedMedia.title == movie_title,
-                                UnifiedMedia.type == 'tv'
-                            ).first()
-                            
-                            if media and media.seasons:
-                                season_data = next((s for s in media.seasons if s.get('season_number') == season_num), None)
-                                if season_data:
-                                    episodes = season_data.get('episodes', [])
-                                    expected_episode_count = len(episodes) if episodes else None
-                                    logger.info(f"Expected episode count for Season {season_num}: {expected_episode_count}")
-                        except:
-                            pass
-                        
                         # Extract the file count from the badge text (e.g., "Complete (9/9)")
                         import re
                         match = re.search(r'Complete \((\d+)/(\d+)\)', complete_badge_text)
@@ -515,7 +558,8 @@ def try_complete_season_pack(driver, movie_title, season_num, normalized_seasons
                             try:
                                 complete_badge.click()
                                 logger.info(f"Opened Complete modal for box {i}")
-                                time.sleep(2)  # Wait for modal to open
+                                # Wait for the modal's file list
+                                adaptive_waits.wait(driver, "complete_modal", element_present(COMPLETE_MODAL_FILE_ROW_XPATH), 2)
                                 
                                 # Try to parse the modal to verify files
                                 try:
@@ -538,7 +582,7 @@ def try_complete_season_pack(driver, movie_title, season_num, normalized_seasons
                                             # Try clicking overlay if no close button
                                             overlay = driver.find_element(By.XPATH, "//div[contains(@class, 'fixed inset-0') and contains(@class, 'bg-black')]")
                                             overlay.click()
-                                            time.sleep(1)
+                                            adaptive_waits.wait(driver, "modal_closed", element_absent(MODAL_OVERLAY_XPATH), 1)
                                         continue
                                     
                                     # Close the modal before proceeding by pressing ESC
@@ -571,7 +615,7 @@ def try_complete_season_pack(driver, movie_title, season_num, normalized_seasons
                                     try:
                                         overlay = driver.find_element(By.XPATH, "//div[contains(@class, 'fixed inset-0') and contains(@class, 'bg-black')]")
                                         overlay.click()
-                                        time.sleep(1)
+                                        adaptive_waits.wait(driver, "modal_closed", element_absent(MODAL_OVERLAY_XPATH), 1)
                                     except:
                                         pass
                             except Exception as click_error:
@@ -1037,24 +1081,26 @@ def try_with_extras_pack(driver, movie_title, season_num, normalized_seasons):
         except NoSuchElementException:
             logger.info(f"'Show more results' button not found for Season {season_num}, proceeding without it")
         
-        # Wait 10 seconds for results to load
-        logger.info(f"Waiting 10 seconds for With extras results to load for Season {season_num}")
-        time.sleep(10)
+        # Wait for the With extras results to load (was a fixed 10 seconds)
+        logger.info(f"Waiting for With extras results to load for Season {season_num}")
+        adaptive_waits.wait(driver, "pack_results", results_settled(RESULT_CARD_XPATH), 10)
         
         # Try to click "Show more results" again after initial load
         try:
             show_more_button = driver.find_element(By.XPATH, "//button[contains(text(), 'Show more results')]")
             logger.info(f"Found 'Show more results' button again for Season {season_num}, clicking it")
+            cards_before = len(driver.find_elements(By.XPATH, RESULT_CARD_XPATH))
             show_more_button.click()
-            logger.info(f"Waiting 3 seconds after clicking 'Show more results' for Season {season_num}")
-            time.sleep(3)
+            logger.info(f"Waiting for more results after clicking 'Show more results' for Season {season_num}")
+            adaptive_waits.wait(driver, "show_more_results",
+                                results_settled(RESULT_CARD_XPATH, min_count=cards_before + 1), 3)
         except NoSuchElementException:
             logger.info(f"'Show more results' button not available for Season {season_num}, proceeding with available results")
         
         # Check if page is still loading and wait longer if needed
         if not check_page_loading_state(driver, season_num, "With extras"):
-            logger.info(f"Page still loading after 10 seconds, waiting additional 5 seconds for Season {season_num}")
-            time.sleep(5)
+            logger.info(f"Page still loading, waiting up to 5 more seconds for Season {season_num}")
+            adaptive_waits.wait(driver, "pack_results_slow", element_absent(LOADING_INDICATOR_XPATH), 5)
             check_page_loading_state(driver, season_num, "With extras")
         
         # Log page state after waiting
@@ -1093,9 +1139,11 @@ def try_with_extras_pack(driver, movie_title, season_num, normalized_seasons):
                 EC.presence_of_all_elements_located((By.XPATH, "//div[contains(@class, 'border-2')]"))
             )
             logger.info(f"Found {len(result_boxes)} result boxes to process (will stop on first success)")
+            expected_episode_count = get_expected_episode_count(movie_title, season_num)
             
-            # Process each result box ONE BY ONE until success
-            for i, result_box in enumerate(result_boxes, 1):
+            # Process each result box ONE BY ONE until success, best-ranked pack first
+            for i in rank_season_pack_boxes(driver, result_boxes, movie_title, season_num, expected_episode_count):
+                result_box = result_boxes[i-1]
                 try:
                     # Extract title from result box
                     title_element = result_box.find_element(By.XPATH, ".//h2")
@@ -1136,25 +1184,6 @@ def try_with_extras_pack(driver, movie_title, season_num, normalized_seasons):
                     
                     # Verify the complete pack by checking the modal before clicking Instant RD
                     try:
-                        # Get expected episode count for this season from database if available
-                        from seerr.database import get_db, UnifiedMedia
-                        expected_episode_count = None
-                        try:
-                            db = get_db()
-                            media = db.query(UnifiedMedia).filter(
-                                UnifiedMedia.title == movie_title,
-                                UnifiedMedia.type == 'tv'
-                            ).first()
-                            
-                            if media and media.seasons:
-                                season_data = next((s for s in media.seasons if s.get('season_number') == season_num), None)
-                                if season_data:
-                                    episodes = season_data.get('episodes', [])
-                                    expected_episode_count = len(episodes) if episodes else None
-                                    logger.info(f"Expected episode count for Season {season_num}: {expected_episode_count}")
-                        except:
-                            pass
-                        
                         # Extract the file count from the badge text (e.g., "Complete (9/9)")
                         import re
                         match = re.search(r'Complete \((\d+)/(\d+)\)', complete_badge_text)
@@ -1171,7 +1200,8 @@ def try_with_extras_pack(driver, movie_title, season_num, normalized_seasons):
                             try:
                                 complete_badge.click()
                                 logger.info(f"Opened Complete modal for box {i}")
-                                time.sleep(2)  # Wait for modal to open
+                                # Wait for the modal's file list
+                                adaptive_waits.wait(driver, "complete_modal", element_present(COMPLETE_MODAL_FILE_ROW_XPATH), 2)
                                 
                                 # Try to parse the modal to verify files
                                 try:
@@ -1194,7 +1224,7 @@ def try_with_extras_pack(driver, movie_title, season_num, normalized_seasons):
                                             # Try clicking overlay if no close button
                                             overlay = driver.find_element(By.XPATH, "//div[contains(@class, 'fixed inset-0') and contains(@class, 'bg-black')]")
                                             overlay.click()
-                                            time.sleep(1)
+                                            adaptive_waits.wait(driver, "modal_closed", element_absent(MODAL_OVERLAY_XPATH), 1)
                                         continue
                                     
                                     # Close the modal before proceeding by pressing ESC
@@ -1227,7 +1257,7 @@ def try_with_extras_pack(driver, movie_title, season_num, normalized_seasons):
                                     try:
                                         overlay = driver.find_element(By.XPATH, "//div[contains(@class, 'fixed inset-0') and contains(@class, 'bg-black')]")
                                         overlay.click()
-                                        time.sleep(1)
+                                        adaptive_waits.wait(driver, "modal_closed", element_absent(MODAL_OVERLAY_XPATH), 1)
                                     except:
                                         pass
                             except Exception as click_error:
@@ -1342,6 +1372,12 @@ def process_individual_episodes_fallback(driver, movie_title, season_num, normal
     
     # If we have specific aired episodes, check for each one
     if aired_episodes_list:
+        # Expand and read the season page once: cached episodes and episodes no result
+        # mentions are answered from memory, only the rest need a filtered search
+        from seerr.result_snapshot_cache import result_snapshot_cache
+        search_started = time.time()
+        season_snapshot = result_snapshot_cache.load(driver, movie_title, season_num, TORRENT_FILTER_REGEX)
+        
         for episode in aired_episodes_list:
             # Check if item is still in queue before processing each episode
             if tmdb_id and _check_queue_status(tmdb_id, 'tv'):
@@ -1358,53 +1394,69 @@ def process_individual_episodes_fallback(driver, movie_title, season_num, normal
             episode_id = f"E{episode_num:02d}"
             logger.info(f"Searching for episode: S{season_num:02d}{episode_id}")
             
+            full_episode_id = f"S{season_num:02d}{episode_id}"  # e.g., "S08E01"
+            
+            cached_in_snapshot = False
+            if season_snapshot is not None:
+                # An episode is only skipped as absent on a snapshot read during this search
+                season_snapshot, cached_in_snapshot, absent_from_snapshot = result_snapshot_cache.find_episode_on_page(
+                    driver, season_snapshot, movie_title, season_num, full_episode_id, confirmed_seasons,
+                    processed_torrents, filter_text=TORRENT_FILTER_REGEX, fresh_since=search_started
+                )
+                if absent_from_snapshot:
+                    logger.info(f"No matching torrents found or processed for episode: {full_episode_id}")
+                    continue
+            
             # Apply episode-specific filter to reduce the number of results
-            try:
-                from selenium.webdriver.support.ui import WebDriverWait
-                from selenium.webdriver.support import expected_conditions as EC
-                from selenium.webdriver.common.by import By
-                from selenium.common.exceptions import TimeoutException
+            if not cached_in_snapshot:
+                try:
+                    from selenium.webdriver.support.ui import WebDriverWait
+                    from selenium.webdriver.support import expected_conditions as EC
+                    from selenium.webdriver.common.by import By
+                    from selenium.common.exceptions import TimeoutException
                 
-                # Clear and update the filter box with episode-specific filter
-                filter_input = WebDriverWait(driver, 3).until(
-                    EC.presence_of_element_located((By.ID, "query"))
-                )
-                episode_filter = f"S{season_num:02d}{episode_id}"  # e.g., "S03E01"
-                if TORRENT_FILTER_REGEX:
-                    full_filter = f"{TORRENT_FILTER_REGEX} {episode_filter}"
-                else:
-                    full_filter = episode_filter
+                    # Clear and update the filter box with episode-specific filter
+                    filter_input = WebDriverWait(driver, 3).until(
+                        EC.presence_of_element_located((By.ID, "query"))
+                    )
+                    episode_filter = f"S{season_num:02d}{episode_id}"  # e.g., "S03E01"
+                    if TORRENT_FILTER_REGEX:
+                        full_filter = f"{TORRENT_FILTER_REGEX} {episode_filter}"
+                    else:
+                        full_filter = episode_filter
                 
-                # Use type_slowly for reliable filter application (same as subscription check)
-                from seerr.background_tasks import type_slowly
-                type_slowly(driver, filter_input, full_filter)
-                logger.info(f"Applied episode filter: {full_filter}")
+                    # Use type_slowly for reliable filter application (same as subscription check)
+                    from seerr.background_tasks import type_slowly
+                    type_slowly(driver, filter_input, full_filter)
+                    logger.info(f"Applied episode filter: {full_filter}")
                 
-                # Wait for filter to update the results before clicking "Show More Results"
-                time.sleep(1)
+                    # Wait for filter to update the results before clicking "Show More Results"
+                    adaptive_waits.wait(driver, "filter_applied", filter_applied(filter_input, full_filter, RESULT_CARD_XPATH), 1)
                 
-                # Click "Show more results" to expand filtered results
-                try:
-                    from seerr.browser import click_show_more_results
-                    click_show_more_results(driver, logger)
-                except TimeoutException:
-                    logger.warning("Timed out while trying to click 'Show More Results'")
-                except Exception as e:
-                    logger.error(f"Unexpected error in click_show_more_results: {e}")
+                    # Click "Show more results" to expand filtered results
+                    try:
+                        from seerr.browser import click_show_more_results
+                        click_show_more_results(driver, logger)
+                    except TimeoutException:
+                        logger.warning("Timed out while trying to click 'Show More Results'")
+                    except Exception as e:
+                        logger.error(f"Unexpected error in click_show_more_results: {e}")
                 
-                # Wait for results to update after applying the filter
-                time.sleep(2)  # Increased from 1 to match subscription check timing
+                    # Wait for results to update after applying the filter
+                    adaptive_waits.wait(driver, "episode_results", results_settled(RESULT_CARD_XPATH), 2)
                 
-            except Exception as e:
-                logger.error(f"Error applying episode filter for {episode_id}: {e}")
-                continue
+                except Exception as e:
+                    logger.error(f"Error applying episode filter for {episode_id}: {e}")
+                    continue
             
             # Step 1: Check if episode already has RD (100%) - already cached
-            full_episode_id = f"S{season_num:02d}{episode_id}"  # e.g., "S08E01"
-            episode_confirmed, _ = check_red_buttons(
-                driver, movie_title, normalized_seasons, confirmed_seasons, True, 
-                episode_id=full_episode_id, processed_torrents=processed_torrents
-            )
+            if cached_in_snapshot:
+                episode_confirmed = True
+            else:
+                episode_confirmed, _ = check_red_buttons(
+                    driver, movie_title, normalized_seasons, confirmed_seasons, True, 
+                    episode_id=full_episode_id, processed_torrents=processed_torrents
+                )
             
             if episode_confirmed:
                 confirmation_flag = True
@@ -2264,6 +2316,84 @@ def process_season_page(driver, movie_title, season_num, normalized_seasons, tmd
         return False
 
 
+def try_multi_season_packs(driver, imdb_id, movie_title, season_numbers, tmdb_id=None):
+    """
+    Cover several requested seasons with multi-season packs (e.g. S01-S05) before the
+    per-season strategies run, so covered seasons need no page loads of their own.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        imdb_id: IMDb ID of the show
+        movie_title: Title of the show
+        season_numbers: Season numbers to cover (aired, not completed, in-progress or discrepant)
+        tmdb_id: TMDB ID for cancellation checks
+    
+    Returns:
+        set: Season numbers confirmed through a multi-season pack
+    """
+    from seerr.browser import snapshot_result_cards, get_result_card, RESULT_CARD_XPATH
+    from seerr.season_planner import plan_season_coverage
+    
+    aired_episodes = {}
+    for season_num in season_numbers:
+        aired = get_season_aired_episodes(movie_title, season_num)
+        # Without an aired count the pack's file count cannot be checked
+        if aired:
+            aired_episodes[season_num] = aired
+    if len(aired_episodes) < 2:
+        return set()
+    
+    # Multi-season packs are listed on every season page they cover; use the first one
+    first_season = min(aired_episodes)
+    season_url = f"https://debridmediamanager.com/show/{imdb_id}/{first_season}"
+    driver.get(season_url)
+    logger.info(f"Planning season coverage for {movie_title} seasons {sorted(aired_episodes)} from {season_url}")
+    try:
+        WebDriverWait(driver, 10).until(EC.presence_of_all_elements_located((By.XPATH, RESULT_CARD_XPATH)))
+    except TimeoutException:
+        logger.info(f"No results on season {first_season} page to plan with")
+        return set()
+    check_page_loading_state(driver, first_season, "Season plan")
+    
+    plan = plan_season_coverage(snapshot_result_cards(driver), movie_title, aired_episodes)
+    if not plan.packs:
+        logger.info(f"No multi-season packs found for {movie_title}; processing seasons one by one")
+        return set()
+    logger.info(f"Season plan for {movie_title}: {[(pack.title, list(pack.seasons)) for pack in plan.packs]}, "
+                f"left for per-season search: {plan.uncovered}")
+    
+    confirmed = set()
+    for pack in plan.packs:
+        if tmdb_id and _check_queue_status(tmdb_id, 'tv'):
+            logger.info(f"Search cancelled for {movie_title} (TMDB: {tmdb_id}) while adding season packs")
+            break
+        seasons = [season for season in pack.seasons if season not in confirmed]
+        if len(seasons) < 2:
+            continue
+        result_box = get_result_card(driver, pack.index)
+        if result_box is None or not prioritize_buttons_in_box(result_box):
+            logger.warning(f"Could not add pack '{pack.title}'; its seasons fall back to per-season search")
+            continue
+        try:
+            rd_button = WebDriverWait(result_box, 5).until(
+                EC.presence_of_element_located((By.XPATH, ".//button[contains(text(), 'RD (')]"))
+            )
+            rd_button_text = rd_button.text
+            logger.info(f"RD button text after clicking pack '{pack.title}': {rd_button_text}")
+            if "RD (0%)" in rd_button_text:
+                logger.warning(f"RD (0%) for pack '{pack.title}'. Undoing click.")
+                rd_button.click()
+                continue
+            if "RD (100%)" in rd_button_text:
+                logger.success(f"RD (100%) achieved with '{pack.title}' for seasons {seasons}")
+                for season_num in seasons:
+                    mark_all_episodes_as_confirmed(movie_title, season_num)
+                confirmed.update(seasons)
+        except TimeoutException:
+            logger.warning(f"Timeout waiting for RD status of pack '{pack.title}'")
+    return confirmed
+
+
 def _check_queue_status(tmdb_id, media_type):
     """
     Check if the current item is still in the queue.
@@ -2281,11 +2411,12 @@ def _check_queue_status(tmdb_id, media_type):
     
     try:
         if USE_DATABASE:
-            from seerr.unified_media_manager import get_media_by_tmdb
-            media_record = get_media_by_tmdb(tmdb_id, media_type)
-            if media_record:
+            from seerr.queue_state_cache import queue_state_cache
+            # Served from the batched queue state snapshot instead of a query per check
+            state = queue_state_cache.get(tmdb_id, media_type)
+            if state:
                 # Simple check: if not in queue, stop processing
-                if not media_record.is_in_queue:
+                if not state['is_in_queue']:
                     logger.info(f"Item {tmdb_id} ({media_type}) is not in queue. Stopping processing.")
                     return True
                 # Item is in queue, continue processing
@@ -2298,6 +2429,15 @@ def _check_queue_status(tmdb_id, media_type):
         return False
 
 def search_on_debrid(imdb_id, movie_title, media_type, driver, extra_data=None, tmdb_id=None):
+    """
+    Search for media on Debrid Media Manager, recording the time the adaptive page waits
+    saved for this title (see _search_on_debrid for the arguments)
+    """
+    with adaptive_waits.track_title(movie_title):
+        return _search_on_debrid(imdb_id, movie_title, media_type, driver, extra_data, tmdb_id)
+
+
+def _search_on_debrid(imdb_id, movie_title, media_type, driver, extra_data=None, tmdb_id=None):
     """
     Search for media on Debrid Media Manager
     
@@ -2335,40 +2475,13 @@ def search_on_debrid(imdb_id, movie_title, media_type, driver, extra_data=None,
             if media_record and media_record.status == 'completed':
                 logger.info(f"Media {tmdb_id} ({media_type}) is already completed. Checking if still available in RD...")
                 
-                # Check if we can verify it's still available in RD without full processing
-                from seerr.browser import driver
-                if driver:
-                    try:
-                        # Quick check if media is still available in RD
-                        from seerr.utils import translate_title_for_search
-                        search_title = translate_title_for_search(movie_title)
-                        
-                        # Navigate to search page
-                        driver.get("https://debridmediamanager.com/search")
-                        
-                        # Wait for search input and search
-                        search_input = WebDriverWait(driver, 10).until(
-                            EC.presence_of_element_located((By.ID, "search-input"))
-                        )
-                        search_input.clear()
-                        search_input.send_keys(search_title)
-                        search_input.send_keys(Keys.RETURN)
-                        
-                        # Wait for results
-                        WebDriverWait(driver, 10).until(
-                            EC.presence_of_element_located((By.CLASS_NAME, "search-results"))
-                        )
-                        
-                        # Check if we have RD (100%) results
-                        red_buttons = check_red_buttons(movie_title, media_type)
-                        
-                        if red_buttons and len(red_buttons) > 0:
-                            logger.info(f"Media {movie_title} is still available in RD (100%). Skipping duplicate processing.")
-                            return "already_available"
-                        else:
-                            logger.info(f"Media {movie_title} not found in RD search. Proceeding with processing.")
-                    except Exception as e:
-                        logger.warning(f"Could not verify RD availability: {e}. Proceeding with processing.")
+                # Ask Real-Debrid directly; if that is not possible the item is processed as usual
+                from seerr.debrid_search_client import debrid_search_client
+                cached = debrid_search_client.find_cached(movie_title, [], False) if media_type == 'movie' else None
+                if cached is not None and cached[0]:
+                    logger.info(f"Media {movie_title} is still available in RD (100%). Skipping duplicate processing.")
+                    return "already_available"
+                logger.info(f"Could not confirm {movie_title} is still available in RD. Proceeding with processing.")
         
         # Process extra_data
     except Exception as e:
@@ -2566,16 +2679,19 @@ def search_on_debrid(imdb_id, movie_title, media_type, driver, extra_data=None,
                         # If we have seasons that need fetching (missing or invalid), fetch them from Trakt
                         if seasons_to_fetch and media_record.trakt_id:
                             logger.info(f"Seasons needing data fetch: {seasons_to_fetch} (missing: {missing_seasons}, invalid: {invalid_seasons}), fetching from Trakt")
-                            from seerr.trakt import get_season_details_from_trakt, check_next_episode_aired
+                            from seerr.trakt import get_season_details_from_trakt, get_all_seasons_from_trakt, check_next_episode_aired
                             from seerr.enhanced_season_manager import EnhancedSeasonManager
                             from datetime import datetime
                             
                             trakt_show_id = media_record.trakt_id
                             new_seasons_data = []
                             
+                            # One Trakt call returns every season with its episode air dates
+                            all_seasons = get_all_seasons_from_trakt(str(trakt_show_id))
+                            
                             for season_num in seasons_to_fetch:
                                 # Fetch season details from Trakt
-                                season_details = get_season_details_from_trakt(str(trakt_show_id), season_num)
+                                season_details = get_season_details_from_trakt(str(trakt_show_id), season_num, all_seasons)
                                 
                                 if season_details:
                                     episode_count = season_details.get('episode_count', 0)
@@ -2585,7 +2701,7 @@ def search_on_debrid(imdb_id, movie_title, media_type, driver, extra_data=None,
                                     # Check for next episode if there's a discrepancy
                                     if episode_count != aired_episodes:
                                         has_aired, next_episode_details = check_next_episode_aired(
-                                            str(trakt_show_id), season_num, aired_episodes
+                                            str(trakt_show_id), season_num, aired_episodes, season_details
                                         )
                                         if has_aired:
                                             logger.info(f"Next episode (E{aired_episodes + 1:02d}) has aired for Season {season_num}. Updating aired_episodes.")
@@ -2740,6 +2856,15 @@ def search_on_debrid(imdb_id, movie_title, media_type, driver, extra_data=None,
         
         # Navigate directly using IMDb ID
         if media_type == 'movie':
+            # A movie that is already cached in RD does not need the DMM page at all
+            from seerr.debrid_search_client import debrid_search_client
+            cached = debrid_search_client.find_cached(movie_title, normalized_seasons, False)
+            if cached is not None and cached[0]:
+                logger.success(f"RD (100%) torrent confirmed for Movie {movie_title} via Real-Debrid API. Skipping browser search.")
+                if USE_DATABASE and 'processed_media_id' in locals() and processed_media_id:
+                    update_media_processing_status(processed_media_id, 'completed', 'browser_automation', extra_data={'torrents_found': 1})
+                return True
+            
             url = f"https://debridmediamanager.com/movie/{imdb_id}"
             driver.get(url)
             logger.info(f"Navigated to movie page: {url}")
@@ -2763,16 +2888,36 @@ def search_on_debrid(imdb_id, movie_title, media_type, driver, extra_data=None,
                 
                 if season_numbers:
                     logger.info(f"Processing TV show with specific seasons: {season_numbers}")
-                    # Process each season individually
                     all_seasons_confirmed = True
                     confirmed_seasons = set()
                     
+                    # Seasons a multi-season pack can cover: aired, not yet completed, and not in
+                    # progress or discrepant (those need per-episode processing)
+                    plannable_seasons = [
+                        season_num for season_num in season_numbers
+                        if not is_season_completed(movie_title, season_num, tmdb_id)
+                        and not is_season_in_progress(movie_title, season_num)
+                        and not is_season_discrepant(movie_title, season_num)
+                    ]
+                    pack_confirmed_seasons = set()
+                    if len(plannable_seasons) >= 2:
+                        try:
+                            pack_confirmed_seasons = try_multi_season_packs(driver, imdb_id, movie_title, plannable_seasons, tmdb_id)
+                        except Exception as e:
+                            logger.warning(f"Multi-season pack planning failed for {movie_title}, processing seasons one by one: {e}")
+                    
+                    # Process each remaining season individually
                     for season_num in season_numbers:
                         # Check for cancellation before processing each season
                         if tmdb_id and _check_queue_status(tmdb_id, media_type):
                             logger.info(f"Search cancelled for {movie_title} (TMDB: {tmdb_id}) during season processing")
                             return "cancelled"
                         
+                        if season_num in pack_confirmed_seasons:
+                            logger.info(f"Season {season_num} confirmed by a multi-season pack. Skipping season page.")
+                            confirmed_seasons.add(f"Season {season_num}")
+                            continue
+                        
                         logger.info(f"Starting processing for Season {season_num}")
                         
                         # Update processing stage to reflect current season being processed
@@ -2837,6 +2982,17 @@ def search_on_debrid(imdb_id, movie_title, media_type, driver, extra_data=None,
                             logger.info(f"Item {movie_title} (TMDB: {tmdb_id}) is not in queue. Stopping before season navigation.")
                             return "cancelled"
                         
+                        # A complete season pack already cached in RD confirms the season without the DMM page;
+                        # in-progress and discrepant seasons need per-episode processing in the browser
+                        if not is_season_in_progress(movie_title, season_num) and not is_season_discrepant(movie_title, season_num):
+                            from seerr.debrid_search_client import debrid_search_client
+                            cached = debrid_search_client.find_cached(movie_title, [f"Season {season_num}"], True, complete_season_pack_only=True)
+                            if cached is not None and cached[0]:
+                                logger.info(f"Found cached RD (100%) season pack for Season {season_num} via Real-Debrid API. Skipping browser search.")
+                                mark_all_episodes_as_confirmed(movie_title, season_num)
+                                confirmed_seasons.add(f"Season {season_num}")
+                                continue
+                        
                         season_url = f"https://debridmediamanager.com/show/{imdb_id}/{season_num}"
                         driver.get(season_url)
                         logger.info(f"Navigated to season {season_num} page: {season_url}")
@@ -3210,7 +3366,6 @@ def search_on_debrid(imdb_id, movie_title, media_type, driver, extra_data=None,
 
                             # Navigate to the new URL
                             driver.get(season_url)
-                            time.sleep(2)  # Wait longer for the page to load and stabilize
                             logger.info(f"Navigated to season {season} URL: {season_url}")
                             
                             # Wait for page to be fully loaded
@@ -3221,8 +3376,8 @@ def search_on_debrid(imdb_id, movie_title, media_type, driver, extra_data=None,
                             except TimeoutException:
                                 logger.warning(f"Page load timeout for season {season}, continuing anyway...")
 
-                            # Wait a bit more for dynamic content to load
-                            time.sleep(2)
+                            # Wait for the results to load (was a fixed 2 seconds before and after the ready check)
+                            adaptive_waits.wait(driver, "season_page", results_settled(RESULT_CARD_XPATH), 4)
 
                             # Perform red button checks for the current season with error handling
                             try:
@@ -3626,65 +3781,88 @@ def search_on_debrid(imdb_id, movie_title, media_type, driver, extra_data=None,
                             logger.warning("Still no result boxes found after second attempt")
                             # result_boxes remains an empty list
 
-                    for i, result_box in enumerate(result_boxes, start=1):
+                    # Read every box's title and badges in one round-trip; box elements are only
+                    # touched again for the box whose buttons get clicked
+                    from seerr.browser import snapshot_result_cards
+                    from seerr.result_ranker import order_result_indexes
+                    result_cards = snapshot_result_cards(driver, "//div[contains(@class, 'border-black')]")
+                    if len(result_cards) != len(result_boxes):
+                        result_cards = []
+
+                    # Try the best-ranked box first (coverage, resolution, size) instead of page order
+                    box_order = (order_result_indexes(result_cards, movie_title, [], is_tv_show)
+                                 if result_cards else range(1, len(result_boxes) + 1))
+                    for i in box_order:
+                        result_box = result_boxes[i-1]
                         # Check for cancellation before processing each box
                         if tmdb_id and _check_queue_status(tmdb_id, media_type):
                             logger.info(f"Search cancelled for {movie_title} (TMDB: {tmdb_id}) during box processing")
                             return "cancelled"
                         
                         try:
-                            # Extract the title from the result box with stale element handling
-                            title_text = None
-                            max_recovery_attempts = 3
-                            recovery_successful = False
+                            # Take the title from the snapshot; read the element only if the snapshot is unavailable
+                            title_text = (result_cards[i-1]['title'] or None) if result_cards else None
+                            recovery_successful = title_text is not None
+                            if recovery_successful:
+                                logger.info(f"Box {i} title: {title_text}")
+                            else:
+                                # Extract the title from the result box with stale element handling
+                                max_recovery_attempts = 3
+                                recovery_successful = False
                             
-                            for recovery_attempt in range(max_recovery_attempts):
-                                try:
-                                    title_element = result_box.find_element(By.XPATH, ".//h2")
-                                    title_text = title_element.text.strip()
-                                    logger.info(f"Box {i} title: {title_text}")
-                                    recovery_successful = True
-                                    break
-                                except StaleElementReferenceException:
-                                    if recovery_attempt < max_recovery_attempts - 1:
-                                        logger.warning(f"Stale element reference for box {i} title (attempt {recovery_attempt + 1}). Re-locating result boxes...")
-                                        try:
-                                            # Re-locate result boxes and try again
-                                            result_boxes = WebDriverWait(driver, 3).until(
-                                                EC.presence_of_all_elements_located((By.XPATH, "//div[contains(@class, 'border-black')]"))
-                                            )
-                                            if i <= len(result_boxes):
-                                                result_box = result_boxes[i-1]
-                                                time.sleep(0.5)  # Brief wait for DOM to stabilize
-                                                continue
-                                            else:
-                                                logger.warning(f"Could not re-locate box {i} (box index out of range). Skipping.")
-                                                break
-                                        except Exception as recovery_error:
-                                            logger.warning(f"Failed to re-locate result boxes (attempt {recovery_attempt + 1}): {str(recovery_error)}")
-                                            if recovery_attempt < max_recovery_attempts - 1:
-                                                time.sleep(1)  # Wait before retry
-                                                continue
-                                            else:
-                                                break
-                                    else:
-                                        # Last attempt failed
-                                        logger.warning(f"Stale element reference for box {i} title after {max_recovery_attempts} attempts. Could not recover.")
+                                for recovery_attempt in range(max_recovery_attempts):
+                                    try:
+                                        title_element = result_box.find_element(By.XPATH, ".//h2")
+                                        title_text = title_element.text.strip()
+                                        logger.info(f"Box {i} title: {title_text}")
+                                        recovery_successful = True
                                         break
+                                    except StaleElementReferenceException:
+                                        if recovery_attempt < max_recovery_attempts - 1:
+                                            logger.warning(f"Stale element reference for box {i} title (attempt {recovery_attempt + 1}). Re-locating result boxes...")
+                                            try:
+                                                # Re-locate result boxes and try again
+                                                result_boxes = WebDriverWait(driver, 3).until(
+                                                    EC.presence_of_all_elements_located((By.XPATH, "//div[contains(@class, 'border-black')]"))
+                                                )
+                                                if i <= len(result_boxes):
+                                                    result_box = result_boxes[i-1]
+                                                    time.sleep(0.5)  # Brief wait for DOM to stabilize
+                                                    continue
+                                                else:
+                                                    logger.warning(f"Could not re-locate box {i} (box index out of range). Skipping.")
+                                                    break
+                                            except Exception as recovery_error:
+                                                logger.warning(f"Failed to re-locate result boxes (attempt {recovery_attempt + 1}): {str(recovery_error)}")
+                                                if recovery_attempt < max_recovery_attempts - 1:
+                                                    time.sleep(1)  # Wait before retry
+                                                    continue
+                                                else:
+                                                    break
+                                        else:
+                                            # Last attempt failed
+                                            logger.warning(f"Stale element reference for box {i} title after {max_recovery_attempts} attempts. Could not recover.")
+                                            break
                             
                             if not recovery_successful or title_text is None:
                                 logger.warning(f"Could not extract title from box {i} after recovery attempts. Continuing to next box.")
                                 continue
 
                             # Check if the result box contains "with extras" and skip if it does
-                            try:
-                                extras_element = WebDriverWait(result_box, 2).until(
-                                    EC.presence_of_element_located((By.XPATH, ".//span[contains(., 'With extras')]"))
-                                )
-                                logger.info(f"Box {i} contains 'With extras'. Skipping.")
-                                continue
-                            except TimeoutException:
+                            if result_cards:
+                                if any('With extras' in badge for badge in result_cards[i-1]['badges']):
+                                    logger.info(f"Box {i} contains 'With extras'. Skipping.")
+                                    continue
                                 logger.info(f"Box {i} does not contain 'With extras'. Proceeding.")
+                            else:
+                                try:
+                                    extras_element = WebDriverWait(result_box, 2).until(
+                                        EC.presence_of_element_located((By.XPATH, ".//span[contains(., 'With extras')]"))
+                                    )
+                                    logger.info(f"Box {i} contains 'With extras'. Skipping.")
+                                    continue
+                                except TimeoutException:
+                                    logger.info(f"Box {i} does not contain 'With extras'. Proceeding.")
                             # Clean both the movie title and the box title for comparison
                             movie_title_cleaned = clean_title(movie_title.split('(')[0].strip(), target_lang='en')
                             title_text_cleaned = clean_title(title_text.split('(')[0].strip(), target_lang='en')
@@ -3819,7 +3997,10 @@ def search_on_debrid(imdb_id, movie_title, media_type, driver, extra_data=None,
                                             if "Instant" in rd_button_text or "RD (" not in rd_button_text:
                                                 logger.info(f"Button still shows '{rd_button_text}', waiting for status change...")
                                                 if retry < max_retries - 1:
-                                                    time.sleep(3)  # Wait 3 seconds before retry
+                                                    adaptive_waits.wait(
+                                                        driver, "rd_status",
+                                                        lambda d: "RD (" in rd_button.text and "Instant" not in rd_button.text, 3
+                                                    )
                                                     continue
                                                 else:
                                                     logger.warning(f"Button status did not change after {max_retries} attempts in box {i}. Moving to next box.")
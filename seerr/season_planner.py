@@ -0,0 +1,85 @@
+"""
+Season planner module for SeerrBridge
+Picks the smallest set of multi-season packs that covers the requested seasons of a show,
+so seasons covered by one torrent do not each need their own DMM page load and searches
+"""
+import re
+from typing import Any, Dict, List, NamedTuple, Sequence, Tuple
+
+from loguru import logger
+
+from seerr.result_ranker import rank_results
+
+# "Complete (62/62)" badge on a pack: the second number is the file count
+COMPLETE_FILES_PATTERN = re.compile(r'Complete \((\d+)/(\d+)\)')
+
+
+class PlannedPack(NamedTuple):
+    """A torrent chosen to cover several seasons"""
+    index: int
+    title: str
+    seasons: Tuple[int, ...]
+    score: float
+
+
+class SeasonPlan(NamedTuple):
+    """Packs to add, and the seasons left for the per-season strategies"""
+    packs: List[PlannedPack]
+    uncovered: List[int]
+
+
+def _file_count(badges: Sequence[str]):
+    for badge in badges:
+        match = COMPLETE_FILES_PATTERN.search(badge)
+        if match:
+            return int(match.group(2))
+    return None
+
+
+def plan_season_coverage(cards: Sequence[Dict[str, Any]], movie_title: str,
+                         aired_episodes: Dict[int, int]) -> SeasonPlan:
+    """
+    Choose multi-season packs that together cover as many requested seasons as possible.
+
+    Candidates are the result cards that match the show and cover at least two of the
+    seasons. A pack whose "Complete (x/y)" badge lists fewer files than the aired episodes
+    of the seasons it covers is left out. Packs are picked greedily: the one covering the
+    most still-uncovered seasons first, the higher-ranked one on ties, until no pack covers
+    two or more uncovered seasons. Single seasons are left to the per-season strategies.
+
+    Args:
+        cards (list): Result cards from snapshot_result_cards
+        movie_title (str): Title of the show
+        aired_episodes (dict): Aired episode count per requested season number
+
+    Returns:
+        SeasonPlan: Packs in the order they should be added, and the uncovered seasons
+    """
+    season_names = {f"Season {number}": number for number in aired_episodes}
+    ranked = rank_results(cards, movie_title, list(season_names), True, complete_season_pack_only=True)
+    badges_by_index = {card.get('index'): card.get('badges') or [] for card in cards}
+
+    candidates = []
+    for result in ranked:
+        seasons = tuple(sorted(season_names[name] for name in result.covered_seasons))
+        if len(seasons) < 2:
+            continue
+        file_count = _file_count(badges_by_index.get(result.index, []))
+        expected = sum(aired_episodes[number] for number in seasons)
+        if file_count is not None and file_count < expected:
+            logger.info(f"Skipping pack '{result.title}': {file_count} files for {expected} aired episodes in seasons {list(seasons)}")
+            continue
+        candidates.append(PlannedPack(index=result.index, title=result.title, seasons=seasons, score=result.score))
+
+    uncovered = set(aired_episodes)
+    packs: List[PlannedPack] = []
+    while candidates:
+        # ranked is best first, so max() keeps the higher-ranked pack on ties
+        best = max(candidates, key=lambda pack: len(uncovered.intersection(pack.seasons)))
+        if len(uncovered.intersection(best.seasons)) < 2:
+            break
+        packs.append(best)
+        uncovered.difference_update(best.seasons)
+        candidates.remove(best)
+
+    return SeasonPlan(packs=packs, uncovered=sorted(uncovered))
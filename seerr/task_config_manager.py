@@ -156,6 +156,16 @@ class TaskConfigManager:
             'refresh_interval_minutes',
             'movie_queue_maxsize',
             'tv_queue_maxsize',
+            'queue_enqueue_timeout_seconds',
+            'browser_pool_size',
+            'http_search_client_enabled',
+            'translation_cache_ttl_days',
+            'browser_performance_profile_enabled',
+            'trakt_cache_enabled',
+            'movie_item_timeout_seconds',
+            'tv_item_timeout_seconds',
+            'item_timeout_max_retries',
+            'movie_queue_share',
             'token_refresh_interval_minutes',
             'movie_processing_check_interval_minutes',
             'library_refresh_interval_minutes',
@@ -0,0 +1,204 @@
+"""
+Title matcher module for SeerrBridge
+Scores a whole page of result titles against the requested title in one call, so
+matching no longer runs per button between WebDriver commands
+"""
+import re
+import time
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Sequence
+
+from fuzzywuzzy import fuzz as legacy_fuzz
+from loguru import logger
+from rapidfuzz import fuzz, process
+
+from seerr.utils import clean_title, extract_year, match_single_season
+
+# Minimum partial ratio between the result title and the requested title
+TITLE_MATCH_THRESHOLD = 65
+
+# fuzzywuzzy rounds its ratios to integers while rapidfuzz returns floats, so a title
+# fuzzywuzzy scores 65 can score 64.7 in rapidfuzz: the pre-filter keeps that margin
+PREFILTER_MARGIN = 1
+
+# Added to the title ratio to rank candidates that pass every check
+YEAR_EXACT_BONUS = 10
+YEAR_NEAR_BONUS = 5
+SEASON_MATCH_BONUS = 20
+
+# Individual episodes, rejected when only complete season packs are wanted
+EPISODE_TITLE_PATTERN = re.compile(r'[sS]\d+[eE]\d+|episode\s+\d+|ep\s+\d+|[eE]\d+')
+
+
+class TitleMatch(NamedTuple):
+    """How one result title compares to the requested media"""
+    index: int
+    title: str
+    cleaned_title: str
+    title_ratio: float
+    year: Optional[int]
+    year_matched: bool
+    season: Optional[str]
+    season_matched: bool
+    episode_matched: bool
+    is_episode: bool
+    matched: bool
+    score: float
+
+
+@lru_cache(maxsize=8192)
+def _clean_for_match(title: str) -> str:
+    """clean_title of the part before any parenthesis, memoized per title"""
+    return clean_title(title.split('(')[0].strip(), target_lang='en').lower()
+
+
+def _legacy_title_ratio(title: str, cleaned_title: str, base_title: str, expected_title: str) -> float:
+    """The fuzzywuzzy ratio check_red_buttons has always used, for titles that pass the batch scorer"""
+    ratio = legacy_fuzz.partial_ratio(cleaned_title, expected_title)
+    if ratio < TITLE_MATCH_THRESHOLD:
+        ratio = max(ratio, legacy_fuzz.partial_ratio(title.lower(), base_title))
+    return ratio
+
+
+def score_titles(titles: Sequence[str], movie_title: str, normalized_seasons: List[str], is_tv_show: bool,
+                 episode_id: str = None, complete_season_pack_only: bool = False) -> List[TitleMatch]:
+    """
+    Score every result title against the requested media.
+
+    Args:
+        titles (list): Result titles, in page order
+        movie_title (str): Expected title, with the year for movies (e.g. "Heat (1995)")
+        normalized_seasons (list): Requested seasons in normalized format
+        is_tv_show (bool): Whether we're checking a TV show
+        episode_id (str, optional): Episode ID for TV shows (e.g. "S01E02")
+        complete_season_pack_only (bool): Reject individual episodes
+
+    Returns:
+        list: One TitleMatch per title, in the same order
+    """
+    if not titles:
+        return []
+
+    base_title = movie_title.split('(')[0].strip().lower()
+    expected_title = _clean_for_match(movie_title)
+    expected_year = extract_year(movie_title)
+
+    # Both ratios for the whole page in two C-level passes; the raw names catch titles
+    # whose extraction failed (partial_ratio finds the title inside a longer name).
+    # rapidfuzz finds the optimal alignment but does not round, so the fuzzywuzzy ratios the
+    # threshold was tuned on can be up to a point higher: titles within PREFILTER_MARGIN of
+    # the threshold are re-checked with fuzzywuzzy below.
+    cleaned_titles = [_clean_for_match(title) for title in titles]
+    cleaned_ratios = [0.0] * len(titles)
+    for _, ratio, index in process.extract(expected_title, cleaned_titles, scorer=fuzz.partial_ratio, limit=None):
+        cleaned_ratios[index] = ratio
+    raw_ratios = [0.0] * len(titles)
+    for _, ratio, index in process.extract(base_title, [title.lower() for title in titles],
+                                           scorer=fuzz.partial_ratio, limit=None):
+        raw_ratios[index] = ratio
+
+    episode_lower = episode_id.lower() if episode_id else None
+    matches = []
+    for index, title in enumerate(titles):
+        title_ratio = max(cleaned_ratios[index], raw_ratios[index])
+        if title_ratio >= TITLE_MATCH_THRESHOLD - PREFILTER_MARGIN:
+            title_ratio = _legacy_title_ratio(title, cleaned_titles[index], base_title, expected_title)
+        title_matched = title_ratio >= TITLE_MATCH_THRESHOLD
+
+        year = extract_year(title, ignore_resolution=True)
+        year_matched = True
+        year_bonus = 0
+        if not is_tv_show and year and expected_year:
+            year_matched = abs(year - expected_year) <= 1
+            year_bonus = YEAR_EXACT_BONUS if year == expected_year else YEAR_NEAR_BONUS if year_matched else 0
+
+        season = None
+        season_matched = False
+        episode_matched = True
+        if is_tv_show and normalized_seasons:
+            season = next((s for s in normalized_seasons if match_single_season(title, s)), None)
+            season_matched = season is not None
+            if episode_lower:
+                episode_matched = episode_lower in title.lower()
+                # Episode searches are already filtered to the season, so an episode match is enough
+                season_matched = season_matched or episode_matched
+
+        is_episode = bool(is_tv_show and complete_season_pack_only and EPISODE_TITLE_PATTERN.search(title))
+        matched = (title_matched and year_matched and not is_episode and
+                   (not is_tv_show or (season_matched and episode_matched)))
+        score = title_ratio + year_bonus + (SEASON_MATCH_BONUS if season_matched else 0)
+
+        matches.append(TitleMatch(
+            index=index,
+            title=title,
+            cleaned_title=cleaned_titles[index],
+            title_ratio=title_ratio,
+            year=year,
+            year_matched=year_matched,
+            season=season if not episode_id else None,
+            season_matched=season_matched,
+            episode_matched=episode_matched,
+            is_episode=is_episode,
+            matched=matched,
+            score=score
+        ))
+    return matches
+
+
+def best_match(matches: Sequence[TitleMatch]) -> Optional[TitleMatch]:
+    """
+    Pick the highest-scoring title that passed every check (the first one on ties).
+
+    Args:
+        matches (list): Output of score_titles
+
+    Returns:
+        TitleMatch: The best match, or None if no title matched
+    """
+    best = None
+    for match in matches:
+        if match.matched and (best is None or match.score > best.score):
+            best = match
+    return best
+
+
+def find_best_match(titles: Sequence[str], movie_title: str, normalized_seasons: List[str], is_tv_show: bool,
+                    episode_id: str = None, complete_season_pack_only: bool = False,
+                    label: str = "result") -> Optional[TitleMatch]:
+    """
+    Score a page of titles and return the best match, logging one summary line.
+
+    Args:
+        titles (list): Result titles, in page order
+        movie_title (str): Expected title
+        normalized_seasons (list): Requested seasons in normalized format
+        is_tv_show (bool): Whether we're checking a TV show
+        episode_id (str, optional): Episode ID for TV shows
+        complete_season_pack_only (bool): Reject individual episodes
+        label (str): Name of the results in log messages
+
+    Returns:
+        TitleMatch: The best match, or None if no title matched
+    """
+    started = time.perf_counter()
+    matches = score_titles(titles, movie_title, normalized_seasons, is_tv_show,
+                           episode_id=episode_id, complete_season_pack_only=complete_season_pack_only)
+    best = best_match(matches)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    for match in matches:
+        logger.debug(f"{label.capitalize()} {match.index + 1}: '{match.title}' ratio {match.title_ratio:.0f}, "
+                     f"year {match.year_matched}, season {match.season_matched}, episode {match.episode_matched}, "
+                     f"episode-only {match.is_episode}, score {match.score:.0f}")
+    passed = sum(1 for match in matches if match.matched)
+    if best:
+        logger.info(f"Scored {len(matches)} {label}(s) against '{movie_title}' in {elapsed_ms:.2f} ms: "
+                    f"{passed} matched, best is {label} {best.index + 1} '{best.title}' (score {best.score:.0f})")
+    else:
+        logger.info(f"Scored {len(matches)} {label}(s) against '{movie_title}' in {elapsed_ms:.2f} ms: no match")
+    return best
+
+
+def get_title_matcher_stats() -> dict:
+    """Hit/miss statistics of the memoized title cleaning"""
+    return _clean_for_match.cache_info()._asdict()
@@ -12,13 +12,8 @@ from seerr.config import TRAKT_API_KEY, USE_DATABASE
 from seerr.database import get_db
 from seerr.unified_models import UnifiedMedia
 from seerr.db_logger import log_info, log_success, log_error
-
-# Trakt API rate limit: 1000 calls every 5 minutes
-TRAKT_RATE_LIMIT = 1000
-TRAKT_RATE_LIMIT_PERIOD = 5 * 60  # 5 minutes in seconds
-
-trakt_api_calls = 0
-last_reset_time = time.time()
+from seerr.trakt_client import trakt_client, TRAKT_RATE_LIMIT, TRAKT_RATE_LIMIT_PERIOD
+from seerr.trakt_cache import trakt_cache
 
 def get_media_details_from_trakt(tmdb_id: str, media_type: str) -> Optional[dict]:
     """
@@ -31,19 +26,6 @@ def get_media_details_from_trakt(tmdb_id: str, media_type: str) -> Optional[dict
     Returns:
         Optional[dict]: Media details if successful, None if failed
     """
-    global trakt_api_calls, last_reset_time
-
-    current_time = time.time()
-    if current_time - last_reset_time >= TRAKT_RATE_LIMIT_PERIOD:
-        trakt_api_calls = 0
-        last_reset_time = current_time
-
-    if trakt_api_calls >= TRAKT_RATE_LIMIT:
-        logger.warning("Trakt API rate limit reached. Waiting for the next period.")
-        time.sleep(TRAKT_RATE_LIMIT_PERIOD - (current_time - last_reset_time))
-        trakt_api_calls = 0
-        last_reset_time = time.time()
-
     # Determine the type based on media_type
     trakt_type = 'show' if media_type == 'tv' else 'movie'
     
@@ -77,9 +59,9 @@ def get_media_details_from_trakt(tmdb_id: str, media_type: str) -> Optional[dict
 
         try:
             start_time = time.time()
-            response = requests.get(url, headers=headers, timeout=10)
+            response = trakt_cache.get(url, headers, endpoint="search/tmdb", item_id=tmdb_id,
+                                       extended=trakt_type, data_class="search")
             search_response_time = time.time() - start_time
-            trakt_api_calls += 1
             search_url = url
 
             if response.status_code == 200:
@@ -120,7 +102,7 @@ def get_media_details_from_trakt(tmdb_id: str, media_type: str) -> Optional[dict
                     
                     trakt_id = media_info['ids']['trakt']
                     if USE_DATABASE:
-                        track_trakt_api_usage(url, True, search_response_time)
+                        track_trakt_api_usage(url, True, search_response_time, response.from_cache)
                 else:
                     logger.error(f"{trakt_type.capitalize()} details for ID not found in Trakt API response (empty or invalid response).")
                     if USE_DATABASE:
@@ -194,19 +176,6 @@ def get_detailed_media_info(trakt_id: int, trakt_type: str) -> Optional[dict]:
     Returns:
         Optional[dict]: Detailed media information if successful, None if failed
     """
-    global trakt_api_calls, last_reset_time
-
-    current_time = time.time()
-    if current_time - last_reset_time >= TRAKT_RATE_LIMIT_PERIOD:
-        trakt_api_calls = 0
-        last_reset_time = current_time
-
-    if trakt_api_calls >= TRAKT_RATE_LIMIT:
-        logger.warning("Trakt API rate limit reached. Waiting for the next period.")
-        time.sleep(TRAKT_RATE_LIMIT_PERIOD - (current_time - last_reset_time))
-        trakt_api_calls = 0
-        last_reset_time = time.time()
-
     # Get detailed information
     url = f"https://api.trakt.tv/{trakt_type}s/{trakt_id}?extended=full"
     headers = {
@@ -217,9 +186,9 @@ def get_detailed_media_info(trakt_id: int, trakt_type: str) -> Optional[dict]:
 
     try:
         start_time = time.time()
-        response = requests.get(url, headers=headers, timeout=10)
+        response = trakt_cache.get(url, headers, endpoint=f"{trakt_type}s", item_id=trakt_id,
+                                   extended="full", data_class="metadata")
         response_time = time.time() - start_time
-        trakt_api_calls += 1
 
         if response.status_code == 200:
             data = response.json()
@@ -304,7 +273,7 @@ def get_detailed_media_info(trakt_id: int, trakt_type: str) -> Optional[dict]:
                 if 'backdrop' in images:
                     detailed_info['backdrop_url'] = extract_image_url(images['backdrop'])
             
-            track_trakt_api_usage(url, True, response_time)
+            track_trakt_api_usage(url, True, response_time, response.from_cache)
             return detailed_info
         else:
             logger.error(f"Trakt API detailed request failed with status code {response.status_code}")
@@ -315,19 +284,20 @@ def get_detailed_media_info(trakt_id: int, trakt_type: str) -> Optional[dict]:
         track_trakt_api_usage(url, False)
         return None
 
-def get_season_details_from_trakt(trakt_show_id: str, season_number: int) -> Optional[dict]:
+def get_season_details_from_trakt(trakt_show_id: str, season_number: int,
+                                  all_seasons: Optional[Dict[int, dict]] = None) -> Optional[dict]:
     """
     Fetch season details from Trakt API using a Trakt show ID and season number.
     
     Args:
         trakt_show_id (str): The Trakt ID of the show, obtained from get_media_details_from_trakt
         season_number (int): The season number to fetch details for
+        all_seasons (dict, optional): Result of get_all_seasons_from_trakt for the show; the
+            season is taken from it instead of being requested
     
     Returns:
         Optional[dict]: Season details if successful, None if failed
     """
-    global trakt_api_calls, last_reset_time
-
     # Validate input parameters
     if not trakt_show_id or not isinstance(trakt_show_id, str):
         logger.error(f"Invalid trakt_show_id provided: {trakt_show_id}")
@@ -336,16 +306,11 @@ def get_season_details_from_trakt(trakt_show_id: str, season_number: int) -> Opt
         logger.error(f"Invalid season_number provided: {season_number}")
         return None
 
-    current_time = time.time()
-    if current_time - last_reset_time >= TRAKT_RATE_LIMIT_PERIOD:
-        trakt_api_calls = 0
-        last_reset_time = current_time
-
-    if trakt_api_calls >= TRAKT_RATE_LIMIT:
-        logger.warning("Trakt API rate limit reached. Waiting for the next period.")
-        time.sleep(TRAKT_RATE_LIMIT_PERIOD - (current_time - last_reset_time))
-        trakt_api_calls = 0
-        last_reset_time = time.time()
+    if all_seasons is not None:
+        season_details = all_seasons.get(season_number)
+        if season_details is None:
+            logger.error(f"Season {season_number} is not listed on Trakt for show ID {trakt_show_id}")
+        return season_details
 
     url = f"https://api.trakt.tv/shows/{trakt_show_id}/seasons/{season_number}/info?extended=full"
     headers = {
@@ -356,8 +321,8 @@ def get_season_details_from_trakt(trakt_show_id: str, season_number: int) -> Opt
 
     try:
         logger.info(f"Fetching season details for show ID {trakt_show_id}, season {season_number}")
-        response = requests.get(url, headers=headers, timeout=10)
-        trakt_api_calls += 1
+        response = trakt_cache.get(url, headers, endpoint="seasons/info", item_id=f"{trakt_show_id}/{season_number}",
+                                   extended="full", data_class="aired_episodes")
 
         if response.status_code == 200:
             data = response.json()
@@ -370,7 +335,70 @@ def get_season_details_from_trakt(trakt_show_id: str, season_number: int) -> Opt
         logger.error(f"Error fetching season details from Trakt API for show ID {trakt_show_id}, season {season_number}: {e}")
         return None
 
-def check_next_episode_aired(trakt_show_id: str, season_number: int, current_aired_episodes: int) -> Tuple[bool, Optional[dict]]:
+def get_all_seasons_from_trakt(trakt_show_id: str) -> Optional[Dict[int, dict]]:
+    """
+    Fetch every season of a show, with its episodes and their air dates, in one Trakt call.
+    
+    Each season carries the same fields as get_season_details_from_trakt (episode_count,
+    aired_episodes, status, rating, ...) plus an 'episodes' list with first_aired, so
+    check_next_episode_aired can answer from it without another request.
+    
+    Args:
+        trakt_show_id (str): The Trakt ID of the show
+    
+    Returns:
+        Optional[Dict[int, dict]]: Season details by season number, None if the request failed
+    """
+    if not trakt_show_id or not isinstance(trakt_show_id, str):
+        logger.error(f"Invalid trakt_show_id provided: {trakt_show_id}")
+        return None
+
+    url = f"https://api.trakt.tv/shows/{trakt_show_id}/seasons?extended=full,episodes"
+    headers = {
+        "Content-type": "application/json",
+        "trakt-api-key": TRAKT_API_KEY,
+        "trakt-api-version": "2"
+    }
+
+    try:
+        logger.info(f"Fetching all seasons for show ID {trakt_show_id}")
+        response = trakt_cache.get(url, headers, endpoint="seasons", item_id=trakt_show_id,
+                                   extended="full,episodes", data_class="aired_episodes")
+
+        if response.status_code == 200 and isinstance(response.json(), list):
+            seasons = {
+                season['number']: season
+                for season in response.json()
+                if isinstance(season, dict) and isinstance(season.get('number'), int)
+            }
+            logger.info(f"Fetched {len(seasons)} season(s) for show ID {trakt_show_id} in one request")
+            return seasons
+        else:
+            logger.error(f"Trakt API seasons request failed with status code {response.status_code}")
+            return None
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Error fetching seasons from Trakt API for show ID {trakt_show_id}: {e}")
+        return None
+
+def _has_episode_aired(episode_data: dict, trakt_show_id: str, season_number: int, episode_number: int) -> bool:
+    """Whether an episode's first_aired time has passed"""
+    first_aired = episode_data.get('first_aired')
+    if not first_aired:
+        logger.warning(f"Episode {episode_number} missing 'first_aired' field for show ID {trakt_show_id}, season {season_number}")
+        return False
+    try:
+        first_aired_datetime = datetime.fromisoformat(first_aired.replace('Z', '+00:00'))
+    except ValueError as e:
+        logger.error(f"Invalid first_aired format for episode {episode_number}: {e}")
+        return False
+    if datetime.now(timezone.utc) >= first_aired_datetime:
+        logger.info(f"Episode {episode_number} has aired for show ID {trakt_show_id}, season {season_number}")
+        return True
+    logger.info(f"Episode {episode_number} has not aired yet for show ID {trakt_show_id}, season {season_number}")
+    return False
+
+def check_next_episode_aired(trakt_show_id: str, season_number: int, current_aired_episodes: int,
+                             season_details: Optional[dict] = None) -> Tuple[bool, Optional[dict]]:
     """
     Check if the next episode (current_aired_episodes + 1) has aired for a given show and season.
     
@@ -378,14 +406,14 @@ def check_next_episode_aired(trakt_show_id: str, season_number: int, current_air
         trakt_show_id (str): The Trakt ID of the show
         season_number (int): The season number to check
         current_aired_episodes (int): The current number of aired episodes in the season
+        season_details (dict, optional): The season from get_all_seasons_from_trakt; its episode
+            list answers the check without a request
     
     Returns:
         tuple[bool, Optional[dict]]: (has_aired, episode_details)
             - has_aired: True if the next episode has aired, False otherwise
             - episode_details: Episode details if the episode exists, None otherwise
     """
-    global trakt_api_calls, last_reset_time
-
     # Starting check_next_episode_aired
 
     # Validate input parameters
@@ -399,22 +427,16 @@ def check_next_episode_aired(trakt_show_id: str, season_number: int, current_air
         logger.error(f"Invalid current_aired_episodes provided: {current_aired_episodes}")
         return False, None
 
-    current_time = time.time()
-
-    if current_time - last_reset_time >= TRAKT_RATE_LIMIT_PERIOD:
-        # Rate limit period expired, resetting API call counter
-        trakt_api_calls = 0
-        last_reset_time = current_time
+    next_episode_number = current_aired_episodes + 1
 
-    if trakt_api_calls >= TRAKT_RATE_LIMIT:
-        wait_time = TRAKT_RATE_LIMIT_PERIOD - (current_time - last_reset_time)
-        logger.warning(f"Trakt API rate limit reached. Sleeping for {wait_time} seconds.")
-        time.sleep(wait_time)
-        trakt_api_calls = 0
-        last_reset_time = time.time()
-        # Woke up from sleep, reset API call counter
+    # The bulk season fetch already lists every episode with its air date
+    if season_details and isinstance(season_details.get('episodes'), list):
+        for episode_data in season_details['episodes']:
+            if isinstance(episode_data, dict) and episode_data.get('number') == next_episode_number:
+                return _has_episode_aired(episode_data, trakt_show_id, season_number, next_episode_number), episode_data
+        logger.info(f"Episode {next_episode_number} does not exist yet for show ID {trakt_show_id}, season {season_number}")
+        return False, None
 
-    next_episode_number = current_aired_episodes + 1
     url = f"https://api.trakt.tv/shows/{trakt_show_id}/seasons/{season_number}/episodes/{next_episode_number}?extended=full"
     headers = {
         "Content-type": "application/json",
@@ -426,35 +448,14 @@ def check_next_episode_aired(trakt_show_id: str, season_number: int, current_air
 
     try:
         logger.info(f"Fetching next episode details for show ID {trakt_show_id}, season {season_number}, episode {next_episode_number}")
-        response = requests.get(url, headers=headers, timeout=10)
-        trakt_api_calls += 1
+        response = trakt_cache.get(url, headers, endpoint="episodes",
+                                   item_id=f"{trakt_show_id}/{season_number}/{next_episode_number}",
+                                   extended="full", data_class="episode")
         # Received response from Trakt API
 
         if response.status_code == 200:
             episode_data = response.json()
-            # Next episode data received
-
-            first_aired = episode_data.get('first_aired')
-            # Next episode first_aired data
-
-            if first_aired:
-                try:
-                    first_aired_datetime = datetime.fromisoformat(first_aired.replace('Z', '+00:00'))
-                    current_utc_time = datetime.now(timezone.utc)
-                    # Parsed first_aired_datetime and current_utc_time
-
-                    if current_utc_time >= first_aired_datetime:
-                        logger.info(f"Episode {next_episode_number} has aired for show ID {trakt_show_id}, season {season_number}")
-                        return True, episode_data
-                    else:
-                        logger.info(f"Episode {next_episode_number} has not aired yet for show ID {trakt_show_id}, season {season_number}")
-                        return False, episode_data
-                except ValueError as e:
-                    logger.error(f"Invalid first_aired format for episode {next_episode_number}: {e}")
-                    return False, episode_data
-            else:
-                logger.warning(f"Episode {next_episode_number} missing 'first_aired' field for show ID {trakt_show_id}, season {season_number}")
-                return False, episode_data
+            return _has_episode_aired(episode_data, trakt_show_id, season_number, next_episode_number), episode_data
 
         elif response.status_code == 404:
             logger.info(f"Episode {next_episode_number} does not exist yet for show ID {trakt_show_id}, season {season_number}")
@@ -613,7 +614,7 @@ def get_media_details_from_database(tmdb_id: str) -> Optional[dict]:
         if 'db' in locals():
             db.close()
 
-def track_trakt_api_usage(api_endpoint: str, success: bool, response_time: float = None) -> bool:
+def track_trakt_api_usage(api_endpoint: str, success: bool, response_time: float = None, from_cache: bool = False) -> bool:
     """
     Track Trakt API usage in the database
     
@@ -621,6 +622,7 @@ def track_trakt_api_usage(api_endpoint: str, success: bool, response_time: float
         api_endpoint (str): API endpoint called
         success (bool): Whether the API call was successful
         response_time (float): Response time in seconds
+        from_cache (bool): Whether the response came from the trakt_cache table
         
     Returns:
         bool: True if successfully tracked, False otherwise
@@ -629,9 +631,12 @@ def track_trakt_api_usage(api_endpoint: str, success: bool, response_time: float
         return False
     
     try:
-        # Log the API usage
+        # Log the API usage, with the share of lookups the cache answered
+        hit_ratio = trakt_cache.hit_ratio()
+        cache_note = f", cache hit ratio: {hit_ratio:.0%}" if hit_ratio is not None else ""
         if success:
-            log_success("Trakt API", f"API call to {api_endpoint} successful (response time: {response_time}s)")
+            source = "served from cache" if from_cache else "successful"
+            log_success("Trakt API", f"API call to {api_endpoint} {source} (response time: {response_time}s{cache_note})")
         else:
             log_error("Trakt API", f"API call to {api_endpoint} failed")
         
@@ -648,19 +653,7 @@ def get_trakt_rate_limit_status() -> dict:
     Returns:
         dict: Rate limit status information
     """
-    global trakt_api_calls, last_reset_time
-    
-    current_time = time.time()
-    time_until_reset = TRAKT_RATE_LIMIT_PERIOD - (current_time - last_reset_time)
-    calls_remaining = TRAKT_RATE_LIMIT - trakt_api_calls
-    
-    status = {
-        'calls_made': trakt_api_calls,
-        'calls_remaining': max(0, calls_remaining),
-        'rate_limit': TRAKT_RATE_LIMIT,
-        'time_until_reset': max(0, time_until_reset),
-        'rate_limit_period': TRAKT_RATE_LIMIT_PERIOD
-    }
+    status = trakt_client.get_rate_limit_status()
     
     log_info("Trakt Rate Limit", f"Rate limit status: {status}")
-    return status 
\ No newline at end of file
+    return status
\ No newline at end of file
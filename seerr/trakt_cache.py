@@ -0,0 +1,248 @@
+"""
+Trakt cache module for SeerrBridge
+Stores Trakt API responses in the trakt_cache table, keyed by (endpoint, id, extended), with a
+time-to-live per kind of data, and revalidates expired entries with conditional requests
+"""
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, NamedTuple, Optional
+
+import requests
+from loguru import logger
+
+from seerr.config import USE_DATABASE
+from seerr.database import get_db, TraktCache
+from seerr.task_config_manager import task_config
+from seerr.trakt_client import trakt_client
+
+# How long each kind of Trakt data is used without asking Trakt again
+DATA_CLASS_TTLS = {
+    # TMDB ID -> Trakt ID lookups never change
+    'search': timedelta(days=30),
+    # Titles, overviews, genres and images of shows and movies change rarely
+    'metadata': timedelta(days=7),
+    # Season info carries aired_episodes, which changes whenever an episode airs
+    'aired_episodes': timedelta(hours=1),
+    # Single episodes: first_aired, or a 404 while the episode is not listed yet
+    'episode': timedelta(hours=1),
+}
+
+# Responses worth keeping: 404 means "not listed (yet)" for seasons and episodes
+CACHEABLE_STATUS_CODES = (200, 404)
+
+# "Nothing found" answers (a 404, or an empty search result for a title Trakt has not
+# indexed yet) are kept at most this long, whatever their data class
+NEGATIVE_RESULT_TTL = timedelta(hours=1)
+
+
+class TraktResponse(NamedTuple):
+    """A Trakt response, from the network or from the cache"""
+    status_code: int
+    data: Any
+    from_cache: bool
+
+    def json(self) -> Any:
+        return self.data
+
+
+def _cache_key(endpoint: str, item_id: str, extended: str) -> str:
+    return hashlib.sha256(f"{endpoint}|{item_id}|{extended}".encode('utf-8')).hexdigest()
+
+
+def _ttl(data_class: str, status_code: int, payload: Any) -> timedelta:
+    """How long a response is kept: its data class TTL, capped for "nothing found" answers"""
+    ttl = DATA_CLASS_TTLS[data_class]
+    if status_code != 200 or not payload:
+        return min(ttl, NEGATIVE_RESULT_TTL)
+    return ttl
+
+
+class TraktResponseCache:
+    """
+    Read-through cache in front of the shared Trakt client.
+
+    A fresh entry is returned without a request. An expired entry that came with an ETag or
+    Last-Modified header is revalidated with If-None-Match / If-Modified-Since; a 304 only
+    extends its lifetime. If Trakt cannot be reached, an expired entry is served rather than
+    failing the caller. Without a database every call goes to Trakt.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+        # Counters reported by get_stats()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.stale_served = 0
+        self.stores = 0
+
+    def is_enabled(self) -> bool:
+        """Check whether the Trakt cache is enabled in the task configuration"""
+        if not USE_DATABASE:
+            return False
+        value = task_config.get_config('trakt_cache_enabled', True)
+        if isinstance(value, str):
+            return value.strip().lower() in ('true', '1', 'yes', 'on')
+        return bool(value)
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read an entry of the trakt_cache table as a plain dict"""
+        db = None
+        try:
+            db = get_db()
+            entry = db.query(TraktCache).filter(TraktCache.cache_key == key).first()
+            if entry is None:
+                return None
+            return {
+                "status_code": entry.status_code,
+                "payload": entry.payload,
+                "etag": entry.etag,
+                "last_modified": entry.last_modified,
+                "expires_at": entry.expires_at
+            }
+        except Exception as e:
+            logger.debug(f"Could not read Trakt cache entry {key}: {e}")
+            return None
+        finally:
+            if db:
+                db.close()
+
+    def _store(self, key: str, endpoint: str, item_id: str, extended: str, data_class: str,
+               status_code: int, payload: Any, etag: Optional[str], last_modified: Optional[str]):
+        """Insert or refresh an entry of the trakt_cache table"""
+        db = None
+        try:
+            db = get_db()
+            now = datetime.utcnow()
+            entry = db.query(TraktCache).filter(TraktCache.cache_key == key).first()
+            if entry is None:
+                entry = TraktCache(cache_key=key, endpoint=endpoint[:100], item_id=item_id[:100],
+                                   extended=extended[:50])
+                db.add(entry)
+            entry.data_class = data_class
+            entry.status_code = status_code
+            entry.payload = payload
+            entry.etag = (etag or '')[:200] or None
+            entry.last_modified = (last_modified or '')[:100] or None
+            entry.fetched_at = now
+            entry.expires_at = now + _ttl(data_class, status_code, payload)
+            db.commit()
+            self._count('stores')
+        except Exception as e:
+            logger.debug(f"Could not store Trakt cache entry for {endpoint} {item_id}: {e}")
+            if db:
+                db.rollback()
+        finally:
+            if db:
+                db.close()
+
+    def _extend(self, key: str, ttl: timedelta):
+        """Give an entry Trakt confirmed unchanged (304) a new lifetime"""
+        db = None
+        try:
+            db = get_db()
+            entry = db.query(TraktCache).filter(TraktCache.cache_key == key).first()
+            if entry is not None:
+                now = datetime.utcnow()
+                entry.fetched_at = now
+                entry.expires_at = now + ttl
+                db.commit()
+        except Exception as e:
+            logger.debug(f"Could not extend Trakt cache entry {key}: {e}")
+            if db:
+                db.rollback()
+        finally:
+            if db:
+                db.close()
+
+    def get(self, url: str, headers: Dict[str, str], endpoint: str, item_id: Any, extended: str = '',
+            data_class: str = 'metadata', timeout: float = 10) -> TraktResponse:
+        """
+        GET a Trakt URL, answering from the trakt_cache table when possible.
+
+        Args:
+            url (str): Full Trakt API URL
+            headers (dict): Request headers (API key and version)
+            endpoint (str): Endpoint part of the cache key, e.g. "shows" or "seasons/info"
+            item_id: ID part of the cache key, e.g. the Trakt ID or "<show>/<season>"
+            extended (str): Extended-info level part of the cache key, e.g. "full"
+            data_class (str): Key of DATA_CLASS_TTLS deciding how long the response is kept
+            timeout (float): Request timeout in seconds
+
+        Returns:
+            TraktResponse: Status code and decoded JSON body (None unless 200)
+
+        Raises:
+            requests.exceptions.RequestException: When Trakt cannot be reached and nothing is cached
+        """
+        if not self.is_enabled():
+            response = trakt_client.get(url, headers=headers, timeout=timeout)
+            return TraktResponse(response.status_code,
+                                 response.json() if response.status_code == 200 else None, False)
+
+        item_id = str(item_id)
+        key = _cache_key(endpoint, item_id, extended)
+        cached = self._load(key)
+        if cached is not None and cached["expires_at"] > datetime.utcnow():
+            self._count('hits')
+            return TraktResponse(cached["status_code"], cached["payload"], True)
+
+        request_headers = dict(headers)
+        if cached is not None and cached["status_code"] == 200:
+            if cached["etag"]:
+                request_headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                request_headers["If-Modified-Since"] = cached["last_modified"]
+
+        try:
+            response = trakt_client.get(url, headers=request_headers, timeout=timeout)
+        except requests.exceptions.RequestException as e:
+            if cached is None:
+                raise
+            self._count('stale_served')
+            logger.warning(f"Trakt request for {endpoint} {item_id} failed ({e}); using the expired cached response.")
+            return TraktResponse(cached["status_code"], cached["payload"], True)
+
+        if response.status_code == 304 and cached is not None:
+            self._count('revalidated')
+            self._extend(key, _ttl(data_class, cached["status_code"], cached["payload"]))
+            return TraktResponse(cached["status_code"], cached["payload"], True)
+
+        self._count('misses')
+        data = response.json() if response.status_code == 200 else None
+        if response.status_code in CACHEABLE_STATUS_CODES:
+            self._store(key, endpoint, item_id, extended, data_class, response.status_code, data,
+                        response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return TraktResponse(response.status_code, data, False)
+
+    def hit_ratio(self) -> Optional[float]:
+        """Share of lookups answered without downloading a response (fresh hits and 304s)"""
+        with self._lock:
+            served = self.hits + self.revalidated + self.stale_served
+            lookups = served + self.misses
+        return round(served / lookups, 3) if lookups else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache counters for status endpoints"""
+        enabled = self.is_enabled()
+        with self._lock:
+            stats = {
+                "enabled": enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidated": self.revalidated,
+                "stale_served": self.stale_served,
+                "stores": self.stores
+            }
+        stats["hit_ratio"] = self.hit_ratio()
+        return stats
+
+
+# Global instance
+trakt_cache = TraktResponseCache()
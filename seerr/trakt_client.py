@@ -0,0 +1,269 @@
+"""
+Trakt client module for SeerrBridge
+Pooled HTTP session for the Trakt API with a shared token bucket, Retry-After handling
+on 429 responses and coalescing of identical in-flight requests
+"""
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from loguru import logger
+
+# Trakt API rate limit: 1000 calls every 5 minutes
+TRAKT_RATE_LIMIT = 1000
+TRAKT_RATE_LIMIT_PERIOD = 5 * 60  # 5 minutes in seconds
+
+# Connections kept open to api.trakt.tv (callers run on several worker threads)
+POOL_MAXSIZE = 10
+
+# A call that cannot get a token within this long fails instead of blocking its thread
+MAX_TOKEN_WAIT_SECONDS = 30
+
+# Retries of a request answered with 429, each after the Retry-After it was given
+MAX_RATE_LIMIT_RETRIES = 2
+
+# Used when a 429 response carries no usable Retry-After header
+DEFAULT_RETRY_AFTER_SECONDS = 10
+
+
+class TraktRateLimitError(requests.exceptions.RequestException):
+    """No request budget is available within MAX_TOKEN_WAIT_SECONDS"""
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: capacity tokens, refilled continuously at capacity/period per
+    second, so callers may burst up to the capacity and then run at the sustained rate.
+    """
+
+    def __init__(self, capacity: int, period_seconds: float):
+        self.capacity = float(capacity)
+        self.rate = capacity / period_seconds
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        # _updated lies in the future while paused; refilling starts when the pause ends
+        if now <= self._updated:
+            return
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, max_wait: float) -> Tuple[bool, float]:
+        """
+        Take one token, waiting for a refill or the end of a pause if needed.
+
+        Args:
+            max_wait (float): Seconds to wait at most
+
+        Returns:
+            Tuple[bool, float]: (a token was taken, seconds waited)
+        """
+        started = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return True, now - started
+                else:
+                    wait = (1 - self._tokens) / self.rate
+            if now - started + wait > max_wait:
+                return False, now - started
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hand out no tokens for the next seconds and start refilling from empty afterwards"""
+        with self._lock:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = 0.0
+            self._updated = self._paused_until
+
+    def get_state(self) -> Dict[str, float]:
+        """Tokens left and seconds until the bucket is full again"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            paused_for = max(0.0, self._paused_until - now)
+            return {
+                "tokens": self._tokens,
+                "paused_for": paused_for,
+                "seconds_until_full": paused_for + (self.capacity - self._tokens) / self.rate
+            }
+
+
+class _InFlight:
+    """A request other callers can wait for instead of sending it again"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response: Optional[requests.Response] = None
+        self.error: Optional[BaseException] = None
+
+
+def _retry_after_seconds(response: requests.Response) -> float:
+    """Seconds a 429 response asks us to wait (Retry-After is either seconds or an HTTP date)"""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return DEFAULT_RETRY_AFTER_SECONDS
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER_SECONDS
+
+
+class TraktClient:
+    """
+    Shared client for the Trakt API.
+
+    All calls share one pooled session and one token bucket sized to the 1000 calls per
+    5 minutes limit. A call waits at most MAX_TOKEN_WAIT_SECONDS for budget and otherwise
+    raises TraktRateLimitError. A 429 pauses the bucket for its Retry-After. Identical GETs
+    in flight at the same time share one response.
+
+    get() blocks while it waits, so async code must call it (and every Trakt helper built on
+    it) through run_io, never directly on the event loop.
+    """
+
+    def __init__(self, rate_limit: int = TRAKT_RATE_LIMIT, period_seconds: float = TRAKT_RATE_LIMIT_PERIOD):
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE))
+        self.bucket = TokenBucket(rate_limit, period_seconds)
+        self._in_flight: Dict[Tuple, _InFlight] = {}
+        self._lock = threading.Lock()
+
+        # Counters reported by get_stats()
+        self.requests = 0
+        self.coalesced = 0
+        self.rate_limited = 0
+        self.budget_exhausted = 0
+        self.throttled_seconds = 0.0
+
+    def get(self, url: str, headers: Dict[str, str] = None, params: Dict[str, Any] = None,
+            timeout: float = 10) -> requests.Response:
+        """
+        GET a Trakt URL through the shared session and rate limiter.
+
+        Args:
+            url (str): Full Trakt API URL
+            headers (dict, optional): Request headers (API key and version)
+            params (dict, optional): Query parameters
+            timeout (float): Request timeout in seconds
+
+        Returns:
+            requests.Response: The response; shared with any caller that asked for the same URL meanwhile
+
+        Raises:
+            requests.exceptions.RequestException: On connection errors, or TraktRateLimitError
+                when no budget frees up in time
+        """
+        key = (url, tuple(sorted((params or {}).items())), tuple(sorted((headers or {}).items())))
+        with self._lock:
+            in_flight = self._in_flight.get(key)
+            leader = in_flight is None
+            if leader:
+                in_flight = self._in_flight[key] = _InFlight()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            # The leader gives up within its own budget wait, retries and timeouts; never wait longer
+            if not in_flight.done.wait(self._max_call_seconds(timeout)):
+                raise requests.exceptions.Timeout(f"Timed out waiting for the in-flight Trakt request for {url}")
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.response
+
+        try:
+            in_flight.response = self._send(url, headers, params, timeout)
+            return in_flight.response
+        except BaseException as e:
+            in_flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            in_flight.done.set()
+
+    @staticmethod
+    def _max_call_seconds(timeout: float) -> float:
+        """Longest a single get() can take: token waits and request timeouts of every attempt"""
+        return (MAX_RATE_LIMIT_RETRIES + 1) * (MAX_TOKEN_WAIT_SECONDS + timeout)
+
+    def _send(self, url: str, headers: Optional[Dict[str, str]], params: Optional[Dict[str, Any]],
+              timeout: float) -> requests.Response:
+        """Send one request, waiting for budget and retrying after 429 responses"""
+        attempt = 0
+        while True:
+            acquired, waited = self.bucket.acquire(MAX_TOKEN_WAIT_SECONDS)
+            with self._lock:
+                self.throttled_seconds += waited
+                if not acquired:
+                    self.budget_exhausted += 1
+            if not acquired:
+                raise TraktRateLimitError(f"Trakt API rate limit budget exhausted; not requesting {url}")
+
+            response = self._session.get(url, headers=headers, params=params, timeout=timeout)
+            with self._lock:
+                self.requests += 1
+            if response.status_code != 429:
+                return response
+
+            retry_after = _retry_after_seconds(response)
+            self.bucket.pause(retry_after)
+            with self._lock:
+                self.rate_limited += 1
+            if attempt >= MAX_RATE_LIMIT_RETRIES or retry_after > MAX_TOKEN_WAIT_SECONDS:
+                logger.warning(f"Trakt API rate limit hit; pausing Trakt requests for {retry_after:.0f}s.")
+                return response
+            attempt += 1
+            logger.warning(f"Trakt API rate limit hit. Retrying in {retry_after:.0f} seconds...")
+
+    def get_rate_limit_status(self) -> Dict[str, Any]:
+        """
+        Budget left in the shared token bucket.
+
+        Returns:
+            dict: Calls made and remaining within the rolling window and seconds until it is full again
+        """
+        state = self.bucket.get_state()
+        tokens = int(state["tokens"])
+        return {
+            'calls_made': int(self.bucket.capacity) - tokens,
+            'calls_remaining': tokens,
+            'rate_limit': int(self.bucket.capacity),
+            'time_until_reset': round(state["seconds_until_full"], 1),
+            'rate_limit_period': TRAKT_RATE_LIMIT_PERIOD,
+            'paused_for': round(state["paused_for"], 1)
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Client counters for status endpoints"""
+        with self._lock:
+            stats = {
+                "requests": self.requests,
+                "coalesced": self.coalesced,
+                "rate_limited": self.rate_limited,
+                "budget_exhausted": self.budget_exhausted,
+                "throttled_seconds": round(self.throttled_seconds, 1),
+                "in_flight": len(self._in_flight)
+            }
+        stats["rate_limit"] = self.get_rate_limit_status()
+        return stats
+
+
+# Global instance
+trakt_client = TraktClient()
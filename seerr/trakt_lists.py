@@ -9,6 +9,7 @@ from loguru import logger
 
 from seerr.config import TRAKT_API_KEY
 from seerr.trakt import get_trakt_rate_limit_status
+from seerr.trakt_client import trakt_client, TraktRateLimitError
 
 # Trakt API configuration
 TRAKT_BASE_URL = "https://api.trakt.tv"
@@ -310,15 +311,8 @@ def search_trakt_by_imdb_id(imdb_id: str) -> Optional[Dict[str, Any]]:
         logger.info(f"Searching Trakt by IMDB ID: {imdb_id}")
         url = f"{TRAKT_BASE_URL}/search/imdb/{imdb_id}"
         
-        response = requests.get(url, headers=get_trakt_headers(), timeout=30)
-        
-        # Handle rate limiting
-        if response.status_code == 429:
-            retry_after = int(response.headers.get('Retry-After', 10))
-            logger.warning(f"Trakt API rate limit hit. Waiting {retry_after} seconds...")
-            import time
-            time.sleep(retry_after)
-            response = requests.get(url, headers=get_trakt_headers(), timeout=30)
+        # Rate limiting and Retry-After are handled by the shared Trakt client
+        response = trakt_client.get(url, headers=get_trakt_headers(), timeout=30)
         
         response.raise_for_status()
         results = response.json()
@@ -402,15 +396,8 @@ def search_trakt_by_title(title: str, year: Optional[int], media_type: str) -> O
         url = f"{TRAKT_BASE_URL}/search/{trakt_type}"
         params = {"query": title}
         
-        response = requests.get(url, headers=get_trakt_headers(), params=params, timeout=30)
-        
-        # Handle rate limiting
-        if response.status_code == 429:
-            retry_after = int(response.headers.get('Retry-After', 10))
-            logger.warning(f"Trakt API rate limit hit. Waiting {retry_after} seconds...")
-            import time
-            time.sleep(retry_after)
-            response = requests.get(url, headers=get_trakt_headers(), params=params, timeout=30)
+        # Rate limiting and Retry-After are handled by the shared Trakt client
+        response = trakt_client.get(url, headers=get_trakt_headers(), params=params, timeout=30)
         
         response.raise_for_status()
         results = response.json()
@@ -531,10 +518,10 @@ def fetch_trakt_list(list_id: str, limit: Optional[int] = None) -> List[Dict[str
             if is_special_list and limit:
                 # Special lists support pagination
                 params = {"limit": min(limit, 100), "page": 1}
-                response = requests.get(url, headers=get_trakt_headers(), params=params, timeout=30)
+                response = trakt_client.get(url, headers=get_trakt_headers(), params=params, timeout=30)
             else:
                 # Regular lists and watchlists
-                response = requests.get(url, headers=get_trakt_headers(), timeout=30)
+                response = trakt_client.get(url, headers=get_trakt_headers(), timeout=30)
             
             response.raise_for_status()
             items = response.json()
@@ -581,6 +568,9 @@ def fetch_trakt_list(list_id: str, limit: Optional[int] = None) -> List[Dict[str
         except requests.exceptions.ConnectionError:
             logger.error(f"Connection error while fetching Trakt list: {list_id}")
             raise ValueError(f"Connection error while fetching Trakt list. Please check your internet connection.")
+        except TraktRateLimitError:
+            logger.warning(f"Trakt API rate limit budget exhausted while fetching Trakt list: {list_id}")
+            raise ValueError("Trakt API rate limit reached. Please try again in a few minutes.")
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
                 logger.error(f"Trakt list not found: {list_id}")
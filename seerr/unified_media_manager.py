@@ -11,6 +11,7 @@ from seerr.database import get_db
 from seerr.unified_models import UnifiedMedia
 from seerr.db_logger import log_info, log_success, log_error, log_warning
 from seerr.enhanced_season_manager import EnhancedSeasonManager
+from seerr.queue_state_cache import queue_state_cache
 
 def create_notification(type: str, title: str, message: str, media_id: Optional[int] = None, 
                         media_type: Optional[str] = None, media_title: Optional[str] = None,
@@ -808,6 +809,8 @@ def update_media_processing_status(media_id: int, status: str, processing_stage:
             pass
         
         db.commit()
+        queue_state_cache.update(media.tmdb_id, media.media_type, status=media.status,
+                                 processing_stage=media.processing_stage, last_checked_at=media.last_checked_at)
         
         log_info("Media Update", f"Updated media {media.title} (ID: {media_id}) status to {status}")
         
@@ -1004,6 +1007,10 @@ def update_tv_subscription(tmdb_id: int, season_number: int, episode_count: int
         
         db.commit()
         
+        # Check the show on the next subscription run instead of at its scheduled time
+        from seerr.air_date_scheduler import air_date_scheduler
+        air_date_scheduler.forget(media.id)
+        
         log_info("TV Subscription", f"Updated subscription for {media.title} Season {season_number}")
         return True
         
@@ -1285,6 +1292,12 @@ def update_tv_show_season_count(tmdb_id: int, requested_seasons: List[int], titl
             log_info("Season Count Update", f"No new seasons to add for {title} (current seasons: {sorted(current_season_numbers)})")
             return True
         
+        # Episode counts of every season come from one Trakt call instead of one per season
+        all_seasons = None
+        if tv_show.trakt_id:
+            from seerr.trakt import get_all_seasons_from_trakt, check_next_episode_aired
+            all_seasons = get_all_seasons_from_trakt(str(tv_show.trakt_id))
+        
         # Add new seasons to the seasons_data JSON array
         for season_num in new_seasons:
             new_season_data = {
@@ -1297,6 +1310,20 @@ def update_tv_show_season_count(tmdb_id: int, requested_seasons: List[int], titl
                 'last_checked': None,
                 'updated_at': datetime.utcnow().isoformat()
             }
+            season_details = all_seasons.get(season_num) if all_seasons else None
+            if season_details:
+                episode_count = season_details.get('episode_count', 0)
+                aired_episodes = season_details.get('aired_episodes', 0)
+                if episode_count != aired_episodes:
+                    has_aired, _ = check_next_episode_aired(str(tv_show.trakt_id), season_num, aired_episodes, season_details)
+                    if has_aired:
+                        aired_episodes += 1
+                new_season_data.update({
+                    'episode_count': episode_count,
+                    'aired_episodes': aired_episodes,
+                    'unprocessed_episodes': [f"E{str(i).zfill(2)}" for i in range(1, aired_episodes + 1)],
+                    'last_checked': datetime.utcnow().isoformat()
+                })
             current_seasons_data.append(new_season_data)
             log_info("Season Count Update", f"Added Season {season_num} for {title}")
         
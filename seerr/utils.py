@@ -1,14 +1,19 @@
 """
 Utility functions for SeerrBridge
 """
+import hashlib
 import re
+import threading
+import unicodedata
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
 import inflect
 from loguru import logger
 from fuzzywuzzy import fuzz
 from deep_translator import GoogleTranslator
 from datetime import datetime, timedelta
 from seerr.config import USE_DATABASE
-from seerr.database import get_db, LogEntry
+from seerr.database import get_db, LogEntry, TranslationCache
 from seerr.db_logger import log_info, log_success, log_error
 
 
@@ -19,19 +24,223 @@ p = inflect.engine()
 START_TIME = datetime.now()
 
 
+# Letters that Unicode decomposition does not reduce to ASCII
+LATIN_TRANSLITERATIONS = str.maketrans({
+    'ß': 'ss', 'ẞ': 'SS', 'æ': 'ae', 'Æ': 'AE', 'œ': 'oe', 'Œ': 'OE',
+    'ø': 'o', 'Ø': 'O', 'đ': 'd', 'Đ': 'D', 'ð': 'd', 'Ð': 'D', 'þ': 'th', 'Þ': 'Th',
+    'ł': 'l', 'Ł': 'L', 'ı': 'i', 'ħ': 'h', 'Ħ': 'H',
+    '‘': "'", '’': "'", '‚': "'", '“': '"', '”': '"', '„': '"',
+    '…': '...', '—': '-', '–': '-', '‐': '-', '−': '-', ' ': ' ',
+})
+
+# Used when a non-Latin title cannot be translated, so it still matches romanized release names
+NON_LATIN_TRANSLITERATIONS = str.maketrans({
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'e', 'ж': 'zh',
+    'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm', 'н': 'n', 'о': 'o',
+    'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u', 'ф': 'f', 'х': 'kh', 'ц': 'ts',
+    'ч': 'ch', 'ш': 'sh', 'щ': 'shch', 'ъ': '', 'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu',
+    'я': 'ya', 'і': 'i', 'ї': 'yi', 'є': 'ye', 'ґ': 'g',
+    'α': 'a', 'β': 'v', 'γ': 'g', 'δ': 'd', 'ε': 'e', 'ζ': 'z', 'η': 'i', 'θ': 'th',
+    'ι': 'i', 'κ': 'k', 'λ': 'l', 'μ': 'm', 'ν': 'n', 'ξ': 'x', 'ο': 'o', 'π': 'p',
+    'ρ': 'r', 'σ': 's', 'ς': 's', 'τ': 't', 'υ': 'y', 'φ': 'f', 'χ': 'ch', 'ψ': 'ps',
+    'ω': 'o',
+})
+
+# Translations already looked up in this process (bounded, cleared when full)
+TRANSLATION_MEMORY_SIZE = 8192
+_translation_memory = {}
+_translation_lock = threading.Lock()
+_translation_stats = {"ascii_skips": 0, "memory_hits": 0, "db_hits": 0, "translated": 0, "failed": 0}
+
+
+def fold_title(title):
+    """
+    Reduce a title to plain ASCII where this can be done offline.
+    Accents are stripped (Amélie -> Amelie) and Latin ligatures and special letters
+    transliterated (Straße -> Strasse); characters of other scripts are kept.
+    
+    Args:
+        title (str): Title to fold
+        
+    Returns:
+        str: The folded title
+    """
+    if title.isascii():
+        return title
+    decomposed = unicodedata.normalize('NFKD', title.translate(LATIN_TRANSLITERATIONS))
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def transliterate_title(title):
+    """
+    Romanize Cyrillic and Greek letters of a title (Брат -> Brat), then fold it.
+    
+    Args:
+        title (str): Title to romanize
+        
+    Returns:
+        str: The transliterated title
+    """
+    # Mapped before folding (й is not и), and again after it for accented letters (ά -> α)
+    return _romanize(fold_title(_romanize(title)))
+
+
+def _romanize(title):
+    return ''.join(
+        char.translate(NON_LATIN_TRANSLITERATIONS) if char.lower() == char
+        else char.lower().translate(NON_LATIN_TRANSLITERATIONS).capitalize()
+        for char in title
+    )
+
+
+@lru_cache(maxsize=16)
+def _get_translator(target_lang):
+    """One GoogleTranslator per target language, reused for every translation"""
+    return GoogleTranslator(source='auto', target=target_lang)
+
+
+def _get_translation_cache_ttl():
+    """How long stored translations are trusted, from the task configuration"""
+    from seerr.task_config_manager import task_config
+    try:
+        return timedelta(days=int(task_config.get_config('translation_cache_ttl_days', 90)))
+    except (TypeError, ValueError):
+        return timedelta(days=90)
+
+
+def _translation_cache_key(text, target_lang):
+    return hashlib.sha256(f"{target_lang}:{text}".encode('utf-8')).hexdigest()
+
+
+def _load_cached_translation(text, target_lang):
+    """Get an unexpired translation from the translation_cache table"""
+    if not USE_DATABASE:
+        return None
+    db = None
+    try:
+        db = get_db()
+        entry = db.query(TranslationCache).filter(
+            TranslationCache.source_hash == _translation_cache_key(text, target_lang)
+        ).first()
+        if entry and entry.expires_at > datetime.utcnow():
+            return entry.translated_text
+    except Exception as e:
+        logger.debug(f"Could not read translation cache for '{text}': {e}")
+    finally:
+        if db:
+            db.close()
+    return None
+
+
+def _store_cached_translation(text, target_lang, translated_text):
+    """Save a translation to the translation_cache table"""
+    if not USE_DATABASE:
+        return
+    db = None
+    try:
+        db = get_db()
+        source_hash = _translation_cache_key(text, target_lang)
+        now = datetime.utcnow()
+        entry = db.query(TranslationCache).filter(TranslationCache.source_hash == source_hash).first()
+        if entry is None:
+            entry = TranslationCache(source_hash=source_hash, source_text=text[:500], target_lang=target_lang)
+            db.add(entry)
+        entry.translated_text = translated_text[:500]
+        entry.created_at = now
+        entry.expires_at = now + _get_translation_cache_ttl()
+        db.commit()
+    except Exception as e:
+        logger.debug(f"Could not store translation of '{text}': {e}")
+        if db:
+            db.rollback()
+    finally:
+        if db:
+            db.close()
+
+
+def _remember_translation(key, translated_title):
+    with _translation_lock:
+        if len(_translation_memory) >= TRANSLATION_MEMORY_SIZE:
+            _translation_memory.clear()
+        _translation_memory[key] = translated_title
+
+
 def translate_title(title, target_lang='en'):
     """
     Detects the language of the input title and translates it to the target language.
+    Titles that fold to ASCII are returned without translating; others are looked up in
+    memory, then in the translation_cache table, and only then sent to Google Translate.
     """
+    folded_title = fold_title(title)
+    if folded_title.isascii():
+        _translation_stats["ascii_skips"] += 1
+        return folded_title
+
+    # The original text is translated: stripping marks from non-Latin letters changes words
+    key = (title, target_lang)
+    translated_title = _translation_memory.get(key)
+    if translated_title is not None:
+        _translation_stats["memory_hits"] += 1
+        return translated_title
+
+    translated_title = _load_cached_translation(title, target_lang)
+    if translated_title is not None:
+        _translation_stats["db_hits"] += 1
+        _remember_translation(key, translated_title)
+        return translated_title
+
     try:
-        translator = GoogleTranslator(source='auto', target=target_lang)
-        translated_title = translator.translate(title)
+        translated_title = _get_translator(target_lang).translate(title)
+        if not translated_title:
+            raise ValueError("empty translation")
+        translated_title = fold_title(translated_title)
+        _translation_stats["translated"] += 1
         logger.info(f"Translated '{title}' to '{translated_title}'")
+        _remember_translation(key, translated_title)
+        _store_cached_translation(title, target_lang, translated_title)
         return translated_title
     except Exception as e:
+        _translation_stats["failed"] += 1
         logger.error(f"Error translating title '{title}': {e}")
-        return title  # Return the original title if translation fails
+        # Fall back to the offline romanization (letters of other scripts are kept as they are)
+        return transliterate_title(title)
+
 
+def get_translation_stats() -> dict:
+    """
+    Get counters of how titles were translated
+    
+    Returns:
+        dict: ASCII skips, memory and database cache hits, network translations and failures
+    """
+    return dict(_translation_stats, memory_entries=len(_translation_memory))
+
+# Precompiled patterns for extract_main_title; titles are parsed many times per search
+DIGITS_YEAR_PATTERN = re.compile(r'\d{4}')
+MAIN_TITLE_YEAR_PATTERNS = (
+    ('year', re.compile(r'\.(19\d{2}|20\d{2})(?:\.|\s|$)')),
+    ('year_space', re.compile(r'(?:^|\s)(19\d{2}|20\d{2})(?:\s|$)')),
+    ('year_alt', re.compile(r'(?:^|\.|\s)(19\d{2}|20\d{2})(?:\.|\s|$)')),
+)
+MAIN_TITLE_TECH_KEYWORD_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\.(PROPER|REMASTERED|REPACK|EXTENDED|DIRECTOR|CUT)(?:\.|$)',  # Dot-separated keywords
+    r'\b(PROPER|REMASTERED|REPACK|EXTENDED|DIRECTOR|CUT)\b',  # Word boundaries
+    r'\.\d{3,4}p(?:\.|$)',  # .720p, .1080p, .2160p
+    r'\b\d{3,4}p\b',  # 720p, 1080p, 2160p
+    r'\.(BluRay|Blu-Ray|WEB-DL|HDTV|DVDRip|BDRip|BRRip|REMUX|Remux)(?:\.|$)',  # Dot-separated
+    r'\b(BluRay|Blu-Ray|WEB-DL|HDTV|DVDRip|BDRip|BRRip|REMUX|Remux)\b',  # Word boundaries
+    r'\.(HEVC|x265|x264|H264|H265)(?:\.|$)',  # Dot-separated codecs
+    r'\b(HEVC|x265|x264|H264|H265)\b',  # Word boundaries
+))
+MAIN_TITLE_SEGMENT_SPEC_PATTERN = re.compile(r'(PROPER|REMASTERED|REPACK|EXTENDED|\d{3,4}p|BluRay|REMUX)', re.IGNORECASE)
+MAIN_TITLE_TRAILING_SPEC_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\s*\[.*?\]\s*$',  # Remove [BluRay Rip 720p] etc at the end
+    r'\s*\(.*?\)\s*$',  # Remove (AC3 2.0 Español) etc at the end
+    r'\s*-\s*[A-Z0-9]+$',  # Remove -RARBG, -YIFY etc at the end
+    r'\s*\.\s*[A-Z0-9]+$',  # Remove .RARBG, .YIFY etc at the end
+))
+
+@lru_cache(maxsize=4096)
 def extract_main_title(title):
     """
     Extract the main title from a torrent name, removing technical specifications.
@@ -39,7 +248,7 @@ def extract_main_title(title):
     Tries multiple extraction strategies to find the best result.
     """
     # Check if this looks like a torrent filename (has many dots)
-    is_torrent_filename = title.count('.') >= 3 or ('.' in title and re.search(r'\d{4}', title))
+    is_torrent_filename = title.count('.') >= 3 or ('.' in title and DIGITS_YEAR_PATTERN.search(title))
     
     extraction_candidates = []
     
@@ -47,14 +256,14 @@ def extract_main_title(title):
         # Strategy 1: Extract before year pattern (most reliable)
         # For dot-separated filenames like "Title.Title.2015.QUALITY", match ".2015" or ".2015."
         # Also handle cases where year might be followed by space or other characters
-        year_match = re.search(r'\.(19\d{2}|20\d{2})(?:\.|\s|$)', title)
+        year_match = MAIN_TITLE_YEAR_PATTERNS[0][1].search(title)
         if year_match:
             candidate = title[:year_match.start()].strip().rstrip('.').strip()
             if candidate:
                 extraction_candidates.append(('year', candidate))
         
         # Strategy 2: Also try space-separated year pattern
-        year_match_space = re.search(r'(?:^|\s)(19\d{2}|20\d{2})(?:\s|$)', title)
+        year_match_space = MAIN_TITLE_YEAR_PATTERNS[1][1].search(title)
         if year_match_space:
             candidate = title[:year_match_space.start()].strip().rstrip('.').strip()
             if candidate and candidate != title:
@@ -62,27 +271,16 @@ def extract_main_title(title):
         
         # Strategy 1b: Also try year pattern without requiring dot before (handles edge cases)
         # This catches cases like "Title Title 2015" or "Title.Title2015"
-        year_match_alt = re.search(r'(?:^|\.|\s)(19\d{2}|20\d{2})(?:\.|\s|$)', title)
+        year_match_alt = MAIN_TITLE_YEAR_PATTERNS[2][1].search(title)
         if year_match_alt and year_match_alt.start() > 0:
             candidate = title[:year_match_alt.start()].strip().rstrip('.').strip()
             if candidate and candidate not in [c[1] for c in extraction_candidates]:
                 extraction_candidates.append(('year_alt', candidate))
         
         # Strategy 3: Extract before common technical keywords
-        tech_keywords = [
-            r'\.(PROPER|REMASTERED|REPACK|EXTENDED|DIRECTOR|CUT)(?:\.|$)',  # Dot-separated keywords
-            r'\b(PROPER|REMASTERED|REPACK|EXTENDED|DIRECTOR|CUT)\b',  # Word boundaries
-            r'\.\d{3,4}p(?:\.|$)',  # .720p, .1080p, .2160p
-            r'\b\d{3,4}p\b',  # 720p, 1080p, 2160p
-            r'\.(BluRay|Blu-Ray|WEB-DL|HDTV|DVDRip|BDRip|BRRip|REMUX|Remux)(?:\.|$)',  # Dot-separated
-            r'\b(BluRay|Blu-Ray|WEB-DL|HDTV|DVDRip|BDRip|BRRip|REMUX|Remux)\b',  # Word boundaries
-            r'\.(HEVC|x265|x264|H264|H265)(?:\.|$)',  # Dot-separated codecs
-            r'\b(HEVC|x265|x264|H264|H265)\b',  # Word boundaries
-        ]
-        
         earliest_match = None
-        for pattern in tech_keywords:
-            match = re.search(pattern, title, re.IGNORECASE)
+        for pattern in MAIN_TITLE_TECH_KEYWORD_PATTERNS:
+            match = pattern.search(title)
             if match:
                 if earliest_match is None or match.start() < earliest_match.start():
                     earliest_match = match
@@ -100,7 +298,7 @@ def extract_main_title(title):
             for num_segments in range(3, min(6, len(segments))):
                 candidate = '.'.join(segments[:num_segments])
                 # Don't include if it looks like it ends with technical specs
-                if not re.search(r'(PROPER|REMASTERED|REPACK|EXTENDED|\d{3,4}p|BluRay|REMUX)', candidate, re.IGNORECASE):
+                if not MAIN_TITLE_SEGMENT_SPEC_PATTERN.search(candidate):
                     extraction_candidates.append(('segments', candidate))
                     break  # Use first reasonable segment count
         
@@ -144,18 +342,20 @@ def extract_main_title(title):
         main_title = title
     
     # Remove common technical specifications that appear at the end
-    patterns_to_remove = [
-        r'\s*\[.*?\]\s*$',  # Remove [BluRay Rip 720p] etc at the end
-        r'\s*\(.*?\)\s*$',  # Remove (AC3 2.0 Español) etc at the end
-        r'\s*-\s*[A-Z0-9]+$',  # Remove -RARBG, -YIFY etc at the end
-        r'\s*\.\s*[A-Z0-9]+$',  # Remove .RARBG, .YIFY etc at the end
-    ]
-    
-    for pattern in patterns_to_remove:
-        main_title = re.sub(pattern, '', main_title, flags=re.IGNORECASE)
+    for pattern in MAIN_TITLE_TRAILING_SPEC_PATTERNS:
+        main_title = pattern.sub('', main_title)
     
     return main_title.strip()
 
+CLEAN_TITLE_EPISODE_PATTERN = re.compile(r'S\d+E\d+', re.IGNORECASE)
+CLEAN_TITLE_RESOLUTION_PATTERN = re.compile(r'\b\d{3,4}p\b', re.IGNORECASE)
+CLEAN_TITLE_QUALITY_PATTERN = re.compile(r'\b(BluRay|Blu-Ray|WEB-DL|HDTV|DVDRip|BDRip|BRRip|Remux|x265|x264)\b', re.IGNORECASE)
+CLEAN_TITLE_GROUP_PATTERN = re.compile(r'\b(RARBG|YIFY|YTS|HDBits|PublicHD)\b', re.IGNORECASE)
+CLEAN_TITLE_YEAR_RANGE_PATTERN = re.compile(r'\b\d{4}[-–]\d{4}\b')
+CLEAN_TITLE_YEAR_PATTERN = re.compile(r'\b(19\d{2}|20\d{2})\b')
+CLEAN_TITLE_PUNCTUATION_PATTERN = re.compile(r"[,:;'-]")
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
 def clean_title(title, target_lang='en'):
     """
     Cleans the movie title by removing commas, hyphens, colons, semicolons, and apostrophes,
@@ -165,7 +365,7 @@ def clean_title(title, target_lang='en'):
     If extraction fails, still attempts to clean and match the original title.
     """
     # Check if this looks like a torrent filename (has many dots or technical specs)
-    is_torrent_filename = title.count('.') >= 3 or ('.' in title and re.search(r'\d{4}', title))
+    is_torrent_filename = title.count('.') >= 3 or ('.' in title and DIGITS_YEAR_PATTERN.search(title))
     
     if is_torrent_filename:
         # For torrent filenames: Extract main title FIRST, then translate
@@ -196,31 +396,31 @@ def clean_title(title, target_lang='en'):
     
     # For TV shows, extract just the main title (before any S01E01 pattern)
     # This helps with matching by ignoring episode info and technical specs
-    season_ep_match = re.search(r'S\d+E\d+', main_title, re.IGNORECASE)
+    season_ep_match = CLEAN_TITLE_EPISODE_PATTERN.search(main_title)
     if season_ep_match:
         main_title = main_title[:season_ep_match.start()].strip()
     
     # Remove technical specifications and quality indicators that might interfere with matching
     # Remove resolution info (720p, 1080p, 2160p, etc.)
-    main_title = re.sub(r'\b\d{3,4}p\b', '', main_title, flags=re.IGNORECASE)
+    main_title = CLEAN_TITLE_RESOLUTION_PATTERN.sub('', main_title)
     # Remove quality indicators (BluRay, WEB-DL, HDTV, etc.)
-    main_title = re.sub(r'\b(BluRay|Blu-Ray|WEB-DL|HDTV|DVDRip|BDRip|BRRip|Remux|x265|x264)\b', '', main_title, flags=re.IGNORECASE)
+    main_title = CLEAN_TITLE_QUALITY_PATTERN.sub('', main_title)
     # Remove group names (RARBG, YIFY, etc.)
-    main_title = re.sub(r'\b(RARBG|YIFY|YTS|HDBits|PublicHD)\b', '', main_title, flags=re.IGNORECASE)
+    main_title = CLEAN_TITLE_GROUP_PATTERN.sub('', main_title)
     # Remove year ranges (2001–2011, 2001-2011)
-    main_title = re.sub(r'\b\d{4}[-–]\d{4}\b', '', main_title)
+    main_title = CLEAN_TITLE_YEAR_RANGE_PATTERN.sub('', main_title)
     # Remove standalone years (4 digits) - but be careful not to remove years from movie names
     # Only remove if it's clearly a year (not part of a word and at word boundaries)
-    main_title = re.sub(r'\b(19\d{2}|20\d{2})\b', '', main_title)
+    main_title = CLEAN_TITLE_YEAR_PATTERN.sub('', main_title)
     
     # Normalize em dashes (—, –) to regular hyphens first, then remove them
     main_title = main_title.replace('—', '-').replace('–', '-')
     # Remove underscores
     main_title = main_title.replace('_', ' ')
     # Remove commas, hyphens, colons, semicolons, and apostrophes
-    cleaned_title = re.sub(r"[,:;'-]", '', main_title)
+    cleaned_title = CLEAN_TITLE_PUNCTUATION_PATTERN.sub('', main_title)
     # Replace multiple spaces with a single dot
-    cleaned_title = re.sub(r'\s+', '.', cleaned_title)
+    cleaned_title = WHITESPACE_PATTERN.sub('.', cleaned_title)
     # Convert to lowercase for comparison
     return cleaned_title.lower()
 
@@ -242,7 +442,7 @@ def normalize_title(title, target_lang='en'):
     translated_title = translate_title(title, target_lang)
 
     # Replace multiple spaces with a single space and dots with spaces
-    normalized_title = re.sub(r'\s+', ' ', translated_title)
+    normalized_title = WHITESPACE_PATTERN.sub(' ', translated_title)
     normalized_title = normalized_title.replace('.', ' ')
     # Convert to lowercase
     return normalized_title.lower()
@@ -271,6 +471,11 @@ def replace_words_with_numbers(title):
         title = re.sub(rf'\b{word}\b', digit, title, flags=re.IGNORECASE)
     return title
 
+EXTRACT_YEAR_PARENTHESES_PATTERN = re.compile(r'\((\d{4})\)')
+EXTRACT_YEAR_SEPARATED_PATTERN = re.compile(r'(?:^|[.\s])(19\d{2}|20\d{2})(?:[.\s]|$)')
+RESOLUTION_PATTERN = re.compile(r'\b\d{3,4}p\b')
+
+@lru_cache(maxsize=4096)
 def extract_year(text, expected_year=None, ignore_resolution=False):
     """
     Extracts the correct year from a movie title.
@@ -284,16 +489,16 @@ def extract_year(text, expected_year=None, ignore_resolution=False):
 
     # Remove common video resolutions that might interfere
     if ignore_resolution:
-        text = re.sub(r'\b\d{3,4}p\b', '', text)
+        text = RESOLUTION_PATTERN.sub('', text)
 
     # Extract years explicitly (avoid numbers inside movie titles)
     # Handle parentheses format: (2009) or (1984)
-    years = re.findall(r'\((\d{4})\)', text)
+    years = EXTRACT_YEAR_PARENTHESES_PATTERN.findall(text)
     
     # If no parentheses format found, try space/dot-separated formats
     if not years:
         # Pattern matches years that are either at word boundaries or surrounded by dots/spaces
-        years = re.findall(r'(?:^|[.\s])(19\d{2}|20\d{2})(?:[.\s]|$)', text)
+        years = EXTRACT_YEAR_SEPARATED_PATTERN.findall(text)
     
     if years:
         # Filter to only valid years (1900-2099) and prefer the latest one
@@ -303,6 +508,8 @@ def extract_year(text, expected_year=None, ignore_resolution=False):
 
     return None  # Return None if no valid year is found
 
+WORD_SEPARATOR_PATTERN = re.compile(r'[.\s]+')
+
 def is_complete_word_match(movie_title, torrent_title):
     """
     Validates that the movie title appears as a complete word/phrase in the torrent title.
@@ -330,8 +537,8 @@ def is_complete_word_match(movie_title, torrent_title):
         return True
     
     # Split both titles into words (using dots, spaces, etc. as separators)
-    movie_words = re.split(r'[.\s]+', movie_title)
-    torrent_words = re.split(r'[.\s]+', torrent_title)
+    movie_words = WORD_SEPARATOR_PATTERN.split(movie_title)
+    torrent_words = WORD_SEPARATOR_PATTERN.split(torrent_title)
     
     # Remove empty strings
     movie_words = [w for w in movie_words if w]
@@ -459,6 +666,18 @@ def normalize_season(season):
         # Default to "Season X" if the format is unrecognized
         return f"Season {season}"
 
+COMPLETE_SERIES_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'complete\s+series',
+    r'complete\s+collection',
+    r'complete\s+box\s+set',
+    r'complete\s+pack',
+    r'full\s+series',
+    r'all\s+seasons',
+    r'seasons?\s+\d+\s*[-–]\s*\d+',  # Seasons 1-10, Season 1-10
+    r's\d+\s*[-–]\s*s\d+',  # S01-S10, S1-S10
+    r'\d{4}[-–]\d{4}',  # Year ranges like 2001–2011
+))
+
 def match_complete_seasons(title, seasons):
     """
     Check if the title contains all requested seasons in a complete pack.
@@ -466,24 +685,11 @@ def match_complete_seasons(title, seasons):
     title = title.lower()
     
     # Check for complete series patterns first
-    complete_patterns = [
-        r'complete\s+series',
-        r'complete\s+collection',
-        r'complete\s+box\s+set',
-        r'complete\s+pack',
-        r'full\s+series',
-        r'all\s+seasons',
-        r'seasons?\s+\d+\s*[-–]\s*\d+',  # Seasons 1-10, Season 1-10
-        r's\d+\s*[-–]\s*s\d+',  # S01-S10, S1-S10
-        r'\d{4}[-–]\d{4}',  # Year ranges like 2001–2011
-    ]
-    
-    # Check if any complete pattern is found
-    for pattern in complete_patterns:
-        if re.search(pattern, title):
+    for pattern in COMPLETE_SERIES_PATTERNS:
+        if pattern.search(title):
             # If it's a complete series, assume it covers all seasons
             # This is more permissive and handles cases like "Complete Series" or year ranges
-            logger.info(f"Found complete series pattern '{pattern}' in title: {title}")
+            logger.info(f"Found complete series pattern '{pattern.pattern}' in title: {title}")
             return True
     
     # Fallback to original logic
@@ -492,18 +698,58 @@ def match_complete_seasons(title, seasons):
             return False
     return True
 
+SEASON_RANGE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r's(\d+)[-–](\d+)',  # S01-04, S1-4
+    r's(\d+)[-–]s(\d+)',  # S01-S04, S1-S4
+    r'season\s+(\d+)[-–]season\s+(\d+)',  # Season 1-Season 4
+    r'season\s+(\d+)[-–](\d+)',  # Season 1-4
+))
+EPISODE_INDICATOR_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'e\d+',  # E01, E1, E25, etc.
+    r'episode\s+\d+',  # Episode 1, Episode 25, etc.
+    r'ep\s+\d+',  # Ep 1, Ep 25, etc.
+))
+SEASON_PACK_RANGE_PATTERN = re.compile(r"s(\d+)[-–]s?(\d+)")
+
+@lru_cache(maxsize=256)
+def _season_number_patterns(season_number):
+    """Substrings and compiled patterns that depend on the requested season number"""
+    explicit_season_patterns = (
+        f"season {season_number}",
+        f"s{season_number:02d}",  # S19 (zero-padded)
+        f"s{season_number}",  # S19 (non-zero-padded)
+        f"temporada {season_number}",  # Spanish
+        f"temporada {season_number:02d}",  # Spanish with zero padding
+        f"season.{season_number}",  # With dots
+        f"s.{season_number:02d}",  # With dots and zero padding
+        f"s.{season_number}",  # With dots
+    )
+    episode_season_patterns = tuple(re.compile(pattern) for pattern in (
+        rf"s{season_number:02d}e\d+",  # S04E01, S04E02, etc.
+        rf"s{season_number}e\d+",  # S4E01, S4E02, etc.
+    ))
+    complete_pack_patterns = tuple(re.compile(pattern) for pattern in (
+        rf"s\d+[-–]s{season_number:02d}",  # S01-S10, S1-S10
+        rf"s{season_number:02d}[-–]s\d+",  # S10-S01, S10-S1
+        rf"season\s+\d+[-–]season\s+{season_number}",  # Season 1-Season 10
+        rf"season\s+{season_number}[-–]season\s+\d+",  # Season 10-Season 1
+        rf"s\d+[-–]{season_number:02d}",  # S01-10, S1-10
+        rf"{season_number:02d}[-–]s\d+",  # 10-S01, 10-S1
+    ))
+    return explicit_season_patterns, episode_season_patterns, complete_pack_patterns
+
 def match_single_season(title, season):
     """
     Check if the title contains the exact requested season.
     Handles formats like "Season 1", "S01", "S1", etc.
     Also handles season ranges like "S01-04" where the requested season falls within the range.
     """
-    import re
-    
-    # Normalize the season string for comparison
-    season = season.lower().strip()
-    title = title.lower()
+    # The same torrent titles are checked against the same seasons many times per search
+    return _match_single_season(title.lower(), season.lower().strip())
 
+@lru_cache(maxsize=8192)
+def _match_single_season(title, season):
+    """match_single_season on a lowercased title and season"""
     # Extract the season number from the requested season
     if season.startswith("season"):
         season_number = season.replace("season", "").strip()
@@ -519,17 +765,11 @@ def match_single_season(title, season):
         logger.warning(f"Invalid season number format: {season}")
         return False
 
+    explicit_season_patterns, episode_season_patterns, complete_pack_patterns = _season_number_patterns(season_number)
+
     # First check for season ranges in the title (e.g., S01-04, S1-S4, Season 1-4)
-    range_patterns = [
-        r's(\d+)[-–](\d+)',  # S01-04, S1-4
-        r's(\d+)[-–]s(\d+)',  # S01-S04, S1-S4
-        r'season\s+(\d+)[-–]season\s+(\d+)',  # Season 1-Season 4
-        r'season\s+(\d+)[-–](\d+)',  # Season 1-4
-    ]
-    
-    for pattern in range_patterns:
-        range_matches = re.findall(pattern, title)
-        for start_str, end_str in range_matches:
+    for pattern in SEASON_RANGE_PATTERNS:
+        for start_str, end_str in pattern.findall(title):
             try:
                 start_season = int(start_str)
                 end_season = int(end_str)
@@ -543,34 +783,12 @@ def match_single_season(title, season):
     # But exclude single episodes (e.g., S19E25 should not match Season 19)
     season_present = False
     
-    # Check for explicit season patterns (complete seasons)
-    explicit_season_patterns = [
-        f"season {season_number}",
-        f"s{season_number:02d}",  # S19 (zero-padded)
-        f"s{season_number}",  # S19 (non-zero-padded)
-        f"temporada {season_number}",  # Spanish
-        f"temporada {season_number:02d}",  # Spanish with zero padding
-        f"season.{season_number}",  # With dots
-        f"s.{season_number:02d}",  # With dots and zero padding
-        f"s.{season_number}",  # With dots
-    ]
+    # Look for episode patterns like E01, E1, Episode 1, etc.
+    is_single_episode = any(pattern.search(title) for pattern in EPISODE_INDICATOR_PATTERNS)
     
+    # Check for explicit season patterns (complete seasons)
     for pattern in explicit_season_patterns:
         if pattern in title:
-            # Additional check: make sure it's not a single episode
-            # Look for episode patterns like E01, E1, Episode 1, etc.
-            episode_patterns = [
-                r'e\d+',  # E01, E1, E25, etc.
-                r'episode\s+\d+',  # Episode 1, Episode 25, etc.
-                r'ep\s+\d+',  # Ep 1, Ep 25, etc.
-            ]
-            
-            is_single_episode = False
-            for ep_pattern in episode_patterns:
-                if re.search(ep_pattern, title):
-                    is_single_episode = True
-                    break
-            
             # For individual episode processing, we want to match episodes too
             # Only skip if it's clearly a single episode that doesn't match our season
             if not is_single_episode:
@@ -579,18 +797,7 @@ def match_single_season(title, season):
                 break
             else:
                 # Check if the episode belongs to our requested season
-                episode_season_patterns = [
-                    rf"s{season_number:02d}e\d+",  # S04E01, S04E02, etc.
-                    rf"s{season_number}e\d+",  # S4E01, S4E02, etc.
-                ]
-                
-                episode_matches_season = False
-                for ep_season_pattern in episode_season_patterns:
-                    if re.search(ep_season_pattern, title):
-                        episode_matches_season = True
-                        break
-                
-                if episode_matches_season:
+                if any(ep_season_pattern.search(title) for ep_season_pattern in episode_season_patterns):
                     season_present = True
                     logger.info(f"Found season {season_number} episode pattern '{pattern}' in title: {title}")
                     break
@@ -603,20 +810,11 @@ def match_single_season(title, season):
     # For single season matching, we should be more permissive
     # Only reject if the title explicitly contains multiple seasons in a way that suggests it's a complete pack
     # Check for patterns like "S01-S10", "S1-S10", "Season 1-10", etc.
-    complete_pack_patterns = [
-        rf"s\d+[-–]s{season_number:02d}",  # S01-S10, S1-S10
-        rf"s{season_number:02d}[-–]s\d+",  # S10-S01, S10-S1
-        rf"season\s+\d+[-–]season\s+{season_number}",  # Season 1-Season 10
-        rf"season\s+{season_number}[-–]season\s+\d+",  # Season 10-Season 1
-        rf"s\d+[-–]{season_number:02d}",  # S01-10, S1-10
-        rf"{season_number:02d}[-–]s\d+",  # 10-S01, 10-S1
-    ]
-    
     # If it's a complete pack pattern, only allow if it's the first season or if it's a range that includes our season
     for pattern in complete_pack_patterns:
-        if re.search(pattern, title):
+        if pattern.search(title):
             # Extract the range and check if our season is within it
-            range_match = re.search(rf"s(\d+)[-–]s?(\d+)", title)
+            range_match = SEASON_PACK_RANGE_PATTERN.search(title)
             if range_match:
                 start_season = int(range_match.group(1))
                 end_season = int(range_match.group(2))
@@ -627,15 +825,142 @@ def match_single_season(title, season):
     # If no complete pack pattern is found, allow the match
     return True
 
+EXTRACT_SEASON_PATTERN = re.compile(r"[sS](\d{1,2})")
+
 def extract_season(title):
     """
     Extract the season number from a title (e.g., 'naruto.s01.bdrip' → 1).
     """
-    season_match = re.search(r"[sS](\d{1,2})", title)
+    season_match = EXTRACT_SEASON_PATTERN.search(title)
     if season_match:
         return int(season_match.group(1))
     return None
 
+class ReleaseInfo(NamedTuple):
+    """Structured fields of a torrent release name"""
+    title: str
+    title_tokens: Tuple[str, ...]
+    year: Optional[int]
+    seasons: Tuple[int, ...]
+    season_ranges: Tuple[Tuple[int, int], ...]
+    episodes: Tuple[Tuple[int, int], ...]
+    resolution: Optional[str]
+    codec: Optional[str]
+    source: Optional[str]
+    group: Optional[str]
+    is_complete: bool
+
+# One alternation scanned left to right; the first matching branch wins at each position,
+# so ranges and episodes are tried before plain seasons
+RELEASE_NAME_PATTERN = re.compile(r"""
+    (?P<season_range>\b(?:s|seasons?[\s.]*)(?P<range_start>\d{1,2})[\s.]*[-–][\s.]*(?:s|season[\s.]*)?(?P<range_end>\d{1,2})\b)
+  | (?P<episode>\bs(?P<episode_season>\d{1,2})[\s.]*e(?P<episode_number>\d{1,3})(?:[-–]?e(?P<episode_end>\d{1,3}))?)
+  | (?P<season>\b(?:s|season[\s.]*|temporada[\s.]*)(?P<season_number>\d{1,2})\b)
+  | (?P<year_range>(?<![\d])(?:19|20)\d{2}[\s.]*[-–][\s.]*(?:19|20)\d{2}(?![\d]))
+  | (?P<year>(?<![\d])(?P<year_value>19\d{2}|20\d{2})(?![\d]))
+  | (?P<resolution>\b(?P<resolution_value>\d{3,4}p|4k|uhd)\b)
+  | (?P<codec>\b(?P<codec_value>x26[45]|h\.?26[45]|hevc|avc|av1|xvid)\b)
+  | (?P<source>\b(?P<source_value>blu-?ray|remux|web-?dl|web-?rip|hdtv|dvdrip|bdrip|brrip|hdrip)\b)
+  | (?P<complete>\b(?:complete|full[\s.]+series|all[\s.]+seasons)\b)
+""", re.IGNORECASE | re.VERBOSE)
+RELEASE_GROUP_PATTERN = re.compile(r"-\s*([A-Za-z0-9]+)(?:\.(?:mkv|mp4|avi))?\s*$")
+TITLE_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+@lru_cache(maxsize=8192)
+def parse_release_name(name):
+    """
+    Parse a torrent release name into structured fields in a single pass.
+    
+    Args:
+        name (str): Release name, e.g. "Show.Name.S01-S03.1080p.BluRay.x264-GROUP"
+    
+    Returns:
+        ReleaseInfo: Title and its lowercase tokens, year, seasons, season ranges,
+            (season, episode) pairs, resolution, codec, source, release group and
+            whether the name marks a complete pack. Missing fields are None or empty.
+    """
+    seasons = []
+    season_ranges = []
+    episodes = []
+    years = []
+    resolution = codec = source = None
+    is_complete = False
+    title_end = None
+    spans = []
+
+    for match in RELEASE_NAME_PATTERN.finditer(name):
+        kind = match.lastgroup
+        spans.append(match.span())
+        if kind == 'year':
+            # A year at the very start is part of the title (e.g. "1917", "2012")
+            if match.start() > 0:
+                years.append(match)
+            continue
+        if kind == 'season_range':
+            start, end = int(match.group('range_start')), int(match.group('range_end'))
+            if start <= end:
+                season_ranges.append((start, end))
+                seasons.extend(range(start, end + 1))
+        elif kind == 'episode':
+            season_number = int(match.group('episode_season'))
+            first = int(match.group('episode_number'))
+            last = int(match.group('episode_end') or first)
+            episodes.extend((season_number, number) for number in range(first, max(first, last) + 1))
+            seasons.append(season_number)
+        elif kind == 'season':
+            seasons.append(int(match.group('season_number')))
+        elif kind == 'resolution':
+            resolution = resolution or match.group('resolution_value').lower()
+        elif kind == 'codec':
+            codec = codec or match.group('codec_value').lower().replace('.', '')
+        elif kind == 'source':
+            source = source or match.group('source_value').lower().replace('-', '')
+        elif kind in ('complete', 'year_range'):
+            # Year ranges (2001-2011) mark complete series packs
+            is_complete = True
+        if title_end is None:
+            title_end = match.start()
+
+    # The last year before the release details is the release year; earlier ones belong
+    # to the title ("Blade.Runner.2049.2017", "Wonder.Woman.1984.2020")
+    years = [match for match in years if title_end is None or match.start() < title_end] or years
+    year = int(years[-1].group('year_value')) if years else None
+    if years and (title_end is None or years[-1].start() < title_end):
+        title_end = years[-1].start()
+
+    title = name[:title_end] if title_end is not None else name
+    title = title.replace('.', ' ').replace('_', ' ').strip(' -[(')
+    group_match = RELEASE_GROUP_PATTERN.search(name)
+    # "-DL" in "WEB-DL" and similar are part of a parsed field, not a release group
+    if group_match and any(start <= group_match.start() < end for start, end in spans):
+        group_match = None
+
+    return ReleaseInfo(
+        title=title,
+        title_tokens=tuple(token.lower() for token in TITLE_TOKEN_PATTERN.findall(title)),
+        year=year,
+        seasons=tuple(sorted(set(seasons))),
+        season_ranges=tuple(season_ranges),
+        episodes=tuple(episodes),
+        resolution=resolution,
+        codec=codec,
+        source=source,
+        group=group_match.group(1) if group_match else None,
+        is_complete=is_complete or bool(season_ranges)
+    )
+
+def get_title_parser_cache_stats() -> dict:
+    """
+    Get hit/miss statistics of the memoized title parsing functions
+    
+    Returns:
+        dict: lru_cache statistics per function
+    """
+    return {
+        func.__name__: func.cache_info()._asdict()
+        for func in (parse_release_name, extract_main_title, extract_year, _match_single_season)
+    }
+
 def get_system_uptime() -> dict:
     """
     Get system uptime information
@@ -0,0 +1,9 @@
+"""
+Shared test setup for SeerrBridge
+The modules under test are pure; run them without a MySQL connection
+"""
+import os
+import sys
+
+os.environ.setdefault("USE_DATABASE", "false")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,136 @@
+"""Tests for the queue journal replay and compaction"""
+import time
+
+import pytest
+
+from seerr.queue_journal import MAX_REPLAY_ATTEMPTS, QueueJournal
+from seerr.request_queue import MediaRequestQueue, PRIORITY_SYNC, PRIORITY_WEBHOOK
+
+
+def movie(tmdb_id):
+    return ("tt%d" % tmdb_id, "Movie %d" % tmdb_id, "movie", None, tmdb_id * 10, tmdb_id, None)
+
+
+def tv(tmdb_id):
+    return ("tv_processing", "tt%d" % tmdb_id, "Show %d" % tmdb_id, "tv", None, tmdb_id * 10, tmdb_id, None)
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return str(tmp_path / "queue_journal.db")
+
+
+def open_queues(journal_path):
+    journal = QueueJournal(journal_path)
+    queues = {"movie": MediaRequestQueue("movie"), "tv": MediaRequestQueue("tv")}
+    for queue in queues.values():
+        queue.journal = journal
+    return journal, queues
+
+
+def restart(journal, journal_path, **kwargs):
+    journal.close()
+    journal, queues = open_queues(journal_path)
+    restored = journal.replay(queues, **kwargs)
+    return journal, queues, restored
+
+
+def drain(queue):
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+def test_replay_restores_pending_items_in_order(journal_path):
+    journal, queues = open_queues(journal_path)
+    for tmdb_id in (1, 2, 3):
+        queues["movie"].put_nowait(movie(tmdb_id))
+    queues["tv"].put_nowait(tv(4), PRIORITY_WEBHOOK)
+
+    journal, queues, restored = restart(journal, journal_path)
+
+    assert restored == 4
+    assert drain(queues["movie"]) == [movie(1), movie(2), movie(3)]
+    assert drain(queues["tv"]) == [tv(4)]
+    assert queues["tv"]._in_flight[(4, "tv")].priority == PRIORITY_WEBHOOK
+    journal.close()
+
+
+def test_replay_skips_completed_and_removed_items(journal_path):
+    journal, queues = open_queues(journal_path)
+    for tmdb_id in (1, 2, 3):
+        queues["movie"].put_nowait(movie(tmdb_id))
+    queues["movie"].complete(queues["movie"].get_nowait())
+    queues["movie"].remove((2, "movie"))
+
+    journal, queues, restored = restart(journal, journal_path)
+
+    assert restored == 1
+    assert drain(queues["movie"]) == [movie(3)]
+    journal.close()
+
+
+def test_replay_restores_in_flight_item_with_its_attempt(journal_path):
+    journal, queues = open_queues(journal_path)
+    queues["movie"].put_nowait(movie(1))
+    queues["movie"].get_nowait()
+
+    journal, queues, restored = restart(journal, journal_path)
+
+    assert restored == 1
+    assert queues["movie"].get_handle((1, "movie")).attempts == 1
+    journal.close()
+
+
+def test_replay_drops_item_after_max_attempts(journal_path):
+    journal, queues = open_queues(journal_path)
+    queues["movie"].put_nowait(movie(1))
+    queues["movie"].put_nowait(movie(2))
+    abandoned = []
+
+    for _ in range(MAX_REPLAY_ATTEMPTS):
+        # The process stops while a worker holds item 1
+        assert queues["movie"].get_nowait() == movie(1)
+        journal, queues, _ = restart(journal, journal_path,
+                                     on_abandon=lambda item, attempts: abandoned.append((item, attempts)))
+
+    assert abandoned == [(movie(1), MAX_REPLAY_ATTEMPTS)]
+    assert (1, "movie") not in queues["movie"]
+    assert drain(queues["movie"]) == [movie(2)]
+    journal.close()
+
+
+def test_compact_keeps_pending_state(journal_path):
+    journal, queues = open_queues(journal_path)
+    for tmdb_id in range(1, 21):
+        queues["movie"].put_nowait(movie(tmdb_id), PRIORITY_SYNC)
+    for _ in range(15):
+        queues["movie"].complete(queues["movie"].get_nowait())
+    in_flight = queues["movie"].get_nowait()
+
+    journal.compact(queues)
+    assert journal._event_count == 6
+
+    journal, queues, restored = restart(journal, journal_path)
+    assert restored == 5
+    assert queues["movie"].get_handle((16, "movie")).attempts == 1
+    assert drain(queues["movie"]) == [in_flight] + [movie(tmdb_id) for tmdb_id in range(17, 21)]
+    journal.close()
+
+
+def test_deferred_retry_survives_restart(journal_path):
+    journal, queues = open_queues(journal_path)
+    queues["movie"].put_nowait(movie(1))
+    item = queues["movie"].get_nowait()
+    queues["movie"].defer(item, time.time() + 600)
+    queues["movie"].complete(item)
+
+    journal, queues, restored = restart(journal, journal_path)
+
+    assert restored == 1
+    assert queues["movie"].empty()
+    assert queues["movie"].has_pending_retry((1, "movie"))
+    assert queues["movie"].release_due(time.time() + 600) == 1
+    assert queues["movie"].get_nowait() == item
+    journal.close()
@@ -0,0 +1,169 @@
+"""Tests for the priority request queue"""
+import asyncio
+
+import pytest
+
+from seerr import request_queue
+from seerr.request_queue import (
+    COMPACT_MIN_REMOVED,
+    MediaRequestQueue,
+    PRIORITY_RECONCILE,
+    PRIORITY_SYNC,
+    PRIORITY_WEBHOOK,
+)
+
+
+def movie(tmdb_id, title=None, request_id=None):
+    return ("tt%d" % tmdb_id, title or "Movie %d" % tmdb_id, "movie", None, tmdb_id * 10, tmdb_id, request_id)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() for the queue module"""
+    now = [1000.0]
+    monkeypatch.setattr(request_queue.time, "time", lambda: now[0])
+    return now
+
+
+def drain(queue):
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+def test_webhook_served_before_sync_enqueued_at_the_same_time(clock):
+    queue = MediaRequestQueue("movie")
+    queue.put_nowait(movie(1), PRIORITY_SYNC)
+    queue.put_nowait(movie(2), PRIORITY_WEBHOOK)
+
+    assert [item[5] for item in drain(queue)] == [2, 1]
+
+
+def test_aged_sync_item_served_before_new_webhook_item(clock):
+    queue = MediaRequestQueue("movie")
+    queue.put_nowait(movie(1), PRIORITY_SYNC)
+    clock[0] += 700
+    queue.put_nowait(movie(2), PRIORITY_WEBHOOK)
+    queue.put_nowait(movie(3), PRIORITY_RECONCILE)
+
+    assert [item[5] for item in drain(queue)] == [1, 2, 3]
+
+
+def test_same_class_is_fifo(clock):
+    queue = MediaRequestQueue("movie")
+    for tmdb_id in (3, 1, 2):
+        queue.put_nowait(movie(tmdb_id))
+
+    assert [item[5] for item in drain(queue)] == [3, 1, 2]
+
+
+def test_remove_keeps_order_of_remaining_items(clock):
+    queue = MediaRequestQueue("movie")
+    for tmdb_id in range(1, 6):
+        queue.put_nowait(movie(tmdb_id))
+
+    assert queue.remove((3, "movie"))
+    assert not queue.remove((3, "movie"))
+    assert (3, "movie") not in queue
+    assert queue.qsize() == 4
+    assert [item[5] for item in drain(queue)] == [1, 2, 4, 5]
+
+
+def test_heap_is_compacted_once_removed_entries_dominate(clock):
+    queue = MediaRequestQueue("movie")
+    count = COMPACT_MIN_REMOVED * 2 + 2
+    for tmdb_id in range(count):
+        queue.put_nowait(movie(tmdb_id))
+    for tmdb_id in range(0, count - 2):
+        queue.remove((tmdb_id, "movie"))
+
+    assert len(queue._heap) < count
+    assert [item[5] for item in drain(queue)] == [count - 2, count - 1]
+
+
+def test_duplicate_request_is_merged_and_promoted(clock):
+    queue = MediaRequestQueue("movie")
+    queue.put_nowait(movie(1), PRIORITY_SYNC)
+    queue.put_nowait(movie(2), PRIORITY_SYNC)
+
+    assert not queue.put_nowait(movie(2, request_id=77), PRIORITY_WEBHOOK)
+    assert queue.qsize() == 2
+    assert queue.duplicates_merged == 1
+    first = queue.get_nowait()
+    assert first[5] == 2 and first[6] == 77
+
+
+def test_merge_keeps_queued_values_the_new_request_lacks(clock):
+    queue = MediaRequestQueue("movie")
+    queue.put_nowait(movie(1, request_id=5))
+    queue.put_nowait(("tt1", "Movie 1", "movie", {"seasons": []}, 10, 1, None))
+
+    assert queue.get_nowait() == ("tt1", "Movie 1", "movie", {"seasons": []}, 10, 1, 5)
+
+
+def test_request_for_in_flight_title_is_held_until_completion(clock):
+    queue = MediaRequestQueue("movie")
+    queue.put_nowait(movie(1), PRIORITY_SYNC)
+    item = queue.get_nowait()
+
+    assert not queue.put_nowait(movie(1, request_id=9), PRIORITY_WEBHOOK)
+    assert queue.empty()
+    assert (1, "movie") in queue
+
+    queue.complete(item)
+    assert queue.qsize() == 1
+    requeued = queue.get_nowait()
+    assert requeued[6] == 9
+    assert queue._in_flight[(1, "movie")].priority == PRIORITY_WEBHOOK
+
+
+def test_removing_in_flight_title_drops_held_request(clock):
+    queue = MediaRequestQueue("movie")
+    queue.put_nowait(movie(1))
+    item = queue.get_nowait()
+    queue.put_nowait(movie(1))
+
+    assert queue.remove((1, "movie"))
+    queue.complete(item)
+    assert queue.empty()
+    assert (1, "movie") not in queue
+
+
+def test_deferred_retry_waits_for_not_before(clock):
+    queue = MediaRequestQueue("movie")
+    queue.put_nowait(movie(1))
+    item = queue.get_nowait()
+
+    assert queue.defer(item, clock[0] + 300)
+    queue.complete(item)
+    assert queue.empty()
+    assert (1, "movie") in queue
+    assert queue.has_pending_retry((1, "movie"))
+
+    assert queue.release_due() == 0
+    clock[0] += 300
+    assert queue.release_due() == 1
+    assert queue.get_nowait() == item
+
+
+def test_request_for_deferred_title_keeps_backoff(clock):
+    queue = MediaRequestQueue("movie")
+    queue.defer(movie(1), clock[0] + 300)
+
+    assert not queue.put_nowait(movie(1, request_id=4), PRIORITY_WEBHOOK)
+    assert queue.empty()
+    clock[0] += 300
+    queue.release_due()
+    assert queue.get_nowait()[6] == 4
+
+
+def test_full_queue_rejects_new_items(clock):
+    queue = MediaRequestQueue("movie", maxsize=1)
+    queue.put_nowait(movie(1))
+
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait(movie(2))
+    assert queue.rejected_enqueues == 1
+    # A duplicate is merged even when the queue is full
+    assert not queue.put_nowait(movie(1))
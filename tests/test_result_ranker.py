@@ -0,0 +1,62 @@
+"""Tests for DMM result ranking"""
+import pytest
+
+import seerr.config
+from seerr.result_ranker import _resolution_height, get_preferred_resolutions, order_result_indexes, rank_results
+
+
+@pytest.fixture(autouse=True)
+def config(monkeypatch):
+    monkeypatch.setattr(seerr.config, "TORRENT_FILTER_REGEX", None)
+    monkeypatch.setattr(seerr.config, "MAX_MOVIE_SIZE", None)
+    monkeypatch.setattr(seerr.config, "MAX_EPISODE_SIZE", None)
+    return monkeypatch
+
+
+def cards(*titles, **extra):
+    return [dict({"index": index, "title": title, "badges": []}, **extra) for index, title in enumerate(titles, 1)]
+
+
+def test_ranked_matches_come_first_then_page_order():
+    page = cards("Other.Film.2010.1080p", "Heat.1995.720p", "Unrelated.2001", "Heat.1995.2160p.BluRay")
+
+    assert order_result_indexes(page, "Heat (1995)", [], False) == [4, 2, 1, 3]
+
+
+def test_preferred_resolutions_follow_the_active_filter_only(config):
+    config.setattr(seerr.config, "TORRENT_FILTER_REGEX", "^(?=.*(720p)).*")
+    assert get_preferred_resolutions() == ("720p",)
+
+    config.setattr(seerr.config, "TORRENT_FILTER_REGEX", "^(?!.*【.*?】).*")
+    assert get_preferred_resolutions() == ()
+
+
+def test_filtered_resolution_outranks_higher_one(config):
+    config.setattr(seerr.config, "TORRENT_FILTER_REGEX", "^(?=.*(720p)).*")
+    page = cards("Heat.1995.2160p.BluRay", "Heat.1995.720p.BluRay")
+
+    assert order_result_indexes(page, "Heat (1995)", [], False) == [2, 1]
+
+
+def test_torrent_over_size_limit_ranks_last(config):
+    config.setattr(seerr.config, "MAX_MOVIE_SIZE", 10)
+    page = cards("Heat.1995.2160p.BluRay", "Heat.1995.1080p.BluRay")
+    page[0]["size_gb"] = 60
+    page[1]["size_gb"] = 8
+
+    assert [result.index for result in rank_results(page, "Heat (1995)", [], False)] == [2, 1]
+
+
+def test_season_pack_covering_more_requested_seasons_ranks_first():
+    page = cards("Dark.S01.1080p", "Dark.S01-S03.1080p", "Dark.S01E01.1080p")
+    ranked = rank_results(page, "Dark", ["Season 1", "Season 2", "Season 3"], True)
+
+    assert [result.index for result in ranked] == [2, 1, 3]
+    assert ranked[0].covered_seasons == ("Season 1", "Season 2", "Season 3")
+
+
+@pytest.mark.parametrize("resolution, height", [
+    ("1080p", 1080), ("2160P", 2160), ("uhd", 2160), ("4k", 2160), ("dvdrip", None), (None, None)
+])
+def test_resolution_height(resolution, height):
+    assert _resolution_height(resolution) == height
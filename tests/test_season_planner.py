@@ -0,0 +1,48 @@
+"""Tests for multi-season pack planning"""
+import pytest
+
+import seerr.config
+from seerr.season_planner import plan_season_coverage
+
+
+@pytest.fixture(autouse=True)
+def config(monkeypatch):
+    monkeypatch.setattr(seerr.config, "TORRENT_FILTER_REGEX", None)
+    monkeypatch.setattr(seerr.config, "MAX_EPISODE_SIZE", None)
+
+
+def cards(*entries):
+    return [{"index": index, "title": title, "badges": badges} for index, (title, badges) in enumerate(entries, 1)]
+
+
+def test_full_pack_covers_every_season():
+    page = cards(("Dark.S01.1080p", []), ("Dark.S01-S03.Complete.1080p", ["Complete (26/26)"]))
+    plan = plan_season_coverage(page, "Dark", {1: 10, 2: 8, 3: 8})
+
+    assert [pack.index for pack in plan.packs] == [2]
+    assert plan.packs[0].seasons == (1, 2, 3)
+    assert plan.uncovered == []
+
+
+def test_greedy_picks_widest_pack_and_leaves_single_seasons():
+    page = cards(("Dark.S01-S02.1080p", []), ("Dark.S02-S04.1080p", []), ("Dark.S05-S06.1080p", []))
+    plan = plan_season_coverage(page, "Dark", {1: 10, 2: 8, 3: 8, 4: 8, 5: 6, 6: 6})
+
+    assert [pack.index for pack in plan.packs] == [2, 3]
+    assert plan.uncovered == [1]
+
+
+def test_pack_with_fewer_files_than_aired_episodes_is_skipped():
+    page = cards(("Dark.S01-S03.720p", ["Complete (20/20)"]))
+    plan = plan_season_coverage(page, "Dark", {1: 10, 2: 8, 3: 8})
+
+    assert plan.packs == []
+    assert plan.uncovered == [1, 2, 3]
+
+
+def test_packs_for_other_shows_and_single_seasons_are_ignored():
+    page = cards(("Other.Show.S01-S03.1080p", []), ("Dark.S02.1080p", []))
+    plan = plan_season_coverage(page, "Dark", {1: 10, 2: 8, 3: 8})
+
+    assert plan.packs == []
+    assert plan.uncovered == [1, 2, 3]
@@ -0,0 +1,71 @@
+"""Tests for batch title scoring"""
+import random
+
+from fuzzywuzzy import fuzz as legacy_fuzz
+
+from seerr.title_matcher import TITLE_MATCH_THRESHOLD, _clean_for_match, best_match, score_titles
+
+WORDS = "bad reloaded lost complete matrix the of a heat show dark knight rises star wars".split()
+
+
+def legacy_title_matched(title, movie_title):
+    """The fuzzywuzzy check check_red_buttons applied before batch scoring"""
+    base_title = movie_title.split('(')[0].strip().lower()
+    expected_title = _clean_for_match(movie_title)
+    ratio = legacy_fuzz.partial_ratio(_clean_for_match(title), expected_title)
+    if ratio < TITLE_MATCH_THRESHOLD:
+        ratio = legacy_fuzz.partial_ratio(title.lower(), base_title)
+    return ratio >= TITLE_MATCH_THRESHOLD
+
+
+def test_title_match_agrees_with_fuzzywuzzy_threshold():
+    rng = random.Random(1)
+    for _ in range(300):
+        movie_title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3)))
+        titles = [".".join(rng.choice(WORDS) for _ in range(rng.randint(2, 4))) for _ in range(5)]
+        matches = score_titles(titles, movie_title, [], False)
+        assert [match.title_ratio >= TITLE_MATCH_THRESHOLD for match in matches] == \
+            [legacy_title_matched(title, movie_title) for title in titles]
+
+
+def test_title_at_threshold_after_fuzzywuzzy_rounding_matches():
+    # rapidfuzz scores this 64.7, fuzzywuzzy rounds it to 65
+    match = score_titles(["Star.Bad.Complete.Dark"], "Reloaded Complete", [], False)[0]
+
+    assert match.title_ratio == TITLE_MATCH_THRESHOLD
+    assert match.matched
+
+
+def test_movie_year_must_be_within_one_year():
+    matches = score_titles(["Heat.1995.1080p.BluRay", "Heat.1996.1080p", "Heat.2013.1080p"], "Heat (1995)", [], False)
+
+    assert [match.matched for match in matches] == [True, True, False]
+    assert matches[0].score > matches[1].score
+
+
+def test_unrelated_title_does_not_match():
+    match = score_titles(["Completely.Different.Film.2001.1080p"], "Heat (1995)", [], False)[0]
+
+    assert not match.matched
+
+
+def test_tv_title_must_cover_a_requested_season():
+    matches = score_titles(["Dark.S01.1080p", "Dark.S02.1080p"], "Dark", ["Season 2"], True)
+
+    assert [match.matched for match in matches] == [False, True]
+    assert matches[1].season == "Season 2"
+
+
+def test_episodes_rejected_when_only_season_packs_are_wanted():
+    titles = ["Dark.S01E03.1080p", "Dark.S01.Complete.1080p"]
+    matches = score_titles(titles, "Dark", ["Season 1"], True, complete_season_pack_only=True)
+
+    assert [match.is_episode for match in matches] == [True, False]
+    assert best_match(matches).index == 1
+
+
+def test_best_match_keeps_first_title_on_ties():
+    matches = score_titles(["Heat.1995.720p", "Heat.1995.1080p"], "Heat (1995)", [], False)
+
+    assert best_match(matches).index == 0
+    assert best_match(score_titles(["Other.Film"], "Heat (1995)", [], False)) is None